@@ -2,15 +2,50 @@
 ASGI config for ConstellationPredictor project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP goes to Django; WebSocket connections are routed to the handlers in
+``websocket_routes``. On lifespan shutdown, buffered Locator writes are
+flushed before the server exits.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
+import asyncio
 import os
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ConstellationPredictor.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after Django is set up so app modules can use settings and models.
+from Predictor.backends import warm_up_backend  # noqa: E402
+from Predictor.streaming import DETECTION_SOCKET_PATH, detection_socket, reject_socket  # noqa: E402
+from Locator.writebehind import drain_write_buffer  # noqa: E402
+
+warm_up_backend()
+
+websocket_routes = {
+    DETECTION_SOCKET_PATH: detection_socket,
+}
+
+
+async def lifespan(scope, receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await asyncio.to_thread(drain_write_buffer)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        return await lifespan(scope, receive, send)
+    if scope['type'] == 'websocket':
+        handler = websocket_routes.get(scope['path'], reject_socket)
+        return await handler(scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -0,0 +1,224 @@
+"""
+Static asset pipeline.
+
+``collectstatic`` (run by build.sh) goes through
+``CompressedManifestStaticFilesStorage``, which minifies CSS and JS, writes a
+content-hashed copy of every file (``js/detect.3f2a9c1b04de.js``) and, for
+text assets, gzip and brotli variants next to each one. ``{% static %}``
+resolves to the hashed names through the manifest, so a changed file always
+gets a new URL.
+
+``StaticFilesMiddleware`` serves STATIC_ROOT from the app process (uvicorn
+has no static file handler). Hashed names never change content, so they're
+sent with a one-year ``immutable`` Cache-Control and repeat visits don't
+even revalidate them; other names get STATIC_MAX_AGE. The smallest variant
+the client accepts is picked from Accept-Encoding. It steps aside when
+DEBUG is on, where runserver serves the source files directly.
+"""
+
+import gzip
+import mimetypes
+import os
+
+import brotli
+import rcssmin
+import rjsmin
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.files.base import ContentFile
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date
+
+MINIFIERS = {
+    '.css': rcssmin.cssmin,
+    '.js': lambda text: rjsmin.jsmin(text, keep_bang_comments=True),
+}
+COMPRESSIBLE = {'.css', '.js', '.json', '.map', '.svg', '.txt', '.html', '.xml', '.ico'}
+# Don't bother compressing tiny files or keeping variants that barely shrink
+COMPRESS_MIN_SIZE = 256
+COMPRESS_MIN_SAVING = 0.95
+# (suffix, Content-Encoding) in order of preference
+ENCODINGS = [('.br', 'br'), ('.gz', 'gzip')]
+# Files up to this size are kept in memory after their first request
+MEMORY_MAX_FILE_SIZE = 512 * 1024
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Minifies, hashes and precompresses files during collectstatic."""
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+        paths = self.minify(paths)
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        names = set(self.hashed_files) | set(self.hashed_files.values())
+        compressed = sum(self.compress(name) for name in sorted(names))
+        print(f"Precompressed {compressed} static files")
+
+    def minify(self, paths):
+        """
+        Replace collected CSS/JS with minified copies before hashing, so the
+        hash (and the URL) follows the shipped bytes. Returns ``paths`` with
+        those files now read from this storage.
+        """
+        paths = dict(paths)
+        for name, (storage, path) in paths.items():
+            stem, ext = os.path.splitext(name)
+            if ext not in MINIFIERS or stem.endswith('.min'):
+                continue
+            with storage.open(path) as source:
+                text = source.read().decode('utf-8')
+            self._replace(name, MINIFIERS[ext](text).encode('utf-8'))
+            paths[name] = (self, name)
+        return paths
+
+    def compress(self, name):
+        """Write .gz and .br variants of ``name``; returns True if any were kept."""
+        if os.path.splitext(name)[1] not in COMPRESSIBLE or not self.exists(name):
+            return False
+        with self.open(name) as f:
+            data = f.read()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return False
+        kept = False
+        for suffix, compressed in (
+            ('.gz', gzip.compress(data, compresslevel=9, mtime=0)),
+            ('.br', brotli.compress(data, quality=11)),
+        ):
+            if len(compressed) < len(data) * COMPRESS_MIN_SAVING:
+                self._replace(name + suffix, compressed)
+                kept = True
+        return kept
+
+    def _replace(self, name, data):
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(data))
+
+
+class StaticFile:
+    """One file under STATIC_ROOT and its precompressed variants."""
+
+    def __init__(self, path, immutable):
+        stat = os.stat(path)
+        self.path = path
+        self.size = stat.st_size
+        self.content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.etag = f'"{int(stat.st_mtime):x}-{stat.st_size:x}"'
+        self.last_modified = http_date(stat.st_mtime)
+        self.immutable = immutable
+        self.variants = {}  # Content-Encoding -> (path, size)
+        for suffix, encoding in ENCODINGS:
+            if os.path.exists(path + suffix):
+                self.variants[encoding] = (path + suffix, os.path.getsize(path + suffix))
+        self._contents = {}
+
+    def pick(self, accept_encoding):
+        """(path, size, Content-Encoding or None) for the client's Accept-Encoding."""
+        accepted = parse_accept_encoding(accept_encoding)
+        for _, encoding in ENCODINGS:
+            if encoding in accepted and encoding in self.variants:
+                return (*self.variants[encoding], encoding)
+        return self.path, self.size, None
+
+    def read(self, path, size):
+        if size > MEMORY_MAX_FILE_SIZE:
+            return None
+        data = self._contents.get(path)
+        if data is None:
+            with open(path, 'rb') as f:
+                data = self._contents[path] = f.read()
+        return data
+
+
+def parse_accept_encoding(header):
+    accepted = set()
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class StaticFilesMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if settings.DEBUG or not settings.STATIC_SERVE:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        self.prefix = '/' + settings.STATIC_URL.lstrip('/')
+        self.files = self.build_index(settings.STATIC_ROOT)
+
+    @staticmethod
+    def build_index(root):
+        """Map URL path (relative to STATIC_URL) to StaticFile for everything collected."""
+        hashed_names = set(getattr(staticfiles_storage, 'hashed_files', {}).values())
+        suffixes = tuple(suffix for suffix, _ in ENCODINGS)
+        files = {}
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith(suffixes):
+                    continue
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, root).replace(os.sep, '/')
+                files[name] = StaticFile(path, immutable=name in hashed_names)
+        return files
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.serve(request)
+        return response if response is not None else self.get_response(request)
+
+    async def __acall__(self, request):
+        response = self.serve(request)
+        return response if response is not None else await self.get_response(request)
+
+    def serve(self, request):
+        if request.method not in ('GET', 'HEAD') or not request.path.startswith(self.prefix):
+            return None
+        static_file = self.files.get(request.path[len(self.prefix):])
+        if static_file is None:
+            return None
+
+        path, size, encoding = static_file.pick(request.headers.get('Accept-Encoding', ''))
+        # Each encoding is a different representation, so it gets its own ETag
+        etag = f'{static_file.etag[:-1]}-{encoding}"' if encoding else static_file.etag
+        if request.headers.get('If-None-Match') == etag:
+            response = HttpResponseNotModified()
+        else:
+            if request.method == 'HEAD':
+                response = HttpResponse(content_type=static_file.content_type)
+            else:
+                data = static_file.read(path, size)
+                if data is not None:
+                    response = HttpResponse(data, content_type=static_file.content_type)
+                else:
+                    response = FileResponse(open(path, 'rb'), content_type=static_file.content_type)
+            response['Content-Length'] = size
+            response['Last-Modified'] = static_file.last_modified
+            if encoding:
+                response['Content-Encoding'] = encoding
+
+        response['ETag'] = etag
+        response['Cache-Control'] = (
+            IMMUTABLE if static_file.immutable else f'public, max-age={settings.STATIC_MAX_AGE}'
+        )
+        if static_file.variants:
+            response['Vary'] = 'Accept-Encoding'
+        return response
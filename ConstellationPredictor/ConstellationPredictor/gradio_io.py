@@ -0,0 +1,49 @@
+"""
+In-memory file transfer for gradio_client.
+
+``gradio_client.handle_file`` only accepts paths on the local filesystem, and
+the client downloads every output file to a temp directory. These helpers
+upload raw bytes straight to a Space's upload route and read outputs back into
+memory, so nothing touches the disk on the request path. Clients used with
+them should be created with ``download_files=False``.
+"""
+
+import urllib.parse
+
+import httpx
+
+
+def upload_bytes(client, data, filename):
+    """Upload ``data`` to the Space and return a FileData dict referencing it."""
+    response = httpx.post(
+        client.upload_url,
+        headers=client.headers,
+        cookies=client.cookies,
+        verify=client.ssl_verify,
+        files=[('files', (filename, data))],
+        **client.httpx_kwargs,
+    )
+    response.raise_for_status()
+    # No "meta" key: gradio_client would otherwise try to upload the path again.
+    return {'path': response.json()[0], 'orig_name': filename}
+
+
+def fetch_bytes(client, file_data):
+    """Download an output FileData (dict or path string) into memory."""
+    if isinstance(file_data, dict):
+        url = file_data.get('url')
+        path = file_data.get('path')
+    else:
+        url, path = None, file_data
+    if not url:
+        url = urllib.parse.urljoin(client.src_prefixed, 'file=' + urllib.parse.quote(path))
+    response = httpx.get(
+        url,
+        headers=client.headers,
+        cookies=client.cookies,
+        verify=client.ssl_verify,
+        follow_redirects=True,
+        **client.httpx_kwargs,
+    )
+    response.raise_for_status()
+    return response.content
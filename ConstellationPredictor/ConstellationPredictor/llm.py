@@ -0,0 +1,382 @@
+"""
+Shared gateway to the Gemini API.
+
+Every app talks to Gemini through ``get_llm_gateway().generate(purpose,
+prompt)``, or ``stream(purpose, prompt)`` to receive the reply in chunks as
+it is written (streamGenerateContent over server-sent events). The gateway keeps one pooled HTTPS session, so hot paths reuse
+connections instead of repeating TLS handshakes, and looks up the model
+and generation settings for each purpose in ``LLM_PURPOSES``.
+
+At most LLM_MAX_CONCURRENCY requests are in flight per process. Callers
+beyond that wait in a priority queue, so chat replies go ahead of
+background work such as description warming. Rate-limit (429) and
+transient (5xx, network) failures share one policy: retries with
+full-jitter backoff, honouring the server's retry delay. A 429 also puts
+the whole gateway into a cooldown, so every caller backs off together
+instead of spending quota on requests that will be refused.
+
+Token usage and latency are recorded per purpose and reported by
+``stats()``.
+"""
+
+import heapq
+import itertools
+import json
+import os
+import random
+import re
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta/models"
+
+# Lower runs first
+PRIORITY_CHAT = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_BACKGROUND = 9
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    """The model could not produce a reply (not configured, refused, or failed)."""
+
+
+class PriorityLimiter:
+    """Counting semaphore that hands free slots to the lowest priority value first."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.available = limit
+        self._waiters = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    def acquire(self, priority, timeout):
+        with self._lock:
+            if self.available > 0 and not self._waiters:
+                self.available -= 1
+                return True
+            waiter = [priority, next(self._order), threading.Event(), False]
+            heapq.heappush(self._waiters, waiter)
+        if waiter[2].wait(timeout):
+            return True
+        with self._lock:
+            if waiter[2].is_set():
+                # Handed a slot just as we timed out; keep it
+                return True
+            waiter[3] = True  # cancelled, skipped by release()
+            return False
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                waiter = heapq.heappop(self._waiters)
+                if not waiter[3]:
+                    waiter[2].set()
+                    return
+            self.available += 1
+
+    def in_use(self):
+        with self._lock:
+            return self.limit - self.available
+
+    def queued(self):
+        with self._lock:
+            return sum(1 for waiter in self._waiters if not waiter[3])
+
+
+class LLMGateway:
+    def __init__(self, api_key, purposes, max_concurrency=8, max_attempts=3,
+                 backoff=1.0, timeout=30.0):
+        self.api_key = api_key
+        self.purposes = purposes
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.timeout = timeout
+        self.limiter = PriorityLimiter(max_concurrency)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount('https://', adapter)
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+        self._usage = {}
+
+    @property
+    def configured(self):
+        return bool(self.api_key)
+
+    def generate(self, purpose, prompt, priority=None):
+        """
+        Return the model's text reply to ``prompt`` using the settings for
+        ``purpose``. Raises LLMError if no reply could be produced within
+        the purpose's timeout.
+        """
+        if not self.configured:
+            raise LLMError("Gemini API key not configured")
+        config = self.purposes[purpose]
+        priority = config.get('priority', PRIORITY_INTERACTIVE) if priority is None else priority
+        deadline_at = time.monotonic() + config.get('timeout', self.timeout)
+        payload = {
+            'contents': [{'parts': [{'text': prompt}]}],
+            'generationConfig': config.get('generation', {}),
+        }
+
+        self._acquire(purpose, priority, deadline_at)
+        try:
+            response, started = self._post(
+                purpose, f"{config['model']}:generateContent", payload, deadline_at
+            )
+            try:
+                result = response.json()
+                usage = result.get('usageMetadata', {})
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                self._record(purpose, error=True)
+                raise LLMError(f"Gemini returned an unreadable response: {e}")
+            self._record(purpose, latency=time.monotonic() - started, usage=usage)
+            return extract_text(result)
+        finally:
+            self.limiter.release()
+
+    def stream(self, purpose, prompt, priority=None):
+        """
+        Yield the model's reply to ``prompt`` in text chunks as they are
+        generated. Failures before the first chunk are retried like
+        ``generate``; a connection lost mid-reply raises LLMError. The LLM
+        slot is held until the generator finishes or is closed.
+        """
+        if not self.configured:
+            raise LLMError("Gemini API key not configured")
+        config = self.purposes[purpose]
+        priority = config.get('priority', PRIORITY_INTERACTIVE) if priority is None else priority
+        deadline_at = time.monotonic() + config.get('timeout', self.timeout)
+        payload = {
+            'contents': [{'parts': [{'text': prompt}]}],
+            'generationConfig': config.get('generation', {}),
+        }
+
+        self._acquire(purpose, priority, deadline_at)
+        try:
+            response, started = self._post(
+                purpose, f"{config['model']}:streamGenerateContent", payload, deadline_at,
+                params={'alt': 'sse'}, stream=True,
+            )
+            usage = {}
+            first_chunk = None
+            with response:
+                try:
+                    for data in iter_sse(response):
+                        chunk = json.loads(data)
+                        usage = chunk.get('usageMetadata', usage)
+                        text = chunk_text(chunk)
+                        if text:
+                            if first_chunk is None:
+                                first_chunk = time.monotonic() - started
+                            yield text
+                except (requests.RequestException, ValueError) as e:
+                    self._record(purpose, error=True)
+                    raise LLMError(f"Gemini stream interrupted: {e}")
+            self._record(
+                purpose, latency=time.monotonic() - started, usage=usage, first_chunk=first_chunk
+            )
+        finally:
+            self.limiter.release()
+
+    def _acquire(self, purpose, priority, deadline_at):
+        queued_at = time.monotonic()
+        if not self.limiter.acquire(priority, max(0.0, deadline_at - queued_at)):
+            self._record(purpose, error=True)
+            raise LLMError(f"Timed out waiting for an LLM slot ({purpose})")
+        self._record(purpose, queue_wait=time.monotonic() - queued_at)
+
+    def _post(self, purpose, method, payload, deadline_at, params=None, stream=False):
+        """
+        POST to ``method`` (``{model}:{rpc}``) under the retry policy. Returns the
+        first 200 response and when its attempt started.
+        """
+        last_error = None
+        for attempt in range(self.max_attempts):
+            try:
+                self._wait_for_cooldown(deadline_at)
+            except LLMError:
+                self._record(purpose, error=True)
+                raise
+            remaining = deadline_at - time.monotonic()
+            started = time.monotonic()
+            retry_after = None
+            try:
+                response = self.session.post(
+                    f"{GEMINI_API_BASE}/{method}",
+                    headers={'x-goog-api-key': self.api_key},
+                    params=params,
+                    json=payload,
+                    timeout=remaining,
+                    stream=stream,
+                )
+            except requests.RequestException as e:
+                last_error = LLMError(f"Gemini request failed: {e}")
+            else:
+                if response.status_code == 200:
+                    return response, started
+                try:
+                    last_error = LLMError(f"Gemini returned HTTP {response.status_code}")
+                    if response.status_code not in RETRYABLE_STATUS:
+                        break
+                    # Reads the error body, so the response is closed only afterwards
+                    retry_after = parse_retry_after(response)
+                    if response.status_code == 429:
+                        self._start_cooldown(retry_after or self.backoff * 2 ** attempt)
+                finally:
+                    response.close()
+
+            # Full jitter, but never sooner than the server asked for
+            delay = max(retry_after or 0.0, random.uniform(0, self.backoff * 2 ** attempt))
+            if attempt + 1 >= self.max_attempts or time.monotonic() + delay >= deadline_at:
+                break
+            self._record(purpose, retry=True)
+            time.sleep(delay)
+
+        self._record(purpose, error=True)
+        raise last_error
+
+    def _start_cooldown(self, seconds):
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + seconds)
+
+    def _wait_for_cooldown(self, deadline_at):
+        with self._lock:
+            until = self._cooldown_until
+        wait = until - time.monotonic()
+        if wait <= 0:
+            return
+        if until >= deadline_at:
+            raise LLMError("Gemini quota exhausted; backing off")
+        time.sleep(wait)
+
+    def _record(self, purpose, latency=None, usage=None, queue_wait=None, retry=False, error=False,
+                first_chunk=None):
+        with self._lock:
+            entry = self._usage.setdefault(purpose, {
+                'calls': 0,
+                'errors': 0,
+                'retries': 0,
+                'prompt_tokens': 0,
+                'output_tokens': 0,
+                'latency_seconds': 0.0,
+                'queue_wait_seconds': 0.0,
+                'streams': 0,
+                'first_chunk_seconds': 0.0,
+            })
+            if latency is not None:
+                entry['calls'] += 1
+                entry['latency_seconds'] += latency
+            if usage:
+                entry['prompt_tokens'] += usage.get('promptTokenCount', 0)
+                entry['output_tokens'] += usage.get('candidatesTokenCount', 0)
+            if queue_wait is not None:
+                entry['queue_wait_seconds'] += queue_wait
+            if first_chunk is not None:
+                entry['streams'] += 1
+                entry['first_chunk_seconds'] += first_chunk
+            if retry:
+                entry['retries'] += 1
+            if error:
+                entry['errors'] += 1
+
+    def stats(self):
+        with self._lock:
+            purposes = {}
+            for purpose, entry in self._usage.items():
+                purposes[purpose] = {
+                    **entry,
+                    'latency_seconds': round(entry['latency_seconds'], 3),
+                    'queue_wait_seconds': round(entry['queue_wait_seconds'], 3),
+                    'first_chunk_seconds': round(entry['first_chunk_seconds'], 3),
+                    'avg_first_chunk_ms': round(entry['first_chunk_seconds'] / entry['streams'] * 1000, 1)
+                    if entry['streams'] else None,
+                    'avg_latency_ms': round(entry['latency_seconds'] / entry['calls'] * 1000, 1)
+                    if entry['calls'] else None,
+                }
+            cooldown = max(0.0, self._cooldown_until - time.monotonic())
+        return {
+            'in_use': self.limiter.in_use(),
+            'queued': self.limiter.queued(),
+            'cooldown_seconds': round(cooldown, 1),
+            'purposes': purposes,
+        }
+
+
+def extract_text(result):
+    """Text of the first candidate in a generateContent response."""
+    try:
+        parts = result['candidates'][0]['content']['parts']
+    except (KeyError, IndexError, TypeError):
+        reason = result.get('promptFeedback', {}).get('blockReason')
+        raise LLMError(f"Gemini returned no text{f' ({reason})' if reason else ''}")
+    return ''.join(part.get('text', '') for part in parts)
+
+
+def chunk_text(chunk):
+    """Text in one streamed chunk; may be empty (e.g. the final usage-only chunk)."""
+    reason = chunk.get('promptFeedback', {}).get('blockReason')
+    if reason:
+        raise LLMError(f"Gemini returned no text ({reason})")
+    candidates = chunk.get('candidates') or [{}]
+    parts = candidates[0].get('content', {}).get('parts', [])
+    return ''.join(part.get('text', '') for part in parts)
+
+
+def iter_sse(response):
+    """``data`` payloads of a server-sent events response, one per event."""
+    data = []
+    for line in response.iter_lines(decode_unicode=True):
+        if line:
+            if line.startswith('data:'):
+                data.append(line[5:].lstrip())
+        elif data:
+            yield '\n'.join(data)
+            data = []
+    if data:
+        yield '\n'.join(data)
+
+
+def parse_retry_after(response):
+    """Seconds to wait from a Retry-After header or a google.rpc.RetryInfo detail."""
+    header = response.headers.get('Retry-After')
+    if header and header.isdigit():
+        return float(header)
+    try:
+        details = response.json().get('error', {}).get('details', [])
+    except (ValueError, requests.RequestException):
+        return None
+    for detail in details:
+        delay = detail.get('retryDelay')
+        if delay:
+            match = re.match(r'([\d.]+)s', delay)
+            if match:
+                return float(match.group(1))
+    return None
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway():
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway(
+                    api_key=os.getenv('GEMINI_API_KEY'),
+                    purposes=settings.LLM_PURPOSES,
+                    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+                    max_attempts=settings.LLM_MAX_ATTEMPTS,
+                    backoff=settings.LLM_BACKOFF_SECONDS,
+                    timeout=settings.LLM_TIMEOUT_SECONDS,
+                )
+    return _gateway
@@ -0,0 +1,101 @@
+"""
+Bounded thread offload for async views.
+
+Gradio, Gemini, Whisper and gTTS clients are synchronous. Async views hand
+those calls to a shared, size-limited thread pool so the event loop keeps
+serving other requests while they wait on the network. ``iterate_blocking``
+does the same for blocking generators, such as a streamed Gemini reply.
+
+Work that may touch the ORM runs inside ``closing_connections``, which
+manages database connections the way Django does around a request; pool
+threads are not request threads, so nothing else would close them.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.OUTBOUND_MAX_THREADS,
+                    thread_name_prefix='outbound',
+                )
+    return _executor
+
+
+def closing_connections(func, *args, **kwargs):
+    """
+    Call ``func``, closing this thread's database connections before and
+    after if they are broken or older than CONN_MAX_AGE.
+    """
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking callable on the outbound pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), partial(closing_connections, func, *args, **kwargs))
+
+
+_DONE = object()
+
+
+async def iterate_blocking(func, *args, **kwargs):
+    """
+    Run a blocking generator on the outbound pool and yield its items as
+    they are produced. If the consumer stops early (e.g. the client
+    disconnected) the generator is closed before its next item.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    stopped = threading.Event()
+
+    def put(item, error=None):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, (item, error))
+        except RuntimeError:
+            # Event loop already closed
+            stopped.set()
+
+    def produce():
+        try:
+            generator = func(*args, **kwargs)
+            try:
+                for item in generator:
+                    if stopped.is_set():
+                        return
+                    put(item)
+            finally:
+                generator.close()
+        except Exception as e:
+            put(_DONE, e)
+        else:
+            put(_DONE)
+
+    loop.run_in_executor(get_executor(), produce)
+    try:
+        while True:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,268 @@
+"""
+Failure isolation for calls to remote services.
+
+``ResilientCaller.call`` runs a blocking call with:
+
+- a deadline budget covering all attempts, after which the caller gets
+  ``DeadlineExceeded`` even if the underlying call is still running;
+- bounded retries with full-jitter exponential backoff, for transient
+  errors only (timeouts and connection failures, see ``TRANSIENT_ERRORS``);
+  anything else is re-raised at once;
+- a circuit breaker that fails fast with ``CircuitOpenError`` after repeated
+  failed calls (each call counts once, however many attempts it made), then
+  lets a single probe through once ``reset_timeout`` passes;
+- optional hedging: if an attempt hasn't finished by the observed p95
+  latency, a duplicate is sent and whichever succeeds first wins.
+
+Attempts run on a dedicated thread pool so a stalled dependency ties up
+those threads, not the request workers. Every named caller is registered so
+``caller_stats()`` can report state and counters to operators.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import httpx
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Failures worth another attempt: the request may succeed if sent again.
+# Errors the remote side returned (bad input, app errors) are not retried.
+TRANSIENT_ERRORS = (
+    TimeoutError,
+    ConnectionError,
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+    requests.Timeout,
+    requests.ConnectionError,
+)
+
+
+class CircuitOpenError(Exception):
+    """The dependency is marked unhealthy; the call was not attempted."""
+
+    def __init__(self, name, retry_after):
+        super().__init__(f"{name} circuit is open; retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(Exception):
+    """The call's time budget ran out before an attempt succeeded."""
+
+
+class CircuitBreaker:
+    """Closed → open after ``failure_threshold`` consecutive failures;
+    open → half-open after ``reset_timeout``; one probe decides the rest."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a call may go ahead."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            elapsed = time.monotonic() - self.opened_at
+            if self.state == self.OPEN and elapsed >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                logger.info(f"Circuit {self.name}: half-open, probing")
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            raise CircuitOpenError(self.name, max(0.0, self.reset_timeout - elapsed))
+
+    def record_success(self):
+        with self._lock:
+            self._probing = False
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit {self.name}: closed")
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self._probing = False
+            self.consecutive_failures += 1
+            if (self.state == self.HALF_OPEN
+                    or self.consecutive_failures >= self.failure_threshold):
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit {self.name}: open after {self.consecutive_failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class ResilientCaller:
+    """Deadline, retries, circuit breaker and hedging around one dependency."""
+
+    def __init__(self, name, deadline=30.0, max_attempts=3, backoff=0.5,
+                 failure_threshold=5, reset_timeout=30.0, hedge=False,
+                 hedge_min_samples=20, max_threads=16, retry_on=TRANSIENT_ERRORS):
+        self.name = name
+        self.retry_on = retry_on
+        self.deadline = deadline
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+        self._executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix=name)
+        self._latencies = deque(maxlen=200)
+        self._lock = threading.Lock()
+        self.counters = {
+            'calls': 0,
+            'successes': 0,
+            'failures': 0,
+            'retries': 0,
+            'timeouts': 0,
+            'short_circuits': 0,
+            'hedges': 0,
+            'hedge_wins': 0,
+        }
+
+    def _count(self, counter):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def p95(self):
+        """p95 latency of recent successful attempts, or None if too few."""
+        with self._lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+    def _timed(self, func, args, kwargs):
+        started = time.monotonic()
+        result = func(*args, **kwargs)
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+        return result
+
+    def _attempt(self, func, args, kwargs, deadline_at):
+        """One attempt, possibly hedged. Raises the first error if all fail."""
+        futures = [self._executor.submit(self._timed, func, args, kwargs)]
+        hedge_after = self.p95() if self.hedge else None
+        if hedge_after is not None:
+            remaining = deadline_at - time.monotonic()
+            done, _ = wait(futures, timeout=max(0.0, min(hedge_after, remaining)))
+            if not done and time.monotonic() < deadline_at:
+                self._count('hedges')
+                futures.append(self._executor.submit(self._timed, func, args, kwargs))
+
+        pending = set(futures)
+        error = None
+        while pending:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is not futures[0]:
+                        self._count('hedge_wins')
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                error = error or future.exception()
+        if pending:
+            for future in pending:
+                future.cancel()
+            raise DeadlineExceeded(f"{self.name} call exceeded its {self.deadline:.0f}s deadline")
+        raise error
+
+    def call(self, func, *args, **kwargs):
+        """Run ``func(*args, **kwargs)`` under the caller's policies."""
+        self._count('calls')
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError:
+            self._count('short_circuits')
+            raise
+
+        deadline_at = time.monotonic() + self.deadline
+        for attempt in range(self.max_attempts):
+            try:
+                result = self._attempt(func, args, kwargs, deadline_at)
+            except DeadlineExceeded:
+                self._count('timeouts')
+                self._count('failures')
+                self.breaker.record_failure()
+                raise
+            except Exception as e:
+                remaining = deadline_at - time.monotonic()
+                # Full jitter: sleep anywhere up to the exponential step
+                delay = random.uniform(0, self.backoff * 2 ** attempt)
+                if (not isinstance(e, self.retry_on) or attempt + 1 >= self.max_attempts
+                        or delay >= remaining or self.breaker.state != CircuitBreaker.CLOSED):
+                    # One breaker failure per call, not per attempt
+                    self.breaker.record_failure()
+                    self._count('failures')
+                    raise
+                logger.warning(f"{self.name} attempt {attempt + 1} failed ({e}); retrying in {delay:.2f}s")
+                self._count('retries')
+                time.sleep(delay)
+            else:
+                self.breaker.record_success()
+                self._count('successes')
+                return result
+
+    def stats(self):
+        p95 = self.p95()
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            'state': self.breaker.state,
+            'consecutive_failures': self.breaker.consecutive_failures,
+            'p95_seconds': round(p95, 3) if p95 is not None else None,
+            'deadline_seconds': self.deadline,
+            'hedging': self.hedge,
+            **counters,
+        }
+
+
+_callers = {}
+_callers_lock = threading.Lock()
+
+
+def get_caller(name):
+    """Return the process-wide ResilientCaller for ``name``, configured from
+    the REMOTE_CALL_* settings."""
+    caller = _callers.get(name)
+    if caller is None:
+        with _callers_lock:
+            caller = _callers.get(name)
+            if caller is None:
+                caller = ResilientCaller(
+                    name,
+                    deadline=settings.REMOTE_CALL_DEADLINE_SECONDS,
+                    max_attempts=settings.REMOTE_CALL_MAX_ATTEMPTS,
+                    backoff=settings.REMOTE_CALL_BACKOFF_SECONDS,
+                    failure_threshold=settings.REMOTE_CALL_BREAKER_THRESHOLD,
+                    reset_timeout=settings.REMOTE_CALL_BREAKER_RESET_SECONDS,
+                    hedge=settings.REMOTE_CALL_HEDGE,
+                )
+                _callers[name] = caller
+    return caller
+
+
+def caller_stats():
+    with _callers_lock:
+        return {name: caller.stats() for name, caller in _callers.items()}
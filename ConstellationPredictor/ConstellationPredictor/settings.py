@@ -52,6 +52,7 @@ GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', 'your-gemini-api-key-here')
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'ConstellationPredictor.assets.StaticFilesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -141,6 +142,11 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
+# collectstatic minifies, hashes and precompresses assets, and with DEBUG off
+# StaticFilesMiddleware serves them (ConstellationPredictor.assets). Hashed
+# names are cached for a year; STATIC_MAX_AGE applies to unhashed ones.
+STATIC_SERVE = os.getenv('STATIC_SERVE', 'True') == 'True'
+STATIC_MAX_AGE = int(os.getenv('STATIC_MAX_AGE', 60))
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -148,3 +154,177 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# "annotated" holds result images (Predictor.media_store), content-addressed
+# and served by Predictor.views.result_image. Swap the backend here to keep
+# them elsewhere (any Django storage works).
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'ConstellationPredictor.assets.CompressedManifestStaticFilesStorage',
+    },
+    'annotated': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {
+            'location': MEDIA_ROOT / 'annotated',
+        },
+    },
+}
+# Result images unused for this long are deleted by the cleanup thread
+ANNOTATED_MEDIA_MAX_AGE = int(os.getenv('ANNOTATED_MEDIA_MAX_AGE', 7 * 24 * 3600))
+ANNOTATED_MEDIA_CLEANUP_INTERVAL = int(os.getenv('ANNOTATED_MEDIA_CLEANUP_INTERVAL', 3600))
+# Chatbot speech (chatbot.speech_cache): MP3s are cached on disk by hash of
+# (language, text) and the least recently used are deleted past this size
+TTS_CACHE_DIR = os.getenv('TTS_CACHE_DIR') or MEDIA_ROOT / 'tts'
+TTS_CACHE_MAX_BYTES = int(os.getenv('TTS_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+# Detection backend (Predictor.backends): 'gradio' (HF Space), 'onnx'
+# (local ONNX Runtime YOLOv8, needs LOCAL_MODEL_PATH), 'stub' (deterministic
+# fake results for offline work), or a dotted path to a backend class.
+DETECTION_BACKEND = os.getenv('DETECTION_BACKEND', 'gradio')
+HF_SPACE = os.getenv('HF_SPACE', 'rverma0631/Constellation_YOLO')
+LOCAL_MODEL_PATH = os.getenv('LOCAL_MODEL_PATH', '')
+# With DETECTION_BACKEND='pool': comma-separated endpoints such as
+# "gradio:owner/space-a,gradio:owner/space-b,onnx:/models/yolo.onnx". Each
+# request goes to the healthy endpoint with the lowest latency EWMA.
+DETECTION_POOL = os.getenv('DETECTION_POOL', '')
+DETECTION_POOL_EWMA_ALPHA = float(os.getenv('DETECTION_POOL_EWMA_ALPHA', 0.3))
+# Connect to / load the backend in the background when the server starts
+DETECTION_WARM_UP = os.getenv('DETECTION_WARM_UP', 'True') == 'True'
+
+# Pre-inference normalization (Predictor.preprocess): images are resized so
+# the longest side is DETECTION_INPUT_SIZE (0 = keep full resolution) and
+# re-encoded as JPEG before detection. Grayscale and contrast stretching can
+# help with faint night-sky photos.
+DETECTION_INPUT_SIZE = int(os.getenv('DETECTION_INPUT_SIZE', 640))
+DETECTION_JPEG_QUALITY = int(os.getenv('DETECTION_JPEG_QUALITY', 90))
+DETECTION_GRAYSCALE = os.getenv('DETECTION_GRAYSCALE', 'False') == 'True'
+DETECTION_CONTRAST_STRETCH = os.getenv('DETECTION_CONTRAST_STRETCH', 'False') == 'True'
+
+# Detection result cache (Predictor.cache)
+# Memory tier is always on; set DETECTION_CACHE_DIR to enable the disk tier.
+DETECTION_CACHE_MAX_BYTES = int(os.getenv('DETECTION_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+DETECTION_CACHE_DIR = os.getenv('DETECTION_CACHE_DIR') or None
+DETECTION_CACHE_DISK_MAX_BYTES = int(os.getenv('DETECTION_CACHE_DISK_MAX_BYTES', 512 * 1024 * 1024))
+
+# Thread pool used by async views for sync-only client libraries
+# (ConstellationPredictor.offload)
+OUTBOUND_MAX_THREADS = int(os.getenv('OUTBOUND_MAX_THREADS', 32))
+
+# Near-duplicate frame suppression for live detection (Predictor.dedup)
+# A frame within FRAME_DEDUP_MAX_DISTANCE bits (of 64) of the last inferred
+# frame reuses its result, for at most FRAME_DEDUP_REFRESH_SECONDS.
+FRAME_DEDUP_MAX_DISTANCE = int(os.getenv('FRAME_DEDUP_MAX_DISTANCE', 10))
+FRAME_DEDUP_REFRESH_SECONDS = float(os.getenv('FRAME_DEDUP_REFRESH_SECONDS', 5))
+FRAME_DEDUP_MAX_SESSIONS = int(os.getenv('FRAME_DEDUP_MAX_SESSIONS', 1000))
+
+# WebSocket live detection (Predictor.streaming): frames processed at once
+# per connection; anything beyond this is dropped and reported to the client.
+DETECTION_WS_MAX_IN_FLIGHT = int(os.getenv('DETECTION_WS_MAX_IN_FLIGHT', 2))
+
+# Batch upload endpoint (Predictor.views.process_batch_upload)
+BATCH_UPLOAD_MAX_IMAGES = int(os.getenv('BATCH_UPLOAD_MAX_IMAGES', 100))
+BATCH_UPLOAD_CONCURRENCY = int(os.getenv('BATCH_UPLOAD_CONCURRENCY', 4))
+
+# Remote call resilience (ConstellationPredictor.resilience): every attempt
+# of a call shares one deadline, and only timeouts and connection errors are
+# retried; after REMOTE_CALL_BREAKER_THRESHOLD straight failed calls, calls
+# fail fast until REMOTE_CALL_BREAKER_RESET_SECONDS pass.
+# Hedging sends a duplicate request when an attempt runs past the p95 latency.
+REMOTE_CALL_DEADLINE_SECONDS = float(os.getenv('REMOTE_CALL_DEADLINE_SECONDS', 30))
+REMOTE_CALL_MAX_ATTEMPTS = int(os.getenv('REMOTE_CALL_MAX_ATTEMPTS', 3))
+REMOTE_CALL_BACKOFF_SECONDS = float(os.getenv('REMOTE_CALL_BACKOFF_SECONDS', 0.5))
+REMOTE_CALL_BREAKER_THRESHOLD = int(os.getenv('REMOTE_CALL_BREAKER_THRESHOLD', 5))
+REMOTE_CALL_BREAKER_RESET_SECONDS = float(os.getenv('REMOTE_CALL_BREAKER_RESET_SECONDS', 30))
+REMOTE_CALL_HEDGE = os.getenv('REMOTE_CALL_HEDGE', 'False') == 'True'
+
+# Constellation descriptions (Predictor.descriptions): Gemini answers are
+# fresh for CONSTELLATION_INFO_TTL seconds, then served stale for up to
+# CONSTELLATION_INFO_STALE_TTL more while they're refreshed in the background.
+CONSTELLATION_INFO_TTL = int(os.getenv('CONSTELLATION_INFO_TTL', 30 * 24 * 3600))
+CONSTELLATION_INFO_STALE_TTL = int(os.getenv('CONSTELLATION_INFO_STALE_TTL', 7 * 24 * 3600))
+
+# Gemini gateway (ConstellationPredictor.llm): model and generation settings
+# per purpose. Lower priority values are served first when all
+# LLM_MAX_CONCURRENCY slots are busy; background warming runs at 9.
+LLM_PURPOSES = {
+    'chat': {
+        'model': os.getenv('GEMINI_CHAT_MODEL', 'gemini-3-flash-preview'),
+        'priority': 0,
+        'timeout': 30,
+        'generation': {},
+    },
+    'locator': {
+        'model': os.getenv('GEMINI_LOCATOR_MODEL', 'gemini-3-flash-preview'),
+        'priority': 1,
+        'timeout': 30,
+        'generation': {},
+    },
+    'description': {
+        'model': os.getenv('GEMINI_DESCRIPTION_MODEL', 'gemini-2.0-flash'),
+        'priority': 1,
+        'timeout': 10,
+        'generation': {'temperature': 0.7, 'maxOutputTokens': 150},
+    },
+}
+LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', 8))
+LLM_MAX_ATTEMPTS = int(os.getenv('LLM_MAX_ATTEMPTS', 3))
+LLM_BACKOFF_SECONDS = float(os.getenv('LLM_BACKOFF_SECONDS', 1))
+LLM_TIMEOUT_SECONDS = float(os.getenv('LLM_TIMEOUT_SECONDS', 30))
+
+# Locator (Locator.sky): constellations are placed with a local alt/az
+# computation; only those whose centre is at least LOCATOR_MIN_ALTITUDE
+# degrees up count as visible. Gemini is asked for a short narrative on top
+# unless LOCATOR_NARRATIVE is off (or a request sends "narrative": false).
+LOCATOR_MIN_ALTITUDE = float(os.getenv('LOCATOR_MIN_ALTITUDE', 15))
+LOCATOR_MAX_CONSTELLATIONS = int(os.getenv('LOCATOR_MAX_CONSTELLATIONS', 8))
+LOCATOR_NARRATIVE = os.getenv('LOCATOR_NARRATIVE', 'True') == 'True'
+# Night timeline (/locator/timeline/): night is when the Sun is below
+# LOCATOR_NIGHT_SUN_ALTITUDE (-12 = nautical twilight). Results are cached
+# per LOCATOR_TIMELINE_CELL_DEGREES grid cell and date in the locator cache.
+LOCATOR_NIGHT_SUN_ALTITUDE = float(os.getenv('LOCATOR_NIGHT_SUN_ALTITUDE', -12))
+LOCATOR_TIMELINE_STEP_MINUTES = int(os.getenv('LOCATOR_TIMELINE_STEP_MINUTES', 10))
+LOCATOR_TIMELINE_CELL_DEGREES = float(os.getenv('LOCATOR_TIMELINE_CELL_DEGREES', 0.25))
+LOCATOR_TIMELINE_CACHE_TTL = int(os.getenv('LOCATOR_TIMELINE_CACHE_TTL', 24 * 3600))
+# find_constellations results (Locator.result_cache) are shared by everyone
+# in the same LOCATOR_CACHE_PRECISION-character geohash cell (5 = ~4.9 km)
+# and LOCATOR_CACHE_BUCKET_MINUTES time slot. Results without the Gemini
+# narrative (Gemini unavailable) are kept for LOCATOR_CACHE_FALLBACK_TTL.
+LOCATOR_CACHE_PRECISION = int(os.getenv('LOCATOR_CACHE_PRECISION', 5))
+LOCATOR_CACHE_BUCKET_MINUTES = int(os.getenv('LOCATOR_CACHE_BUCKET_MINUTES', 15))
+LOCATOR_CACHE_TTL = int(os.getenv('LOCATOR_CACHE_TTL', 3600))
+LOCATOR_CACHE_FALLBACK_TTL = int(os.getenv('LOCATOR_CACHE_FALLBACK_TTL', 60))
+# New LocationData and ConstellationQuery rows (Locator.writebehind) are
+# bulk-written in the background every LOCATOR_WRITE_FLUSH_SECONDS, or once
+# LOCATOR_WRITE_BATCH_SIZE are waiting; at most LOCATOR_WRITE_MAX_PENDING are
+# held while the database is unavailable.
+LOCATOR_WRITE_BATCH_SIZE = int(os.getenv('LOCATOR_WRITE_BATCH_SIZE', 200))
+LOCATOR_WRITE_FLUSH_SECONDS = float(os.getenv('LOCATOR_WRITE_FLUSH_SECONDS', 1))
+LOCATOR_WRITE_MAX_PENDING = int(os.getenv('LOCATOR_WRITE_MAX_PENDING', 10000))
+# Nearby observations (/locator/nearby/, Locator.nearby): the search area is
+# covered with at most LOCATOR_NEARBY_MAX_CELLS geohash cells and at most
+# LOCATOR_NEARBY_SCAN_LIMIT recent rows in them are read.
+LOCATOR_NEARBY_RADIUS_KM = float(os.getenv('LOCATOR_NEARBY_RADIUS_KM', 10))
+LOCATOR_NEARBY_MAX_RADIUS_KM = float(os.getenv('LOCATOR_NEARBY_MAX_RADIUS_KM', 100))
+LOCATOR_NEARBY_MAX_CELLS = int(os.getenv('LOCATOR_NEARBY_MAX_CELLS', 16))
+LOCATOR_NEARBY_SCAN_LIMIT = int(os.getenv('LOCATOR_NEARBY_SCAN_LIMIT', 2000))
+# manage.py compact_locator_log deletes queries and locations older than this
+LOCATOR_RETENTION_DAYS = int(os.getenv('LOCATOR_RETENTION_DAYS', 90))
+
+# Caches. "locator" holds Locator results; it is per-process by default. To
+# share it across workers set LOCATOR_CACHE_BACKEND, e.g.
+# django.core.cache.backends.redis.RedisCache with LOCATOR_CACHE_LOCATION
+# redis://host:6379/1, or django.core.cache.backends.db.DatabaseCache with a
+# table name (create it with manage.py createcachetable).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'locator': {
+        'BACKEND': os.getenv('LOCATOR_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('LOCATOR_CACHE_LOCATION', 'locator'),
+        'TIMEOUT': LOCATOR_CACHE_TTL,
+    },
+}
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ConstellationPredictor.settings')
 
 application = get_wsgi_application()
+
+from Predictor.backends import warm_up_backend  # noqa: E402
+
+warm_up_backend()
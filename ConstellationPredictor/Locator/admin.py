@@ -10,11 +10,14 @@ class LocationDataAdmin(admin.ModelAdmin):
 
 @admin.register(ConstellationQuery)
 class ConstellationQueryAdmin(admin.ModelAdmin):
-    list_display = ['location', 'created_at', 'query_text_preview']
-    list_filter = ['created_at']
-    readonly_fields = ['created_at']
-    search_fields = ['query_text', 'location__user__username']
+    list_display = ['location', 'created_at', 'prompt_template', 'response_preview']
+    list_filter = ['created_at', 'prompt_template']
+    list_select_related = ['location', 'response']
+    raw_id_fields = ['location', 'response']
+    readonly_fields = ['created_at', 'query_text', 'gemini_response']
+    search_fields = ['response__text', 'location__user__username']
     
-    def query_text_preview(self, obj):
-        return obj.query_text[:50] + "..." if len(obj.query_text) > 50 else obj.query_text
-    query_text_preview.short_description = "Query Preview"
\ No newline at end of file
+    def response_preview(self, obj):
+        text = obj.response.text
+        return text[:50] + "..." if len(text) > 50 else text
+    response_preview.short_description = "Response Preview"
\ No newline at end of file
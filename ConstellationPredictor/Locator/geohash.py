@@ -0,0 +1,96 @@
+"""
+Geohash encoding (https://en.wikipedia.org/wiki/Geohash).
+
+A geohash names a lat/lng cell; each extra character splits the cell into
+32, so precision 5 is about 4.9 x 4.9 km and precision 6 about 1.2 x 0.6 km.
+Points in the same cell share a prefix, which makes geohashes usable as
+cache keys for "the same place", and ``covering`` turns a search area into
+a short list of cells to look up in an indexed geohash column.
+"""
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+DECODE = {c: i for i, c in enumerate(BASE32)}
+
+
+def encode(latitude, longitude, precision=5):
+    """Geohash of a point, ``precision`` characters long."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # Bits alternate longitude, latitude, starting with longitude
+    while len(chars) < precision:
+        span, coordinate = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (span[0] + span[1]) / 2
+        value <<= 1
+        if coordinate >= mid:
+            value |= 1
+            span[0] = mid
+        else:
+            span[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = value = 0
+    return ''.join(chars)
+
+
+def bounds(geohash):
+    """(south, west, north, east) of a geohash cell."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+    for c in geohash.lower():
+        value = DECODE[c]
+        for shift in range(4, -1, -1):
+            span = lng_range if even else lat_range
+            mid = (span[0] + span[1]) / 2
+            if value >> shift & 1:
+                span[0] = mid
+            else:
+                span[1] = mid
+            even = not even
+    return lat_range[0], lng_range[0], lat_range[1], lng_range[1]
+
+
+def decode(geohash):
+    """Centre (latitude, longitude) of a geohash cell."""
+    south, west, north, east = bounds(geohash)
+    return (south + north) / 2, (west + east) / 2
+
+
+def cell_size(precision):
+    """(height, width) in degrees of cells at ``precision``."""
+    bits = 5 * precision
+    return 180.0 / 2 ** (bits // 2), 360.0 / 2 ** ((bits + 1) // 2)
+
+
+def covering_count(south, west, north, east, precision):
+    """Upper bound on the number of cells ``covering`` returns."""
+    height, width = cell_size(precision)
+    return (int((north - south) / height) + 2) * (int((east - west) / width) + 2)
+
+
+def covering(south, west, north, east, precision):
+    """
+    Geohashes of every cell at ``precision`` that overlaps a lat/lng box.
+    For boxes across the antimeridian ``west`` and ``east`` may run past
+    +/-180 (for example 170 to 190).
+    """
+    height, width = cell_size(precision)
+    south, north = max(south, -90.0), min(north, 90.0)
+    cells = set()
+    lat = south
+    while True:
+        lng = west
+        while True:
+            cells.add(encode(lat, (lng + 180.0) % 360.0 - 180.0, precision))
+            if lng >= east:
+                break
+            lng = min(lng + width, east)
+        if lat >= north:
+            break
+        lat = min(lat + height, north)
+    return cells
@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from Locator.models import GEOHASH_PRECISIONS, LocationData
+
+
+class Command(BaseCommand):
+    help = "Fill the geohash columns of locations saved before they existed"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows updated per statement (each batch is its own transaction)',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.0,
+            help='Seconds to sleep between batches',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recompute every row, not just those without geohashes',
+        )
+
+    def handle(self, *args, **options):
+        fields = [f'geohash_{p}' for p in GEOHASH_PRECISIONS]
+        rows = LocationData.objects.order_by('pk').only('pk', 'latitude', 'longitude', *fields)
+        if not options['all']:
+            rows = rows.filter(geohash_6='')
+        updated = 0
+        last_pk = 0
+        while True:
+            # Walk by primary key so each batch is a short index range scan
+            batch = list(rows.filter(pk__gt=last_pk)[:options['batch_size']])
+            if not batch:
+                break
+            for location in batch:
+                location.set_geohashes()
+            LocationData.objects.bulk_update(batch, fields)
+            updated += len(batch)
+            last_pk = batch[-1].pk
+            if options['pause']:
+                time.sleep(options['pause'])
+        self.stdout.write(self.style.SUCCESS(f"Updated geohashes for {updated} locations"))
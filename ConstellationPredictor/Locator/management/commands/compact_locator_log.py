@@ -0,0 +1,76 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from Locator.models import ConstellationQuery, LocationData, ResponseText
+
+# Responses newer than this are left alone even when unreferenced: a
+# write-behind flush may be about to insert the query that points at one
+RESPONSE_GRACE = timedelta(hours=1)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete Locator queries and locations older than the retention period, "
+        "and responses no query uses, in small batches"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.LOCATOR_RETENTION_DAYS,
+            help='Keep queries and locations from the last this many days',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows deleted per statement (each batch is its own transaction)',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.1,
+            help='Seconds to sleep between batches, to leave room for other writers',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count what would be deleted',
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        cutoff = now - timedelta(days=options['days'])
+        steps = [
+            ('queries', ConstellationQuery.objects.filter(created_at__lt=cutoff)),
+            ('locations', LocationData.objects.filter(
+                created_at__lt=cutoff, constellationquery__isnull=True,
+            )),
+            ('responses', ResponseText.objects.filter(
+                created_at__lt=now - RESPONSE_GRACE, queries__isnull=True,
+            )),
+        ]
+        for label, queryset in steps:
+            if options['dry_run']:
+                self.stdout.write(f"Would delete {queryset.count()} {label}")
+                continue
+            deleted = self.delete_in_batches(queryset, options['batch_size'], options['pause'])
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} {label}"))
+
+    def delete_in_batches(self, queryset, batch_size, pause):
+        """Delete by primary key a batch at a time, oldest first, so no lock is held for long."""
+        model = queryset.model
+        deleted = 0
+        while True:
+            pks = list(queryset.order_by('created_at').values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                return deleted
+            model.objects.filter(pk__in=pks).delete()
+            deleted += len(pks)
+            if pause:
+                time.sleep(pause)
@@ -0,0 +1,43 @@
+import uuid
+
+from django.db import migrations, models
+
+
+def fill_public_ids(apps, schema_editor):
+    for model_name in ('LocationData', 'ConstellationQuery'):
+        model = apps.get_model('Locator', model_name)
+        rows = list(model.objects.only('pk'))
+        for row in rows:
+            row.public_id = uuid.uuid4()
+        model.objects.bulk_update(rows, ['public_id'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Locator', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='locationdata',
+            name='public_id',
+            field=models.UUIDField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='constellationquery',
+            name='public_id',
+            field=models.UUIDField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_public_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='locationdata',
+            name='public_id',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='constellationquery',
+            name='public_id',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
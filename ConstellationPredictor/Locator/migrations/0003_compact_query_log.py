@@ -0,0 +1,74 @@
+import hashlib
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def compact_queries(apps, schema_editor):
+    """Move full prompts to the legacy template and responses to ResponseText."""
+    ConstellationQuery = apps.get_model('Locator', 'ConstellationQuery')
+    ResponseText = apps.get_model('Locator', 'ResponseText')
+    rows = ConstellationQuery.objects.order_by('pk').only('pk', 'query_text', 'gemini_response')
+    last_pk = 0
+    while True:
+        batch = list(rows.filter(pk__gt=last_pk)[:BATCH_SIZE])
+        if not batch:
+            return
+        for row in batch:
+            row.prompt_template = 'legacy'
+            row.prompt_params = {'text': row.query_text}
+            row.response_id = hashlib.sha256(row.gemini_response.encode('utf-8')).hexdigest()
+        save_batch(ResponseText, ConstellationQuery, batch)
+        last_pk = batch[-1].pk
+
+
+def save_batch(ResponseText, ConstellationQuery, batch):
+    texts = {row.response_id: row.gemini_response for row in batch}
+    ResponseText.objects.bulk_create(
+        [ResponseText(sha256=sha256, text=text) for sha256, text in texts.items()],
+        ignore_conflicts=True,
+    )
+    ConstellationQuery.objects.bulk_update(batch, ['prompt_template', 'prompt_params', 'response'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Locator', '0002_public_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResponseText',
+            fields=[
+                ('sha256', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('text', models.TextField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='constellationquery',
+            name='prompt_template',
+            field=models.CharField(default='legacy', max_length=32),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='constellationquery',
+            name='prompt_params',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name='constellationquery',
+            name='response',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='queries',
+                to='Locator.responsetext',
+            ),
+        ),
+        migrations.RunPython(compact_queries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Separate from 0003: PostgreSQL can't alter a table with pending
+    # deferred foreign key checks from the data migration's updates
+
+    dependencies = [
+        ('Locator', '0003_compact_query_log'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='constellationquery',
+            name='query_text',
+        ),
+        migrations.RemoveField(
+            model_name='constellationquery',
+            name='gemini_response',
+        ),
+        migrations.AlterField(
+            model_name='constellationquery',
+            name='response',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='queries',
+                to='Locator.responsetext',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='constellationquery',
+            name='location',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to='Locator.locationdata',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='locationdata',
+            index=models.Index(fields=['-created_at'], name='locator_location_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='locationdata',
+            index=models.Index(fields=['user', '-created_at'], name='locator_location_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='constellationquery',
+            index=models.Index(fields=['-created_at'], name='locator_query_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='constellationquery',
+            index=models.Index(fields=['location', '-created_at'], name='locator_query_location_idx'),
+        ),
+    ]
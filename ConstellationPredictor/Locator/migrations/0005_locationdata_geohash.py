@@ -0,0 +1,48 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Existing rows get empty geohashes; fill them with manage.py backfill_geohash
+
+    dependencies = [
+        ('Locator', '0004_query_log_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='locationdata',
+            name='geohash_3',
+            field=models.CharField(default='', editable=False, max_length=3),
+        ),
+        migrations.AddField(
+            model_name='locationdata',
+            name='geohash_4',
+            field=models.CharField(default='', editable=False, max_length=4),
+        ),
+        migrations.AddField(
+            model_name='locationdata',
+            name='geohash_5',
+            field=models.CharField(default='', editable=False, max_length=5),
+        ),
+        migrations.AddField(
+            model_name='locationdata',
+            name='geohash_6',
+            field=models.CharField(default='', editable=False, max_length=6),
+        ),
+        migrations.AddIndex(
+            model_name='locationdata',
+            index=models.Index(fields=['geohash_3', '-created_at'], name='locator_location_geohash3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='locationdata',
+            index=models.Index(fields=['geohash_4', '-created_at'], name='locator_location_geohash4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='locationdata',
+            index=models.Index(fields=['geohash_5', '-created_at'], name='locator_location_geohash5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='locationdata',
+            index=models.Index(fields=['geohash_6', '-created_at'], name='locator_location_geohash6_idx'),
+        ),
+    ]
@@ -1,30 +1,96 @@
 # models.py
+import hashlib
+import uuid
+
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
 
+from . import geohash
+from .prompts import render_prompt
+
+# Geohash columns kept on LocationData, coarsest (~156 km) to finest (~1.2 km)
+GEOHASH_PRECISIONS = (3, 4, 5, 6)
+
 class LocationData(models.Model):
+    # Assigned in the app so callers get an ID before the row is written
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
     latitude = models.FloatField()
     longitude = models.FloatField()
-    accuracy = models.FloatField(default=0) 
+    accuracy = models.FloatField(default=0)
     created_at = models.DateTimeField(default=timezone.now)
-    
+    # Spatial index (Locator.nearby): the point's geohash at each precision.
+    # Set by save(); bulk writers call set_geohashes() themselves.
+    geohash_3 = models.CharField(max_length=3, default='', editable=False)
+    geohash_4 = models.CharField(max_length=4, default='', editable=False)
+    geohash_5 = models.CharField(max_length=5, default='', editable=False)
+    geohash_6 = models.CharField(max_length=6, default='', editable=False)
+
     class Meta:
         ordering = ['-created_at']
-        
+        indexes = [
+            models.Index(fields=['-created_at'], name='locator_location_created_idx'),
+            models.Index(fields=['user', '-created_at'], name='locator_location_user_idx'),
+        ] + [
+            models.Index(fields=[f'geohash_{p}', '-created_at'], name=f'locator_location_geohash{p}_idx')
+            for p in GEOHASH_PRECISIONS
+        ]
+
     def __str__(self):
         return f"Location ({self.latitude}, {self.longitude}) - {self.created_at}"
 
+    def set_geohashes(self):
+        cell = geohash.encode(float(self.latitude), float(self.longitude), max(GEOHASH_PRECISIONS))
+        for p in GEOHASH_PRECISIONS:
+            setattr(self, f'geohash_{p}', cell[:p])
+
+    def save(self, *args, **kwargs):
+        self.set_geohashes()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {f'geohash_{p}' for p in GEOHASH_PRECISIONS}
+        super().save(*args, **kwargs)
+
+class ResponseText(models.Model):
+    """A model reply, stored once however many queries received it."""
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    text = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    @classmethod
+    def for_text(cls, text):
+        """Unsaved instance keyed by the text's hash."""
+        return cls(sha256=hashlib.sha256(text.encode('utf-8')).hexdigest(), text=text)
+
+    def __str__(self):
+        return self.text[:50]
+
 class ConstellationQuery(models.Model):
-    location = models.ForeignKey(LocationData, on_delete=models.CASCADE)
-    query_text = models.TextField() 
-    gemini_response = models.TextField()  
-    visible_constellations = models.JSONField(default=list) 
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    # Covered by the (location, -created_at) index
+    location = models.ForeignKey(LocationData, on_delete=models.CASCADE, db_index=False)
+    # The prompt as a Locator.prompts template ID and its parameters
+    prompt_template = models.CharField(max_length=32)
+    prompt_params = models.JSONField(default=dict)
+    response = models.ForeignKey(ResponseText, on_delete=models.PROTECT, related_name='queries')
+    visible_constellations = models.JSONField(default=list)
     created_at = models.DateTimeField(default=timezone.now)
-    
+
     class Meta:
         ordering = ['-created_at']
-        
+        indexes = [
+            models.Index(fields=['-created_at'], name='locator_query_created_idx'),
+            models.Index(fields=['location', '-created_at'], name='locator_query_location_idx'),
+        ]
+
     def __str__(self):
-        return f"Query for {self.location} - {self.created_at}"
\ No newline at end of file
+        return f"Query for {self.location} - {self.created_at}"
+
+    @property
+    def query_text(self):
+        return render_prompt(self.prompt_template, self.prompt_params)
+
+    @property
+    def gemini_response(self):
+        return self.response.text
@@ -0,0 +1,98 @@
+"""
+Recent observations near a point.
+
+The search circle's bounding box is covered with geohash cells at the
+finest precision that needs at most LOCATOR_NEARBY_MAX_CELLS of them. Rows
+are then read through the (geohash_N, -created_at) index for just those
+cells. That is an equality lookup, so it behaves the same on SQLite and
+PostgreSQL and stays fast however large the table gets. At most
+LOCATOR_NEARBY_SCAN_LIMIT candidates are read, newest first. They are
+filtered to the exact circle and ordered by distance, and each one is
+joined with the constellations its latest query found.
+
+Positions are reported as the centre of the observation's precision-6 cell
+(about 1 km), never the stored coordinates.
+"""
+
+import math
+from collections import Counter
+
+from django.conf import settings
+
+from . import geohash
+from .models import GEOHASH_PRECISIONS, ConstellationQuery, LocationData
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def search_cells(latitude, longitude, radius_km, max_cells):
+    """(precision, geohashes) covering the circle, finest precision that fits ``max_cells``."""
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    south, north = latitude - d_lat, latitude + d_lat
+    if south <= -90 or north >= 90:
+        # Circle contains a pole: every longitude
+        west, east = -180.0, 180.0
+    else:
+        widest = max(abs(south), abs(north))
+        d_lng = min(180.0, d_lat / math.cos(math.radians(widest)))
+        west, east = longitude - d_lng, longitude + d_lng
+    for precision in sorted(GEOHASH_PRECISIONS, reverse=True):
+        if geohash.covering_count(south, west, north, east, precision) <= max_cells:
+            break
+    return precision, geohash.covering(south, west, north, east, precision)
+
+
+def find_nearby(latitude, longitude, radius_km, since, limit):
+    precision, cells = search_cells(latitude, longitude, radius_km, settings.LOCATOR_NEARBY_MAX_CELLS)
+    candidates = (
+        LocationData.objects
+        .filter(**{f'geohash_{precision}__in': cells}, created_at__gte=since)
+        .order_by('-created_at')
+        .values('id', 'latitude', 'longitude', 'geohash_6', 'created_at')
+        [:settings.LOCATOR_NEARBY_SCAN_LIMIT]
+    )
+
+    matches = []
+    for row in candidates:
+        distance = haversine_km(latitude, longitude, row['latitude'], row['longitude'])
+        if distance <= radius_km:
+            matches.append((distance, row))
+    matches.sort(key=lambda match: match[0])
+    matches = matches[:limit]
+
+    # Latest query per location, through the (location, -created_at) index
+    visible = {}
+    queries = (
+        ConstellationQuery.objects
+        .filter(location_id__in=[row['id'] for _, row in matches])
+        .order_by('location_id', '-created_at')
+        .values_list('location_id', 'visible_constellations')
+    )
+    for location_id, constellations in queries:
+        visible.setdefault(location_id, constellations)
+
+    observations = []
+    for distance, row in matches:
+        cell_lat, cell_lng = geohash.decode(row['geohash_6'])
+        observations.append({
+            'distance_km': round(distance, 1),
+            'latitude': round(cell_lat, 3),
+            'longitude': round(cell_lng, 3),
+            'observed_at': row['created_at'].isoformat(),
+            'visible_constellations': visible.get(row['id'], []),
+        })
+    counts = Counter(name for o in observations for name in o['visible_constellations'])
+    return {
+        'precision': precision,
+        'cells': len(cells),
+        'observations': observations,
+        'constellations': [{'name': name, 'observers': n} for name, n in counts.most_common()],
+    }
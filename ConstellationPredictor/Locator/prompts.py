@@ -0,0 +1,48 @@
+"""
+Prompt templates for the Locator's Gemini calls.
+
+The narrative prompt is nearly the same every time, so ConstellationQuery
+stores a template ID and its parameters instead of the rendered text, and
+``render_prompt`` rebuilds the prompt when it is needed. A template is
+never edited in place. A changed prompt gets a new ID, so old rows still
+render as they were sent.
+"""
+
+# Rows from before templates: the whole prompt is the "text" parameter
+LEGACY = 'legacy'
+NARRATIVE = 'narrative-v1'
+
+PROMPT_TEMPLATES = {
+    LEGACY: '{text}',
+    NARRATIVE: """
+    Location: Latitude {latitude:.2f}, Longitude {longitude:.2f}
+    Date and time (UTC): {time}
+
+    These constellations are above the horizon right now (compass direction, altitude):
+    {listing}
+
+    In 2-3 sentences, tell the user roughly where they are based on the location, and
+    which of these constellations to look for first and how to spot it.
+    Keep it simple and practical for someone using a phone compass.
+    Format: Just plain text, no special formatting or symbols.
+    """,
+}
+
+
+def narrative_params(latitude, longitude, when, constellations):
+    return {
+        'latitude': latitude,
+        'longitude': longitude,
+        'time': when.strftime('%Y-%m-%d %H:%M'),
+        'constellations': [[c['name'], c['direction'], c['altitude']] for c in constellations],
+    }
+
+
+def render_prompt(template_id, params):
+    params = dict(params)
+    if 'constellations' in params:
+        params['listing'] = '\n'.join(
+            f"- {name}: {direction}, {altitude:.0f} degrees above the horizon"
+            for name, direction, altitude in params['constellations']
+        )
+    return PROMPT_TEMPLATES[template_id].format(**params)
@@ -0,0 +1,133 @@
+"""
+Shared cache of find_constellations results.
+
+Everyone in the same geohash cell (LOCATOR_CACHE_PRECISION characters) in
+the same LOCATOR_CACHE_BUCKET_MINUTES slot sees the same sky, so the
+result is computed once, at the cell centre and the middle of the slot,
+and reused. That covers the sky positions and the Gemini narrative; each
+request still records its own ConstellationQuery. Entries live in the
+"locator" cache alias (see CACHES in settings); point it at Redis or the
+database cache to share them across workers. Concurrent misses for one key
+in a process share a single computation.
+
+Hits and misses are counted per process and, through the cache backend,
+across all workers.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import caches
+
+from Predictor.descriptions import SingleFlight
+
+from . import geohash
+
+COUNTER_KEY = 'locator:sky:stats:{}'
+
+
+@dataclass(frozen=True)
+class SkyCell:
+    key: str
+    geohash: str
+    latitude: float
+    longitude: float
+    when: datetime
+
+
+class SkyResultCache:
+    def __init__(self, backend, precision, bucket_minutes, ttl, fallback_ttl):
+        self.backend = backend
+        self.precision = precision
+        self.bucket_seconds = bucket_minutes * 60
+        self.ttl = ttl
+        self.fallback_ttl = fallback_ttl
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def cell(self, latitude, longitude, when, variant=''):
+        """The cache cell holding a place and moment; ``variant`` separates result kinds."""
+        cell = geohash.encode(latitude, longitude, self.precision)
+        bucket = int(when.timestamp() // self.bucket_seconds)
+        cell_lat, cell_lng = geohash.decode(cell)
+        middle = datetime.fromtimestamp((bucket + 0.5) * self.bucket_seconds, dt_timezone.utc)
+        return SkyCell(
+            key=f"locator:sky:{cell}:{bucket}:{variant}",
+            geohash=cell,
+            latitude=round(cell_lat, 6),
+            longitude=round(cell_lng, 6),
+            when=middle,
+        )
+
+    def get_or_compute(self, cell, compute):
+        """
+        Return (result, hit). On a miss ``compute(cell)`` runs and its result
+        is stored; it returns (result, fallback), and fallback results
+        (Gemini unavailable) are kept only for the short fallback TTL.
+        """
+        result = self.backend.get(cell.key)
+        if result is not None:
+            self._count('hits')
+            return result, True
+        self._count('misses')
+        return self._flight.do(cell.key, lambda: self._fill(cell, compute)), False
+
+    def _fill(self, cell, compute):
+        # Another worker may have filled it while this one was queued
+        result = self.backend.get(cell.key)
+        if result is not None:
+            return result
+        result, fallback = compute(cell)
+        self.backend.set(cell.key, result, self.fallback_ttl if fallback else self.ttl)
+        return result
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+        key = COUNTER_KEY.format(counter)
+        try:
+            self.backend.incr(key)
+        except ValueError:
+            self.backend.add(key, 0, timeout=None)
+            self.backend.incr(key)
+
+    def stats(self):
+        with self._lock:
+            local = {'hits': self.hits, 'misses': self.misses}
+        shared = {
+            counter: self.backend.get(COUNTER_KEY.format(counter), 0)
+            for counter in ('hits', 'misses')
+        }
+        for counts in (local, shared):
+            lookups = counts['hits'] + counts['misses']
+            counts['hit_rate'] = round(counts['hits'] / lookups, 3) if lookups else None
+        return {
+            'precision': self.precision,
+            'bucket_minutes': self.bucket_seconds // 60,
+            'ttl': self.ttl,
+            'process': local,
+            'shared': shared,
+        }
+
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = SkyResultCache(
+                    backend=caches['locator'],
+                    precision=settings.LOCATOR_CACHE_PRECISION,
+                    bucket_minutes=settings.LOCATOR_CACHE_BUCKET_MINUTES,
+                    ttl=settings.LOCATOR_CACHE_TTL,
+                    fallback_ttl=settings.LOCATOR_CACHE_FALLBACK_TTL,
+                )
+    return _result_cache
@@ -0,0 +1,251 @@
+"""
+Where the constellations are in the local sky, computed in-process.
+
+Positions come from Locator.sky_catalog. The local sidereal time for a
+place and moment fixes the sky's rotation. One vectorized alt/az transform
+then covers every centroid and boundary vertex at once (about 1,500
+points), so a lookup takes a fraction of a millisecond and needs no network
+call. ``timeline`` does the same for a whole night, with one
+(steps x constellations) array. Precession since J2000 and atmospheric
+refraction are ignored: both are under a degree, far finer than the
+compass points shown to users.
+"""
+
+import math
+import threading
+
+import numpy as np
+
+from .sky_catalog import SKY_CATALOG
+
+COMPASS_POINTS = [
+    'North', 'Northeast', 'East', 'Southeast', 'South', 'Southwest', 'West', 'Northwest',
+]
+SIDEREAL_DEGREES_PER_DAY = 360.98564736629
+# Above this altitude the compass direction stops being useful; look up
+OVERHEAD_ALTITUDE = 75
+# Well-known constellations, listed ahead of fainter ones at similar heights
+PROMINENT = {
+    'Andromeda', 'Aquarius', 'Aquila', 'Aries', 'Auriga', 'Boötes', 'Cancer',
+    'Canis Major', 'Canis Minor', 'Capricornus', 'Carina', 'Cassiopeia', 'Centaurus',
+    'Cepheus', 'Corona Borealis', 'Crux', 'Cygnus', 'Draco', 'Gemini', 'Hercules',
+    'Leo', 'Libra', 'Lyra', 'Ophiuchus', 'Orion', 'Pegasus', 'Perseus', 'Pisces',
+    'Sagittarius', 'Scorpius', 'Taurus', 'Ursa Major', 'Ursa Minor', 'Virgo',
+}
+
+
+def julian_date(when):
+    """Julian date of an aware datetime."""
+    return when.timestamp() / 86400.0 + 2440587.5
+
+
+def sidereal_time(jd, longitude):
+    """
+    Local mean sidereal time in degrees (IAU 1982 GMST) for Julian dates
+    (scalar or array), east longitude positive.
+    """
+    days = np.asarray(jd) - 2451545.0
+    centuries = days / 36525
+    gmst = (
+        280.46061837
+        + SIDEREAL_DEGREES_PER_DAY * days
+        + 0.000387933 * centuries ** 2
+        - centuries ** 3 / 38710000
+    )
+    return (gmst + longitude) % 360
+
+
+def local_sidereal_time(when, longitude):
+    return float(sidereal_time(julian_date(when), longitude))
+
+
+def sun_position(jd):
+    """Apparent RA and Dec of the Sun in degrees (low precision, ~0.01 degrees)."""
+    days = np.asarray(jd) - 2451545.0
+    mean_longitude = 280.460 + 0.9856474 * days
+    anomaly = np.radians(357.528 + 0.9856003 * days)
+    ecliptic_longitude = np.radians(
+        mean_longitude + 1.915 * np.sin(anomaly) + 0.020 * np.sin(2 * anomaly)
+    )
+    obliquity = np.radians(23.439 - 0.0000004 * days)
+    ra = np.degrees(np.arctan2(
+        np.cos(obliquity) * np.sin(ecliptic_longitude), np.cos(ecliptic_longitude)
+    )) % 360
+    dec = np.degrees(np.arcsin(np.sin(obliquity) * np.sin(ecliptic_longitude)))
+    return ra, dec
+
+
+def altaz(ra, dec, latitude, lst):
+    """
+    Altitude and azimuth in degrees for RA/Dec in degrees (scalars or arrays,
+    broadcast against ``lst``). Azimuth runs from north through east.
+    """
+    hour_angle = np.radians(np.subtract(lst, ra))
+    dec = np.radians(dec)
+    lat = math.radians(latitude)
+    sin_dec, cos_dec = np.sin(dec), np.cos(dec)
+    cos_ha = np.cos(hour_angle)
+    sin_alt = sin_dec * math.sin(lat) + cos_dec * math.cos(lat) * cos_ha
+    altitude = np.arcsin(np.clip(sin_alt, -1.0, 1.0))
+    azimuth = np.arctan2(
+        -cos_dec * np.sin(hour_angle),
+        sin_dec * math.cos(lat) - cos_dec * math.sin(lat) * cos_ha,
+    )
+    return np.degrees(altitude), np.degrees(azimuth) % 360
+
+
+def compass_point(azimuth, altitude=None):
+    """Nearest of the eight compass points, or 'Overhead' near the zenith."""
+    if altitude is not None and altitude >= OVERHEAD_ALTITUDE:
+        return 'Overhead'
+    return COMPASS_POINTS[int((azimuth + 22.5) // 45) % 8]
+
+
+class SkyEngine:
+    def __init__(self, catalog):
+        self.names = list(catalog)
+        vertices = [catalog[name][1] for name in self.names]
+        counts = np.array([len(v) for v in vertices])
+        self.vertex_starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        self.vertex_counts = counts
+        centroids = np.array([catalog[name][0] for name in self.names], dtype=float)
+        # Centroids first, then every boundary vertex, so one transform does all
+        self.points = np.vstack([centroids, np.array([p for v in vertices for p in v], dtype=float)])
+        self.ra = self.points[:, 0]
+        self.dec = self.points[:, 1]
+
+    def positions(self, latitude, longitude, when):
+        """
+        Per constellation (in catalog order): centroid altitude and azimuth,
+        the highest boundary vertex altitude, and the fraction of boundary
+        vertices above the horizon.
+        """
+        altitude, azimuth = altaz(self.ra, self.dec, latitude, local_sidereal_time(when, longitude))
+        n = len(self.names)
+        vertex_alt = altitude[n:]
+        highest = np.maximum.reduceat(vertex_alt, self.vertex_starts)
+        above = np.add.reduceat(vertex_alt > 0, self.vertex_starts) / self.vertex_counts
+        return altitude[:n], azimuth[:n], highest, above
+
+    def visible(self, latitude, longitude, when, min_altitude=0.0):
+        """Constellations whose centroid is at least ``min_altitude`` up, highest first."""
+        altitude, azimuth, highest, above = self.positions(latitude, longitude, when)
+        visible = []
+        for i in np.argsort(-altitude):
+            if altitude[i] < min_altitude:
+                break
+            visible.append({
+                'name': self.names[i],
+                'altitude': round(float(altitude[i]), 1),
+                'azimuth': round(float(azimuth[i]), 1),
+                'direction': compass_point(azimuth[i], altitude[i]),
+                'highest_altitude': round(float(highest[i]), 1),
+                'above_horizon': round(float(above[i]), 2),
+            })
+        return visible
+
+    def timeline(self, latitude, longitude, start, end, step_minutes, min_altitude, night_altitude):
+        """
+        Alt/az of every centroid at each ``step_minutes`` from ``start`` to
+        ``end`` (aware datetimes), computed as one (steps x 88) array.
+
+        Returns epoch-second times: the night (Sun below ``night_altitude``),
+        and per constellation its rise, set and transit within the span and
+        its viewing windows, the dark stretches when it is at least
+        ``min_altitude`` up. ``series`` holds the raw altitude/azimuth grid.
+        """
+        step = step_minutes * 60
+        times = np.arange(start.timestamp(), end.timestamp() + 1, step)
+        jd = times / 86400.0 + 2440587.5
+        lst = sidereal_time(jd, longitude)
+        n = len(self.names)
+        ra, dec = self.ra[:n], self.dec[:n]
+        altitude, azimuth = altaz(ra[np.newaxis, :], dec[np.newaxis, :], latitude, lst[:, np.newaxis])
+        sun_ra, sun_dec = sun_position(jd)
+        sun_altitude, _ = altaz(sun_ra, sun_dec, latitude, lst)
+        dark = sun_altitude < night_altitude
+
+        # Horizon crossings, interpolated between steps
+        up = altitude > 0
+        rises = crossings(times, altitude, ~up[:-1] & up[1:])
+        sets = crossings(times, altitude, up[:-1] & ~up[1:])
+
+        # Transit is when the hour angle is zero; the first one in the span
+        transit = times[0] + ((ra - lst[0]) % 360) / SIDEREAL_DEGREES_PER_DAY * 86400
+        transit_altitude = 90 - np.abs(latitude - dec)
+
+        # Viewing windows: runs of steps that are dark with the centroid high enough
+        good = dark[:, np.newaxis] & (altitude >= min_altitude)
+        edges = np.diff(np.pad(good.astype(np.int8), ((1, 1), (0, 0))), axis=0).T
+        window_starts = np.nonzero(edges == 1)
+        window_ends = np.nonzero(edges == -1)
+        windows = [[] for _ in range(n)]
+        for c, first, last in zip(window_starts[0], window_starts[1], window_ends[1]):
+            windows[c].append((float(times[first]), float(times[last - 1])))
+        best = np.argmax(np.where(good, altitude, -np.inf), axis=0)
+
+        constellations = []
+        for i, name in enumerate(self.names):
+            b = best[i]
+            constellations.append({
+                'name': name,
+                'rise': rises.get(i),
+                'set': sets.get(i),
+                'transit': float(transit[i]) if transit[i] <= times[-1] else None,
+                'transit_altitude': round(float(transit_altitude[i]), 1),
+                'circumpolar': bool(up[:, i].all()),
+                'never_rises': bool(not up[:, i].any()),
+                'windows': windows[i],
+                'best': {
+                    'time': float(times[b]),
+                    'altitude': round(float(altitude[b, i]), 1),
+                    'azimuth': round(float(azimuth[b, i]), 1),
+                    'direction': compass_point(azimuth[b, i], altitude[b, i]),
+                } if good[b, i] else None,
+            })
+
+        dark_steps = np.nonzero(dark)[0]
+        return {
+            'night': {
+                'start': float(times[dark_steps[0]]),
+                'end': float(times[dark_steps[-1]]),
+            } if len(dark_steps) else None,
+            'constellations': constellations,
+            'series': {
+                'times': times,
+                'altitude': altitude,
+                'azimuth': azimuth,
+                'sun_altitude': sun_altitude,
+            },
+        }
+
+
+def crossings(times, altitude, mask):
+    """First crossing of the horizon per constellation index, as epoch seconds."""
+    steps, columns = np.nonzero(mask)
+    before = altitude[steps, columns]
+    after = altitude[steps + 1, columns]
+    fraction = before / (before - after)
+    when = times[steps] + fraction * (times[1] - times[0])
+    first = {}
+    for column, t in zip(columns, when):
+        first.setdefault(int(column), float(t))
+    return first
+
+
+def pick_constellations(visible, limit):
+    """Up to ``limit`` of ``visible``, well-known ones first, each group by altitude."""
+    return sorted(visible, key=lambda c: c['name'] not in PROMINENT)[:limit]
+
+
+_sky_engine = None
+_sky_engine_lock = threading.Lock()
+
+
+def get_sky_engine():
+    global _sky_engine
+    if _sky_engine is None:
+        with _sky_engine_lock:
+            if _sky_engine is None:
+                _sky_engine = SkyEngine(SKY_CATALOG)
+    return _sky_engine
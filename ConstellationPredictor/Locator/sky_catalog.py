@@ -0,0 +1,585 @@
+"""
+Positions of the 88 IAU constellations, J2000 degrees.
+
+Each entry is ``name: ((centroid RA, centroid Dec), [(RA, Dec), ...])``. The
+points are the corner vertices of the official IAU boundaries (Delporte 1930,
+as tabulated by Roman 1987, CDS VI/42), precessed from B1875 to J2000. The
+centroid is the area-weighted mean direction of the region. Names match
+Predictor.constellations.
+"""
+
+SKY_CATALOG = {
+    'Andromeda': (
+        (10.13, 40.47),
+        [(3.74, 21.69), (14.41, 21.67), (2.61, 22.69), (3.74, 22.69), (12.41, 24.43),
+         (14.42, 24.42), (1.61, 28.69), (2.61, 28.69), (1.61, 32.03), (357.83, 32.03),
+         (354.05, 32.77), (357.83, 32.78), (12.44, 33.68), (22.9, 33.64), (344.47, 35.17),
+         (354.05, 35.19), (22.91, 35.64), (31.85, 35.59), (31.87, 37.34), (39.68, 37.29),
+         (4.14, 46.69), (14.78, 46.67), (26.93, 47.62), (32.62, 47.59), (4.15, 48.69),
+         (14.79, 48.67), (18.59, 48.66), (355.28, 48.69), (18.6, 50.66), (26.97, 50.62),
+         (351.47, 50.68), (355.27, 50.69), (32.67, 51.09), (39.88, 51.04), (344.35, 53.16),
+         (351.46, 53.18)],
+    ),
+    'Antlia': (
+        (151.99, -34.0),
+        [(141.73, -40.29), (166.45, -40.43), (163.95, -35.67), (166.48, -35.68), (160.2, -31.82),
+         (163.97, -31.84), (155.18, -29.8), (160.21, -29.82), (147.65, -27.09), (155.2, -27.13),
+         (141.9, -24.54), (147.68, -24.58)],
+    ),
+    'Apus': (
+        (243.93, -76.03),
+        [(209.13, -83.13), (276.91, -82.46), (207.47, -70.63), (258.49, -70.16), (258.26, -67.66),
+         (273.29, -67.48)],
+    ),
+    'Aquarius': (
+        (335.95, -10.44),
+        [(329.77, -24.9), (359.11, -24.8), (309.75, -14.56), (321.72, -14.46), (321.67, -8.46),
+         (329.66, -8.4), (342.87, -3.34), (359.1, -3.3), (326.59, 2.33), (331.59, 2.36),
+         (309.58, 2.44), (323.59, 2.55), (331.59, 2.61), (342.84, 2.66), (323.58, 3.3),
+         (326.58, 3.33)],
+    ),
+    'Aquila': (
+        (294.72, 2.13),
+        [(284.75, -11.87), (301.73, -11.68), (301.7, -8.64), (309.69, -8.56), (280.4, -3.88),
+         (284.65, -3.83), (280.33, 2.12), (284.58, 2.17), (306.08, 2.4), (309.58, 2.44),
+         (281.46, 6.38), (284.53, 6.42), (303.64, 8.88), (306.02, 8.9), (281.39, 12.13),
+         (284.46, 12.17), (298.93, 16.08), (303.56, 16.13), (286.41, 16.36), (298.93, 16.5),
+         (284.38, 18.66), (286.38, 18.69)],
+    ),
+    'Ara': (
+        (260.05, -54.26),
+        [(255.74, -67.69), (265.79, -67.57), (254.3, -65.21), (255.55, -65.19), (251.69, -63.82),
+         (254.21, -63.79), (249.09, -61.27), (251.55, -61.24), (265.18, -57.08), (272.68, -56.98),
+         (248.58, -45.77), (272.32, -45.49)],
+    ),
+    'Aries': (
+        (39.91, 20.11),
+        [(26.65, 10.54), (50.94, 10.36), (51.03, 19.45), (52.29, 19.43), (26.74, 25.62),
+         (30.51, 25.6), (30.53, 27.85), (38.07, 27.8), (38.1, 31.22), (52.42, 31.1)],
+    ),
+    'Auriga': (
+        (89.11, 41.1),
+        [(90.21, 28.01), (99.96, 27.89), (73.21, 28.71), (90.22, 28.51), (69.47, 30.25),
+         (73.23, 30.21), (100.08, 35.39), (112.55, 35.25), (69.57, 36.25), (72.45, 36.22),
+         (104.26, 44.34), (112.73, 44.24), (99.91, 49.89), (104.4, 49.84), (72.83, 52.72),
+         (77.48, 52.66), (94.05, 53.97), (100.04, 53.89), (77.6, 56.16), (94.12, 55.97)],
+    ),
+    'Boötes': (
+        (218.89, 29.33),
+        [(204.07, 7.36), (227.78, 7.53), (227.61, 25.53), (229.1, 25.54), (203.96, 27.86),
+         (210.79, 27.9), (210.77, 30.15), (211.89, 30.16), (229.02, 32.54), (232.75, 32.58),
+         (232.65, 39.58), (237.37, 39.62), (229.66, 52.55), (237.09, 52.62), (211.59, 54.91),
+         (229.6, 55.05)],
+    ),
+    'Caelum': (
+        (71.31, -38.0),
+        [(64.88, -48.7), (68.35, -48.74), (68.42, -46.24), (73.39, -46.29), (73.47, -42.79),
+         (75.97, -42.82), (65.12, -36.7), (69.86, -36.75), (69.97, -29.75), (71.72, -29.77),
+         (71.76, -27.02), (76.25, -27.08)],
+    ),
+    'Camelopardalis': (
+        (85.33, 70.8),
+        [(52.31, 52.93), (77.48, 52.66), (49.85, 55.46), (52.37, 55.43), (77.6, 56.16),
+         (94.12, 55.97), (48.89, 57.46), (49.91, 57.46), (107.74, 59.8), (122.12, 59.65),
+         (94.4, 61.96), (107.84, 61.8), (49.39, 68.46), (54.23, 68.42), (123.07, 73.14),
+         (140.6, 72.98), (55.29, 77.41), (56.71, 77.4), (174.43, 76.31), (204.16, 76.37),
+         (57.5, 80.39), (80.46, 80.15), (162.8, 79.35), (174.52, 79.31), (203.82, 79.37),
+         (216.8, 79.45), (142.16, 81.47), (163.09, 81.34), (84.47, 85.12), (127.9, 84.61),
+         (130.33, 86.1), (213.06, 85.94)],
+    ),
+    'Cancer': (
+        (130.22, 19.29),
+        [(120.54, 6.66), (140.4, 6.47), (118.83, 9.67), (120.58, 9.66), (118.94, 19.67),
+         (120.06, 19.66), (120.16, 27.66), (121.91, 27.64), (121.99, 33.14), (140.64, 32.97)],
+    ),
+    'Canes Venatici': (
+        (197.37, 40.36),
+        [(200.23, 27.85), (210.79, 27.9), (210.77, 30.15), (211.89, 30.16), (186.56, 31.31),
+         (200.21, 31.35), (181.59, 33.31), (186.55, 33.31), (181.59, 44.31), (182.82, 44.31),
+         (203.8, 47.86), (211.7, 47.91), (182.82, 52.31), (203.74, 52.36)],
+    ),
+    'Canis Major': (
+        (102.5, -21.94),
+        [(92.89, -33.03), (111.67, -33.25), (93.21, -11.03), (111.97, -11.25)],
+    ),
+    'Canis Minor': (
+        (114.43, 5.92),
+        [(109.59, -0.22), (122.84, -0.37), (106.86, 1.31), (109.61, 1.28), (106.66, 5.31),
+         (106.91, 5.31), (120.54, 6.66), (122.92, 6.63), (118.83, 9.67), (120.58, 9.66),
+         (106.74, 12.31), (114.24, 12.22), (114.25, 13.22), (118.87, 13.17)],
+    ),
+    'Capricornus': (
+        (315.4, -18.74),
+        [(301.92, -27.64), (321.84, -27.46), (321.81, -24.96), (329.77, -24.9), (309.75, -14.56),
+         (321.72, -14.46), (301.7, -8.64), (309.69, -8.56), (321.67, -8.46), (329.66, -8.4)],
+    ),
+    'Carina': (
+        (131.55, -63.05),
+        [(135.22, -75.5), (169.85, -75.69), (102.69, -64.15), (136.08, -64.5), (97.98, -58.09),
+         (103.0, -58.15), (133.31, -56.98), (170.15, -57.19), (93.1, -55.03), (98.1, -55.09),
+         (127.56, -54.92), (133.37, -54.98), (123.31, -53.38), (127.6, -53.42), (90.68, -52.5),
+         (93.19, -52.53), (90.74, -50.75), (123.37, -51.13)],
+    ),
+    'Cassiopeia': (
+        (15.35, 62.56),
+        [(4.14, 46.69), (14.78, 46.67), (4.15, 48.69), (14.79, 48.67), (18.59, 48.66),
+         (355.28, 48.69), (18.6, 50.66), (22.41, 50.64), (351.47, 50.68), (355.27, 50.69),
+         (344.35, 53.16), (351.46, 53.18), (22.45, 54.64), (27.53, 54.62), (38.76, 57.55),
+         (48.89, 57.46), (27.59, 58.12), (30.77, 58.1), (30.79, 59.1), (38.8, 59.05),
+         (344.27, 59.75), (348.86, 59.76), (348.82, 63.68), (355.22, 63.69), (6.76, 66.69),
+         (355.2, 66.69), (49.39, 68.46), (54.23, 68.42), (6.92, 77.69), (55.29, 77.41)],
+    ),
+    'Centaurus': (
+        (196.5, -46.09),
+        [(170.08, -64.69), (179.05, -64.7), (194.44, -64.68), (220.52, -64.54), (166.33, -57.18),
+         (170.15, -57.19), (179.07, -55.7), (194.33, -55.68), (214.66, -55.58), (220.24, -55.54),
+         (214.45, -42.58), (225.8, -42.5), (166.48, -35.68), (185.39, -35.7), (185.39, -33.7),
+         (190.43, -33.69), (190.42, -30.19), (225.64, -30.0)],
+    ),
+    'Cepheus': (
+        (334.83, 72.1),
+        [(330.65, 53.35), (333.18, 53.36), (309.84, 55.27), (330.61, 55.43), (333.14, 55.61),
+         (335.94, 55.63), (335.92, 56.88), (344.31, 56.91), (344.27, 59.75), (348.86, 59.76),
+         (300.58, 59.85), (308.73, 59.93), (308.67, 61.35), (309.63, 61.36), (300.5, 61.85),
+         (306.82, 61.91), (348.82, 63.68), (355.22, 63.69), (6.76, 66.69), (355.2, 66.69),
+         (306.53, 67.41), (310.35, 67.45), (301.9, 75.37), (309.59, 75.44), (6.92, 77.69),
+         (56.71, 77.4), (57.5, 80.39), (80.46, 80.15), (300.71, 80.36), (313.73, 80.48),
+         (84.47, 85.12), (127.9, 84.61), (308.42, 86.63), (343.56, 86.83), (135.72, 87.57),
+         (339.39, 88.66)],
+    ),
+    'Cetus': (
+        (24.36, -9.01),
+        [(26.46, -24.87), (359.11, -24.8), (26.46, -23.75), (41.15, -23.85), (6.59, -6.31),
+         (359.1, -6.3), (41.34, -1.22), (50.83, -1.3), (6.6, 2.69), (31.61, 2.6), (31.66, 10.51),
+         (50.94, 10.36)],
+    ),
+    'Chamaeleon': (
+        (160.32, -80.13),
+        [(111.61, -82.78), (209.13, -83.13), (114.19, -75.29), (207.79, -75.63)],
+    ),
+    'Circinus': (
+        (222.26, -63.22),
+        [(207.47, -70.63), (224.18, -70.52), (224.01, -68.02), (226.57, -68.0), (204.71, -65.64),
+         (207.27, -65.63), (204.68, -64.64), (220.52, -64.54), (226.36, -64.08), (230.18, -64.05),
+         (230.06, -61.46), (232.6, -61.44), (220.24, -55.54), (232.39, -55.44)],
+    ),
+    'Columba': (
+        (86.8, -35.58),
+        [(75.97, -42.82), (99.7, -43.11), (92.89, -33.03), (99.9, -33.11), (76.25, -27.08),
+         (92.99, -27.28)],
+    ),
+    'Coma Berenices': (
+        (191.33, 22.37),
+        [(179.6, 13.31), (194.06, 13.32), (194.06, 14.32), (204.03, 14.36), (200.23, 27.85),
+         (203.96, 27.86), (179.61, 28.31), (181.59, 28.31), (186.56, 31.31), (200.21, 31.35),
+         (181.59, 33.31), (186.55, 33.31)],
+    ),
+    'Corona Australis': (
+        (279.71, -41.2),
+        [(269.82, -45.52), (289.78, -45.28), (269.63, -37.02), (289.6, -36.78)],
+    ),
+    'Corona Borealis': (
+        (238.22, 32.18),
+        [(229.1, 25.54), (243.81, 25.69), (243.79, 26.69), (246.28, 26.71), (229.02, 32.54),
+         (232.75, 32.58), (232.65, 39.58), (246.08, 39.71)],
+    ),
+    'Corvus': (
+        (186.32, -18.14),
+        [(179.09, -25.2), (190.4, -25.19), (190.4, -22.69), (194.17, -22.68), (179.1, -11.7),
+         (194.13, -11.68)],
+    ),
+    'Crater': (
+        (171.07, -15.7),
+        [(164.0, -25.17), (179.09, -25.2), (162.77, -19.66), (164.03, -19.67), (162.82, -6.66),
+         (179.1, -6.7)],
+    ),
+    'Crux': (
+        (186.67, -60.07),
+        [(179.05, -64.7), (194.44, -64.68), (179.07, -55.7), (194.33, -55.68)],
+    ),
+    'Cygnus': (
+        (309.26, 43.09),
+        [(290.14, 27.73), (296.28, 27.8), (315.09, 28.49), (327.4, 28.58), (296.26, 29.3),
+         (315.08, 29.49), (290.1, 30.23), (291.6, 30.25), (327.32, 36.58), (329.47, 36.59),
+         (291.5, 36.75), (292.13, 36.76), (288.48, 43.71), (291.99, 43.75), (329.38, 44.34),
+         (329.89, 44.35), (329.88, 44.6), (330.77, 44.6), (287.13, 47.7), (288.38, 47.71),
+         (309.84, 55.27), (330.61, 55.43), (286.89, 55.7), (291.92, 55.76), (291.82, 58.25),
+         (297.11, 58.31), (297.05, 59.81), (308.73, 59.93), (308.67, 61.35), (309.63, 61.36)],
+    ),
+    'Delphinus': (
+        (310.18, 12.19),
+        [(306.08, 2.4), (314.09, 2.48), (314.05, 6.48), (314.68, 6.48), (303.64, 8.88),
+         (306.02, 8.9), (314.62, 12.32), (317.25, 12.34), (303.56, 16.13), (305.19, 16.14),
+         (309.91, 19.94), (317.18, 20.0), (305.14, 20.89), (309.9, 20.94)],
+    ),
+    'Dorado': (
+        (75.38, -61.31),
+        [(68.57, -69.74), (98.44, -70.1), (90.16, -64.0), (98.92, -64.11), (82.85, -60.91),
+         (90.33, -61.0), (65.54, -58.71), (69.26, -58.75), (75.54, -57.32), (83.01, -57.41),
+         (60.68, -56.15), (65.64, -56.21), (68.21, -53.73), (75.67, -53.82), (58.31, -52.79),
+         (60.79, -52.82), (58.37, -50.63), (62.09, -50.67), (62.14, -48.67), (68.35, -48.74)],
+    ),
+    'Draco': (
+        (254.36, 68.15),
+        [(274.35, 47.55), (287.13, 47.7), (255.79, 50.33), (274.27, 50.55), (237.13, 51.12),
+         (255.77, 51.33), (229.66, 52.55), (237.09, 52.62), (217.26, 54.95), (229.6, 55.05),
+         (286.89, 55.7), (291.92, 55.76), (291.82, 58.25), (297.11, 58.31), (297.05, 59.81),
+         (300.58, 59.85), (300.5, 61.85), (306.82, 61.91), (203.58, 62.36), (217.05, 62.45),
+         (181.58, 63.31), (203.55, 63.36), (210.83, 65.4), (235.34, 65.61), (171.84, 65.82),
+         (181.58, 65.81), (306.53, 67.41), (310.35, 67.45), (196.1, 69.33), (210.66, 69.4),
+         (235.06, 69.6), (247.85, 69.74), (140.6, 72.98), (171.95, 72.82), (247.24, 74.74),
+         (261.56, 74.91), (301.9, 75.37), (309.59, 75.44), (174.43, 76.31), (195.82, 76.33),
+         (162.8, 79.35), (174.52, 79.31), (260.25, 79.9), (267.69, 79.99), (300.71, 80.36),
+         (313.73, 80.48), (142.16, 81.47), (163.09, 81.34), (261.8, 85.95), (308.8, 86.46)],
+    ),
+    'Equuleus': (
+        (317.98, 7.46),
+        [(314.09, 2.48), (321.59, 2.54), (314.05, 6.48), (314.68, 6.48), (314.62, 12.32),
+         (318.26, 12.35), (318.25, 13.01), (321.5, 13.04)],
+    ),
+    'Eridanus': (
+        (56.97, -21.02),
+        [(21.2, -57.84), (33.49, -57.91), (33.58, -53.41), (37.28, -53.44), (21.27, -52.84),
+         (24.96, -52.86), (24.99, -50.86), (28.69, -50.88), (37.34, -50.44), (41.04, -50.47),
+         (41.08, -48.47), (46.03, -48.51), (28.73, -47.55), (36.15, -47.6), (46.09, -45.51),
+         (52.28, -45.57), (52.32, -43.57), (59.03, -43.63), (36.26, -39.43), (46.18, -39.51),
+         (59.1, -39.63), (65.07, -39.7), (46.19, -39.09), (53.64, -39.16), (65.12, -36.7),
+         (69.86, -36.75), (53.69, -35.58), (57.43, -35.62), (69.97, -29.75), (71.72, -29.77),
+         (71.76, -27.02), (73.75, -27.05), (41.15, -23.85), (57.58, -24.0), (73.92, -14.3),
+         (75.17, -14.31), (75.22, -10.81), (77.71, -10.84), (71.55, -3.77), (77.8, -3.84),
+         (41.34, -1.22), (55.33, -1.35), (55.35, 0.4), (71.6, 0.23)],
+    ),
+    'Fornax': (
+        (41.54, -31.53),
+        [(26.35, -39.37), (46.18, -39.51), (46.19, -39.09), (53.64, -39.16), (53.69, -35.58),
+         (57.43, -35.62), (26.46, -23.75), (57.58, -24.0)],
+    ),
+    'Gemini': (
+        (107.27, 23.44),
+        [(105.71, 9.82), (106.71, 9.81), (96.37, 11.93), (105.74, 11.82), (106.74, 12.31),
+         (114.24, 12.22), (114.25, 13.22), (118.87, 13.17), (95.06, 17.45), (96.44, 17.43),
+         (118.94, 19.67), (120.06, 19.66), (90.12, 21.51), (95.12, 21.45), (90.21, 28.01),
+         (99.96, 27.89), (120.16, 27.66), (121.91, 27.64), (118.25, 33.18), (121.99, 33.14),
+         (100.08, 35.39), (118.28, 35.18)],
+    ),
+    'Grus': (
+        (337.81, -45.23),
+        [(332.12, -56.39), (351.77, -56.31), (322.12, -49.46), (332.0, -49.39), (321.93, -36.46),
+         (351.68, -36.31)],
+    ),
+    'Hercules': (
+        (259.47, 28.57),
+        [(242.81, 3.67), (252.81, 3.79), (275.21, 12.05), (284.46, 12.17), (252.71, 12.62),
+         (260.2, 12.71), (260.18, 14.21), (275.18, 14.39), (240.19, 15.65), (242.68, 15.67),
+         (240.12, 21.65), (241.86, 21.67), (241.81, 25.67), (243.81, 25.69), (276.77, 26.07),
+         (284.28, 26.16), (243.79, 26.69), (246.28, 26.71), (273.83, 30.04), (276.71, 30.07),
+         (237.37, 39.62), (246.08, 39.71), (273.48, 47.54), (274.35, 47.55), (255.79, 50.33),
+         (274.27, 50.55), (237.13, 51.12), (255.77, 51.33)],
+    ),
+    'Horologium': (
+        (49.55, -53.28),
+        [(33.2, -66.91), (48.35, -67.03), (48.78, -57.03), (53.23, -57.08), (33.58, -53.41),
+         (37.28, -53.44), (53.36, -52.74), (58.31, -52.79), (37.34, -50.44), (41.04, -50.47),
+         (58.37, -50.63), (62.09, -50.67), (41.08, -48.47), (46.03, -48.51), (62.14, -48.67),
+         (64.88, -48.7), (46.09, -45.51), (52.28, -45.57), (52.32, -43.57), (59.03, -43.63),
+         (59.1, -39.63), (65.07, -39.7)],
+    ),
+    'Hydra': (
+        (156.54, -18.97),
+        [(163.95, -35.67), (185.39, -35.7), (185.39, -33.7), (190.43, -33.69), (160.2, -31.82),
+         (163.97, -31.84), (190.42, -30.19), (225.64, -30.0), (155.18, -29.8), (160.21, -29.82),
+         (147.65, -27.09), (155.2, -27.13), (164.0, -25.17), (190.4, -25.19), (215.54, -25.07),
+         (225.58, -25.0), (137.63, -24.51), (147.68, -24.58), (190.4, -22.69), (215.52, -22.57),
+         (130.16, -19.44), (137.68, -19.51), (162.77, -19.66), (164.03, -19.67), (126.92, -17.41),
+         (130.18, -17.44), (122.73, -11.37), (126.98, -11.41), (145.27, -11.57), (162.81, -11.66),
+         (122.92, 6.63), (145.39, 6.43)],
+    ),
+    'Hydrus': (
+        (35.62, -71.56),
+        [(1.54, -81.8), (50.06, -82.06), (12.29, -75.31), (20.65, -75.34), (1.57, -74.3),
+         (12.33, -74.31), (52.06, -74.57), (67.94, -74.74), (33.2, -66.91), (68.78, -67.25),
+         (21.2, -57.84), (33.49, -57.91)],
+    ),
+    'Indus': (
+        (322.2, -58.49),
+        [(323.2, -74.45), (352.0, -74.31), (332.41, -66.89), (351.87, -66.81), (307.57, -59.59),
+         (322.36, -59.45), (322.12, -49.46), (332.0, -49.39), (307.18, -45.09), (322.05, -44.96)],
+    ),
+    'Lacerta': (
+        (337.43, 45.11),
+        [(343.71, 35.16), (344.47, 35.17), (331.36, 35.6), (343.71, 35.66), (329.47, 36.59),
+         (331.35, 36.6), (329.38, 44.34), (329.89, 44.35), (329.88, 44.6), (330.77, 44.6),
+         (330.65, 53.35), (333.18, 53.36), (333.14, 55.61), (335.94, 55.63), (335.92, 56.88),
+         (344.31, 56.91)],
+    ),
+    'Leo': (
+        (160.56, 15.07),
+        [(162.82, -6.66), (174.34, -6.69), (140.4, 6.47), (162.87, 6.34), (174.36, 10.31),
+         (179.6, 10.31), (159.21, 22.86), (162.94, 22.84), (162.95, 24.84), (166.68, 24.83),
+         (150.04, 27.9), (159.23, 27.86), (166.69, 28.33), (179.61, 28.31), (140.64, 32.97),
+         (150.08, 32.91)],
+    ),
+    'Leo Minor': (
+        (155.39, 33.52),
+        [(159.21, 22.86), (162.94, 22.84), (162.95, 24.84), (166.68, 24.83), (150.04, 27.9),
+         (159.23, 27.86), (140.64, 32.97), (150.08, 32.91), (163.49, 33.34), (166.71, 33.33),
+         (140.72, 39.22), (145.68, 39.18), (154.36, 39.38), (163.52, 39.34), (145.7, 41.43),
+         (154.37, 41.38)],
+    ),
+    'Lepus': (
+        (83.63, -19.06),
+        [(73.75, -27.05), (92.99, -27.28), (73.92, -14.3), (75.17, -14.31), (75.22, -10.81),
+         (93.21, -11.03)],
+    ),
+    'Libra': (
+        (228.42, -15.25),
+        [(225.64, -30.0), (236.94, -29.89), (215.54, -25.07), (225.58, -25.0), (236.82, -20.39),
+         (240.58, -20.35), (215.41, -8.57), (221.67, -8.53), (227.88, -3.72), (240.39, -3.6),
+         (221.61, -0.53), (227.86, -0.47)],
+    ),
+    'Lupus': (
+        (229.75, -42.41),
+        [(214.66, -55.58), (228.09, -55.48), (228.06, -54.48), (232.36, -54.44), (232.21, -48.44),
+         (237.25, -48.39), (214.45, -42.58), (225.8, -42.5), (237.13, -42.39), (242.16, -42.34),
+         (225.64, -30.0), (241.95, -29.84)],
+    ),
+    'Lynx': (
+        (121.3, 46.8),
+        [(118.25, 33.18), (140.64, 32.97), (112.55, 35.25), (118.28, 35.18), (140.72, 39.22),
+         (145.68, 39.18), (139.51, 41.48), (145.7, 41.43), (104.26, 44.34), (112.73, 44.24),
+         (128.43, 46.58), (139.58, 46.48), (99.91, 49.89), (104.4, 49.84), (94.05, 53.97),
+         (100.04, 53.89), (107.74, 59.8), (128.79, 59.58), (94.4, 61.96), (107.84, 61.8)],
+    ),
+    'Lyra': (
+        (282.68, 36.64),
+        [(284.28, 25.66), (290.17, 25.73), (276.77, 26.07), (284.28, 26.16), (273.83, 30.04),
+         (276.71, 30.07), (290.1, 30.23), (291.6, 30.25), (291.5, 36.75), (292.13, 36.76),
+         (288.48, 43.71), (291.99, 43.75), (273.48, 47.54), (288.38, 47.71)],
+    ),
+    'Mensa': (
+        (82.19, -77.51),
+        [(48.2, -84.55), (108.95, -85.26), (52.06, -74.57), (67.94, -74.74), (97.75, -75.1),
+         (114.19, -75.29), (68.57, -69.74), (98.44, -70.1)],
+    ),
+    'Microscopium': (
+        (314.43, -36.01),
+        [(307.18, -45.09), (322.05, -44.96), (306.9, -27.59), (321.84, -27.46)],
+    ),
+    'Monoceros': (
+        (105.24, -2.7),
+        [(88.96, -10.98), (122.73, -11.37), (89.05, -3.98), (95.17, -4.05), (109.59, -0.22),
+         (122.84, -0.37), (106.86, 1.31), (109.61, 1.28), (106.66, 5.31), (106.91, 5.31),
+         (95.34, 9.95), (96.34, 9.93), (105.71, 9.82), (106.71, 9.81), (96.37, 11.93),
+         (105.74, 11.82)],
+    ),
+    'Musca': (
+        (188.59, -70.07),
+        [(169.85, -75.69), (207.79, -75.63), (204.71, -65.64), (207.27, -65.63), (170.08, -64.69),
+         (204.68, -64.64)],
+    ),
+    'Norma': (
+        (241.18, -51.63),
+        [(232.56, -60.44), (249.04, -60.27), (228.09, -55.48), (232.39, -55.44), (228.06, -54.48),
+         (232.36, -54.44), (232.21, -48.44), (237.25, -48.39), (237.13, -42.39), (248.5, -42.27)],
+    ),
+    'Octans': (
+        (318.81, -84.52),
+        [(48.2, -84.55), (108.95, -85.26), (1.54, -81.8), (50.06, -82.06), (111.61, -82.78),
+         (276.91, -82.46), (1.57, -74.3), (274.22, -74.97)],
+    ),
+    'Ophiuchus': (
+        (259.57, -5.27),
+        [(253.24, -30.21), (266.01, -30.06), (245.9, -24.88), (253.16, -24.8), (245.83, -19.55),
+         (247.46, -19.53), (245.82, -18.55), (247.44, -18.53), (259.3, -16.14), (265.81, -16.06),
+         (265.5, -11.73), (266.75, -11.72), (259.23, -10.14), (265.48, -10.07), (266.73, -10.05),
+         (271.23, -10.0), (240.44, -8.35), (245.7, -8.3), (269.15, -4.02), (271.16, -4.0),
+         (240.39, -3.6), (245.64, -3.55), (269.11, -0.02), (275.36, 0.06), (275.32, 3.06),
+         (277.94, 3.09), (245.56, 3.7), (252.81, 3.79), (275.3, 4.56), (277.93, 4.59),
+         (275.28, 6.31), (281.46, 6.38), (275.21, 12.05), (281.39, 12.13), (252.71, 12.62),
+         (260.2, 12.71), (260.18, 14.21), (275.18, 14.39)],
+    ),
+    'Orion': (
+        (83.91, 5.17),
+        [(77.71, -10.84), (88.96, -10.98), (71.55, -3.77), (77.8, -3.84), (89.05, -3.98),
+         (95.17, -4.05), (70.85, 0.24), (71.6, 0.23), (95.34, 9.95), (96.34, 9.93), (85.75, 12.56),
+         (88.25, 12.53), (71.03, 15.74), (76.28, 15.68), (81.79, 15.61), (85.79, 15.56),
+         (76.29, 16.18), (81.79, 16.11), (95.06, 17.45), (96.44, 17.43), (87.32, 18.04),
+         (88.32, 18.03), (90.12, 21.51), (95.12, 21.45), (87.39, 22.88), (90.14, 22.84)],
+    ),
+    'Pavo': (
+        (293.54, -65.61),
+        [(274.22, -74.97), (323.2, -74.45), (265.79, -67.57), (273.29, -67.48), (307.57, -59.59),
+         (322.36, -59.45), (265.18, -57.08), (307.47, -56.59)],
+    ),
+    'Pegasus': (
+        (340.42, 19.49),
+        [(326.59, 2.33), (331.59, 2.36), (321.59, 2.54), (323.59, 2.55), (331.59, 2.61),
+         (342.84, 2.66), (323.58, 3.3), (326.58, 3.33), (342.82, 8.16), (359.1, 8.2), (1.6, 10.7),
+         (359.1, 10.7), (317.25, 12.34), (318.26, 12.35), (1.6, 13.2), (3.74, 13.19),
+         (318.25, 13.01), (321.5, 13.04), (317.18, 20.0), (320.19, 20.03), (2.61, 22.69),
+         (3.74, 22.69), (320.16, 24.03), (322.67, 24.05), (1.61, 28.69), (2.61, 28.69),
+         (322.63, 28.55), (327.4, 28.58), (1.61, 32.03), (357.83, 32.03), (354.05, 32.77),
+         (357.83, 32.78), (343.71, 35.16), (354.05, 35.19), (331.36, 35.6), (343.71, 35.66),
+         (327.32, 36.58), (331.35, 36.6)],
+    ),
+    'Perseus': (
+        (53.12, 44.46),
+        [(42.63, 31.18), (69.48, 30.92), (40.4, 34.54), (42.66, 34.52), (69.57, 36.25),
+         (72.45, 36.22), (39.68, 37.29), (40.43, 37.28), (26.93, 47.62), (32.62, 47.59),
+         (22.41, 50.64), (26.97, 50.62), (32.67, 51.09), (39.88, 51.04), (52.31, 52.93),
+         (72.83, 52.72), (22.45, 54.64), (27.53, 54.62), (49.85, 55.46), (52.37, 55.43),
+         (38.76, 57.55), (49.91, 57.46), (27.59, 58.12), (30.77, 58.1), (30.79, 59.1),
+         (38.8, 59.05)],
+    ),
+    'Phoenix': (
+        (11.7, -47.83),
+        [(21.2, -57.84), (351.78, -57.81), (21.27, -52.84), (24.96, -52.86), (24.99, -50.86),
+         (28.69, -50.88), (28.73, -47.55), (36.15, -47.6), (36.26, -39.43), (351.69, -39.31)],
+    ),
+    'Pictor': (
+        (83.62, -52.49),
+        [(90.16, -64.0), (102.69, -64.15), (82.85, -60.91), (90.33, -61.0), (97.98, -58.09),
+         (103.0, -58.15), (75.54, -57.32), (83.01, -57.41), (93.1, -55.03), (98.1, -55.09),
+         (68.21, -53.73), (75.67, -53.82), (90.68, -52.5), (93.19, -52.53), (68.42, -46.24),
+         (73.39, -46.29), (73.47, -42.79), (90.94, -43.0)],
+    ),
+    'Pisces': (
+        (9.57, 10.99),
+        [(6.59, -6.31), (359.1, -6.3), (342.87, -3.34), (359.1, -3.3), (6.6, 2.69), (31.61, 2.6),
+         (342.82, 8.16), (359.1, 8.2), (26.65, 10.54), (31.66, 10.51), (1.6, 10.7), (359.1, 10.7),
+         (1.6, 13.2), (3.74, 13.19), (3.74, 21.69), (14.41, 21.67), (12.41, 24.43), (14.42, 24.42),
+         (22.86, 28.64), (26.76, 28.62), (12.44, 33.68), (22.9, 33.64)],
+    ),
+    'Piscis Austrinus': (
+        (334.27, -30.71),
+        [(321.93, -36.46), (346.73, -36.32), (321.81, -24.96), (346.68, -24.82)],
+    ),
+    'Puppis': (
+        (114.94, -33.24),
+        [(90.74, -50.75), (120.85, -51.1), (90.94, -43.0), (99.7, -43.11), (121.03, -43.35),
+         (126.57, -43.41), (99.9, -33.11), (111.67, -33.25), (111.97, -11.25), (126.98, -11.41)],
+    ),
+    'Pyxis': (
+        (133.68, -28.45),
+        [(126.67, -37.16), (141.77, -37.29), (137.63, -24.51), (141.9, -24.54), (130.16, -19.44),
+         (137.68, -19.51), (126.92, -17.41), (130.18, -17.44)],
+    ),
+    'Reticulum': (
+        (58.34, -60.82),
+        [(48.35, -67.03), (68.78, -67.25), (65.54, -58.71), (69.26, -58.75), (48.78, -57.03),
+         (53.23, -57.08), (60.68, -56.15), (65.64, -56.21), (53.36, -52.74), (60.79, -52.82)],
+    ),
+    'Sagitta': (
+        (295.68, 18.77),
+        [(298.93, 16.08), (305.19, 16.14), (286.41, 16.36), (298.93, 16.5), (284.38, 18.66),
+         (286.38, 18.69), (290.13, 19.4), (298.89, 19.5), (284.35, 21.25), (290.1, 21.31),
+         (298.87, 21.58), (305.13, 21.64)],
+    ),
+    'Sagittarius': (
+        (287.54, -27.5),
+        [(289.78, -45.28), (307.18, -45.09), (269.63, -37.02), (289.6, -36.78), (266.01, -30.06),
+         (269.51, -30.02), (301.92, -27.64), (306.9, -27.59), (265.81, -16.06), (284.8, -15.83),
+         (284.75, -11.87), (301.73, -11.68)],
+    ),
+    'Scorpius': (
+        (251.36, -32.16),
+        [(248.58, -45.77), (269.82, -45.52), (242.16, -42.34), (248.5, -42.27), (253.24, -30.21),
+         (269.51, -30.02), (236.94, -29.89), (241.95, -29.84), (245.9, -24.88), (253.16, -24.8),
+         (236.82, -20.39), (240.58, -20.35), (245.83, -19.55), (247.46, -19.53), (245.82, -18.55),
+         (247.44, -18.53), (240.44, -8.35), (245.7, -8.3)],
+    ),
+    'Sculptor': (
+        (6.98, -32.23),
+        [(26.35, -39.37), (351.69, -39.31), (346.73, -36.32), (351.68, -36.31), (26.46, -24.87),
+         (346.68, -24.82)],
+    ),
+    'Scutum': (
+        (280.13, -9.86),
+        [(275.56, -15.94), (284.8, -15.83), (275.4, -3.94), (284.65, -3.83)],
+    ),
+    'Serpens': (
+        (247.41, 4.86),
+        [(259.3, -16.14), (275.56, -15.94), (265.5, -11.73), (266.75, -11.72), (259.23, -10.14),
+         (265.48, -10.07), (266.73, -10.05), (271.23, -10.0), (269.15, -4.02), (271.16, -4.0),
+         (275.4, -3.94), (280.4, -3.88), (227.88, -3.72), (245.64, -3.55), (269.11, -0.02),
+         (275.36, 0.06), (280.33, 2.12), (284.58, 2.17), (275.32, 3.06), (277.94, 3.09),
+         (242.81, 3.67), (245.56, 3.7), (275.3, 4.56), (277.93, 4.59), (275.28, 6.31),
+         (284.53, 6.42), (240.19, 15.65), (242.68, 15.67), (240.12, 21.65), (241.86, 21.67),
+         (227.61, 25.53), (241.81, 25.67)],
+    ),
+    'Sextans': (
+        (154.06, -2.61),
+        [(145.27, -11.57), (162.81, -11.66), (145.39, 6.43), (162.87, 6.34)],
+    ),
+    'Taurus': (
+        (66.16, 17.08),
+        [(50.83, -1.3), (55.33, -1.35), (55.35, 0.4), (70.85, 0.24), (85.75, 12.56),
+         (88.25, 12.53), (71.03, 15.74), (76.28, 15.68), (81.79, 15.61), (85.79, 15.56),
+         (76.29, 16.18), (81.79, 16.11), (87.32, 18.04), (88.32, 18.03), (51.03, 19.45),
+         (52.29, 19.43), (87.39, 22.88), (90.14, 22.84), (73.21, 28.71), (90.22, 28.51),
+         (69.47, 30.25), (73.23, 30.21), (52.42, 31.1), (69.48, 30.92)],
+    ),
+    'Telescopium': (
+        (289.91, -51.22),
+        [(272.68, -56.98), (307.47, -56.59), (272.32, -45.49), (307.18, -45.09)],
+    ),
+    'Triangulum': (
+        (32.09, 32.18),
+        [(26.74, 25.62), (30.51, 25.6), (30.53, 27.85), (38.07, 27.8), (22.86, 28.64),
+         (26.76, 28.62), (38.1, 31.22), (42.63, 31.18), (40.4, 34.54), (42.66, 34.52),
+         (22.91, 35.64), (31.85, 35.59), (31.87, 37.34), (40.43, 37.28)],
+    ),
+    'Triangulum Australe': (
+        (240.97, -65.85),
+        [(224.18, -70.52), (258.49, -70.16), (224.01, -68.02), (226.57, -68.0), (255.74, -67.69),
+         (258.26, -67.66), (254.3, -65.21), (255.55, -65.19), (226.36, -64.08), (230.18, -64.05),
+         (251.69, -63.82), (254.21, -63.79), (230.06, -61.46), (232.6, -61.44), (249.09, -61.27),
+         (251.55, -61.24), (232.56, -60.44), (249.04, -60.27)],
+    ),
+    'Tucana': (
+        (357.61, -64.6),
+        [(12.29, -75.31), (20.65, -75.34), (12.33, -74.31), (352.0, -74.31), (332.41, -66.89),
+         (351.87, -66.81), (21.2, -57.84), (351.78, -57.81), (332.12, -56.39), (351.77, -56.31)],
+    ),
+    'Ursa Major': (
+        (165.58, 54.39),
+        [(166.69, 28.33), (181.59, 28.31), (163.49, 33.34), (166.71, 33.33), (154.36, 39.38),
+         (163.52, 39.34), (139.51, 41.48), (154.37, 41.38), (181.59, 44.31), (182.82, 44.31),
+         (128.43, 46.58), (139.58, 46.48), (203.8, 47.86), (211.7, 47.91), (182.82, 52.31),
+         (203.74, 52.36), (211.59, 54.91), (217.26, 54.95), (122.12, 59.65), (128.79, 59.58),
+         (203.58, 62.36), (217.05, 62.45), (181.58, 63.31), (203.55, 63.36), (171.84, 65.82),
+         (181.58, 65.81), (123.07, 73.14), (171.95, 72.82)],
+    ),
+    'Ursa Minor': (
+        (225.63, 76.69),
+        [(210.83, 65.4), (235.34, 65.61), (196.1, 69.33), (210.66, 69.4), (235.06, 69.6),
+         (247.85, 69.74), (247.24, 74.74), (261.56, 74.91), (195.82, 76.33), (204.16, 76.37),
+         (203.82, 79.37), (216.8, 79.45), (260.25, 79.9), (267.69, 79.99), (261.8, 85.95),
+         (308.8, 86.46), (308.42, 86.63), (343.56, 86.83), (130.33, 86.1), (213.06, 85.94),
+         (135.72, 87.57), (339.39, 88.66)],
+    ),
+    'Vela': (
+        (144.18, -48.04),
+        [(133.31, -56.98), (166.33, -57.18), (127.56, -54.92), (133.37, -54.98), (123.31, -53.38),
+         (127.6, -53.42), (120.85, -51.1), (123.37, -51.13), (121.03, -43.35), (126.57, -43.41),
+         (141.73, -40.29), (166.45, -40.43), (126.67, -37.16), (141.77, -37.29)],
+    ),
+    'Virgo': (
+        (199.34, -2.69),
+        [(194.17, -22.68), (215.52, -22.57), (179.1, -11.7), (194.13, -11.68), (215.41, -8.57),
+         (221.67, -8.53), (174.34, -6.69), (179.1, -6.7), (221.61, -0.53), (227.86, -0.47),
+         (204.07, 7.36), (227.78, 7.53), (174.36, 10.31), (179.6, 10.31), (179.6, 13.31),
+         (194.06, 13.32), (194.06, 14.32), (204.03, 14.36)],
+    ),
+    'Volans': (
+        (117.0, -69.67),
+        [(97.75, -75.1), (135.22, -75.5), (98.92, -64.11), (136.08, -64.5)],
+    ),
+    'Vulpecula': (
+        (304.33, 24.88),
+        [(290.13, 19.4), (298.89, 19.5), (309.91, 19.94), (320.19, 20.03), (305.14, 20.89),
+         (309.9, 20.94), (284.35, 21.25), (290.1, 21.31), (298.87, 21.58), (305.13, 21.64),
+         (320.16, 24.03), (322.67, 24.05), (284.28, 25.66), (290.17, 25.73), (290.14, 27.73),
+         (296.28, 27.8), (315.09, 28.49), (322.63, 28.55), (296.26, 29.3), (315.08, 29.49)],
+    ),
+}
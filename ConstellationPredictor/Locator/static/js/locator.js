@@ -0,0 +1,348 @@
+// Endpoint URLs come from the script tag's data attributes
+const locatorUrls = document.currentScript.dataset;
+
+class ConstellationFinder {
+    constructor() {
+        this.currentLocation = null;
+        this.currentHeading = 0;
+        this.targetHeading = 0;
+        this.selectedConstellation = null;
+        this.isCompassActive = false;
+        this.constellationDirections = {};
+        this.orientationHandler = null;
+        this.init();
+    }
+
+    init() {
+        document.getElementById('getLocationBtn').addEventListener('click', () => this.getLocation());
+        document.getElementById('findConstellationsBtn').addEventListener('click', () => this.findConstellations());
+        document.getElementById('startCompassBtn').addEventListener('click', () => this.startCompass());
+        document.getElementById('stopCompassBtn').addEventListener('click', () => this.stopCompass());
+    }
+
+    async getLocation() {
+        const btn = document.getElementById('getLocationBtn');
+        const info = document.getElementById('locationInfo');
+        const constellationSection = document.getElementById('constellationSection');
+
+        btn.disabled = true;
+        btn.textContent = 'Getting Location...';
+
+        if (!navigator.geolocation) {
+            this.showError('Geolocation is not supported by this browser.');
+            btn.disabled = false;
+            btn.textContent = 'Get My Location';
+            return;
+        }
+
+        const options = {
+            enableHighAccuracy: true,
+            timeout: 15000,
+            maximumAge: 60000
+        };
+
+        try {
+            const position = await new Promise((resolve, reject) => {
+                navigator.geolocation.getCurrentPosition(resolve, reject, options);
+            });
+
+            this.currentLocation = {
+                latitude: position.coords.latitude,
+                longitude: position.coords.longitude,
+                accuracy: position.coords.accuracy
+            };
+
+            info.innerHTML = `
+                <strong>📍 Location Found!</strong><br>
+                Latitude: ${this.currentLocation.latitude.toFixed(6)}°<br>
+                Longitude: ${this.currentLocation.longitude.toFixed(6)}°<br>
+                Accuracy: ±${Math.round(this.currentLocation.accuracy)} meters
+            `;
+            info.classList.remove('hidden');
+            constellationSection.classList.remove('hidden');
+
+            btn.disabled = false;
+            btn.textContent = 'Update Location';
+
+        } catch (error) {
+            let message = 'Unable to retrieve location: ';
+            switch(error.code) {
+                case error.PERMISSION_DENIED:
+                    message += 'Permission denied. Please allow location access.';
+                    break;
+                case error.POSITION_UNAVAILABLE:
+                    message += 'Location unavailable.';
+                    break;
+                case error.TIMEOUT:
+                    message += 'Request timeout.';
+                    break;
+                default:
+                    message += error.message || 'Unknown error.';
+                    break;
+            }
+            this.showError(message);
+            btn.disabled = false;
+            btn.textContent = 'Get My Location';
+        }
+    }
+
+    async findConstellations() {
+        if (!this.currentLocation) {
+            this.showError('Please get your location first.');
+            return;
+        }
+
+        const btn = document.getElementById('findConstellationsBtn');
+        const loading = document.getElementById('loadingIndicator');
+        const response = document.getElementById('constellationResponse');
+        const list = document.getElementById('constellationList');
+
+        btn.disabled = true;
+        loading.classList.remove('hidden');
+        response.classList.add('hidden');
+        list.innerHTML = '';
+
+        try {
+            // Save the location and find the constellations above it in one request
+            const constellationResponse = await fetch(locatorUrls.locateUrl, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': this.getCookie('csrftoken')
+                },
+                body: JSON.stringify(this.currentLocation)
+            });
+
+            if (!constellationResponse.ok) {
+                throw new Error('Failed to get constellation data');
+            }
+
+            const data = await constellationResponse.json();
+
+            if (data.status !== 'success') {
+                throw new Error(data.message || 'Failed to find constellations');
+            }
+
+            // Display the narrative (from Gemini, or a local summary)
+            response.textContent = data.response;
+            response.classList.remove('hidden');
+
+            // Display constellation list with directions
+            this.displayConstellationList(data.constellations);
+
+        } catch (error) {
+            this.showError('Error finding constellations: ' + error.message);
+        } finally {
+            loading.classList.add('hidden');
+            btn.disabled = false;
+        }
+    }
+
+    displayConstellationList(constellations) {
+        const list = document.getElementById('constellationList');
+
+        if (!constellations || constellations.length === 0) {
+            list.innerHTML = '<p class="col-span-full text-center text-cosmic-gold">No constellations found for your location.</p>';
+            return;
+        }
+
+        this.constellationDirections = {};
+
+        list.innerHTML = constellations.map(constellation => {
+            // Azimuth and altitude come from the server's sky computation
+            const azimuth = Math.round(constellation.azimuth);
+            const altitude = Math.round(constellation.altitude);
+            this.constellationDirections[constellation.name] = constellation.direction;
+
+            return `
+                <div class="constellation-card p-4 bg-gradient-to-br from-purple-600 to-purple-800 rounded-2xl text-center cursor-pointer transition-all duration-300 hover:scale-105 hover:shadow-lg hover:shadow-purple-500/25 border-2 border-transparent hover:border-cosmic-gold" data-constellation="${constellation.name}" data-direction="${azimuth}" data-altitude="${altitude}">
+                    <h3 class="text-lg font-semibold mb-2">⭐ ${constellation.name}</h3>
+                    <p class="text-sm text-purple-200">Direction: ${constellation.direction}</p>
+                    <p class="text-cosmic-gold font-medium">${azimuth}°</p>
+                    <p class="text-sm text-purple-200">${altitude}° above the horizon</p>
+                </div>
+            `;
+        }).join('');
+
+        // Add click handlers
+        list.addEventListener('click', (e) => {
+            const card = e.target.closest('.constellation-card');
+            if (card) {
+                this.selectConstellation(card);
+            }
+        });
+    }
+
+    getCookie(name) {
+        let cookieValue = null;
+        if (document.cookie && document.cookie !== '') {
+            const cookies = document.cookie.split(';');
+            for (let i = 0; i < cookies.length; i++) {
+                const cookie = cookies[i].trim();
+                if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                    cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                    break;
+                }
+            }
+        }
+        return cookieValue;
+    }
+
+    selectConstellation(card) {
+        // Remove previous selection
+        document.querySelectorAll('.constellation-card').forEach(c => {
+            c.classList.remove('border-cosmic-gold', 'bg-gradient-to-br', 'from-cosmic-gold', 'to-cosmic-yellow', 'text-black');
+            c.classList.add('bg-gradient-to-br', 'from-purple-600', 'to-purple-800');
+        });
+
+        // Select new card
+        card.classList.remove('from-purple-600', 'to-purple-800');
+        card.classList.add('border-cosmic-gold', 'from-cosmic-gold', 'to-cosmic-yellow', 'text-black');
+
+        const constellation = card.dataset.constellation;
+        const direction = parseInt(card.dataset.direction);
+        this.targetAltitude = parseInt(card.dataset.altitude);
+
+        this.selectedConstellation = constellation;
+        this.targetHeading = direction;
+
+        document.getElementById('selectedConstellation').textContent = `🎯 Finding: ${constellation}`;
+        document.getElementById('targetDirection').textContent = `${direction}°`;
+        document.getElementById('compassSection').classList.remove('hidden');
+
+        // Update compass if active
+        if (this.isCompassActive) {
+            this.updateCompassGuide();
+        }
+    }
+
+    startCompass() {
+        if (this.isCompassActive) return;
+
+        if (!('DeviceOrientationEvent' in window)) {
+            this.showError('Device orientation is not supported on this device.');
+            return;
+        }
+
+        // Request permission for iOS 13+
+        if (typeof DeviceOrientationEvent.requestPermission === 'function') {
+            DeviceOrientationEvent.requestPermission()
+                .then(response => {
+                    if (response === 'granted') {
+                        this.initCompass();
+                    } else {
+                        this.showError('Permission denied for device orientation.');
+                    }
+                })
+                .catch(error => {
+                    this.showError('Error requesting compass permission.');
+                });
+        } else {
+            this.initCompass();
+        }
+    }
+
+    initCompass() {
+        this.orientationHandler = (event) => {
+            let heading = event.alpha;
+            if (heading !== null) {
+                heading = heading < 0 ? heading + 360 : heading;
+                this.updateCompass(heading);
+            }
+        };
+
+        window.addEventListener('deviceorientationabsolute', this.orientationHandler);
+        window.addEventListener('deviceorientation', this.orientationHandler);
+
+        this.isCompassActive = true;
+        document.getElementById('startCompassBtn').classList.add('hidden');
+        document.getElementById('stopCompassBtn').classList.remove('hidden');
+
+        // Check if compass is working
+        setTimeout(() => {
+            if (this.currentHeading === 0) {
+                this.showError('Compass data not available. This feature works best on mobile devices.');
+            }
+        }, 3000);
+    }
+
+    updateCompass(heading) {
+        if (heading !== null && !isNaN(heading)) {
+            this.currentHeading = heading;
+
+            const needle = document.getElementById('compassNeedle');
+            const currentHeadingEl = document.getElementById('currentHeading');
+
+            needle.style.transform = `translateX(-50%) rotate(${360 - heading}deg)`;
+            currentHeadingEl.textContent = `${Math.round(heading)}°`;
+            this.updateCompassGuide();
+        }
+    }
+
+    updateCompassGuide() {
+        if (!this.selectedConstellation) return;
+
+        const guide = document.getElementById('compassGuide');
+        const difference = this.calculateAngleDifference(this.currentHeading, this.targetHeading);
+
+        if (Math.abs(difference) < 10) {
+            guide.innerHTML = `🎯 <strong>Perfect! Look ${this.targetAltitude}° up to find ${this.selectedConstellation}!</strong>`;
+            guide.className = 'text-lg text-green-400 font-medium';
+        } else if (difference > 0) {
+            guide.innerHTML = `↻ Turn right ${Math.round(Math.abs(difference))}° to find ${this.selectedConstellation}`;
+            guide.className = 'text-lg text-cosmic-gold font-medium';
+        } else {
+            guide.innerHTML = `↺ Turn left ${Math.round(Math.abs(difference))}° to find ${this.selectedConstellation}`;
+            guide.className = 'text-lg text-cosmic-gold font-medium';
+        }
+    }
+
+    calculateAngleDifference(current, target) {
+        let diff = target - current;
+        if (diff > 180) diff -= 360;
+        if (diff < -180) diff += 360;
+        return diff;
+    }
+
+    stopCompass() {
+        this.isCompassActive = false;
+
+        if (this.orientationHandler) {
+            window.removeEventListener('deviceorientationabsolute', this.orientationHandler);
+            window.removeEventListener('deviceorientation', this.orientationHandler);
+            this.orientationHandler = null;
+        }
+
+        document.getElementById('startCompassBtn').classList.remove('hidden');
+        document.getElementById('stopCompassBtn').classList.add('hidden');
+    }
+
+    showError(message) {
+        const existingError = document.querySelector('.error-message');
+        if (existingError) {
+            existingError.remove();
+        }
+
+        const errorDiv = document.createElement('div');
+        errorDiv.className = 'error-message fixed top-4 right-4 bg-red-500/90 text-white px-6 py-3 rounded-lg shadow-lg border border-red-400 z-50 max-w-sm';
+        errorDiv.innerHTML = `
+            <div class="flex items-center">
+                <span class="mr-2">⚠️</span>
+                <span class="flex-1">${message}</span>
+                <button onclick="this.parentElement.parentElement.remove()" class="ml-2 text-white hover:text-red-200">×</button>
+            </div>
+        `;
+        document.body.appendChild(errorDiv);
+
+        setTimeout(() => {
+            if (errorDiv.parentNode) {
+                errorDiv.remove();
+            }
+        }, 7000);
+    }
+}
+
+// Initialize the app when DOM is loaded
+document.addEventListener('DOMContentLoaded', () => {
+    new ConstellationFinder();
+});
@@ -1,3 +1,625 @@
-from django.test import TestCase
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.utils import timezone
+
+from ConstellationPredictor.llm import LLMError
+
+from . import geohash, views
+from .models import ConstellationQuery, LocationData, ResponseText
+from .nearby import find_nearby, haversine_km
+from .prompts import NARRATIVE, render_prompt
+from .result_cache import SkyResultCache
+from .sky import (
+    PROMINENT, altaz, compass_point, crossings, get_sky_engine, julian_date,
+    local_sidereal_time, pick_constellations, sun_position,
+)
+from .writebehind import WriteBehindBuffer
+
+J2000 = datetime(2000, 1, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+
+def make_buffer():
+    # Never flushes on its own: tests call flush()
+    return WriteBehindBuffer(batch_size=100, flush_seconds=3600, max_pending=100)
+
+
+class SiderealTimeTests(TestCase):
+    def test_julian_date_of_j2000(self):
+        self.assertAlmostEqual(julian_date(J2000), 2451545.0)
+
+    def test_greenwich_sidereal_time_at_j2000(self):
+        self.assertAlmostEqual(local_sidereal_time(J2000, 0), 280.46061837, places=6)
+
+    def test_east_longitude_adds(self):
+        self.assertAlmostEqual(local_sidereal_time(J2000, 90), 10.46061837, places=6)
+
+
+class AltAzTests(TestCase):
+    def test_pole_altitude_equals_declination(self):
+        for dec in (-30, 0, 45, 89):
+            altitude, _ = altaz(123.0, dec, 90, 10.0)
+            self.assertAlmostEqual(float(altitude), dec, places=6)
+
+    def test_meridian_transit(self):
+        # On the meridian, altitude is 90 - |latitude - dec|
+        altitude, azimuth = altaz(50.0, 30.0, 40, 50.0)
+        self.assertAlmostEqual(float(altitude), 80.0, places=6)
+        self.assertAlmostEqual(float(azimuth), 180.0, places=6)
+        altitude, azimuth = altaz(50.0, 60.0, 40, 50.0)
+        self.assertAlmostEqual(float(altitude), 70.0, places=6)
+        self.assertAlmostEqual(float(azimuth) % 360, 0.0, places=6)
+
+    def test_rising_in_the_east(self):
+        # Equator, celestial equator, six hours before transit: on the eastern horizon
+        altitude, azimuth = altaz(90.0, 0.0, 0, 0.0)
+        self.assertAlmostEqual(float(altitude), 0.0, places=6)
+        self.assertAlmostEqual(float(azimuth), 90.0, places=6)
+
+
+class CompassPointTests(TestCase):
+    def test_points(self):
+        cases = {0: 'North', 22: 'North', 23: 'Northeast', 90: 'East', 180: 'South',
+                 225: 'Southwest', 300: 'Northwest', 350: 'North'}
+        for azimuth, point in cases.items():
+            with self.subTest(azimuth=azimuth):
+                self.assertEqual(compass_point(azimuth), point)
+
+    def test_overhead(self):
+        self.assertEqual(compass_point(180, 80), 'Overhead')
+        self.assertEqual(compass_point(180, 60), 'South')
+
+
+class SkyEngineTests(TestCase):
+    def test_visible_is_sorted_and_filtered(self):
+        visible = get_sky_engine().visible(28.6, 77.2, J2000, min_altitude=15)
+        altitudes = [c['altitude'] for c in visible]
+        self.assertTrue(visible)
+        self.assertEqual(altitudes, sorted(altitudes, reverse=True))
+        self.assertGreaterEqual(min(altitudes), 15)
+
+    def test_circumpolar_constellations(self):
+        names = {c['name'] for c in get_sky_engine().visible(90, 0, J2000)}
+        self.assertIn('Ursa Minor', names)
+        self.assertNotIn('Octans', names)
+        names = {c['name'] for c in get_sky_engine().visible(-90, 0, J2000)}
+        self.assertIn('Octans', names)
+        self.assertNotIn('Ursa Minor', names)
+
+    def test_pick_puts_prominent_first(self):
+        visible = [
+            {'name': 'Lynx', 'altitude': 70},
+            {'name': 'Orion', 'altitude': 50},
+            {'name': 'Lepus', 'altitude': 40},
+            {'name': 'Taurus', 'altitude': 30},
+        ]
+        self.assertIn('Orion', PROMINENT)
+        picked = [c['name'] for c in pick_constellations(visible, 3)]
+        self.assertEqual(picked, ['Orion', 'Taurus', 'Lynx'])
+
+
+class FindConstellationsTests(TestCase):
+    def setUp(self):
+        caches['locator'].clear()
+        self.location = LocationData.objects.create(latitude=28.6, longitude=77.2)
+        self.buffer = make_buffer()
+        patcher = mock.patch.object(views, 'get_write_buffer', return_value=self.buffer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def find(self, location=None, **payload):
+        request = RequestFactory().post(
+            '/locator/find-constellations/',
+            json.dumps({'location_id': (location or self.location).id, **payload}),
+            content_type='application/json',
+        )
+        return json.loads(async_to_sync(views.find_constellations)(request).content)
+
+    def test_local_narrative(self):
+        with mock.patch.object(views, 'render_prompt') as render:
+            data = self.find(time='2000-01-01T12:00:00Z', narrative=False)
+        # The prompt is only built when Gemini is asked
+        render.assert_not_called()
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(data['narrative_source'], 'local')
+        self.assertTrue(data['visible_constellations'])
+        self.assertEqual(set(data['compass_directions']), set(data['visible_constellations']))
+        self.buffer.flush()
+        self.assertEqual(str(ConstellationQuery.objects.get().public_id), data['query_id'])
+
+    def test_invalid_time(self):
+        data = self.find(time='yesterday')
+        self.assertEqual(data, {'status': 'error', 'message': 'Invalid time; use ISO 8601'})
+
+    def test_llm_failure_falls_back_to_local_summary(self):
+        gateway = mock.Mock(configured=True)
+        gateway.generate.side_effect = LLMError('quota')
+        with mock.patch.object(views, 'get_llm_gateway', return_value=gateway):
+            data = self.find(time='2000-01-01T12:00:00Z', narrative=True)
+        gateway.generate.assert_called_once()
+        self.assertEqual(data['narrative_source'], 'local')
+        self.assertIn('constellations are above the horizon', data['response'])
+
+    def test_gemini_narrative(self):
+        gateway = mock.Mock(configured=True)
+        gateway.generate.return_value = ' Look south for Orion. '
+        with mock.patch.object(views, 'get_llm_gateway', return_value=gateway):
+            data = self.find(time='2000-01-01T12:00:00Z', narrative=True)
+        self.assertEqual(data['narrative_source'], 'gemini')
+        self.assertEqual(data['response'], 'Look south for Orion.')
+
+    def test_nearby_requests_share_a_result(self):
+        neighbour = LocationData.objects.create(latitude=28.601, longitude=77.201)
+        first = self.find(time='2025-01-15T20:00:00Z', narrative=False)
+        second = self.find(neighbour, time='2025-01-15T20:05:00Z', narrative=False)
+        self.assertEqual([first['cached'], second['cached']], [False, True])
+        self.assertEqual(first['cell'], second['cell'])
+        self.assertEqual(first['visible_constellations'], second['visible_constellations'])
+        # Each request records its own query, cache hit or not
+        self.assertNotEqual(first['query_id'], second['query_id'])
+        self.buffer.flush()
+        queries = ConstellationQuery.objects.order_by('id')
+        self.assertEqual([q.location_id for q in queries], [self.location.id, neighbour.id])
+        self.assertEqual(str(queries[1].public_id), second['query_id'])
+
+    def test_nearby_sees_cache_hits(self):
+        neighbour = LocationData.objects.create(latitude=28.601, longitude=77.201)
+        first = self.find(time='2025-01-15T20:00:00Z', narrative=False)
+        self.find(neighbour, time='2025-01-15T20:05:00Z', narrative=False)
+        self.buffer.flush()
+        nearby = find_nearby(28.6, 77.2, 5, timezone.now() - timedelta(hours=1), 10)
+        visible = first['visible_constellations']
+        self.assertTrue(visible)
+        self.assertEqual([o['visible_constellations'] for o in nearby['observations']], [visible, visible])
+
+
+class SunPositionTests(TestCase):
+    def test_sun_at_j2000(self):
+        ra, dec = sun_position(julian_date(J2000))
+        self.assertAlmostEqual(float(ra), 281.29, delta=0.05)
+        self.assertAlmostEqual(float(dec), -23.03, delta=0.05)
+
+    def test_equinox(self):
+        _, dec = sun_position(julian_date(datetime(2024, 3, 20, 3, 6, tzinfo=dt_timezone.utc)))
+        self.assertAlmostEqual(float(dec), 0.0, delta=0.05)
+
+
+class TimelineTests(TestCase):
+    def night(self, latitude, longitude=0.0, step=10):
+        start = datetime(2024, 1, 15, 12, tzinfo=dt_timezone.utc)
+        return get_sky_engine().timeline(latitude, longitude, start, start + timedelta(days=1), step, 15, -12)
+
+    def by_name(self, result):
+        return {c['name']: c for c in result['constellations']}
+
+    def test_crossings_are_interpolated(self):
+        times = np.array([0.0, 60.0, 120.0])
+        altitude = np.array([[-1.0, 3.0], [1.0, -1.0], [2.0, -2.0]])
+        up = altitude > 0
+        self.assertEqual(crossings(times, altitude, ~up[:-1] & up[1:]), {0: 30.0})
+        self.assertEqual(crossings(times, altitude, up[:-1] & ~up[1:]), {1: 45.0})
+
+    def test_circumpolar_and_never_rises(self):
+        constellations = self.by_name(self.night(60))
+        self.assertTrue(constellations['Ursa Minor']['circumpolar'])
+        self.assertIsNone(constellations['Ursa Minor']['rise'])
+        self.assertTrue(constellations['Octans']['never_rises'])
+        self.assertEqual(constellations['Octans']['windows'], [])
+        self.assertIsNone(constellations['Octans']['best'])
+
+    def test_rise_transit_set_are_ordered(self):
+        result = self.night(30)
+        orion = self.by_name(result)['Orion']
+        self.assertLess(orion['rise'], orion['transit'])
+        self.assertLess(orion['transit'], orion['set'])
+        # Transit altitude is 90 - |latitude - dec|
+        dec = get_sky_engine().dec[get_sky_engine().names.index('Orion')]
+        self.assertAlmostEqual(orion['transit_altitude'], 90 - abs(30 - dec), places=1)
+
+    def test_windows_are_dark_and_high(self):
+        result = self.night(30)
+        night = result['night']
+        self.assertIsNotNone(night)
+        series = result['series']
+        orion = self.by_name(result)['Orion']
+        self.assertTrue(orion['windows'])
+        i = get_sky_engine().names.index('Orion')
+        for first, last in orion['windows']:
+            self.assertGreaterEqual(first, night['start'])
+            self.assertLessEqual(last, night['end'])
+            steps = (series['times'] >= first) & (series['times'] <= last)
+            self.assertTrue((series['altitude'][steps, i] >= 15).all())
+        self.assertGreaterEqual(orion['best']['altitude'], 15)
+
+    def test_polar_day_has_no_night(self):
+        start = datetime(2024, 6, 21, 12, tzinfo=dt_timezone.utc)
+        result = get_sky_engine().timeline(80, 0, start, start + timedelta(days=1), 10, 15, -12)
+        self.assertIsNone(result['night'])
+        self.assertTrue(all(c['best'] is None for c in result['constellations']))
+
+
+class VisibilityTimelineTests(TestCase):
+    def setUp(self):
+        caches['locator'].clear()
+
+    def get(self, **params):
+        request = RequestFactory().get('/locator/timeline/', params)
+        return json.loads(views.visibility_timeline(request).content)
+
+    def test_timeline(self):
+        data = self.get(lat=28.61, lng=77.21, date='2024-01-15', tz='Asia/Kolkata')
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(data['date'], '2024-01-15')
+        self.assertEqual(data['timezone'], 'Asia/Kolkata')
+        self.assertEqual(data['cell'], {'latitude': 28.625, 'longitude': 77.125})
+        self.assertEqual(len(data['constellations']), 88)
+        self.assertTrue(data['night']['start'].startswith('2024-01-15T1'))
+        self.assertTrue(data['night']['start'].endswith('+05:30'))
+        self.assertNotIn('series', data)
+        first = data['constellations'][0]
+        self.assertIsNotNone(first['best'])
+        self.assertIsNone(data['constellations'][-1]['best'])
+
+    def test_series(self):
+        data = self.get(lat=28.61, lng=77.21, date='2024-01-15', step=30, series=1)
+        self.assertEqual(len(data['series']['times']), 49)
+        self.assertEqual(len(data['series']['altitude']['Orion']), 49)
+        # Solar time from the longitude: +05:00
+        self.assertTrue(data['series']['times'][0].endswith('+05:00'))
+
+    def test_nearby_points_share_a_cache_entry(self):
+        with mock.patch.object(views, 'build_timeline', wraps=views.build_timeline) as build:
+            self.get(lat=28.61, lng=77.21, date='2024-01-15', utc_offset=330)
+            self.get(lat=28.62, lng=77.24, date='2024-01-15', utc_offset=330)
+        build.assert_called_once()
+
+    def test_invalid_input(self):
+        cases = [
+            ({'lng': 10}, 'Valid lat and lng are required'),
+            ({'lat': 95, 'lng': 10}, 'Valid lat and lng are required'),
+            ({'lat': 'nan', 'lng': 10}, 'Valid lat and lng are required'),
+            ({'lat': 10, 'lng': 10, 'tz': 'Mars/Olympus'}, 'Unknown time zone'),
+            ({'lat': 10, 'lng': 10, 'date': '15/01/2024'}, 'Invalid date or step'),
+            ({'lat': 10, 'lng': 10, 'step': 'ten'}, 'Invalid date or step'),
+        ]
+        for params, message in cases:
+            with self.subTest(params=params):
+                self.assertEqual(self.get(**params), {'status': 'error', 'message': message})
+
+    def test_grid_cell(self):
+        self.assertEqual(views.grid_cell(28.61, 77.21, 0.25), (28.625, 77.125))
+        self.assertEqual(views.grid_cell(-0.1, -0.1, 0.25), (-0.125, -0.125))
+        self.assertEqual(views.grid_cell(90, 0, 0.25), (90.0, 0.125))
+
+
+class QueryLogTests(TestCase):
+    def test_prompt_is_rendered_from_template(self):
+        location = LocationData.objects.create(latitude=28.6, longitude=77.2)
+        params = {
+            'latitude': 28.6, 'longitude': 77.2, 'time': '2025-01-15 20:00',
+            'constellations': [['Orion', 'Southeast', 42.4]],
+        }
+        response = ResponseText.for_text('Look for Orion.')
+        response.save()
+        query = ConstellationQuery.objects.create(
+            location=location, prompt_template=NARRATIVE, prompt_params=params, response=response,
+        )
+        self.assertIn('- Orion: Southeast, 42 degrees above the horizon', query.query_text)
+        self.assertEqual(query.query_text, render_prompt(NARRATIVE, params))
+        self.assertEqual(query.gemini_response, 'Look for Orion.')
+        self.assertEqual(response.sha256, hashlib.sha256(b'Look for Orion.').hexdigest())
+
+
+class CompactLocatorLogTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.old = now - timedelta(days=400)
+        self.shared = ResponseText.objects.create(sha256='a' * 64, text='shared', created_at=self.old)
+        self.orphan = ResponseText.objects.create(sha256='b' * 64, text='orphan', created_at=self.old)
+        self.fresh = ResponseText.objects.create(sha256='c' * 64, text='fresh')
+        self.stale_location = LocationData.objects.create(latitude=1, longitude=1, created_at=self.old)
+        self.kept_location = LocationData.objects.create(latitude=2, longitude=2, created_at=self.old)
+        self.stale_query = self.query(self.stale_location, self.old)
+        self.kept_query = self.query(self.kept_location, now)
+
+    def query(self, location, created_at):
+        return ConstellationQuery.objects.create(
+            location=location, prompt_template='legacy', prompt_params={'text': ''},
+            response=self.shared, created_at=created_at,
+        )
+
+    def compact(self, *args):
+        out = StringIO()
+        call_command('compact_locator_log', '--days=30', '--pause=0', '--batch-size=1', *args, stdout=out)
+        return out.getvalue()
+
+    def test_deletes_expired_rows_in_batches(self):
+        output = self.compact()
+        self.assertIn('Deleted 1 queries', output)
+        self.assertIn('Deleted 1 locations', output)
+        self.assertIn('Deleted 1 responses', output)
+        self.assertQuerySetEqual(ConstellationQuery.objects.all(), [self.kept_query])
+        # A location with a recent query is kept however old it is
+        self.assertQuerySetEqual(LocationData.objects.all(), [self.kept_location])
+        # Referenced or still inside the grace period
+        self.assertQuerySetEqual(
+            ResponseText.objects.order_by('sha256'), [self.shared, self.fresh]
+        )
+
+    def test_dry_run(self):
+        output = self.compact('--dry-run')
+        # Counted up front, so the stale location still has its query
+        self.assertEqual(output.split('\n')[:3], [
+            'Would delete 1 queries', 'Would delete 0 locations', 'Would delete 1 responses',
+        ])
+        self.assertEqual(ConstellationQuery.objects.count(), 2)
+
+
+class CompactQueryLogMigrationTests(TransactionTestCase):
+    migrate_from = [('Locator', '0002_public_id')]
+
+    def setUp(self):
+        self.executor = MigrationExecutor(connection)
+        self.migrate_to = self.executor.loader.graph.leaf_nodes('Locator')
+        self.executor.migrate(self.migrate_from)
+
+    def tearDown(self):
+        MigrationExecutor(connection).migrate(self.migrate_to)
+
+    def test_queries_move_to_legacy_template_and_shared_responses(self):
+        apps = self.executor.loader.project_state(self.migrate_from).apps
+        Location = apps.get_model('Locator', 'LocationData')
+        Query = apps.get_model('Locator', 'ConstellationQuery')
+        location = Location.objects.create(latitude=28.6, longitude=77.2)
+        for prompt in ('first prompt', 'second prompt'):
+            Query.objects.create(location=location, query_text=prompt, gemini_response='Same reply')
+
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_to)
+
+        queries = ConstellationQuery.objects.order_by('pk')
+        self.assertEqual([q.query_text for q in queries], ['first prompt', 'second prompt'])
+        self.assertEqual({q.prompt_template for q in queries}, {'legacy'})
+        self.assertEqual([q.gemini_response for q in queries], ['Same reply', 'Same reply'])
+        self.assertEqual(ResponseText.objects.count(), 1)
+
+
+class LocationFromTests(TestCase):
+    def test_string_coordinates_are_coerced(self):
+        location = views.location_from({'latitude': '28.6', 'longitude': '77.2'}, AnonymousUser())
+        self.assertEqual((location.latitude, location.longitude), (28.6, 77.2))
+
+    def test_equator_and_meridian_are_valid(self):
+        location = views.location_from({'latitude': 0, 'longitude': 0}, AnonymousUser())
+        self.assertEqual((location.latitude, location.longitude), (0.0, 0.0))
+
+    def test_missing_coordinates(self):
+        self.assertIsNone(views.location_from({'latitude': 10}, AnonymousUser()))
+
+    def test_invalid_coordinates_are_rejected(self):
+        for lat, lng in [('abc', 10), (10, [1]), ('nan', 10), (10, 'inf'), (91, 0), (0, -181)]:
+            with self.subTest(lat=lat, lng=lng), self.assertRaises(ValueError):
+                views.location_from({'latitude': lat, 'longitude': lng}, AnonymousUser())
+
+
+class SaveLocationTests(TestCase):
+    def test_invalid_latitude_is_not_buffered(self):
+        buffer = make_buffer()
+        request = RequestFactory().post(
+            '/locator/save-location/',
+            json.dumps({'latitude': 'abc', 'longitude': 10}),
+            content_type='application/json',
+        )
+        request.user = AnonymousUser()
+        with mock.patch.object(views, 'get_write_buffer', return_value=buffer):
+            response = views.save_location(request)
+        self.assertEqual(json.loads(response.content)['status'], 'error')
+        self.assertEqual(buffer.stats()['pending'], 0)
+
+
+class WriteBehindBufferTests(TestCase):
+    def query_for(self, location, text):
+        response = ResponseText.for_text(text)
+        return response, ConstellationQuery(
+            location=location, prompt_template=NARRATIVE, prompt_params={},
+            response=response, visible_constellations=['Orion'],
+        )
+
+    def test_flush_writes_parents_before_queries(self):
+        buffer = make_buffer()
+        location = LocationData(latitude=28.6, longitude=77.2)
+        response, query = self.query_for(location, 'Orion is up')
+        for obj in (query, response, location):
+            buffer.add(obj)
+        self.assertIs(buffer.pending_location(location.public_id), location)
+
+        self.assertEqual(buffer.flush(), 3)
+        self.assertIsNone(buffer.pending_location(location.public_id))
+        saved = LocationData.objects.get(public_id=location.public_id)
+        self.assertEqual(saved.geohash_5, 'ttnfs')
+        self.assertEqual(ConstellationQuery.objects.get().gemini_response, 'Orion is up')
+
+    def test_invalid_record_is_dropped_and_the_rest_written(self):
+        buffer = make_buffer()
+        good = LocationData(latitude=28.6, longitude=77.2)
+        bad = LocationData(latitude='abc', longitude=10)
+        response, orphan = self.query_for(bad, 'Nothing')
+        for obj in (bad, good, response, orphan):
+            buffer.add(obj)
+
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(list(LocationData.objects.values_list('public_id', flat=True)), [good.public_id])
+        stats = buffer.stats()
+        self.assertEqual((stats['dropped'], stats['pending'], stats['failures']), (2, 0, 0))
+
+    def test_unconvertible_value_falls_back_to_row_by_row(self):
+        buffer = make_buffer()
+        good = LocationData(latitude=1, longitude=2)
+        bad = LocationData(latitude=3, longitude=4, accuracy='bad')
+        buffer.add(bad)
+        buffer.add(good)
+
+        self.assertEqual(buffer.flush(), 1)
+        self.assertTrue(LocationData.objects.filter(public_id=good.public_id).exists())
+        self.assertEqual(buffer.stats()['dropped'], 1)
+
+    def test_database_error_requeues_the_batch(self):
+        buffer = make_buffer()
+        location = LocationData(latitude=28.6, longitude=77.2)
+        response, query = self.query_for(location, 'Later')
+        for obj in (location, response, query):
+            buffer.add(obj)
+
+        with mock.patch.object(LocationData.objects, 'bulk_create', side_effect=OperationalError('locked')):
+            self.assertEqual(buffer.flush(), 0)
+        stats = buffer.stats()
+        self.assertEqual((stats['failures'], stats['pending'], stats['dropped']), (1, 3, 0))
+        self.assertIs(buffer.pending_location(location.public_id), location)
+
+        self.assertEqual(buffer.flush(), 3)
+        self.assertEqual(ConstellationQuery.objects.count(), 1)
+
+    def test_overflow_drops_oldest(self):
+        buffer = WriteBehindBuffer(batch_size=100, flush_seconds=3600, max_pending=2)
+        locations = [LocationData(latitude=i, longitude=i) for i in range(3)]
+        for location in locations:
+            buffer.add(location)
+        self.assertIsNone(buffer.pending_location(locations[0].public_id))
+        self.assertEqual(buffer.stats()['dropped'], 1)
+
+
+class LocateConstellationsTests(TestCase):
+    def setUp(self):
+        caches['locator'].clear()
+
+    def test_string_coordinates(self):
+        # Clients have always been able to send coordinates as JSON strings
+        buffer = make_buffer()
+        with mock.patch.object(views, 'get_write_buffer', return_value=buffer):
+            response = self.client.post(
+                '/locator/locate/',
+                {'latitude': '28.6', 'longitude': '77.2', 'narrative': False},
+                content_type='application/json',
+            )
+        data = response.json()
+        self.assertEqual(data['status'], 'success', data)
+        self.assertEqual(data['cell'], 'ttnfs')
+
+
+class SkyResultCacheTests(TestCase):
+    def setUp(self):
+        caches['locator'].clear()
+        self.cache = SkyResultCache(caches['locator'], precision=5, bucket_minutes=15, ttl=3600, fallback_ttl=60)
+
+    def test_nearby_points_share_a_cell(self):
+        when = datetime(2025, 1, 15, 20, 7, tzinfo=dt_timezone.utc)
+        a = self.cache.cell(28.6, 77.2, when, 'local')
+        b = self.cache.cell(28.601, 77.201, when + timedelta(minutes=5), 'local')
+        self.assertEqual(a, b)
+        self.assertEqual(a.when, datetime(2025, 1, 15, 20, 7, 30, tzinfo=dt_timezone.utc))
+        self.assertNotEqual(a.key, self.cache.cell(28.6, 77.2, when, 'gemini').key)
+
+    def test_get_or_compute(self):
+        cell = self.cache.cell(28.6, 77.2, timezone.now())
+        calls = []
+
+        def compute(cell):
+            calls.append(cell)
+            return {'n': len(calls)}, False
+
+        self.assertEqual(self.cache.get_or_compute(cell, compute), ({'n': 1}, False))
+        self.assertEqual(self.cache.get_or_compute(cell, compute), ({'n': 1}, True))
+        self.assertEqual(len(calls), 1)
+        stats = self.cache.stats()
+        self.assertEqual(stats['process'], {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+        self.assertEqual(stats['shared']['hits'], 1)
+
+    def test_fallback_results_use_the_short_ttl(self):
+        cell = self.cache.cell(28.6, 77.2, timezone.now())
+        backend = mock.Mock(wraps=caches['locator'])
+        self.cache.backend = backend
+        self.cache.get_or_compute(cell, lambda cell: ({}, True))
+        backend.set.assert_called_once_with(cell.key, {}, 60)
+
+
+class GeohashTests(TestCase):
+    def test_encode_decode(self):
+        self.assertEqual(geohash.encode(57.64911, 10.40744, 11), 'u4pruydqqvj')
+        latitude, longitude = geohash.decode('u4pruydqqvj')
+        self.assertAlmostEqual(latitude, 57.64911, places=4)
+        self.assertAlmostEqual(longitude, 10.40744, places=4)
+
+    def test_covering_contains_every_point_in_the_box(self):
+        cells = geohash.covering(51.0, -0.5, 51.2, 0.3, 5)
+        self.assertLessEqual(len(cells), geohash.covering_count(51.0, -0.5, 51.2, 0.3, 5))
+        for lat in (51.0, 51.05, 51.2):
+            for lng in (-0.5, 0.0, 0.3):
+                self.assertIn(geohash.encode(lat, lng, 5), cells)
+
+    def test_covering_across_the_antimeridian(self):
+        cells = geohash.covering(-17.0, 179.8, -16.9, 180.2, 4)
+        self.assertIn(geohash.encode(-16.95, 179.9, 4), cells)
+        self.assertIn(geohash.encode(-16.95, -179.9, 4), cells)
+
+
+class NearbyTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.points = [
+            (51.5, -0.1, now),
+            (51.52, -0.12, now - timedelta(hours=2)),
+            (51.6, 0.2, now),                       # ~24 km away
+            (51.5, -0.1, now - timedelta(days=3)),  # too old
+            (-33.9, 151.2, now),
+        ]
+        for lat, lng, created_at in self.points:
+            LocationData.objects.create(latitude=lat, longitude=lng, created_at=created_at)
+
+    def test_matches_brute_force(self):
+        since = timezone.now() - timedelta(hours=24)
+        for radius_km in (1, 5, 30, 100):
+            with self.subTest(radius_km=radius_km):
+                expected = sorted(
+                    haversine_km(51.5, -0.1, lat, lng) for lat, lng, created_at in self.points
+                    if created_at >= since and haversine_km(51.5, -0.1, lat, lng) <= radius_km
+                )
+                result = find_nearby(51.5, -0.1, radius_km, since, 50)
+                self.assertEqual(
+                    [o['distance_km'] for o in result['observations']], [round(d, 1) for d in expected]
+                )
+                self.assertLessEqual(result['cells'], settings.LOCATOR_NEARBY_MAX_CELLS)
+
+    def test_positions_are_rounded_to_a_cell(self):
+        result = find_nearby(51.52, -0.12, 1, timezone.now() - timedelta(hours=24), 50)
+        observation = result['observations'][0]
+        self.assertNotEqual((observation['latitude'], observation['longitude']), (51.52, -0.12))
+        self.assertLess(haversine_km(51.52, -0.12, observation['latitude'], observation['longitude']), 1)
+
+    def test_rejects_non_finite_parameters(self):
+        for params in (
+            {'lat': 'nan', 'lng': '0'},
+            {'lat': '51.5', 'lng': 'inf'},
+            {'lat': '51.5', 'lng': '-0.1', 'radius_km': 'nan'},
+            {'lat': '51.5', 'lng': '-0.1', 'hours': 'nan'},
+            {'lat': '51.5', 'lng': '-0.1', 'limit': 'x'},
+        ):
+            with self.subTest(params=params):
+                data = self.client.get('/locator/nearby/', params).json()
+                self.assertEqual(data['status'], 'error')
+
+    def test_view(self):
+        data = self.client.get('/locator/nearby/', {'lat': '51.5', 'lng': '-0.1', 'radius_km': '5'}).json()
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(len(data['observations']), 2)
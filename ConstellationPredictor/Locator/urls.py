@@ -7,4 +7,8 @@ urlpatterns = [
     path('', views.ConstellationFinderView.as_view(), name='locator'),
     path('save-location/', views.save_location, name='save_location'),
     path('find-constellations/', views.find_constellations, name='find_constellations'),
+    path('locate/', views.locate_constellations, name='locate_constellations'),
+    path('timeline/', views.visibility_timeline, name='visibility_timeline'),
+    path('nearby/', views.nearby_observations, name='nearby_observations'),
+    path('status/', views.locator_status, name='locator_status'),
 ]
\ No newline at end of file
@@ -1,49 +1,97 @@
 import json
-import requests
 from django.shortcuts import render
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
-from django.utils.decorators import method_decorator
 from django.views import View
-from .models import LocationData, ConstellationQuery
-import google.generativeai as genai
-from datetime import datetime
+from .models import LocationData, ConstellationQuery, ResponseText
+from .prompts import NARRATIVE, narrative_params, render_prompt
+from ConstellationPredictor.llm import LLMError, get_llm_gateway
+from ConstellationPredictor.offload import run_blocking
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+from django.core.cache import caches
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views.decorators.http import require_GET
+from .sky import get_sky_engine, pick_constellations
+from .result_cache import get_result_cache
+from .writebehind import get_write_buffer
+from .nearby import find_nearby
 import math
-import re
+import uuid
 from dotenv import load_dotenv
 load_dotenv()
-import os
 
 class ConstellationFinderView(View):
     def get(self, request):
         return render(request, 'Locator/index.html')
 
+
+def location_from(data, user):
+    """
+    An unsaved LocationData from request JSON, or None without coordinates.
+    Raises ValueError unless they are numbers on the globe.
+    """
+    lat = data.get('latitude')
+    lng = data.get('longitude')
+    if lat in (None, '') or lng in (None, ''):
+        return None
+    try:
+        latitude, longitude = float(lat), float(lng)
+        accuracy = float(data.get('accuracy') or 0)
+    except (TypeError, ValueError):
+        raise ValueError("Latitude, longitude and accuracy must be numbers")
+    if not all(map(math.isfinite, (latitude, longitude, accuracy))):
+        raise ValueError("Latitude, longitude and accuracy must be finite")
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError("Latitude or longitude out of range")
+    return LocationData(
+        user=user if user.is_authenticated else None,
+        latitude=latitude,
+        longitude=longitude,
+        accuracy=accuracy
+    )
+
+
+async def find_location(location_id):
+    """LocationData by public ID (possibly not written yet) or by legacy numeric ID."""
+    if str(location_id).isdigit():
+        return await LocationData.objects.filter(id=location_id).afirst()
+    try:
+        public_id = uuid.UUID(str(location_id))
+    except ValueError:
+        return None
+    location = get_write_buffer().pending_location(public_id)
+    if location is None:
+        location = await LocationData.objects.filter(public_id=public_id).afirst()
+    return location
+
+
 @csrf_exempt
 def save_location(request):
     if request.method == 'POST':
         try:
             data = json.loads(request.body)
-            lat = data.get('latitude')
-            lng = data.get('longitude')
-            accuracy = data.get('accuracy', 0)
-            
-            if not lat or not lng:
+            try:
+                location = location_from(data, request.user)
+            except ValueError as e:
+                return JsonResponse({
+                    'status': 'error',
+                    'message': str(e)
+                })
+            if location is None:
                 return JsonResponse({
                     'status': 'error', 
                     'message': 'Latitude and longitude are required'
                 })
             
-            location = LocationData.objects.create(
-                user=request.user if request.user.is_authenticated else None,
-                latitude=lat,
-                longitude=lng,
-                accuracy=accuracy
-            )
+            # Written in the background; the public ID is usable right away
+            get_write_buffer().add(location)
             
             return JsonResponse({
                 'status': 'success',
-                'location_id': location.id,
+                'location_id': str(location.public_id),
                 'message': 'Location saved successfully'
             })
             
@@ -61,7 +109,7 @@ def save_location(request):
     return JsonResponse({'status': 'error', 'message': 'Invalid request method'})
 
 @csrf_exempt
-def find_constellations(request):
+async def find_constellations(request):
     if request.method == 'POST':
         try:
             data = json.loads(request.body)
@@ -73,247 +121,320 @@ def find_constellations(request):
                     'message': 'Location ID is required'
                 })
             
-            # Get location from database
-            try:
-                location = LocationData.objects.get(id=location_id)
-            except LocationData.DoesNotExist:
+            location = await find_location(location_id)
+            if location is None:
                 return JsonResponse({
                     'status': 'error', 
                     'message': 'Location not found'
                 })
             
-            # Configure Gemini AI
-            gemini_api_key = os.getenv('GEMINI_API_KEY')
-            if not gemini_api_key:
-                return JsonResponse({
-                    'status': 'error', 
-                    'message': 'Gemini API key not configured'
-                })
-            
-            genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-            model = genai.GenerativeModel('gemini-3-flash-preview')
-            
-            current_time = datetime.now()
-            current_hour = current_time.hour
-            prompt = f"""
-            Location: Latitude {location.latitude}, Longitude {location.longitude}
-            Date: {current_time.strftime('%Y-%m-%d')}
-            Time: {current_time.strftime('%H:%M')} ({current_hour}:00)
-            
-            Please provide a simple response about constellations visible from this location tonight:
-            
-            1. Give a brief description (2-3 sentences) of what constellations are visible
-            2. List 5-7 major constellations that can be seen
-            3. For each constellation, specify the general compass direction (North, South, East, West, Northeast, Northwest, Southeast, Southwest, or Overhead)
-            Also tell where am i based on location.
-            Keep the response simple and practical for someone using a phone compass to find constellations.
-            Format: Just plain text, no special formatting or symbols.
-            """
-            
-            # Get response from Gemini
+            return await constellations_response(location, data)
+
+        except json.JSONDecodeError:
+            return JsonResponse({
+                'status': 'error', 
+                'message': 'Invalid JSON data'
+            })
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error', 
+                'message': f'Server error: {str(e)}'
+            })
+    
+    return JsonResponse({'status': 'error', 'message': 'Invalid request method'})
+
+@csrf_exempt
+async def locate_constellations(request):
+    """save_location and find_constellations in one round trip."""
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
             try:
-                response = model.generate_content(prompt)
-                gemini_response = response.text.strip()
-                
-                # Extract constellation information
-                visible_constellations = extract_constellation_names(gemini_response)
-                compass_directions = extract_compass_directions(gemini_response, visible_constellations)
-                
-                # Save query to database
-                constellation_query = ConstellationQuery.objects.create(
-                    location=location,
-                    query_text=prompt,
-                    gemini_response=gemini_response,
-                    visible_constellations=visible_constellations
-                )
-                
+                location = location_from(data, await request.auser())
+            except ValueError as e:
                 return JsonResponse({
-                    'status': 'success',
-                    'response': gemini_response,
-                    'visible_constellations': visible_constellations,
-                    'compass_directions': compass_directions,
-                    'query_id': constellation_query.id
+                    'status': 'error',
+                    'message': str(e)
                 })
-                
-            except Exception as e:
+            if location is None:
                 return JsonResponse({
-                    'status': 'error', 
-                    'message': f'Gemini API error: {str(e)}'
+                    'status': 'error',
+                    'message': 'Latitude and longitude are required'
                 })
-                
+
+            get_write_buffer().add(location)
+            return await constellations_response(location, data)
+
         except json.JSONDecodeError:
             return JsonResponse({
-                'status': 'error', 
+                'status': 'error',
                 'message': 'Invalid JSON data'
             })
         except Exception as e:
             return JsonResponse({
-                'status': 'error', 
+                'status': 'error',
                 'message': f'Server error: {str(e)}'
             })
-    
+
     return JsonResponse({'status': 'error', 'message': 'Invalid request method'})
 
-def extract_constellation_names(text):
-    """Extract constellation names from Gemini response using improved pattern matching"""
-    
-    # Common constellation names to look for
-    common_constellations = [
-        'Ursa Major', 'Big Dipper', 'Great Bear',
-        'Ursa Minor', 'Little Dipper', 'Little Bear',
-        'Cassiopeia', 'The Queen',
-        'Orion', 'The Hunter',
-        'Leo', 'The Lion',
-        'Virgo', 'The Maiden',
-        'Libra', 'The Scales',
-        'Scorpius', 'Scorpio', 'The Scorpion',
-        'Sagittarius', 'The Archer',
-        'Capricornus', 'Capricorn', 'The Sea Goat',
-        'Aquarius', 'The Water Bearer',
-        'Pisces', 'The Fish',
-        'Aries', 'The Ram',
-        'Taurus', 'The Bull',
-        'Gemini', 'The Twins',
-        'Cancer', 'The Crab',
-        'Andromeda', 'The Princess',
-        'Perseus', 'The Hero',
-        'Auriga', 'The Charioteer',
-        'Bootes', 'Boötes', 'The Herdsman',
-        'Corona Borealis', 'Northern Crown',
-        'Cygnus', 'The Swan',
-        'Lyra', 'The Harp',
-        'Aquila', 'The Eagle',
-        'Draco', 'The Dragon',
-        'Hercules', 'The Strongman',
-        'Ophiuchus', 'The Serpent Bearer',
-        'Serpens', 'The Serpent',
-        'Canis Major', 'The Great Dog',
-        'Canis Minor', 'The Little Dog',
-        'Pegasus', 'The Winged Horse',
-        'Cepheus', 'The King',
-        'Lacerta', 'The Lizard',
-        'Vela', 'The Sails',
-        'Centaurus', 'The Centaur',
-        'Crux', 'Southern Cross',
-        'Polaris', 'North Star', 'Pole Star'
-    ]
-    
-    found_constellations = []
-    text_upper = text.upper()
-    
-    for constellation in common_constellations:
-        # Check if constellation name appears in text
-        if constellation.upper() in text_upper:
-            # Use the most common name
-            if constellation in ['Big Dipper', 'Great Bear']:
-                if 'Ursa Major' not in found_constellations:
-                    found_constellations.append('Ursa Major')
-            elif constellation in ['Little Dipper', 'Little Bear']:
-                if 'Ursa Minor' not in found_constellations:
-                    found_constellations.append('Ursa Minor')
-            elif constellation in ['The Queen']:
-                if 'Cassiopeia' not in found_constellations:
-                    found_constellations.append('Cassiopeia')
-            elif constellation in ['The Hunter']:
-                if 'Orion' not in found_constellations:
-                    found_constellations.append('Orion')
-            elif constellation in ['Scorpio', 'The Scorpion']:
-                if 'Scorpius' not in found_constellations:
-                    found_constellations.append('Scorpius')
-            elif constellation in ['Capricorn', 'The Sea Goat']:
-                if 'Capricornus' not in found_constellations:
-                    found_constellations.append('Capricornus')
-            elif constellation in ['Boötes', 'The Herdsman']:
-                if 'Bootes' not in found_constellations:
-                    found_constellations.append('Bootes')
-            elif constellation in ['North Star', 'Pole Star']:
-                if 'Polaris' not in found_constellations:
-                    found_constellations.append('Polaris')
-            elif constellation in ['Southern Cross']:
-                if 'Crux' not in found_constellations:
-                    found_constellations.append('Crux')
-            else:
-                # Use the constellation name as-is if it's not an alias
-                clean_name = constellation.replace('The ', '')
-                if clean_name not in found_constellations:
-                    found_constellations.append(clean_name)
-    
-    # Remove duplicates while preserving order
-    unique_constellations = []
-    for constellation in found_constellations:
-        if constellation not in unique_constellations:
-            unique_constellations.append(constellation)
-    
-    return unique_constellations[:8]  # Limit to 8 constellations
+async def constellations_response(location, data):
+    when = timezone.now()
+    if data.get('time'):
+        when = parse_datetime(data['time'])
+        if when is None:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Invalid time; use ISO 8601'
+            })
+        if timezone.is_naive(when):
+            when = timezone.make_aware(when, dt_timezone.utc)
 
-def extract_compass_directions(text, constellations):
-    """Extract compass directions for each constellation from Gemini response"""
-    
-    directions = {}
-    
-    # Direction keywords mapping
-    direction_keywords = {
-        'north': ['North', 'N'],
-        'northeast': ['Northeast', 'NE'],
-        'east': ['East', 'E'],
-        'southeast': ['Southeast', 'SE'],
-        'south': ['South', 'S'],
-        'southwest': ['Southwest', 'SW'],
-        'west': ['West', 'W'],
-        'northwest': ['Northwest', 'NW'],
-        'overhead': ['Overhead', 'Zenith', 'Above']
+    gateway = get_llm_gateway()
+    narrate = bool(data.get('narrative', settings.LOCATOR_NARRATIVE)) and gateway.configured
+    result_cache = get_result_cache()
+    cell = result_cache.cell(
+        location.latitude, location.longitude, when, 'gemini' if narrate else 'local'
+    )
+    result, cached = await run_blocking(
+        result_cache.get_or_compute, cell, lambda cell: sky_result(cell, narrate)
+    )
+    # Logged for every request, cached or not; the ID is this request's own
+    constellation_query = record_query(location, cell, result)
+
+    return JsonResponse({
+        'status': 'success',
+        **result,
+        'query_id': str(constellation_query.public_id),
+        'location_id': str(location.public_id),
+        'cell': cell.geohash,
+        'cached': cached,
+    })
+
+def locator_status(request):
+    """
+    Operator view of the Locator: result cache hit rates (this process and
+    all workers) and Gemini usage for narratives. Only available to staff
+    users (or anyone when DEBUG is on).
+    """
+    if not (settings.DEBUG or request.user.is_staff):
+        return JsonResponse({'error': 'Not found'}, status=404)
+    return JsonResponse({
+        'cache': get_result_cache().stats(),
+        'writes': get_write_buffer().stats(),
+        'llm': get_llm_gateway().stats()['purposes'].get('locator'),
+    })
+
+def finite_float(value):
+    """float(value), but NaN and infinity raise ValueError too."""
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{value!r} is not a finite number")
+    return number
+
+# ── Night timeline ──
+
+def timeline_zone(request, longitude):
+    """Time zone for the timeline: ?tz= (IANA name), ?utc_offset= (minutes), or solar time."""
+    name = request.GET.get('tz')
+    if name:
+        return ZoneInfo(name)
+    offset = request.GET.get('utc_offset')
+    minutes = int(offset) if offset else round(longitude / 15) * 60
+    return dt_timezone(timedelta(minutes=minutes))
+
+
+def grid_cell(latitude, longitude, size):
+    """Centre of the ``size``-degree grid cell containing a point."""
+    cell_lat = min(max((math.floor(latitude / size) + 0.5) * size, -90.0), 90.0)
+    cell_lng = (math.floor(longitude / size) + 0.5) * size
+    return round(cell_lat, 6), round(cell_lng, 6)
+
+
+def build_timeline(latitude, longitude, date, tz, step, series):
+    # The night of ``date``: local noon to the next local noon
+    start = datetime.combine(date, time(12), tzinfo=tz)
+    end = start + timedelta(days=1)
+    result = get_sky_engine().timeline(
+        latitude, longitude, start, end, step,
+        settings.LOCATOR_MIN_ALTITUDE, settings.LOCATOR_NIGHT_SUN_ALTITUDE,
+    )
+
+    def iso(timestamp):
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp, tz).isoformat(timespec='minutes')
+
+    constellations = []
+    for c in result['constellations']:
+        constellations.append({
+            **c,
+            'rise': iso(c['rise']),
+            'set': iso(c['set']),
+            'transit': iso(c['transit']),
+            'windows': [
+                {'start': iso(first), 'end': iso(last), 'minutes': round((last - first) / 60) + step}
+                for first, last in c['windows']
+            ],
+            'best': {**c['best'], 'time': iso(c['best']['time'])} if c['best'] else None,
+        })
+    # Best-placed first; ones that can't be seen tonight at the end
+    constellations.sort(key=lambda c: (c['best'] is None, -(c['best'] or {}).get('altitude', 0), c['name']))
+
+    night = result['night']
+    timeline = {
+        'date': date.isoformat(),
+        'timezone': str(tz),
+        'cell': {'latitude': latitude, 'longitude': longitude},
+        'step_minutes': step,
+        'night': {'start': iso(night['start']), 'end': iso(night['end'])} if night else None,
+        'constellations': constellations,
     }
-    
-    # Default directions for common constellations (backup)
-    default_directions = {
-        'Ursa Major': 'North',
-        'Ursa Minor': 'North',
-        'Cassiopeia': 'North',
-        'Polaris': 'North',
-        'Orion': 'South',
-        'Leo': 'South',
-        'Scorpius': 'South',
-        'Sagittarius': 'South',
-        'Cygnus': 'Overhead',
-        'Lyra': 'West',
-        'Aquila': 'East',
-        'Andromeda': 'Northeast',
-        'Perseus': 'Northeast',
-        'Pegasus': 'West',
-        'Taurus': 'West',
-        'Gemini': 'East'
+    if series:
+        grid = result['series']
+        timeline['series'] = {
+            'times': [iso(t) for t in grid['times']],
+            'sun_altitude': [round(float(a), 1) for a in grid['sun_altitude']],
+            'altitude': {
+                name: [round(float(a), 1) for a in grid['altitude'][:, i]]
+                for i, name in enumerate(get_sky_engine().names)
+            },
+            'azimuth': {
+                name: [round(float(a), 1) for a in grid['azimuth'][:, i]]
+                for i, name in enumerate(get_sky_engine().names)
+            },
+        }
+    return timeline
+
+
+@require_GET
+def visibility_timeline(request):
+    """
+    Rise, transit and set times and the best viewing windows of all 88
+    constellations for one night. Results are cached per grid cell and date.
+    """
+    try:
+        latitude = finite_float(request.GET['lat'])
+        longitude = finite_float(request.GET['lng'])
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError
+    except (KeyError, ValueError):
+        return JsonResponse({'status': 'error', 'message': 'Valid lat and lng are required'})
+    try:
+        tz = timeline_zone(request, longitude)
+    except (KeyError, ValueError):
+        return JsonResponse({'status': 'error', 'message': 'Unknown time zone'})
+    try:
+        date = parse_date(request.GET['date']) if request.GET.get('date') else datetime.now(tz).date()
+        step = min(max(int(request.GET.get('step', settings.LOCATOR_TIMELINE_STEP_MINUTES)), 1), 60)
+    except ValueError:
+        date = None
+    if date is None:
+        return JsonResponse({'status': 'error', 'message': 'Invalid date or step'})
+    series = request.GET.get('series') == '1'
+
+    cell_lat, cell_lng = grid_cell(latitude, longitude, settings.LOCATOR_TIMELINE_CELL_DEGREES)
+    key = f"locator:timeline:{cell_lat}:{cell_lng}:{date}:{tz}:{step}:{int(series)}"
+    timeline = caches['locator'].get(key)
+    if timeline is None:
+        timeline = build_timeline(cell_lat, cell_lng, date, tz, step, series)
+        caches['locator'].set(key, timeline, settings.LOCATOR_TIMELINE_CACHE_TTL)
+    return JsonResponse({'status': 'success', **timeline})
+
+
+# ── Nearby observations ──
+
+@require_GET
+def nearby_observations(request):
+    """
+    Recent observations within ``radius_km`` of a point, nearest first, with
+    the constellations each one found.
+    """
+    try:
+        latitude = finite_float(request.GET['lat'])
+        longitude = finite_float(request.GET['lng'])
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError
+    except (KeyError, ValueError):
+        return JsonResponse({'status': 'error', 'message': 'Valid lat and lng are required'})
+    try:
+        radius_km = finite_float(request.GET.get('radius_km', settings.LOCATOR_NEARBY_RADIUS_KM))
+        hours = finite_float(request.GET.get('hours', 24))
+        limit = int(request.GET.get('limit', 50))
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': 'Invalid radius_km, hours or limit'})
+    radius_km = min(max(radius_km, 0.1), settings.LOCATOR_NEARBY_MAX_RADIUS_KM)
+    hours = min(max(hours, 0), 24 * 30)
+    limit = min(max(limit, 1), 200)
+
+    result = find_nearby(latitude, longitude, radius_km, timezone.now() - timedelta(hours=hours), limit)
+    return JsonResponse({'status': 'success', 'radius_km': radius_km, 'hours': hours, **result})
+
+
+# ── Sky result ──
+
+def sky_result(cell, narrate):
+    """
+    The find_constellations result for a cache cell, and whether it is a
+    fallback. Runs in a worker thread on a cache miss.
+    """
+    # Positions are computed locally; Gemini only writes the narrative
+    visible = get_sky_engine().visible(
+        cell.latitude, cell.longitude, cell.when, settings.LOCATOR_MIN_ALTITUDE
+    )
+    constellations = pick_constellations(visible, settings.LOCATOR_MAX_CONSTELLATIONS)
+    visible_constellations = [c['name'] for c in constellations]
+
+    narrative = sky_summary(cell.latitude, cell.longitude, cell.when, visible, constellations)
+    narrative_source = 'local'
+    if constellations and narrate:
+        prompt = render_prompt(
+            NARRATIVE, narrative_params(cell.latitude, cell.longitude, cell.when, constellations)
+        )
+        try:
+            narrative = get_llm_gateway().generate('locator', prompt).strip()
+            narrative_source = 'gemini'
+        except LLMError as e:
+            print(f"Locator narrative unavailable: {e}")
+
+    result = {
+        'response': narrative,
+        'narrative_source': narrative_source,
+        'time': cell.when.isoformat(),
+        'visible_constellations': visible_constellations,
+        'compass_directions': {c['name']: c['direction'] for c in constellations},
+        'constellations': constellations,
+        'visible_count': len(visible),
     }
-    
-    # Try to extract directions from text
-    for constellation in constellations:
-        found_direction = None
-        
-        # Look for constellation name followed by direction
-        for direction_key, direction_names in direction_keywords.items():
-            for direction_name in direction_names:
-                # Pattern: constellation name followed by direction within reasonable distance
-                pattern = rf'{re.escape(constellation)}.*?{re.escape(direction_name.lower())}'
-                if re.search(pattern, text.lower(), re.IGNORECASE):
-                    found_direction = direction_names[0]  # Use first (full) name
-                    break
-                
-                # Pattern: direction followed by constellation name
-                pattern = rf'{re.escape(direction_name.lower())}.*?{re.escape(constellation)}'
-                if re.search(pattern, text.lower(), re.IGNORECASE):
-                    found_direction = direction_names[0]
-                    break
-                    
-            if found_direction:
-                break
-        
-        # Use found direction or fall back to default
-        if found_direction:
-            directions[constellation] = found_direction
-        elif constellation in default_directions:
-            directions[constellation] = default_directions[constellation]
-        else:
-            # Random fallback direction
-            import random
-            directions[constellation] = random.choice(['North', 'South', 'East', 'West', 'Northeast', 'Northwest', 'Southeast', 'Southwest'])
-    
-    return directions
\ No newline at end of file
+    return result, bool(constellations) and narrate and narrative_source != 'gemini'
+
+
+def record_query(location, cell, result):
+    """Save the query behind a sky result to the database (in the background)."""
+    response = ResponseText.for_text(result['response'])
+    constellation_query = ConstellationQuery(
+        location=location,
+        prompt_template=NARRATIVE,
+        prompt_params=narrative_params(cell.latitude, cell.longitude, cell.when, result['constellations']),
+        response=response,
+        visible_constellations=result['visible_constellations']
+    )
+    get_write_buffer().add(response)
+    get_write_buffer().add(constellation_query)
+    return constellation_query
+
+
+# ── Narrative ──
+
+def sky_summary(latitude, longitude, when, visible, constellations):
+    """Plain-text description of the sky used when Gemini isn't asked or can't answer."""
+    if not constellations:
+        return "No constellations are high enough above the horizon to spot right now."
+    highlights = ', '.join(
+        f"{c['name']} ({c['direction'].lower()}, {c['altitude']:.0f}° up)" for c in constellations[:3]
+    )
+    return (
+        f"{len(visible)} constellations are above the horizon from {latitude:.2f}, "
+        f"{longitude:.2f} at {when.strftime('%H:%M')} UTC. Look for {highlights}."
+    )
+
@@ -0,0 +1,209 @@
+"""
+Write-behind persistence for Locator records.
+
+Views hand new LocationData, ResponseText and ConstellationQuery instances to
+``get_write_buffer().add()`` and return immediately. Callers identify rows
+by their app-assigned ``public_id``, so no ID has to come back from the
+database. A background thread writes the buffer with one ``bulk_create``
+per model. It runs every LOCATOR_WRITE_FLUSH_SECONDS, or sooner once
+LOCATOR_WRITE_BATCH_SIZE records are waiting. Locations and responses are
+always written before the queries that point at them. Responses are keyed
+by their hash, so one that is already stored is skipped. The buffer is drained when the
+server shuts down (ASGI lifespan, or interpreter exit).
+
+A record is visible to other workers only after its flush. Until then the
+worker that accepted it finds it with ``pending_location``. If a flush
+fails, its records are put back and retried, as long as fewer than
+LOCATOR_WRITE_MAX_PENDING are waiting; past that, the oldest are dropped.
+A record with a value its column can't hold is dropped on its own and the
+rest of the batch is still written.
+"""
+
+import atexit
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+
+from .models import ConstellationQuery, LocationData, ResponseText
+
+# Parents first, so foreign keys point at rows that already exist
+WRITE_ORDER = [LocationData, ResponseText, ConstellationQuery]
+# Safe to write again, so they are always retried along with a failed batch
+IDEMPOTENT = {ResponseText}
+
+
+class WriteBehindBuffer:
+    def __init__(self, batch_size, flush_seconds, max_pending):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.max_pending = max_pending
+        self._pending = []
+        self._locations = {}  # public_id -> LocationData not written yet
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self.written = 0
+        self.batches = 0
+        self.failures = 0
+        self.dropped = 0
+
+    def add(self, obj):
+        with self._lock:
+            self._pending.append(obj)
+            if isinstance(obj, LocationData):
+                self._locations[obj.public_id] = obj
+            if len(self._pending) > self.max_pending:
+                self._drop(self._pending.pop(0))
+            full = len(self._pending) >= self.batch_size
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='locator-writes', daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def pending_location(self, public_id):
+        with self._lock:
+            return self._locations.get(public_id)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Locator write-behind flush error: {e}")
+
+    def flush(self):
+        """Write everything buffered so far; returns the number of rows written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            close_old_connections()
+            written = 0
+            for model in WRITE_ORDER:
+                objs = [obj for obj in batch if type(obj) is model]
+                if model is ResponseText:
+                    objs = list({obj.pk: obj for obj in objs}.values())
+                if model is LocationData:
+                    # bulk_create skips save(), which fills these
+                    objs = [obj for obj in objs if self._prepare(obj)]
+                if model is ConstellationQuery:
+                    # A query whose location was dropped can't be written
+                    orphans = [obj for obj in objs if obj.location.pk is None]
+                    with self._lock:
+                        for obj in orphans:
+                            self._drop(obj)
+                    objs = [obj for obj in objs if obj.location.pk is not None]
+                if not objs:
+                    continue
+                saved, unsaved, error = self._write(model, objs)
+                written += len(saved)
+                with self._lock:
+                    for obj in saved:
+                        if isinstance(obj, LocationData):
+                            self._locations.pop(obj.public_id, None)
+                if error is not None:
+                    print(f"Locator write-behind: {len(unsaved)} {model.__name__} rows not written: {error}")
+                    later = WRITE_ORDER[WRITE_ORDER.index(model) + 1:]
+                    retry = unsaved + [
+                        obj for obj in batch
+                        if type(obj) in later or (type(obj) in IDEMPOTENT and type(obj) is not model)
+                    ]
+                    with self._lock:
+                        self.failures += 1
+                        self._pending[:0] = retry
+                        while len(self._pending) > self.max_pending:
+                            self._drop(self._pending.pop(0))
+                    break
+            with self._lock:
+                self.written += written
+                self.batches += 1
+            return written
+
+    def _write(self, model, objs):
+        """
+        bulk_create ``objs``. Returns (written, not written, DatabaseError
+        or None). If a record can't be converted for its column, it is
+        dropped and the others are written one at a time.
+        """
+        ignore_conflicts = model in IDEMPOTENT
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create(objs, batch_size=self.batch_size, ignore_conflicts=ignore_conflicts)
+            return objs, [], None
+        except DatabaseError as e:
+            return [], objs, e
+        except (TypeError, ValueError):
+            pass
+        saved = []
+        for i, obj in enumerate(objs):
+            try:
+                with transaction.atomic():
+                    model.objects.bulk_create([obj], ignore_conflicts=ignore_conflicts)
+            except DatabaseError as e:
+                return saved, objs[i:], e
+            except (TypeError, ValueError) as e:
+                self._reject(obj, e)
+            else:
+                saved.append(obj)
+        return saved, [], None
+
+    def _prepare(self, location):
+        try:
+            location.set_geohashes()
+        except (TypeError, ValueError) as e:
+            self._reject(location, e)
+            return False
+        return True
+
+    def _reject(self, obj, error):
+        print(f"Locator write-behind: dropped invalid {type(obj).__name__}: {error}")
+        with self._lock:
+            self._drop(obj)
+
+    def _drop(self, obj):
+        # Called with self._lock held
+        self.dropped += 1
+        if isinstance(obj, LocationData):
+            self._locations.pop(obj.public_id, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'written': self.written,
+                'batches': self.batches,
+                'failures': self.failures,
+                'dropped': self.dropped,
+            }
+
+
+_write_buffer = None
+_write_buffer_lock = threading.Lock()
+
+
+def get_write_buffer():
+    global _write_buffer
+    if _write_buffer is None:
+        with _write_buffer_lock:
+            if _write_buffer is None:
+                _write_buffer = WriteBehindBuffer(
+                    batch_size=settings.LOCATOR_WRITE_BATCH_SIZE,
+                    flush_seconds=settings.LOCATOR_WRITE_FLUSH_SECONDS,
+                    max_pending=settings.LOCATOR_WRITE_MAX_PENDING,
+                )
+                atexit.register(drain_write_buffer)
+    return _write_buffer
+
+
+def drain_write_buffer():
+    """Write out anything still buffered (server shutdown)."""
+    if _write_buffer is not None:
+        written = _write_buffer.flush()
+        if written:
+            print(f"Locator write-behind drained {written} rows")
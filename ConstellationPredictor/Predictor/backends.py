@@ -0,0 +1,502 @@
+"""
+Detection backends.
+
+Every backend implements ``predict(image_bytes, confidence) -> detections``,
+where each detection is a dict with ``name``, ``confidence`` and ``box``
+(``[x1, y1, x2, y2]`` in image pixels, or None when the backend can't
+provide one). ``predict_annotated`` additionally returns an annotated JPEG;
+by default it draws the boxes locally, backends that get a rendered image
+from their service override it.
+
+The active backend is chosen by the ``DETECTION_BACKEND`` setting: one of
+the names in ``BACKENDS`` or a dotted path to a backend class. ``pool``
+spreads requests over the endpoints listed in ``DETECTION_POOL``.
+"""
+
+import ast
+import hashlib
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from gradio_client import Client
+from PIL import Image, ImageDraw, ImageOps
+
+from ConstellationPredictor.gradio_io import fetch_bytes, upload_bytes
+from ConstellationPredictor.resilience import CircuitBreaker, CircuitOpenError
+
+# Classes of the constellation YOLOv8 model (see README)
+CONSTELLATION_CLASSES = [
+    'Aquila', 'Bootes', 'Canis Major', 'Canis Minor', 'Cassiopeia', 'Cygnus',
+    'Gemini', 'Leo', 'Lyra', 'Moon', 'Orion', 'Pleiades', 'Sagittarius',
+    'Scorpius', 'Taurus', 'Ursa Major',
+]
+
+
+def upload_filename(image_bytes):
+    """Name to upload bytes under; Gradio picks the decoder from the suffix."""
+    return 'image.png' if image_bytes[:8] == b'\x89PNG\r\n\x1a\n' else 'image.jpg'
+
+
+def annotate_image(image_bytes, detections):
+    """
+    Draw detection boxes and labels onto the image and return JPEG bytes.
+    Boxes are in the coordinates of the EXIF-oriented image.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        canvas = ImageOps.exif_transpose(img).convert('RGB')
+    draw = ImageDraw.Draw(canvas)
+    line_width = max(2, round(max(canvas.size) / 400))
+    for detection in detections:
+        box = detection.get('box')
+        if not box:
+            continue
+        x1, y1, x2, y2 = box
+        draw.rectangle((x1, y1, x2, y2), outline=(96, 165, 250), width=line_width)
+        label = f"{detection['name']} {detection['confidence']:.0%}"
+        text_box = draw.textbbox((x1, y1), label)
+        text_height = text_box[3] - text_box[1] + 4
+        top = max(0, y1 - text_height)
+        draw.rectangle((x1, top, x1 + text_box[2] - text_box[0] + 6, top + text_height), fill=(96, 165, 250))
+        draw.text((x1 + 3, top + 2), label, fill=(0, 0, 0))
+    out = io.BytesIO()
+    canvas.save(out, 'JPEG', quality=85)
+    return out.getvalue()
+
+
+class DetectionBackend:
+    """Base class for detection backends."""
+
+    name = 'base'
+    # Whether detections carry boxes, so clients can draw overlays themselves
+    provides_boxes = True
+    # What the "argument" in a "name:argument" spec means, or None if the
+    # backend doesn't take one (see build_backend)
+    spec_argument = None
+
+    def predict(self, image_bytes, confidence):
+        raise NotImplementedError
+
+    def predict_annotated(self, image_bytes, confidence):
+        """Return (annotated_jpeg_bytes, detections)."""
+        detections = self.predict(image_bytes, confidence)
+        return annotate_image(image_bytes, detections), detections
+
+    def warm_up(self):
+        """Open connections / load models ahead of the first request."""
+
+    def stats(self):
+        """Backend-specific state for the operator status view."""
+        return {}
+
+
+# ── Remote: HF Space via Gradio ───────────────────────────────────────────────
+class GradioBackend(DetectionBackend):
+    """The constellation YOLO model served by a Hugging Face Space."""
+
+    name = 'gradio'
+    # The Space only returns a rendered image and a markdown summary
+    provides_boxes = False
+    spec_argument = 'Space name'
+
+    def __init__(self, space=None):
+        self.space = space or settings.HF_SPACE
+        self._client = None
+        self._lock = threading.Lock()
+
+    def get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    # Abandoned attempts (see ConstellationPredictor.resilience)
+                    # shouldn't hold connections open past the call deadline
+                    self._client = Client(
+                        self.space,
+                        download_files=False,
+                        httpx_kwargs={'timeout': settings.REMOTE_CALL_DEADLINE_SECONDS},
+                    )
+                    print(f"Gradio client connected to {self.space}")
+        return self._client
+
+    def warm_up(self):
+        self.get_client()
+
+    def run_api(self, image_bytes, confidence):
+        """
+        Call the Space's /predict_constellation endpoint.
+        Returns (annotated_image_bytes, summary_markdown).
+        """
+        client = self.get_client()
+        annotated, summary_text = client.predict(
+            image=upload_bytes(client, image_bytes, upload_filename(image_bytes)),
+            confidence=confidence,
+            api_name="/predict_constellation",
+        )
+        return fetch_bytes(client, annotated), summary_text
+
+    @staticmethod
+    def parse_detections(summary_text):
+        """Parse "- **Name** — XX.X% confidence" lines from the Space summary."""
+        detections = []
+        for line in summary_text.splitlines():
+            line = line.strip()
+            if line.startswith('- **') and '—' in line:
+                name_part = line.split('**')[1]
+                conf_part = line.split('—')[1].strip()
+                conf_val = float(conf_part.replace('% confidence', '').replace('%', '').strip()) / 100
+                detections.append({
+                    'name': name_part,
+                    'confidence': conf_val,
+                    'box': None,
+                })
+        return detections
+
+    def predict(self, image_bytes, confidence):
+        return self.predict_annotated(image_bytes, confidence)[1]
+
+    def predict_annotated(self, image_bytes, confidence):
+        annotated_bytes, summary_text = self.run_api(image_bytes, confidence)
+        return annotated_bytes, self.parse_detections(summary_text)
+
+
+# ── Local: ONNX Runtime YOLOv8 on CPU ─────────────────────────────────────────
+class OnnxBackend(DetectionBackend):
+    """
+    In-process YOLOv8 inference with ONNX Runtime (optional dependency).
+
+    Expects an Ultralytics ONNX export (``yolo export format=onnx``) at
+    ``LOCAL_MODEL_PATH``. Class names are read from the model metadata when
+    present, falling back to ``CONSTELLATION_CLASSES``.
+    """
+
+    name = 'onnx'
+    spec_argument = 'model path'
+
+    def __init__(self, model_path=None, iou_threshold=0.45):
+        self.model_path = model_path or settings.LOCAL_MODEL_PATH
+        self.iou_threshold = iou_threshold
+        self._session = None
+        self._lock = threading.Lock()
+
+    def get_session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    try:
+                        import onnxruntime
+                    except ImportError:
+                        raise RuntimeError(
+                            "DETECTION_BACKEND='onnx' requires the onnxruntime package"
+                        )
+                    if not self.model_path:
+                        raise RuntimeError("DETECTION_BACKEND='onnx' requires LOCAL_MODEL_PATH")
+                    session = onnxruntime.InferenceSession(
+                        str(self.model_path), providers=['CPUExecutionProvider']
+                    )
+                    names = session.get_modelmeta().custom_metadata_map.get('names')
+                    if names:
+                        parsed = ast.literal_eval(names)
+                        self.class_names = [parsed[i] for i in sorted(parsed)]
+                    else:
+                        self.class_names = CONSTELLATION_CLASSES
+                    self.input_name = session.get_inputs()[0].name
+                    self.input_size = session.get_inputs()[0].shape[2]
+                    if not isinstance(self.input_size, int):
+                        self.input_size = 640
+                    self._session = session
+        return self._session
+
+    def warm_up(self):
+        self.get_session()
+
+    def predict(self, image_bytes, confidence):
+        import numpy as np
+
+        session = self.get_session()
+        size = self.input_size
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            rgb = img.convert('RGB')
+        width, height = rgb.size
+
+        # Letterbox to the model's square input
+        scale = min(size / width, size / height)
+        resized = rgb.resize((round(width * scale), round(height * scale)), Image.Resampling.BILINEAR)
+        pad_x = (size - resized.width) // 2
+        pad_y = (size - resized.height) // 2
+        board = Image.new('RGB', (size, size), (114, 114, 114))
+        board.paste(resized, (pad_x, pad_y))
+        tensor = np.asarray(board, dtype=np.float32).transpose(2, 0, 1)[None] / 255.0
+
+        # YOLOv8 output: (1, 4 + classes, anchors) with cx, cy, w, h first
+        output = session.run(None, {self.input_name: tensor})[0][0].T
+        scores = output[:, 4:]
+        class_ids = scores.argmax(axis=1)
+        class_scores = scores[np.arange(len(scores)), class_ids]
+        keep = class_scores >= confidence
+        if not keep.any():
+            return []
+        boxes = output[keep, :4]
+        class_ids = class_ids[keep]
+        class_scores = class_scores[keep]
+
+        xyxy = np.empty_like(boxes)
+        xyxy[:, 0] = (boxes[:, 0] - boxes[:, 2] / 2 - pad_x) / scale
+        xyxy[:, 1] = (boxes[:, 1] - boxes[:, 3] / 2 - pad_y) / scale
+        xyxy[:, 2] = (boxes[:, 0] + boxes[:, 2] / 2 - pad_x) / scale
+        xyxy[:, 3] = (boxes[:, 1] + boxes[:, 3] / 2 - pad_y) / scale
+        xyxy[:, [0, 2]] = xyxy[:, [0, 2]].clip(0, width)
+        xyxy[:, [1, 3]] = xyxy[:, [1, 3]].clip(0, height)
+
+        detections = []
+        for index in self._nms(xyxy, class_scores, class_ids):
+            detections.append({
+                'name': self.class_names[int(class_ids[index])],
+                'confidence': round(float(class_scores[index]), 4),
+                'box': [round(float(v), 1) for v in xyxy[index]],
+            })
+        return detections
+
+    def _nms(self, boxes, scores, class_ids):
+        """Class-aware non-maximum suppression; returns kept indices by score."""
+        import numpy as np
+
+        # Offset boxes per class so different classes never overlap
+        offset = boxes + (class_ids * (boxes.max() + 1))[:, None]
+        areas = (offset[:, 2] - offset[:, 0]) * (offset[:, 3] - offset[:, 1])
+        order = scores.argsort()[::-1]
+        kept = []
+        while order.size:
+            best = order[0]
+            kept.append(best)
+            rest = order[1:]
+            x1 = np.maximum(offset[best, 0], offset[rest, 0])
+            y1 = np.maximum(offset[best, 1], offset[rest, 1])
+            x2 = np.minimum(offset[best, 2], offset[rest, 2])
+            y2 = np.minimum(offset[best, 3], offset[rest, 3])
+            inter = (x2 - x1).clip(0) * (y2 - y1).clip(0)
+            iou = inter / (areas[best] + areas[rest] - inter + 1e-9)
+            order = rest[iou <= self.iou_threshold]
+        return kept
+
+
+# ── Local: deterministic stub ─────────────────────────────────────────────────
+class StubBackend(DetectionBackend):
+    """
+    Deterministic fake detections derived from the image hash.
+
+    Same bytes always give the same result, with no network or model, which
+    makes it suitable for offline development and load testing.
+    """
+
+    name = 'stub'
+
+    def predict(self, image_bytes, confidence):
+        digest = hashlib.sha256(image_bytes).digest()
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            width, height = img.size
+        detections = []
+        for i in range(digest[0] % 4):
+            chunk = digest[1 + i * 6:7 + i * 6]
+            score = 0.2 + (chunk[1] / 255) * 0.79
+            if score < confidence:
+                continue
+            x1 = chunk[2] / 255 * width * 0.6
+            y1 = chunk[3] / 255 * height * 0.6
+            detections.append({
+                'name': CONSTELLATION_CLASSES[chunk[0] % len(CONSTELLATION_CLASSES)],
+                'confidence': round(score, 4),
+                'box': [
+                    round(x1, 1),
+                    round(y1, 1),
+                    round(x1 + (0.15 + chunk[4] / 255 * 0.25) * width, 1),
+                    round(y1 + (0.15 + chunk[5] / 255 * 0.25) * height, 1),
+                ],
+            })
+        return detections
+
+
+# ── Pool: latency-aware routing across endpoints ────────────────────────────
+def build_backend(spec):
+    """
+    Build a backend from a ``name`` or ``name:argument`` spec, e.g.
+    ``gradio:owner/space`` or ``onnx:/models/constellations.onnx``.
+    """
+    choice, _, argument = spec.strip().partition(':')
+    backend_class = BACKENDS.get(choice) or import_string(choice)
+    if not argument:
+        return backend_class()
+    if getattr(backend_class, 'spec_argument', None) is None:
+        raise RuntimeError(f"Detection backend '{choice}' takes no argument (got '{spec.strip()}')")
+    return backend_class(argument)
+
+
+class PoolEndpoint:
+    """One pool member with its latency estimate and health."""
+
+    def __init__(self, backend, label, failure_threshold, reset_timeout):
+        self.backend = backend
+        self.label = label
+        self.breaker = CircuitBreaker(f"pool:{label}", failure_threshold, reset_timeout)
+        self.ewma = None
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+
+    def score(self):
+        # Untried endpoints go first so every replica gets measured
+        if self.ewma is None:
+            return 0.0
+        return self.ewma * (1 + self.in_flight)
+
+
+class PooledBackend(DetectionBackend):
+    """
+    Routes each request to the fastest healthy endpoint in DETECTION_POOL.
+
+    Latency is tracked per endpoint as an EWMA (failures count as a full
+    deadline) and weighted by the requests already in flight there. Each
+    endpoint has its own circuit breaker, so a replica that keeps failing is
+    skipped until its reset timeout passes.
+    """
+
+    name = 'pool'
+    spec_argument = 'comma-separated endpoint specs'
+
+    def __init__(self, specs=None, alpha=None):
+        specs = specs or settings.DETECTION_POOL
+        if isinstance(specs, str):
+            specs = [spec for spec in specs.split(',') if spec.strip()]
+        if not specs:
+            raise RuntimeError("DETECTION_BACKEND='pool' requires DETECTION_POOL")
+        self.alpha = alpha or settings.DETECTION_POOL_EWMA_ALPHA
+        self.endpoints = [
+            PoolEndpoint(
+                build_backend(spec),
+                spec.strip(),
+                settings.REMOTE_CALL_BREAKER_THRESHOLD,
+                settings.REMOTE_CALL_BREAKER_RESET_SECONDS,
+            )
+            for spec in specs
+        ]
+        self.provides_boxes = all(e.backend.provides_boxes for e in self.endpoints)
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        """Pick the best endpoint the breakers allow and mark it busy."""
+        with self._lock:
+            ranked = sorted(self.endpoints, key=PoolEndpoint.score)
+            retry_after = None
+            for endpoint in ranked:
+                try:
+                    endpoint.breaker.before_call()
+                except CircuitOpenError as e:
+                    retry_after = e.retry_after if retry_after is None else min(retry_after, e.retry_after)
+                    continue
+                endpoint.in_flight += 1
+                endpoint.calls += 1
+                return endpoint
+        raise CircuitOpenError(self.name, retry_after or 0.0)
+
+    def _release(self, endpoint, elapsed, ok):
+        with self._lock:
+            endpoint.in_flight -= 1
+            if not ok:
+                # Count a failure as a call that took the whole deadline, so
+                # the endpoint drops down the ranking before its breaker trips
+                endpoint.failures += 1
+                elapsed = max(elapsed, settings.REMOTE_CALL_DEADLINE_SECONDS)
+            endpoint.ewma = elapsed if endpoint.ewma is None else (
+                self.alpha * elapsed + (1 - self.alpha) * endpoint.ewma
+            )
+        if ok:
+            endpoint.breaker.record_success()
+        else:
+            endpoint.breaker.record_failure()
+
+    def _route(self, method, image_bytes, confidence):
+        endpoint = self._acquire()
+        started = time.monotonic()
+        try:
+            result = getattr(endpoint.backend, method)(image_bytes, confidence)
+        except Exception:
+            self._release(endpoint, time.monotonic() - started, ok=False)
+            raise
+        self._release(endpoint, time.monotonic() - started, ok=True)
+        return result
+
+    def predict(self, image_bytes, confidence):
+        return self._route('predict', image_bytes, confidence)
+
+    def predict_annotated(self, image_bytes, confidence):
+        return self._route('predict_annotated', image_bytes, confidence)
+
+    def warm_up(self):
+        """Warm every endpoint in parallel; failures only mark that endpoint."""
+        def warm(endpoint):
+            try:
+                endpoint.backend.warm_up()
+            except Exception as e:
+                print(f"Warm-up failed for {endpoint.label}: {e}")
+                endpoint.breaker.record_failure()
+
+        with ThreadPoolExecutor(max_workers=len(self.endpoints)) as executor:
+            list(executor.map(warm, self.endpoints))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'endpoints': [
+                    {
+                        'endpoint': e.label,
+                        'state': e.breaker.state,
+                        'ewma_ms': round(e.ewma * 1000, 1) if e.ewma is not None else None,
+                        'in_flight': e.in_flight,
+                        'calls': e.calls,
+                        'failures': e.failures,
+                    }
+                    for e in self.endpoints
+                ],
+            }
+
+
+BACKENDS = {
+    GradioBackend.name: GradioBackend,
+    OnnxBackend.name: OnnxBackend,
+    StubBackend.name: StubBackend,
+    PooledBackend.name: PooledBackend,
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the process-wide backend selected by DETECTION_BACKEND."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = build_backend(settings.DETECTION_BACKEND)
+    return _backend
+
+
+def warm_up_backend():
+    """
+    Connect / load the detection backend in the background at server boot,
+    so the first request doesn't pay for it. Controlled by DETECTION_WARM_UP.
+    """
+    if not settings.DETECTION_WARM_UP:
+        return
+
+    def warm():
+        try:
+            backend = get_backend()
+            backend.warm_up()
+            print(f"Detection backend '{backend.name}' warmed up")
+        except Exception as e:
+            print(f"Detection backend warm-up failed: {e}")
+
+    threading.Thread(target=warm, name='detection-warm-up', daemon=True).start()
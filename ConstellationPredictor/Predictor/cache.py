@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class DetectionCache:
+    """
+    Content-addressed cache of detection results.
+
+    Entries are keyed by the SHA-256 of the image bytes plus the confidence
+    threshold (and the backend that produced them) and hold the annotated
+    JPEG together with the parsed detections. A size-bounded in-memory LRU
+    sits in front of an optional on-disk tier.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_dir=None, disk_max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._disk_size = None
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(image_bytes, confidence, namespace=''):
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        key = f"{digest}-{confidence:.3f}"
+        return f"{key}-{namespace}" if namespace else key
+
+    def get(self, key):
+        """Return (annotated_bytes, detections) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store(key, entry)
+        return entry
+
+    def set(self, key, annotated_bytes, detections):
+        entry = (annotated_bytes, detections)
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    # ── Memory tier ───────────────────────────────────────────────────────────
+    @staticmethod
+    def _entry_size(entry):
+        annotated_bytes, detections = entry
+        return len(annotated_bytes) + len(json.dumps(detections))
+
+    def _store(self, key, entry):
+        size = self._entry_size(entry)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= self._entry_size(old)
+        self._entries[key] = entry
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= self._entry_size(evicted)
+
+    # ── Disk tier ─────────────────────────────────────────────────────────────
+    def _paths(self, key):
+        base = os.path.join(self.disk_dir, key[:2], key)
+        return base + '.jpg', base + '.json'
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        image_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                detections = json.load(f)
+            with open(image_path, 'rb') as f:
+                annotated_bytes = f.read()
+            os.utime(image_path)
+        except (OSError, ValueError):
+            return None
+        return annotated_bytes, detections
+
+    def _write_disk(self, key, entry):
+        if not self.disk_dir:
+            return
+        annotated_bytes, detections = entry
+        image_path, meta_path = self._paths(key)
+        try:
+            os.makedirs(os.path.dirname(image_path), exist_ok=True)
+            # Write the image first; an entry only counts once its JSON exists.
+            with open(image_path, 'wb') as f:
+                f.write(annotated_bytes)
+            tmp_meta = f"{meta_path}.{threading.get_ident()}.tmp"
+            with open(tmp_meta, 'w', encoding='utf-8') as f:
+                json.dump(detections, f)
+            os.replace(tmp_meta, meta_path)
+        except OSError as e:
+            print(f"Detection cache disk write failed: {e}")
+            return
+        with self._lock:
+            if self._disk_size is None:
+                self._disk_size = self._scan_disk_size()
+            else:
+                self._disk_size += len(annotated_bytes)
+            over_budget = self._disk_size > self.disk_max_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _scan_disk_size(self):
+        total = 0
+        for root, _, names in os.walk(self.disk_dir):
+            for name in names:
+                if name.endswith('.jpg'):
+                    try:
+                        total += os.path.getsize(os.path.join(root, name))
+                    except OSError:
+                        pass
+        return total
+
+    def _evict_disk(self):
+        """Drop least-recently-used files until the disk tier fits its budget."""
+        files = []
+        total = 0
+        for root, _, names in os.walk(self.disk_dir):
+            for name in names:
+                if not name.endswith('.jpg'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.disk_max_bytes:
+                break
+            for stale in (path, path[:-len('.jpg')] + '.json'):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+            total -= size
+        with self._lock:
+            self._disk_size = total
+
+
+_detection_cache = None
+_detection_cache_lock = threading.Lock()
+
+
+def get_detection_cache():
+    global _detection_cache
+    if _detection_cache is None:
+        with _detection_cache_lock:
+            if _detection_cache is None:
+                _detection_cache = DetectionCache(
+                    max_bytes=settings.DETECTION_CACHE_MAX_BYTES,
+                    disk_dir=settings.DETECTION_CACHE_DIR,
+                    disk_max_bytes=settings.DETECTION_CACHE_DISK_MAX_BYTES,
+                )
+    return _detection_cache
@@ -0,0 +1,131 @@
+"""
+In-memory search index over the 88 constellations.
+
+Built once per process from Predictor.constellations. ``search`` ranks exact
+names, aliases and IAU abbreviations first, then prefixes, word prefixes,
+fuzzy (typo-tolerant) matches and finally description text. ``resolve``
+maps any known name or alias to the canonical constellation name, for
+code that needs to recognise constellations in free text.
+"""
+
+import bisect
+import difflib
+import hashlib
+import json
+import re
+import threading
+import unicodedata
+
+from .constellations import ABBREVIATIONS, ALIASES, CONSTELLATIONS
+
+# Scores for each kind of match; results are ordered by score, then name
+EXACT = 100
+PREFIX = 80
+WORD_PREFIX = 60
+FUZZY = 50
+DESCRIPTION = 20
+FUZZY_CUTOFF = 0.75
+
+
+def normalize(text):
+    """Casefold, strip accents and punctuation, and drop a leading "the"."""
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c)).casefold()
+    text = re.sub(r"[^a-z0-9]+", ' ', text.replace("'", '')).strip()
+    if text.startswith('the '):
+        text = text[4:]
+    return text
+
+
+class Catalog:
+    def __init__(self, constellations, aliases, abbreviations):
+        self.entries = sorted(constellations, key=lambda c: c['name'])
+        self.by_id = {entry['id']: entry for entry in self.entries}
+        by_name = {entry['name']: entry for entry in self.entries}
+
+        # Every searchable term: (normalized term, entry id, display text)
+        terms = []
+        for entry in self.entries:
+            name = entry['name']
+            terms.append((normalize(name), entry['id'], name))
+            for alias in aliases.get(name, []):
+                terms.append((normalize(alias), entry['id'], alias))
+            if name in abbreviations:
+                terms.append((normalize(abbreviations[name]), entry['id'], abbreviations[name]))
+        self.terms = sorted(terms)
+        self.term_keys = [term for term, _, _ in self.terms]
+        self.exact = {}
+        for term, entry_id, _ in self.terms:
+            self.exact.setdefault(term, entry_id)
+        self.abbreviations = {name: abbreviations.get(name) for name in by_name}
+        self.aliases = {name: list(aliases.get(name, [])) for name in by_name}
+        self.descriptions = {entry['id']: normalize(entry['description']) for entry in self.entries}
+
+        # Changes whenever the catalog data does; used for HTTP ETags
+        self.version = hashlib.sha1(
+            json.dumps([self.entries, self.aliases, self.abbreviations], sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+    def resolve(self, text):
+        """Canonical name for a name, alias or abbreviation, or None."""
+        entry_id = self.exact.get(normalize(text))
+        return self.by_id[entry_id]['name'] if entry_id is not None else None
+
+    def search(self, query):
+        """
+        Entries matching ``query`` as (entry, matched_term) pairs, best
+        first. An empty query lists everything alphabetically.
+        """
+        q = normalize(query)
+        if not q:
+            return [(entry, None) for entry in self.entries]
+
+        scores = {}
+
+        def hit(entry_id, score, matched):
+            if score > scores.get(entry_id, (0, None))[0]:
+                scores[entry_id] = (score, matched)
+
+        # Prefix matches: a contiguous run of the sorted term list
+        start = bisect.bisect_left(self.term_keys, q)
+        for term, entry_id, display in self.terms[start:]:
+            if not term.startswith(q):
+                break
+            hit(entry_id, EXACT if term == q else PREFIX, display)
+
+        # The query is seq2 so difflib computes its lookup tables only once
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(q)
+        for term, entry_id, display in self.terms:
+            if entry_id in scores and scores[entry_id][0] >= WORD_PREFIX:
+                continue
+            if any(word.startswith(q) for word in term.split()[1:]):
+                hit(entry_id, WORD_PREFIX, display)
+            elif len(q) >= 3:
+                matcher.set_seq1(term)
+                if (matcher.real_quick_ratio() >= FUZZY_CUTOFF
+                        and matcher.quick_ratio() >= FUZZY_CUTOFF):
+                    ratio = matcher.ratio()
+                    if ratio >= FUZZY_CUTOFF:
+                        hit(entry_id, FUZZY + ratio, display)
+
+        if len(q) >= 3:
+            for entry_id, description in self.descriptions.items():
+                if q in description:
+                    hit(entry_id, DESCRIPTION, None)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1][0], self.by_id[item[0]]['name']))
+        return [(self.by_id[entry_id], matched) for entry_id, (_, matched) in ranked]
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = Catalog(CONSTELLATIONS, ALIASES, ABBREVIATIONS)
+    return _catalog
@@ -0,0 +1,281 @@
+"""
+The 88 IAU constellations: database page entries, IAU abbreviations and the
+common names people use for them. Search over these lives in Predictor.catalog.
+"""
+
+CONSTELLATIONS = [
+    {'id': 0, 'name': 'Andromeda', 'description': 'The Royal Sea Monster Bait, a princess chained to a rock as sacrifice', 'image': 'image0.webp'},
+    {'id': 1, 'name': 'Antlia', 'description': 'The Air Pump, a scientific instrument invented in the 17th century', 'image': 'image1.webp'},
+    {'id': 2, 'name': 'Apus', 'description': 'The Bird of Paradise, representing exotic birds from New Guinea', 'image': 'image2.webp'},
+    {'id': 3, 'name': 'Aquarius', 'description': 'The Water-Bearer, representing a figure pouring water from a jar', 'image': 'image3.webp'},
+    {'id': 4, 'name': 'Aquila', 'description': "The Thunderbolt Eagle, Zeus's eagle that carried his thunderbolts", 'image': 'image4.webp'},
+    {'id': 5, 'name': 'Ara', 'description': 'The Altar, where gods formed an alliance before battling the Titans', 'image': 'image5.webp'},
+    {'id': 6, 'name': 'Aries', 'description': 'The Ram with the golden fleece from Greek mythology', 'image': 'image6.webp'},
+    {'id': 7, 'name': 'Auriga', 'description': 'The Charioteer, a skilled chariot driver in Greek mythology', 'image': 'image7.webp'},
+    {'id': 8, 'name': 'Boötes', 'description': 'The Herdsman, said to be hunting the bears of Ursa Major and Minor', 'image': 'image8.webp'},
+    {'id': 9, 'name': 'Caelum', 'description': 'The Chisel, a tool used by sculptors to create artistic works', 'image': 'image9.webp'},
+    {'id': 10, 'name': 'Camelopardalis', 'description': 'The Giraffe, one of the larger but fainter constellations', 'image': 'image10.webp'},
+    {'id': 11, 'name': 'Cancer', 'description': 'The Crab sent by Hera to distract Hercules during his labors', 'image': 'image11.webp'},
+    {'id': 12, 'name': 'Canes Venatici', 'description': 'The Hunting Dogs, represented by two dogs named Asterion and Chara', 'image': 'image12.webp'},
+    {'id': 13, 'name': 'Canis Major', 'description': 'The Big Dog, containing Sirius, the brightest star in our night sky', 'image': 'image13.webp'},
+    {'id': 14, 'name': 'Canis Minor', 'description': 'The Small Dog, companion to Orion the hunter', 'image': 'image14.webp'},
+    {'id': 15, 'name': 'Capricornus', 'description': "The Sea Goat, a mythological creature with a goat's head and fish's tail", 'image': 'image15.webp'},
+    {'id': 16, 'name': 'Carina', 'description': 'The Keel of the ship Argo Navis from Jason and the Argonauts', 'image': 'image16.webp'},
+    {'id': 17, 'name': 'Cassiopeia', 'description': 'The Vain Queen whose boasting led to her daughter being sacrificed', 'image': 'image17.webp'},
+    {'id': 18, 'name': 'Centaurus', 'description': 'The Centaur, containing Alpha Centauri, the closest star system to our own', 'image': 'image18.webp'},
+    {'id': 19, 'name': 'Cepheus', 'description': 'The King, husband of Cassiopeia and father of Andromeda', 'image': 'image19.webp'},
+    {'id': 20, 'name': 'Cetus', 'description': 'The Whale or sea monster sent to devour Andromeda', 'image': 'image20.webp'},
+    {'id': 21, 'name': 'Chamaeleon', 'description': 'The Chameleon, a small southern constellation named after the reptile', 'image': 'image21.webp'},
+    {'id': 22, 'name': 'Circinus', 'description': 'The Compass used for drawing circles, a modern scientific constellation', 'image': 'image22.webp'},
+    {'id': 23, 'name': 'Columba', 'description': 'The Dove, representing the bird that Noah sent from the Ark', 'image': 'image23.webp'},
+    {'id': 24, 'name': 'Coma Berenices', 'description': "Berenice's Hair, named after Queen Berenice II who sacrificed her hair", 'image': 'image24.webp'},
+    {'id': 25, 'name': 'Corona Australis', 'description': 'The Southern Crown, representing a crown worn by centaurs', 'image': 'image25.webp'},
+    {'id': 26, 'name': 'Corona Borealis', 'description': 'The Northern Crown, a crown given to Ariadne by Dionysus', 'image': 'image26.webp'},
+    {'id': 27, 'name': 'Corvus', 'description': "The Raven, Apollo's sacred bird in Greek mythology", 'image': 'image27.webp'},
+    {'id': 28, 'name': 'Crater', 'description': 'The Cup, representing the cup of Apollo in Greek mythology', 'image': 'image28.webp'},
+    {'id': 29, 'name': 'Crux', 'description': 'The Southern Cross, the smallest constellation but one of the most recognizable', 'image': 'image29.webp'},
+    {'id': 30, 'name': 'Cygnus', 'description': 'The Swan, representing Zeus in disguise or the friend of Phaethon', 'image': 'image30.webp'},
+    {'id': 31, 'name': 'Delphinus', 'description': 'The Dolphin, representing the creature that saved the poet Arion', 'image': 'image31.webp'},
+    {'id': 32, 'name': 'Dorado', 'description': 'The Goldfish or Swordfish, home to most of the Large Magellanic Cloud', 'image': 'image32.webp'},
+    {'id': 33, 'name': 'Draco', 'description': 'The Dragon that guarded the golden apples in the Garden of Hesperides', 'image': 'image33.webp'},
+    {'id': 34, 'name': 'Equuleus', 'description': 'The Little Horse, representing the brother of Pegasus given to Castor', 'image': 'image34.webp'},
+    {'id': 35, 'name': 'Eridanus', 'description': 'The River, representing the path Phaethon fell after failing to drive the sun chariot', 'image': 'image35.webp'},
+    {'id': 36, 'name': 'Fornax', 'description': "The Furnace, a modern constellation representing a chemist's furnace", 'image': 'image36.webp'},
+    {'id': 37, 'name': 'Gemini', 'description': 'The Twins Castor and Pollux from Greek mythology', 'image': 'image37.webp'},
+    {'id': 38, 'name': 'Grus', 'description': 'The Crane, a southern bird constellation created in the 16th century', 'image': 'image38.webp'},
+    {'id': 39, 'name': 'Hercules', 'description': 'The Strong Man, representing the Greek hero known for his twelve labors', 'image': 'image39.webp'},
+    {'id': 40, 'name': 'Horologium', 'description': 'The Pendulum Clock, a modern constellation representing a timekeeping device', 'image': 'image40.webp'},
+    {'id': 41, 'name': 'Hydra', 'description': 'The Water Serpent, the largest constellation in the sky', 'image': 'image41.webp'},
+    {'id': 42, 'name': 'Hydrus', 'description': 'The Watersnake, a southern constellation distinct from Hydra', 'image': 'image42.webp'},
+    {'id': 43, 'name': 'Indus', 'description': 'The Indian, representing a native of the East Indies', 'image': 'image43.webp'},
+    {'id': 44, 'name': 'Lacerta', 'description': 'The Lizard, a small and faint northern constellation', 'image': 'image44.webp'},
+    {'id': 45, 'name': 'Leo', 'description': 'The Lion that Hercules slew as his first labor', 'image': 'image45.webp'},
+    {'id': 46, 'name': 'Leo Minor', 'description': 'The Little Lion, a small constellation near Leo', 'image': 'image46.webp'},
+    {'id': 47, 'name': 'Lepus', 'description': 'The Hare/Rabbit hunted by Orion and his dogs', 'image': 'image47.webp'},
+    {'id': 48, 'name': 'Libra', 'description': 'The Scales, the only zodiac constellation representing an inanimate object', 'image': 'image48.webp'},
+    {'id': 49, 'name': 'Lupus', 'description': 'The Wolf, an ancient constellation associated with various myths', 'image': 'image49.webp'},
+    {'id': 50, 'name': 'Lynx', 'description': 'The Lynx, named for the keen eyesight needed to see its faint stars', 'image': 'image50.webp'},
+    {'id': 51, 'name': 'Lyra', 'description': 'The Harp played by Orpheus, containing the bright star Vega', 'image': 'image51.webp'},
+    {'id': 52, 'name': 'Mensa', 'description': 'The Table Mountain in South Africa, containing part of the Large Magellanic Cloud', 'image': 'image52.webp'},
+    {'id': 53, 'name': 'Microscopium', 'description': 'The Microscope, a modern constellation representing the scientific instrument', 'image': 'image53.webp'},
+    {'id': 54, 'name': 'Monoceros', 'description': 'The Unicorn, a faint constellation between Orion and Hydra', 'image': 'image54.webp'},
+    {'id': 55, 'name': 'Musca', 'description': 'The Fly, a small southern constellation near the Southern Cross', 'image': 'image55.webp'},
+    {'id': 56, 'name': 'Norma', 'description': "The Level, a carpenter's square used for measuring right angles", 'image': 'image56.webp'},
+    {'id': 57, 'name': 'Octans', 'description': 'The Octant, a measuring instrument containing the south celestial pole', 'image': 'image57.webp'},
+    {'id': 58, 'name': 'Ophiuchus', 'description': 'The Serpent-Bearer, representing the healer Asclepius holding a serpent', 'image': 'image58.webp'},
+    {'id': 59, 'name': 'Orion', 'description': 'The Hunter with his distinctive belt of three stars', 'image': 'image59.webp'},
+    {'id': 60, 'name': 'Pavo', 'description': 'The Peacock, a southern constellation representing the beautiful bird', 'image': 'image60.webp'},
+    {'id': 61, 'name': 'Pegasus', 'description': "The Winged Horse that sprang from Medusa's blood", 'image': 'image61.webp'},
+    {'id': 62, 'name': 'Perseus', 'description': 'The Greek Hero who rescued Andromeda from Cetus', 'image': 'image62.webp'},
+    {'id': 63, 'name': 'Phoenix', 'description': 'The Firebird that rises from its own ashes', 'image': 'image63.webp'},
+    {'id': 64, 'name': 'Pictor', 'description': "The Painter's Easel, a modern constellation representing an artist's tool", 'image': 'image64.webp'},
+    {'id': 65, 'name': 'Pisces', 'description': 'The Fishes, representing Venus and Cupid transformed to escape Typhon', 'image': 'image65.webp'},
+    {'id': 66, 'name': 'Piscis Austrinus', 'description': 'The Southern Fish, drinking the water poured by Aquarius', 'image': 'image66.webp'},
+    {'id': 67, 'name': 'Puppis', 'description': 'The Stern of the ship Argo Navis from Greek mythology', 'image': 'image67.webp'},
+    {'id': 68, 'name': 'Pyxis', 'description': 'The Compass of the ship Argo Navis, a navigational instrument', 'image': 'image68.webp'},
+    {'id': 69, 'name': 'Reticulum', 'description': 'The Reticle, a small net-like pattern used in telescope eyepieces', 'image': 'image69.webp'},
+    {'id': 70, 'name': 'Sagitta', 'description': 'The Arrow shot by Hercules or used by Apollo to slay the Cyclops', 'image': 'image70.webp'},
+    {'id': 71, 'name': 'Sagittarius', 'description': 'The Archer, a centaur with a bow pointed at Scorpius', 'image': 'image71.webp'},
+    {'id': 72, 'name': 'Scorpius', 'description': 'The Scorpion that killed Orion in Greek mythology', 'image': 'image72.webp'},
+    {'id': 73, 'name': 'Sculptor', 'description': "The Sculptor, representing an artist's studio with tools", 'image': 'image73.webp'},
+    {'id': 74, 'name': 'Scutum', 'description': 'The Shield, created to honor King John Sobieski of Poland', 'image': 'image74.webp'},
+    {'id': 75, 'name': 'Serpens', 'description': 'The Serpent, the only constellation split into two parts (Caput and Cauda)', 'image': 'image75.webp'},
+    {'id': 76, 'name': 'Sextans', 'description': 'The Sextant, a navigational instrument used by astronomers', 'image': 'image76.webp'},
+    {'id': 77, 'name': 'Taurus', 'description': 'The Bull, representing Zeus disguised to abduct Europa', 'image': 'image77.webp'},
+    {'id': 78, 'name': 'Telescopium', 'description': 'The Telescope, honoring the invention that revolutionized astronomy', 'image': 'image78.webp'},
+    {'id': 79, 'name': 'Triangulum', 'description': 'The Triangle, one of the smallest but oldest recognized constellations', 'image': 'image79.webp'},
+    {'id': 80, 'name': 'Triangulum Australe', 'description': 'The Southern Triangle, a small but distinctive southern constellation', 'image': 'image80.webp'},
+    {'id': 81, 'name': 'Tucana', 'description': 'The Toucan, home to the Small Magellanic Cloud galaxy', 'image': 'image81.webp'},
+    {'id': 82, 'name': 'Ursa Major', 'description': 'The Big Bear, containing the famous Big Dipper asterism', 'image': 'image82.webp'},
+    {'id': 83, 'name': 'Ursa Minor', 'description': 'The Small Bear, containing Polaris, the North Star', 'image': 'image83.webp'},
+    {'id': 84, 'name': 'Vela', 'description': 'The Sails of the ship Argo Navis, containing several bright stars', 'image': 'image84.webp'},
+    {'id': 85, 'name': 'Virgo', 'description': 'The Young Maiden, the second largest constellation containing bright star Spica', 'image': 'image85.webp'},
+    {'id': 86, 'name': 'Volans', 'description': 'The Flying Fish, a small southern constellation', 'image': 'image86.webp'},
+    {'id': 87, 'name': 'Vulpecula', 'description': 'The Little Fox, home to the famous Dumbbell Nebula', 'image': 'image87.webp'},
+]
+
+CONSTELLATION_NAMES = [c['name'] for c in CONSTELLATIONS]
+
+# IAU three-letter abbreviations
+ABBREVIATIONS = {
+    'Andromeda': 'And',
+    'Antlia': 'Ant',
+    'Apus': 'Aps',
+    'Aquarius': 'Aqr',
+    'Aquila': 'Aql',
+    'Ara': 'Ara',
+    'Aries': 'Ari',
+    'Auriga': 'Aur',
+    'Boötes': 'Boo',
+    'Caelum': 'Cae',
+    'Camelopardalis': 'Cam',
+    'Cancer': 'Cnc',
+    'Canes Venatici': 'CVn',
+    'Canis Major': 'CMa',
+    'Canis Minor': 'CMi',
+    'Capricornus': 'Cap',
+    'Carina': 'Car',
+    'Cassiopeia': 'Cas',
+    'Centaurus': 'Cen',
+    'Cepheus': 'Cep',
+    'Cetus': 'Cet',
+    'Chamaeleon': 'Cha',
+    'Circinus': 'Cir',
+    'Columba': 'Col',
+    'Coma Berenices': 'Com',
+    'Corona Australis': 'CrA',
+    'Corona Borealis': 'CrB',
+    'Corvus': 'Crv',
+    'Crater': 'Crt',
+    'Crux': 'Cru',
+    'Cygnus': 'Cyg',
+    'Delphinus': 'Del',
+    'Dorado': 'Dor',
+    'Draco': 'Dra',
+    'Equuleus': 'Equ',
+    'Eridanus': 'Eri',
+    'Fornax': 'For',
+    'Gemini': 'Gem',
+    'Grus': 'Gru',
+    'Hercules': 'Her',
+    'Horologium': 'Hor',
+    'Hydra': 'Hya',
+    'Hydrus': 'Hyi',
+    'Indus': 'Ind',
+    'Lacerta': 'Lac',
+    'Leo': 'Leo',
+    'Leo Minor': 'LMi',
+    'Lepus': 'Lep',
+    'Libra': 'Lib',
+    'Lupus': 'Lup',
+    'Lynx': 'Lyn',
+    'Lyra': 'Lyr',
+    'Mensa': 'Men',
+    'Microscopium': 'Mic',
+    'Monoceros': 'Mon',
+    'Musca': 'Mus',
+    'Norma': 'Nor',
+    'Octans': 'Oct',
+    'Ophiuchus': 'Oph',
+    'Orion': 'Ori',
+    'Pavo': 'Pav',
+    'Pegasus': 'Peg',
+    'Perseus': 'Per',
+    'Phoenix': 'Phe',
+    'Pictor': 'Pic',
+    'Pisces': 'Psc',
+    'Piscis Austrinus': 'PsA',
+    'Puppis': 'Pup',
+    'Pyxis': 'Pyx',
+    'Reticulum': 'Ret',
+    'Sagitta': 'Sge',
+    'Sagittarius': 'Sgr',
+    'Scorpius': 'Sco',
+    'Sculptor': 'Scl',
+    'Scutum': 'Sct',
+    'Serpens': 'Ser',
+    'Sextans': 'Sex',
+    'Taurus': 'Tau',
+    'Telescopium': 'Tel',
+    'Triangulum': 'Tri',
+    'Triangulum Australe': 'TrA',
+    'Tucana': 'Tuc',
+    'Ursa Major': 'UMa',
+    'Ursa Minor': 'UMi',
+    'Vela': 'Vel',
+    'Virgo': 'Vir',
+    'Volans': 'Vol',
+    'Vulpecula': 'Vul',
+}
+
+# Common English names and asterisms that refer to a constellation
+ALIASES = {
+    'Andromeda': ['Chained Princess', 'Princess'],
+    'Antlia': ['Air Pump'],
+    'Apus': ['Bird of Paradise'],
+    'Aquarius': ['Water Bearer'],
+    'Aquila': ['Eagle'],
+    'Ara': ['Altar'],
+    'Aries': ['Ram'],
+    'Auriga': ['Charioteer'],
+    'Boötes': ['Bootes', 'Herdsman'],
+    'Caelum': ['Chisel'],
+    'Camelopardalis': ['Giraffe'],
+    'Cancer': ['Crab'],
+    'Canes Venatici': ['Hunting Dogs'],
+    'Canis Major': ['Great Dog'],
+    'Canis Minor': ['Little Dog'],
+    'Capricornus': ['Capricorn', 'Sea Goat'],
+    'Carina': ['Keel'],
+    'Cassiopeia': ['Queen'],
+    'Centaurus': ['Centaur'],
+    'Cepheus': ['King'],
+    'Cetus': ['Whale', 'Sea Monster'],
+    'Chamaeleon': ['Chameleon'],
+    'Circinus': ['Compass'],
+    'Columba': ['Dove'],
+    'Coma Berenices': ["Berenice's Hair"],
+    'Corona Australis': ['Southern Crown'],
+    'Corona Borealis': ['Northern Crown'],
+    'Corvus': ['Crow'],
+    'Crater': ['Cup'],
+    'Crux': ['Southern Cross'],
+    'Cygnus': ['Swan', 'Northern Cross'],
+    'Delphinus': ['Dolphin'],
+    'Dorado': ['Swordfish'],
+    'Draco': ['Dragon'],
+    'Equuleus': ['Little Horse', 'Foal'],
+    'Eridanus': ['River'],
+    'Fornax': ['Furnace'],
+    'Gemini': ['Twins'],
+    'Grus': ['Crane'],
+    'Hercules': ['Strongman'],
+    'Horologium': ['Pendulum Clock', 'Clock'],
+    'Hydra': ['Water Serpent', 'Sea Serpent'],
+    'Hydrus': ['Water Snake'],
+    'Indus': ['Indian'],
+    'Lacerta': ['Lizard'],
+    'Leo': ['Lion'],
+    'Leo Minor': ['Little Lion'],
+    'Lepus': ['Hare'],
+    'Libra': ['Scales'],
+    'Lupus': ['Wolf'],
+    'Lynx': [],
+    'Lyra': ['Lyre', 'Harp'],
+    'Mensa': ['Table Mountain'],
+    'Microscopium': ['Microscope'],
+    'Monoceros': ['Unicorn'],
+    'Musca': ['Fly'],
+    'Norma': ['Level', "Carpenter's Square"],
+    'Octans': ['Octant'],
+    'Ophiuchus': ['Serpent Bearer'],
+    'Orion': ['Hunter'],
+    'Pavo': ['Peacock'],
+    'Pegasus': ['Winged Horse'],
+    'Perseus': ['Hero'],
+    'Phoenix': [],
+    'Pictor': ["Painter's Easel", 'Easel'],
+    'Pisces': ['Fishes', 'Fish'],
+    'Piscis Austrinus': ['Southern Fish'],
+    'Puppis': ['Stern'],
+    'Pyxis': ["Mariner's Compass"],
+    'Reticulum': ['Reticle', 'Net'],
+    'Sagitta': ['Arrow'],
+    'Sagittarius': ['Archer', 'Teapot'],
+    'Scorpius': ['Scorpio', 'Scorpion'],
+    'Sculptor': [],
+    'Scutum': ['Shield'],
+    'Serpens': ['Serpent'],
+    'Sextans': ['Sextant'],
+    'Taurus': ['Bull'],
+    'Telescopium': ['Telescope'],
+    'Triangulum': ['Triangle'],
+    'Triangulum Australe': ['Southern Triangle'],
+    'Tucana': ['Toucan'],
+    'Ursa Major': ['Big Dipper', 'Great Bear', 'Plough', 'Plow'],
+    'Ursa Minor': ['Little Dipper', 'Little Bear'],
+    'Vela': ['Sails'],
+    'Virgo': ['Maiden', 'Virgin'],
+    'Volans': ['Flying Fish'],
+    'Vulpecula': ['Little Fox', 'Fox'],
+}
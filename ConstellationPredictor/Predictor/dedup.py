@@ -0,0 +1,102 @@
+import io
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from PIL import Image
+
+
+def frame_hash(image_bytes, hash_size=8):
+    """
+    64-bit difference hash (dHash) of an encoded frame.
+
+    JPEGs are decoded in draft mode, which lets libjpeg scale down during the
+    DCT, so hashing costs a fraction of a full decode.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        img.draft('L', (hash_size * 8, hash_size * 8))
+        small = img.convert('L').resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR)
+        pixels = small.tobytes()
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a, b):
+    return (a ^ b).bit_count()
+
+
+class FrameDeduplicator:
+    """
+    Per-session memory of the last frame sent for inference.
+
+    A new frame whose hash is within ``max_distance`` bits of that reference
+    frame reuses its result (annotated image or detection list), until
+    ``refresh_seconds`` have passed since the last real inference. Comparing
+    against the inferred frame rather than the previous one stops slow drift
+    from being suppressed forever.
+    """
+
+    def __init__(self, max_distance=10, refresh_seconds=5.0, max_sessions=1000):
+        self.max_distance = max_distance
+        self.refresh_seconds = refresh_seconds
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.reused = 0
+        self.forwarded = 0
+
+    def lookup(self, session_id, hash_value):
+        """Return the reusable result for this frame, or None."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is not None:
+                ref_hash, inferred_at, result = state
+                self._sessions.move_to_end(session_id)
+                if (now - inferred_at < self.refresh_seconds
+                        and hamming_distance(ref_hash, hash_value) <= self.max_distance):
+                    self.reused += 1
+                    return result
+            self.forwarded += 1
+            return None
+
+    def remember(self, session_id, hash_value, result):
+        with self._lock:
+            self._sessions[session_id] = (hash_value, time.monotonic(), result)
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def forget(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'reused': self.reused,
+                'forwarded': self.forwarded,
+            }
+
+
+_frame_deduplicator = None
+_frame_deduplicator_lock = threading.Lock()
+
+
+def get_frame_deduplicator():
+    global _frame_deduplicator
+    if _frame_deduplicator is None:
+        with _frame_deduplicator_lock:
+            if _frame_deduplicator is None:
+                _frame_deduplicator = FrameDeduplicator(
+                    max_distance=settings.FRAME_DEDUP_MAX_DISTANCE,
+                    refresh_seconds=settings.FRAME_DEDUP_REFRESH_SECONDS,
+                    max_sessions=settings.FRAME_DEDUP_MAX_SESSIONS,
+                )
+    return _frame_deduplicator
@@ -0,0 +1,211 @@
+"""
+Cached constellation descriptions.
+
+There are only 88 constellations, so Gemini descriptions are kept in the
+``ConstellationDescription`` table (shared by all workers and filled ahead
+of time by ``manage.py warm_descriptions``) with a per-process copy in
+memory. Entries are fresh for CONSTELLATION_INFO_TTL; after that they're
+still served while a background refresh runs, for up to
+CONSTELLATION_INFO_STALE_TTL more. Concurrent misses for the same entry
+share one Gemini call. When Gemini can't be reached the stale entry is
+kept, or ``get_basic_constellation_info`` is used if there is none.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import get_language_info
+
+from ConstellationPredictor.offload import closing_connections, get_executor
+
+from .backends import CONSTELLATION_CLASSES
+from .constellations import CONSTELLATION_NAMES
+from .models import ConstellationDescription
+
+# Names worth caching: the IAU list plus what the detector can report
+CACHEABLE_NAMES = set(CONSTELLATION_NAMES) | set(CONSTELLATION_CLASSES)
+# How long a fallback answer is reused before Gemini is tried again
+FALLBACK_TTL = 60
+
+
+def language_name(language):
+    """English name of a language code, or None if Django doesn't know it."""
+    try:
+        return get_language_info(language)['name']
+    except KeyError:
+        return None
+
+
+def description_prompt(name, language='en'):
+    prompt = f"""
+        Provide a brief, fascinating description of the constellation {name}.
+        Include key mythological background, notable stars, and interesting facts.
+        Keep it concise, under 100 words, and engaging for general audience.
+        """
+    if language != 'en':
+        prompt += f"Write the description in {language_name(language)}.\n"
+    return prompt
+
+
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers share its result."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {'done': threading.Event()}
+        if not leader:
+            call['done'].wait()
+            if 'error' in call:
+                raise call['error']
+            return call['result']
+        try:
+            call['result'] = func()
+            return call['result']
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._calls
+
+
+class DescriptionService:
+    def __init__(self, fetch, fallback, ttl, stale_ttl):
+        # fetch(prompt, background) -> text or None; fallback(name) -> text
+        self.fetch = fetch
+        self.fallback = fallback
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._memory = {}  # (name, language) -> (text, updated epoch, source)
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, name, language='en'):
+        """Return (description, source) with source 'cache', 'gemini' or 'basic'."""
+        if name not in CACHEABLE_NAMES:
+            text = self.fetch(description_prompt(name, language))
+            return (text, 'gemini') if text else (self.fallback(name), 'basic')
+
+        key = (name, language)
+        entry = self._lookup(key)
+        if entry is not None:
+            text, updated, source = entry
+            age = time.time() - updated
+            ttl = FALLBACK_TTL if source == 'basic' else self.ttl
+            if age < ttl:
+                self._count('hits')
+                return text, 'cache' if source == 'gemini' else source
+            if source == 'gemini' and age < ttl + self.stale_ttl:
+                self._count('stale_hits')
+                if not self._flight.in_flight(key):
+                    get_executor().submit(closing_connections, self._refresh_quietly, key)
+                return text, 'cache'
+
+        self._count('misses')
+        return self._flight.do(key, lambda: self.refresh(name, language))
+
+    def refresh(self, name, language='en', force=False, background=False):
+        """
+        Fetch from Gemini and store it; keeps the old entry if that fails.
+        ``background`` refreshes queue behind interactive Gemini calls.
+        """
+        key = (name, language)
+        if not force:
+            # Another worker (or warm_descriptions) may have refreshed it already
+            row = ConstellationDescription.objects.filter(name=name, language=language).first()
+            if row is not None and time.time() - row.updated_at.timestamp() < self.ttl:
+                self._remember(key, row.description, row.updated_at.timestamp(), 'gemini')
+                return row.description, 'cache'
+
+        text = self.fetch(description_prompt(name, language), background=background)
+        if text:
+            ConstellationDescription.objects.update_or_create(
+                name=name,
+                language=language,
+                defaults={'description': text, 'updated_at': timezone.now()},
+            )
+            self._remember(key, text, time.time(), 'gemini')
+            return text, 'gemini'
+
+        entry = self._lookup(key)
+        if entry is not None and entry[2] == 'gemini':
+            # Keep serving the stale text and retry after FALLBACK_TTL
+            text = entry[0]
+            self._remember(key, text, time.time() - self.ttl + FALLBACK_TTL, 'gemini')
+            return text, 'cache'
+        text = self.fallback(name)
+        self._remember(key, text, time.time(), 'basic')
+        return text, 'basic'
+
+    def _refresh_quietly(self, key):
+        try:
+            self._flight.do(key, lambda: self.refresh(*key, background=True))
+        except Exception as e:
+            print(f"Description refresh failed for {key[0]}: {e}")
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+        row = ConstellationDescription.objects.filter(name=key[0], language=key[1]).first()
+        if row is None:
+            return None
+        entry = (row.description, row.updated_at.timestamp(), 'gemini')
+        with self._lock:
+            self._memory.setdefault(key, entry)
+        return entry
+
+    def _remember(self, key, text, updated, source):
+        with self._lock:
+            self._memory[key] = (text, updated, source)
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._memory),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+            }
+
+
+_description_service = None
+_description_service_lock = threading.Lock()
+
+
+def get_description_service():
+    global _description_service
+    if _description_service is None:
+        with _description_service_lock:
+            if _description_service is None:
+                from .views import call_gemini_api, get_basic_constellation_info
+
+                _description_service = DescriptionService(
+                    fetch=call_gemini_api,
+                    fallback=get_basic_constellation_info,
+                    ttl=settings.CONSTELLATION_INFO_TTL,
+                    stale_ttl=settings.CONSTELLATION_INFO_STALE_TTL,
+                )
+    return _description_service
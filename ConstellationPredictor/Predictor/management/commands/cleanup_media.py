@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.files.storage import storages
+from django.core.management.base import BaseCommand
+
+from Predictor.media_store import MediaStore
+
+
+class Command(BaseCommand):
+    help = "Delete stored result images that haven't been used recently"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age',
+            type=int,
+            default=settings.ANNOTATED_MEDIA_MAX_AGE,
+            help='Age in seconds after which an unused image is deleted',
+        )
+
+    def handle(self, *args, **options):
+        # A plain store: the command shouldn't start the background cleanup thread
+        store = MediaStore(storages['annotated'])
+        removed = store.cleanup(options['max_age'])
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} result images"))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from Predictor.constellations import CONSTELLATION_NAMES
+from Predictor.descriptions import get_description_service, language_name
+
+
+class Command(BaseCommand):
+    help = "Fetch and cache Gemini descriptions for all 88 constellations"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help='Language code to warm (repeatable, default: en)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Refetch entries that are still fresh',
+        )
+
+    def handle(self, *args, **options):
+        languages = options['languages'] or ['en']
+        for language in languages:
+            if language_name(language) is None:
+                raise CommandError(f"Unknown language code: {language}")
+
+        service = get_description_service()
+        counts = {'gemini': 0, 'cache': 0, 'basic': 0}
+        for language in languages:
+            for name in CONSTELLATION_NAMES:
+                _, source = service.refresh(
+                    name, language, force=options['force'], background=True
+                )
+                counts[source] += 1
+                if source == 'basic':
+                    self.stderr.write(f"No Gemini description for {name} ({language})")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Descriptions: {counts['gemini']} fetched, {counts['cache']} already fresh, "
+            f"{counts['basic']} unavailable"
+        ))
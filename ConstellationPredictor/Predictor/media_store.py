@@ -0,0 +1,127 @@
+"""
+Content-addressed store for result images.
+
+Annotated results (and originals shown with client-side overlays) are saved
+under the SHA-256 of their bytes in the ``annotated`` storage from
+``STORAGES``, a FileSystemStorage under MEDIA_ROOT by default; any Django
+storage backend can be swapped in there. Pages link to them by URL instead
+of inlining base64, and since a name never changes content the images can be
+cached by browsers indefinitely.
+
+A background thread deletes images older than ANNOTATED_MEDIA_MAX_AGE; the
+``cleanup_media`` management command does the same on demand.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+
+CONTENT_TYPES = {
+    'jpg': 'image/jpeg',
+    'png': 'image/png',
+}
+
+
+def image_extension(image_bytes):
+    return 'png' if image_bytes[:8] == b'\x89PNG\r\n\x1a\n' else 'jpg'
+
+
+class MediaStore:
+    """Saves bytes under their content hash in a Django storage."""
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    @staticmethod
+    def name_for(key, ext):
+        # Fan out into 256 directories to keep listings small
+        return f"{key[:2]}/{key}.{ext}"
+
+    def save(self, image_bytes):
+        """Store the image if it's new; returns (key, ext)."""
+        key = hashlib.sha256(image_bytes).hexdigest()
+        ext = image_extension(image_bytes)
+        name = self.name_for(key, ext)
+        if self.storage.exists(name):
+            self.touch(name)
+        else:
+            saved = self.storage.save(name, ContentFile(image_bytes))
+            if saved != name:
+                # Another worker stored the same content first; keep theirs
+                self.storage.delete(saved)
+        return key, ext
+
+    def touch(self, name):
+        """Refresh the modified time so images still in use aren't cleaned up."""
+        try:
+            path = self.storage.path(name)
+        except NotImplementedError:
+            return
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def open(self, key, ext):
+        return self.storage.open(self.name_for(key, ext), 'rb')
+
+    def exists(self, key, ext):
+        return self.storage.exists(self.name_for(key, ext))
+
+    def cleanup(self, max_age):
+        """Delete images not written or reused within ``max_age`` seconds."""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age)
+        removed = 0
+        try:
+            directories, _ = self.storage.listdir('')
+        except FileNotFoundError:
+            return 0
+        for directory in directories:
+            _, files = self.storage.listdir(directory)
+            for filename in files:
+                name = f"{directory}/{filename}"
+                try:
+                    modified = self.storage.get_modified_time(name)
+                except (OSError, NotImplementedError):
+                    continue
+                if modified.tzinfo is None:
+                    modified = modified.replace(tzinfo=timezone.utc)
+                if modified < cutoff:
+                    self.storage.delete(name)
+                    removed += 1
+        return removed
+
+
+_media_store = None
+_media_store_lock = threading.Lock()
+
+
+def cleanup_loop(store):
+    while True:
+        time.sleep(settings.ANNOTATED_MEDIA_CLEANUP_INTERVAL)
+        try:
+            removed = store.cleanup(settings.ANNOTATED_MEDIA_MAX_AGE)
+            if removed:
+                print(f"Media cleanup removed {removed} images")
+        except Exception as e:
+            print(f"Media cleanup error: {e}")
+
+
+def get_media_store():
+    """Process-wide store; starts the cleanup thread on first use."""
+    global _media_store
+    if _media_store is None:
+        with _media_store_lock:
+            if _media_store is None:
+                _media_store = MediaStore(storages['annotated'])
+                if settings.ANNOTATED_MEDIA_CLEANUP_INTERVAL > 0:
+                    threading.Thread(
+                        target=cleanup_loop, args=(_media_store,), name='media-cleanup', daemon=True
+                    ).start()
+    return _media_store
@@ -1,3 +1,18 @@
 from django.db import models
+from django.utils import timezone
 
-# Create your models here.
+
+class ConstellationDescription(models.Model):
+    """Gemini-written description of a constellation, cached per language."""
+    name = models.CharField(max_length=64)
+    language = models.CharField(max_length=16, default='en')
+    description = models.TextField()
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'language'], name='unique_description_per_language'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.language})"
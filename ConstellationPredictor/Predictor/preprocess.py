@@ -0,0 +1,144 @@
+"""
+Pre-inference image normalization.
+
+Images are shrunk to the model's input resolution before they're sent to a
+detection backend: the YOLO model resizes to 640px anyway, so uploading a
+full-resolution astrophoto only costs transfer time. EXIF orientation is
+applied first so detections line up with the image as browsers display it,
+and boxes (or an annotated image the backend rendered) are scaled back to
+the original resolution afterwards.
+"""
+
+import io
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+EXIF_ORIENTATION = 0x0112
+# Orientations 5-8 rotate by 90/270 degrees, swapping width and height
+TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def exif_orientation(img):
+    try:
+        return img.getexif().get(EXIF_ORIENTATION, 1)
+    except (OSError, ValueError):
+        return 1
+
+
+def upright_size(img):
+    """Image size after applying its EXIF orientation."""
+    width, height = img.size
+    if exif_orientation(img) in TRANSPOSED_ORIENTATIONS:
+        return height, width
+    return width, height
+
+
+def preprocessing_signature():
+    """Short string identifying the current settings, for cache keys."""
+    return (
+        f"{settings.DETECTION_INPUT_SIZE}q{settings.DETECTION_JPEG_QUALITY}"
+        f"{'g' if settings.DETECTION_GRAYSCALE else ''}"
+        f"{'c' if settings.DETECTION_CONTRAST_STRETCH else ''}"
+    )
+
+
+class PreparedImage:
+    """Normalized image bytes plus what's needed to map boxes back."""
+
+    def __init__(self, image_bytes, scale_x=1.0, scale_y=1.0, size=None):
+        self.image_bytes = image_bytes
+        self.scale_x = scale_x
+        self.scale_y = scale_y
+        # Upright size of the original image
+        self.size = size
+
+    def restore_boxes(self, detections):
+        """Return detections with boxes in original-image pixels."""
+        if self.scale_x == 1.0 and self.scale_y == 1.0:
+            return detections
+        width, height = self.size
+        restored = []
+        for detection in detections:
+            box = detection.get('box')
+            if box:
+                x1, y1, x2, y2 = box
+                detection = {
+                    **detection,
+                    'box': [
+                        round(min(max(x1 * self.scale_x, 0), width), 1),
+                        round(min(max(y1 * self.scale_y, 0), height), 1),
+                        round(min(max(x2 * self.scale_x, 0), width), 1),
+                        round(min(max(y2 * self.scale_y, 0), height), 1),
+                    ],
+                }
+            restored.append(detection)
+        return restored
+
+    def restore_image(self, rendered_bytes):
+        """
+        Scale an image rendered from the normalized input (e.g. a backend's
+        annotated result) back up to the original size, as JPEG.
+        """
+        if (self.scale_x == 1.0 and self.scale_y == 1.0) or self.size is None:
+            return rendered_bytes
+        try:
+            with Image.open(io.BytesIO(rendered_bytes)) as img:
+                if img.size == self.size:
+                    return rendered_bytes
+                restored = img.convert('RGB').resize(self.size, Image.Resampling.LANCZOS)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            return rendered_bytes
+        out = io.BytesIO()
+        restored.save(out, 'JPEG', quality=85)
+        return out.getvalue()
+
+
+def prepare_image(image_bytes, max_side=None, quality=None, grayscale=None, contrast=None):
+    """
+    Normalize an encoded image for inference.
+
+    Applies the EXIF orientation, downscales so the longest side is at most
+    ``max_side`` (0 disables resizing), optionally converts to grayscale and
+    stretches the contrast, and re-encodes as JPEG at ``quality``. Images
+    that need none of this are passed through untouched, and bytes Pillow
+    can't read are left for the backend to reject.
+    """
+    max_side = settings.DETECTION_INPUT_SIZE if max_side is None else max_side
+    quality = quality or settings.DETECTION_JPEG_QUALITY
+    grayscale = settings.DETECTION_GRAYSCALE if grayscale is None else grayscale
+    contrast = settings.DETECTION_CONTRAST_STRETCH if contrast is None else contrast
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            orientation = exif_orientation(img)
+            width, height = upright_size(img)
+            scale = min(1.0, max_side / max(width, height)) if max_side else 1.0
+            if (scale == 1.0 and orientation == 1 and not grayscale and not contrast
+                    and img.format in ('JPEG', 'PNG')):
+                return PreparedImage(image_bytes, size=(width, height))
+
+            target = (max(1, round(width * scale)), max(1, round(height * scale)))
+            # Let libjpeg do most of the downscaling during decode
+            raw_target = target if orientation not in TRANSPOSED_ORIENTATIONS else target[::-1]
+            img.draft('L' if grayscale else 'RGB', raw_target)
+            normalized = ImageOps.exif_transpose(img)
+            normalized = normalized.convert('L' if grayscale else 'RGB')
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return PreparedImage(image_bytes)
+
+    if normalized.size != target:
+        normalized = normalized.resize(target, Image.Resampling.LANCZOS, reducing_gap=2.0)
+    if contrast:
+        # Clip the darkest/brightest 0.5%: stretches faint stars without
+        # letting a few hot pixels pin the range
+        normalized = ImageOps.autocontrast(normalized, cutoff=0.5, preserve_tone=True)
+
+    out = io.BytesIO()
+    normalized.save(out, 'JPEG', quality=quality)
+    return PreparedImage(
+        out.getvalue(),
+        scale_x=width / target[0],
+        scale_y=height / target[1],
+        size=(width, height),
+    )
@@ -0,0 +1,84 @@
+// Mobile menu toggle
+const mobileMenuBtn = document.getElementById('mobileMenuBtn');
+const mobileMenu = document.getElementById('mobileMenu');
+
+mobileMenuBtn.addEventListener('click', () => {
+    mobileMenu.classList.toggle('hidden');
+});
+
+// Create animated star background
+function createAnimatedStarBackground() {
+    const starBackground = document.getElementById('starBackground');
+    const numberOfStars = 200;
+
+    for (let i = 0; i < numberOfStars; i++) {
+        const star = document.createElement('div');
+        star.className = 'absolute bg-white rounded-full animate-twinkle-star';
+
+        // Random position
+        star.style.left = Math.random() * 100 + '%';
+        star.style.top = Math.random() * 100 + '%';
+
+        // Random size
+        const size = 0.5 + Math.random() * 2.5;
+        star.style.width = size + 'px';
+        star.style.height = size + 'px';
+
+        // Random animation duration
+        star.style.animationDuration = (2 + Math.random() * 6) + 's';
+        star.style.animationDelay = Math.random() * 4 + 's';
+
+        // Add some colored stars
+        if (Math.random() < 0.1) {
+            star.style.background = '#FFD700';
+        } else if (Math.random() < 0.05) {
+            star.style.background = '#87CEEB';
+        }
+
+        starBackground.appendChild(star);
+    }
+
+    createShootingStars();
+}
+
+// Create shooting stars effect
+function createShootingStars() {
+    const starBackground = document.getElementById('starBackground');
+
+    setInterval(() => {
+        if (Math.random() < 0.3) {
+            const shootingStar = document.createElement('div');
+            shootingStar.className = 'absolute w-0.5 h-0.5 rounded-full opacity-0';
+            shootingStar.style.background = 'linear-gradient(45deg, white, transparent)';
+            shootingStar.style.left = Math.random() * 100 + '%';
+            shootingStar.style.top = Math.random() * 50 + '%';
+            shootingStar.style.animation = 'shoot 1.5s ease-out forwards';
+
+            starBackground.appendChild(shootingStar);
+
+            setTimeout(() => {
+                if (starBackground.contains(shootingStar)) {
+                    starBackground.removeChild(shootingStar);
+                }
+            }, 1500);
+        }
+    }, 3000);
+}
+
+// Smooth scrolling for anchor links
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        e.preventDefault();
+        const target = document.querySelector(this.getAttribute('href'));
+        if (target) {
+            target.scrollIntoView({
+                behavior: 'smooth'
+            });
+        }
+    });
+});
+
+// Initialize on page load
+document.addEventListener('DOMContentLoaded', function() {
+    createAnimatedStarBackground();
+});
@@ -0,0 +1,258 @@
+// Constellations are fetched a page at a time from the catalog API
+const catalogUrl = document.currentScript.dataset.catalogUrl;
+
+// Variables
+let currentView = 'grid';
+let loadedData = [];
+let nextPage = 1;
+let currentQuery = '';
+let loading = false;
+let requestId = 0;
+let searchTimer = null;
+const constellationsById = new Map();
+
+// DOM Elements
+const searchInput = document.getElementById('searchInput');
+const gridView = document.getElementById('gridView');
+const listView = document.getElementById('listView');
+const noResults = document.getElementById('noResults');
+const filteredCount = document.getElementById('filteredCount');
+const totalCount = document.getElementById('totalCount');
+const loadMoreSentinel = document.getElementById('loadMoreSentinel');
+const gridBtn = document.getElementById('gridBtn');
+const listBtn = document.getElementById('listBtn');
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+// Create constellation card
+function createConstellationCard(constellation) {
+    return `
+        <div class="group p-6 bg-white/5 rounded-2xl backdrop-blur-sm border border-white/10 hover:-translate-y-2 transition-all duration-300 cursor-pointer" data-constellation="${constellation.id}">
+            <div class="mb-4 relative h-48 bg-gradient-to-br from-blue-500/20 to-purple-500/20 rounded-xl overflow-hidden">
+                <div class="absolute inset-0 flex items-center justify-center">
+                    <div class="w-full h-full bg-gradient-to-t from-blue-900/50 to-transparent flex items-center justify-center">
+                        <img src="${constellation.image}" alt="${escapeHtml(constellation.name)}" loading="lazy"/>
+                    </div>
+                </div>
+                <div class="absolute bottom-0 left-0 right-0 p-4">
+                    <div class="flex items-center">
+                        <svg class="w-5 h-5 text-yellow-300 mr-2" fill="currentColor" viewBox="0 0 20 20">
+                            <path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.519 4.674a1 1 0 00.95.69h4.915c.969 0 1.371 1.24.588 1.81l-3.976 2.888a1 1 0 00-.363 1.118l1.518 4.674c.3.922-.755 1.688-1.538 1.118l-3.976-2.888a1 1 0 00-1.176 0l-3.976 2.888c-.783.57-1.838-.196-1.538-1.118l1.518-4.674a1 1 0 00-.363-1.118l-3.976-2.888c-.784-.57-.38-1.81.588-1.81h4.914a1 1 0 00.951-.69l1.519-4.674z"></path>
+                        </svg>
+                        <h3 class="font-orbitron text-xl font-bold text-white">${escapeHtml(constellation.name)}</h3>
+                    </div>
+                </div>
+            </div>
+            ${matchedAlias(constellation)}
+            <p class="text-white/80 leading-relaxed">${escapeHtml(constellation.description)}</p>
+        </div>
+    `;
+}
+
+// Create constellation list item
+function createConstellationListItem(constellation) {
+    return `
+        <div class="group p-4 bg-white/5 rounded-2xl backdrop-blur-sm border border-white/10 flex items-center hover:bg-white/10 transition-all duration-300 cursor-pointer" data-constellation="${constellation.id}">
+            <div class="w-16 h-16 rounded-full bg-gradient-to-br from-blue-500/20 to-purple-500/20 flex items-center justify-center mr-4">
+                <svg class="w-8 h-8 text-yellow-300" fill="currentColor" viewBox="0 0 20 20">
+                    <path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.519 4.674a1 1 0 00.95.69h4.915c.969 0 1.371 1.24.588 1.81l-3.976 2.888a1 1 0 00-.363 1.118l1.518 4.674c.3.922-.755 1.688-1.538 1.118l-3.976-2.888a1 1 0 00-1.176 0l-3.976 2.888c-.783.57-1.838-.196-1.538-1.118l1.518-4.674a1 1 0 00-.363-1.118l-3.976-2.888c-.784-.57-.38-1.81.588-1.81h4.914a1 1 0 00.951-.69l1.519-4.674z"></path>
+                </svg>
+            </div>
+            <div class="flex-grow">
+                <h3 class="font-orbitron text-lg font-bold text-blue-400">${escapeHtml(constellation.name)}</h3>
+                ${matchedAlias(constellation)}
+                <p class="text-white/80 text-sm leading-relaxed">${escapeHtml(constellation.description)}</p>
+            </div>
+        </div>
+    `;
+}
+
+// Show which alias matched, e.g. "Big Dipper" for Ursa Major
+function matchedAlias(constellation) {
+    if (!constellation.matched || constellation.matched === constellation.name) {
+        return '';
+    }
+    return `<p class="text-yellow-300 text-sm mb-2">Matched "${escapeHtml(constellation.matched)}"</p>`;
+}
+
+function createItem(constellation) {
+    return currentView === 'grid'
+        ? createConstellationCard(constellation)
+        : createConstellationListItem(constellation);
+}
+
+// Render everything loaded so far (after a new search or a view change)
+function renderConstellations() {
+    if (loadedData.length === 0 && !loading) {
+        gridView.classList.add('hidden');
+        listView.classList.add('hidden');
+        noResults.classList.remove('hidden');
+        return;
+    }
+    noResults.classList.add('hidden');
+    gridView.classList.toggle('hidden', currentView !== 'grid');
+    listView.classList.toggle('hidden', currentView !== 'list');
+    gridView.innerHTML = currentView === 'grid' ? loadedData.map(createItem).join('') : '';
+    listView.innerHTML = currentView === 'list' ? loadedData.map(createItem).join('') : '';
+}
+
+// Append one page without re-rendering the items already shown
+function appendConstellations(items) {
+    const container = currentView === 'grid' ? gridView : listView;
+    container.insertAdjacentHTML('beforeend', items.map(createItem).join(''));
+}
+
+async function loadNextPage() {
+    if (loading || nextPage === null) return;
+    loading = true;
+    const thisRequest = ++requestId;
+    const params = new URLSearchParams({ q: currentQuery, page: nextPage });
+
+    try {
+        const response = await fetch(`${catalogUrl}?${params}`);
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        const data = await response.json();
+        if (thisRequest !== requestId) return;  // superseded by a newer search
+
+        const firstPage = data.page === 1;
+        data.results.forEach(c => constellationsById.set(String(c.id), c));
+        loadedData = firstPage ? data.results : loadedData.concat(data.results);
+        nextPage = data.has_next ? data.page + 1 : null;
+        filteredCount.textContent = data.count;
+        totalCount.textContent = data.total;
+
+        loading = false;
+        if (firstPage) {
+            renderConstellations();
+        } else {
+            appendConstellations(data.results);
+        }
+    } catch (error) {
+        console.error('Failed to load constellations:', error);
+    } finally {
+        if (thisRequest === requestId) {
+            loading = false;
+        }
+    }
+}
+
+// Start over from the first page for a new search term
+function filterConstellations(searchTerm) {
+    currentQuery = searchTerm.trim();
+    nextPage = 1;
+    loading = false;
+    requestId++;
+    loadNextPage();
+}
+
+// Handle search input (debounced so typing doesn't send a request per key)
+searchInput.addEventListener('input', (e) => {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(() => filterConstellations(e.target.value), 200);
+});
+
+// Load the next page as the end of the list scrolls into view
+const loadMoreObserver = new IntersectionObserver((entries) => {
+    if (entries.some(entry => entry.isIntersecting)) {
+        loadNextPage();
+    }
+}, { rootMargin: '400px' });
+loadMoreObserver.observe(loadMoreSentinel);
+
+// Handle view toggle
+function setActiveView(view) {
+    currentView = view;
+
+    // Update button states
+    document.querySelectorAll('.view-toggle').forEach(btn => {
+        btn.classList.remove('active');
+    });
+
+    if (view === 'grid') {
+        gridBtn.classList.add('active');
+        gridBtn.style.backgroundColor = 'rgba(59, 130, 246, 0.5)';
+        gridBtn.style.color = 'white';
+        listBtn.style.backgroundColor = 'transparent';
+        listBtn.style.color = 'rgba(255, 255, 255, 0.7)';
+    } else {
+        listBtn.classList.add('active');
+        listBtn.style.backgroundColor = 'rgba(59, 130, 246, 0.5)';
+        listBtn.style.color = 'white';
+        gridBtn.style.backgroundColor = 'transparent';
+        gridBtn.style.color = 'rgba(255, 255, 255, 0.7)';
+    }
+
+    renderConstellations();
+}
+
+// Add event listeners for view toggle
+gridBtn.addEventListener('click', () => setActiveView('grid'));
+listBtn.addEventListener('click', () => setActiveView('list'));
+
+// Click handlers for constellation cards/items, delegated so appended pages work too
+function handleConstellationClick(e) {
+    const card = e.target.closest('[data-constellation]');
+    if (!card) return;
+    const constellation = constellationsById.get(card.dataset.constellation);
+    if (constellation) {
+        // You can add navigation to detailed view here
+        console.log('Clicked on:', constellation.name);
+        // Example: window.location.href = `/constellation/${constellation.id}/`;
+    }
+}
+gridView.addEventListener('click', handleConstellationClick);
+listView.addEventListener('click', handleConstellationClick);
+
+// Initialize the page
+document.addEventListener('DOMContentLoaded', () => {
+    setActiveView('grid');
+    loadNextPage();
+});
+
+// Keyboard shortcuts
+document.addEventListener('keydown', (e) => {
+    // Focus search on '/' key
+    if (e.key === '/' && !e.ctrlKey && !e.altKey && !e.metaKey) {
+        e.preventDefault();
+        searchInput.focus();
+    }
+
+    // Clear search on Escape
+    if (e.key === 'Escape' && document.activeElement === searchInput) {
+        searchInput.value = '';
+        clearTimeout(searchTimer);
+        filterConstellations('');
+        searchInput.blur();
+    }
+
+    // Toggle view with 'g' for grid and 'l' for list
+    if (e.key === 'g' && !e.ctrlKey && !e.altKey && !e.metaKey && document.activeElement !== searchInput) {
+        setActiveView('grid');
+    }
+    if (e.key === 'l' && !e.ctrlKey && !e.altKey && !e.metaKey && document.activeElement !== searchInput) {
+        setActiveView('list');
+    }
+});
+
+// Add search placeholder animation
+let placeholderIndex = 0;
+const placeholders = [
+    "Search constellations...",
+    "Try 'Orion' or 'Big Dipper'...",
+    "Find your favorite stars...",
+    "Explore the night sky..."
+];
+
+function animatePlaceholder() {
+    if (searchInput.value === '') {
+        searchInput.placeholder = placeholders[placeholderIndex];
+        placeholderIndex = (placeholderIndex + 1) % placeholders.length;
+    }
+}
+
+// Change placeholder every 3 seconds
+setInterval(animatePlaceholder, 3000);
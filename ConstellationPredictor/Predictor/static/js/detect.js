@@ -0,0 +1,659 @@
+const video = document.getElementById('video');
+const canvas = document.getElementById('canvas');
+const resultImg = document.getElementById('result');
+const placeholder = document.getElementById('placeholder');
+const videoContainer = document.getElementById('videoContainer');
+const startCameraBtn = document.getElementById('startCamera');
+const switchCameraBtn = document.getElementById('switchCamera');
+const startDetectionBtn = document.getElementById('startDetection');
+const stopDetectionBtn = document.getElementById('stopDetection');
+const showTroubleshootingBtn = document.getElementById('showTroubleshooting');
+const fullscreenToggle = document.getElementById('fullscreenToggle');
+const fullscreenControls = document.getElementById('fullscreenControls');
+const statusDiv = document.getElementById('status');
+const troubleshootingDiv = document.getElementById('troubleshooting');
+const ctx = canvas.getContext('2d');
+const overlay = document.getElementById('overlay');
+const overlayCtx = overlay.getContext('2d');
+// Boxes come back as JSON and are drawn here instead of fetching annotated images
+const overlayMode = document.currentScript.dataset.overlayMode === 'true';
+
+let streaming = false;
+let cameraStream = null;
+let detectionActive = false;
+let currentFacingMode = 'environment'; // Start with back camera
+let availableCameras = [];
+let currentCameraIndex = 0;
+let isFullscreen = false;
+let detectionSession = null; // Lets the server skip near-identical frames
+let detectSocket = null;     // WebSocket stream, when the server supports it
+let framesInFlight = 0;
+let maxFramesInFlight = 1;
+
+// Mobile device detection
+function isMobile() {
+    return /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent);
+}
+
+// Update status with better mobile UX
+function updateStatus(message, type = 'info', icon = '🔭') {
+    const statusContent = statusDiv.querySelector('.status-content');
+    const statusIcon = statusContent.querySelector('.status-icon');
+    const statusText = statusContent.querySelector('span');
+
+    statusIcon.textContent = icon;
+    statusText.textContent = message;
+
+    // Remove all status classes
+    statusDiv.className = 'mb-4 sm:mb-8 p-3 sm:p-4 rounded-2xl backdrop-blur-sm border border-white/10 bg-white/5 text-center';
+
+    // Add specific status class
+    if (type === 'error') {
+        statusDiv.classList.add('status-error');
+    } else if (type === 'success') {
+        statusDiv.classList.add('status-success');
+    } else {
+        statusDiv.classList.add('status-info');
+    }
+}
+
+// Get available cameras
+async function getAvailableCameras() {
+    try {
+        const devices = await navigator.mediaDevices.enumerateDevices();
+        availableCameras = devices.filter(device => device.kind === 'videoinput');
+
+        console.log('Available cameras:', availableCameras.length);
+
+        if (availableCameras.length > 1) {
+            switchCameraBtn.style.display = 'flex';
+        }
+
+        return availableCameras;
+    } catch (err) {
+        console.error('Error getting camera list:', err);
+        return [];
+    }
+}
+
+// Enhanced browser compatibility check
+function checkBrowserSupport() {
+    const isSecureContext = window.isSecureContext || location.protocol === 'https:' || location.hostname === 'localhost' || location.hostname === '127.0.0.1';
+
+    if (!navigator.mediaDevices || !navigator.mediaDevices.getUserMedia) {
+        updateStatus('Camera access not supported in this browser. Please use a modern browser.', 'error', '❌');
+        startCameraBtn.disabled = true;
+        showTroubleshootingInfo();
+        return false;
+    }
+
+    if (!isSecureContext) {
+        updateStatus('Camera requires HTTPS or localhost. Please use https:// or localhost.', 'error', '🔒');
+        startCameraBtn.disabled = true;
+        showTroubleshootingInfo();
+        return false;
+    }
+
+    return true;
+}
+
+function showTroubleshootingInfo() {
+    troubleshootingDiv.style.display = 'block';
+    document.getElementById('currentUrl').textContent = window.location.href;
+
+    const deviceInfo = {
+        userAgent: navigator.userAgent,
+        platform: navigator.platform,
+        mobile: isMobile() ? 'Yes' : 'No',
+        touchScreen: 'ontouchstart' in window ? 'Yes' : 'No'
+    };
+
+    document.getElementById('deviceInfo').textContent = 
+        `${deviceInfo.platform} | Mobile: ${deviceInfo.mobile} | Touch: ${deviceInfo.touchScreen}`;
+}
+
+// Get camera constraints based on device and preference
+function getCameraConstraints() {
+    const constraints = {
+        video: {
+            width: { ideal: isMobile() ? 720 : 1280 },
+            height: { ideal: isMobile() ? 960 : 720 },
+        }
+    };
+
+    if (availableCameras.length > 0) {
+        // Use specific camera device
+        constraints.video.deviceId = { exact: availableCameras[currentCameraIndex].deviceId };
+    } else {
+        // Fallback to facingMode
+        constraints.video.facingMode = currentFacingMode;
+    }
+
+    return constraints;
+}
+
+// Start camera function with mobile optimizations
+async function startCamera() {
+    try {
+        updateStatus('Starting camera...', 'info', '📹');
+
+        // Get available cameras first
+        await getAvailableCameras();
+
+        const constraints = getCameraConstraints();
+        console.log('Camera constraints:', constraints);
+
+        // Stop existing stream if any
+        if (cameraStream) {
+            cameraStream.getTracks().forEach(track => track.stop());
+        }
+
+        cameraStream = await navigator.mediaDevices.getUserMedia(constraints);
+        video.srcObject = cameraStream;
+
+        video.onloadedmetadata = () => {
+            video.play().then(() => {
+                streaming = true;
+                video.style.display = 'block';
+                placeholder.style.display = 'none';
+                fullscreenToggle.style.display = 'block';
+
+                startCameraBtn.disabled = true;
+                startDetectionBtn.disabled = false;
+                switchCameraBtn.disabled = false;
+
+                const cameraName = availableCameras.length > 0 ? 
+                    (availableCameras[currentCameraIndex].label || `Camera ${currentCameraIndex + 1}`) : 
+                    (currentFacingMode === 'environment' ? 'Back Camera' : 'Front Camera');
+
+                updateStatus(`Camera started: ${cameraName}. Point at the night sky and start detection.`, 'success', '✅');
+            }).catch(err => {
+                updateStatus(`Error playing video: ${err.message}`, 'error', '❌');
+            });
+        };
+
+    } catch (err) {
+        console.error("Error accessing webcam:", err);
+        let errorMessage = 'Camera access failed: ';
+        let icon = '❌';
+
+        if (err.name === 'NotAllowedError') {
+            errorMessage += 'Permission denied. Please allow camera access and try again.';
+            icon = '🚫';
+        } else if (err.name === 'NotFoundError') {
+            errorMessage += 'No camera found on this device.';
+            icon = '📷';
+        } else if (err.name === 'NotReadableError') {
+            errorMessage += 'Camera is being used by another app. Please close other camera apps.';
+            icon = '🔒';
+        } else if (err.name === 'OverconstrainedError') {
+            errorMessage += 'Camera constraints not supported. Trying fallback...';
+            icon = '⚠️';
+            // Try with basic constraints
+            setTimeout(() => startCameraFallback(), 1000);
+        } else {
+            errorMessage += err.message;
+        }
+
+        updateStatus(errorMessage, 'error', icon);
+    }
+}
+
+// Fallback camera start with basic constraints
+async function startCameraFallback() {
+    try {
+        updateStatus('Trying basic camera access...', 'info', '📹');
+
+        const basicConstraints = {
+            video: true
+        };
+
+        if (cameraStream) {
+            cameraStream.getTracks().forEach(track => track.stop());
+        }
+
+        cameraStream = await navigator.mediaDevices.getUserMedia(basicConstraints);
+        video.srcObject = cameraStream;
+
+        video.onloadedmetadata = () => {
+            video.play().then(() => {
+                streaming = true;
+                video.style.display = 'block';
+                placeholder.style.display = 'none';
+                fullscreenToggle.style.display = 'block';
+
+                startCameraBtn.disabled = true;
+                startDetectionBtn.disabled = false;
+
+                updateStatus('Camera started with basic settings. Ready for detection.', 'success', '✅');
+            });
+        };
+
+    } catch (err) {
+        updateStatus('Unable to access any camera. Please check permissions and try again.', 'error', '❌');
+        showTroubleshootingInfo();
+    }
+}
+
+// Switch camera function
+async function switchCamera() {
+    if (availableCameras.length <= 1) {
+        // Fallback to facingMode switching
+        currentFacingMode = currentFacingMode === 'environment' ? 'user' : 'environment';
+    } else {
+        currentCameraIndex = (currentCameraIndex + 1) % availableCameras.length;
+    }
+
+    updateStatus('Switching camera...', 'info', '🔄');
+    await startCamera();
+}
+
+function showResult(imageBlob) {
+    if (resultImg.src.startsWith('blob:')) {
+        URL.revokeObjectURL(resultImg.src);
+    }
+    resultImg.src = URL.createObjectURL(imageBlob);
+    resultImg.style.display = 'block';
+    video.style.display = 'none';
+}
+
+function drawOverlay(detections) {
+    const width = overlay.clientWidth;
+    const height = overlay.clientHeight;
+    const ratio = window.devicePixelRatio || 1;
+    overlay.width = width * ratio;
+    overlay.height = height * ratio;
+    overlayCtx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    overlayCtx.clearRect(0, 0, width, height);
+    overlay.style.display = 'block';
+
+    // The video is shown with object-fit: cover, so map frame pixels onto it
+    const frameWidth = video.videoWidth || 640;
+    const frameHeight = video.videoHeight || 480;
+    const scale = Math.max(width / frameWidth, height / frameHeight);
+    const offsetX = (width - frameWidth * scale) / 2;
+    const offsetY = (height - frameHeight * scale) / 2;
+
+    overlayCtx.font = '14px sans-serif';
+    overlayCtx.lineWidth = 2;
+    let labelRow = 0;
+    detections.forEach(detection => {
+        const label = `${detection.name} ${Math.round(detection.confidence * 100)}%`;
+        const labelWidth = overlayCtx.measureText(label).width + 8;
+        let x = 8;
+        let y = 8 + labelRow * 22;
+        if (detection.box) {
+            const [x1, y1, x2, y2] = detection.box;
+            x = offsetX + x1 * scale;
+            y = offsetY + y1 * scale;
+            overlayCtx.strokeStyle = '#60a5fa';
+            overlayCtx.strokeRect(x, y, (x2 - x1) * scale, (y2 - y1) * scale);
+            y = Math.max(0, y - 20);
+        } else {
+            labelRow++;
+        }
+        overlayCtx.fillStyle = '#60a5fa';
+        overlayCtx.fillRect(x, y, labelWidth, 20);
+        overlayCtx.fillStyle = '#000';
+        overlayCtx.fillText(label, x + 4, y + 15);
+    });
+}
+
+function clearOverlay() {
+    overlayCtx.clearRect(0, 0, overlay.width, overlay.height);
+    overlay.style.display = 'none';
+}
+
+// WebSocket streaming: the server announces how many frames it will
+// work on at once, and a new frame is only captured when one of those
+// slots frees up, so the frame rate follows server speed.
+function openDetectSocket() {
+    return new Promise(resolve => {
+        if (!('WebSocket' in window)) {
+            resolve(null);
+            return;
+        }
+        const scheme = location.protocol === 'https:' ? 'wss' : 'ws';
+        const format = overlayMode ? '?format=json' : '';
+        const socket = new WebSocket(`${scheme}://${location.host}/ws/detect/${format}`);
+        let ready = false;
+
+        socket.onmessage = event => {
+            if (typeof event.data === 'string') {
+                const message = JSON.parse(event.data);
+                if (message.type === 'ready') {
+                    maxFramesInFlight = message.max_in_flight;
+                    ready = true;
+                    resolve(socket);
+                } else if (message.type === 'result' && message.detections) {
+                    framesInFlight = Math.max(0, framesInFlight - 1);
+                    if (detectionActive) {
+                        drawOverlay(message.detections);
+                    }
+                    pumpFrames();
+                } else if (message.type === 'dropped' || message.type === 'error') {
+                    framesInFlight = Math.max(0, framesInFlight - 1);
+                    pumpFrames();
+                }
+                return;
+            }
+            // Binary message: the annotated frame for the preceding result
+            framesInFlight = Math.max(0, framesInFlight - 1);
+            if (detectionActive) {
+                showResult(event.data);
+            }
+            pumpFrames();
+        };
+        socket.onclose = () => {
+            if (!ready) {
+                resolve(null);
+                return;
+            }
+            if (detectSocket === socket) {
+                // Connection lost mid-session: fall back to HTTP polling
+                detectSocket = null;
+                if (detectionActive) {
+                    detectLoop();
+                }
+            }
+        };
+        socket.binaryType = 'blob';
+    });
+}
+
+function closeDetectSocket() {
+    if (detectSocket) {
+        const socket = detectSocket;
+        detectSocket = null;
+        socket.close();
+    }
+    framesInFlight = 0;
+}
+
+function pumpFrames() {
+    while (detectSocket && detectionActive && streaming && framesInFlight < maxFramesInFlight) {
+        framesInFlight++;
+        const videoWidth = video.videoWidth || 640;
+        const videoHeight = video.videoHeight || 480;
+        canvas.width = videoWidth;
+        canvas.height = videoHeight;
+        ctx.drawImage(video, 0, 0, videoWidth, videoHeight);
+        canvas.toBlob(blob => {
+            if (!blob || !detectSocket || !detectionActive) {
+                framesInFlight = Math.max(0, framesInFlight - 1);
+                return;
+            }
+            detectSocket.send(blob);
+        }, 'image/jpeg', 0.7);
+    }
+}
+
+// Detection loop function with mobile optimizations (HTTP fallback)
+function detectLoop() {
+    if (!detectionActive || !streaming) return;
+
+    try {
+        // Adjust canvas size based on video dimensions
+        const videoWidth = video.videoWidth || 640;
+        const videoHeight = video.videoHeight || 480;
+
+        canvas.width = videoWidth;
+        canvas.height = videoHeight;
+
+        ctx.drawImage(video, 0, 0, videoWidth, videoHeight);
+
+        canvas.toBlob(blob => {
+            if (!blob || !detectionActive) return;
+
+            const formData = new FormData();
+            formData.append('frame', blob, 'frame.jpg');
+            formData.append('session', detectionSession);
+
+            fetch(overlayMode ? '/detect/api/' : '/detect/process/', {
+                method: 'POST',
+                body: formData
+            })
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                }
+                return overlayMode ? response.json() : response.blob();
+            })
+            .then(result => {
+                if (detectionActive) {
+                    if (overlayMode) {
+                        drawOverlay(result.detections);
+                    } else {
+                        showResult(result);
+                    }
+
+                    // Continue detection loop
+                    setTimeout(() => {
+                        if (detectionActive) {
+                            requestAnimationFrame(detectLoop);
+                        }
+                    }, 500); // Reduced frequency for mobile performance
+                }
+            })
+            .catch(err => {
+                console.error('Detection error:', err);
+                updateStatus(`Detection error: ${err.message}`, 'error', '⚠️');
+                stopDetection();
+            });
+        }, 'image/jpeg', 0.7); // Reduced quality for mobile performance
+
+    } catch (err) {
+        console.error('Canvas error:', err);
+        updateStatus(`Canvas error: ${err.message}`, 'error', '⚠️');
+        stopDetection();
+    }
+}
+
+async function startDetection() {
+    if (!streaming) {
+        updateStatus('Camera not started yet!', 'error', '❌');
+        return;
+    }
+
+    detectionActive = true;
+    detectionSession = window.crypto && crypto.randomUUID
+        ? crypto.randomUUID()
+        : Date.now().toString(36) + Math.random().toString(36).slice(2);
+    startDetectionBtn.disabled = true;
+    stopDetectionBtn.disabled = false;
+
+    // Update fullscreen controls
+    document.getElementById('fullscreenStartDetection').disabled = true;
+    document.getElementById('fullscreenStopDetection').disabled = false;
+
+    updateStatus('AI is analyzing the night sky for constellations...', 'info', '🔍');
+    const socket = await openDetectSocket();
+    if (!detectionActive) {
+        if (socket) socket.close();
+        return;
+    }
+    if (socket) {
+        detectSocket = socket;
+        pumpFrames();
+    } else {
+        detectLoop();
+    }
+}
+
+function stopDetection() {
+    detectionActive = false;
+    closeDetectSocket();
+    startDetectionBtn.disabled = false;
+    stopDetectionBtn.disabled = true;
+
+    // Update fullscreen controls
+    document.getElementById('fullscreenStartDetection').disabled = false;
+    document.getElementById('fullscreenStopDetection').disabled = true;
+
+    resultImg.style.display = 'none';
+    clearOverlay();
+    video.style.display = 'block';
+    updateStatus('Detection stopped. Camera is still active.', 'info', '⏸️');
+}
+
+function stopCamera() {
+    if (cameraStream) {
+        cameraStream.getTracks().forEach(track => track.stop());
+        cameraStream = null;
+    }
+    streaming = false;
+    detectionActive = false;
+    closeDetectSocket();
+    video.style.display = 'none';
+    resultImg.style.display = 'none';
+    clearOverlay();
+    placeholder.style.display = 'flex';
+    fullscreenToggle.style.display = 'none';
+
+    startCameraBtn.disabled = false;
+    startDetectionBtn.disabled = true;
+    stopDetectionBtn.disabled = true;
+    switchCameraBtn.disabled = true;
+
+    updateStatus('Camera stopped', 'info', '📷');
+}
+
+// Fullscreen functionality
+function toggleFullscreen() {
+    if (!isFullscreen) {
+        enterFullscreen();
+    } else {
+        exitFullscreen();
+    }
+}
+
+function enterFullscreen() {
+    videoContainer.classList.add('fullscreen-active');
+    fullscreenControls.style.display = 'flex';
+    fullscreenToggle.innerHTML = `
+        <svg class="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M6 18L18 6M6 6l12 12"></path>
+        </svg>
+    `;
+    isFullscreen = true;
+
+    // Lock orientation on mobile if available
+    if (screen.orientation && screen.orientation.lock) {
+        screen.orientation.lock('landscape').catch(() => {
+            // Orientation lock not supported or failed
+        });
+    }
+}
+
+function exitFullscreen() {
+    videoContainer.classList.remove('fullscreen-active');
+    fullscreenControls.style.display = 'none';
+    fullscreenToggle.innerHTML = `
+        <svg class="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 8V4m0 0h4M4 4l5 5m11-1V4m0 0h-4m4 0l-5 5M4 16v4m0 0h4m-4 0l5-5m11 5l-5-5m5 5v-4m0 4h-4"></path>
+        </svg>
+    `;
+    isFullscreen = false;
+
+    // Unlock orientation
+    if (screen.orientation && screen.orientation.unlock) {
+        screen.orientation.unlock();
+    }
+}
+
+// Event listeners
+startCameraBtn.addEventListener('click', startCamera);
+switchCameraBtn.addEventListener('click', switchCamera);
+startDetectionBtn.addEventListener('click', startDetection);
+stopDetectionBtn.addEventListener('click', stopDetection);
+fullscreenToggle.addEventListener('click', toggleFullscreen);
+
+// Fullscreen controls
+document.getElementById('fullscreenStartDetection').addEventListener('click', startDetection);
+document.getElementById('fullscreenStopDetection').addEventListener('click', stopDetection);
+document.getElementById('fullscreenSwitchCamera').addEventListener('click', switchCamera);
+document.getElementById('exitFullscreen').addEventListener('click', exitFullscreen);
+
+showTroubleshootingBtn.addEventListener('click', () => {
+    const isVisible = troubleshootingDiv.style.display !== 'none';
+    troubleshootingDiv.style.display = isVisible ? 'none' : 'block';
+    if (!isVisible) {
+        showTroubleshootingInfo();
+    }
+});
+
+// Mobile-specific event handlers
+if (isMobile()) {
+    // Prevent zoom on double tap
+    let lastTouchEnd = 0;
+    document.addEventListener('touchend', function (event) {
+        const now = (new Date()).getTime();
+        if (now - lastTouchEnd <= 300) {
+            event.preventDefault();
+        }
+        lastTouchEnd = now;
+    }, false);
+
+    // Handle orientation changes
+    window.addEventListener('orientationchange', () => {
+        setTimeout(() => {
+            if (streaming && video.videoWidth && video.videoHeight) {
+                // Adjust video display after orientation change
+                video.style.width = '100%';
+                video.style.height = '100%';
+            }
+        }, 500);
+    });
+
+    // Handle visibility changes (app switching)
+    document.addEventListener('visibilitychange', () => {
+        if (document.hidden && detectionActive) {
+            // Pause detection when app goes to background
+            stopDetection();
+            updateStatus('Detection paused - app in background', 'info', '⏸️');
+        }
+    });
+}
+
+// Keyboard shortcuts for desktop
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'f' || e.key === 'F') {
+        if (streaming) {
+            toggleFullscreen();
+        }
+    } else if (e.key === ' ') {
+        e.preventDefault();
+        if (streaming && !detectionActive) {
+            startDetection();
+        } else if (detectionActive) {
+            stopDetection();
+        }
+    } else if (e.key === 'c' || e.key === 'C') {
+        if (streaming && availableCameras.length > 1) {
+            switchCamera();
+        }
+    }
+});
+
+// Cleanup when page is unloaded
+window.addEventListener('beforeunload', stopCamera);
+
+// Initialize
+if (checkBrowserSupport()) {
+    if (isMobile()) {
+        updateStatus('Mobile device detected. Tap "Start Camera" to begin.', 'info', '📱');
+    }
+
+    // Get available cameras on load
+    getAvailableCameras();
+} else {
+    console.log('Browser details:', {
+        userAgent: navigator.userAgent,
+        protocol: location.protocol,
+        hostname: location.hostname,
+        isSecureContext: window.isSecureContext,
+        hasMediaDevices: !!navigator.mediaDevices,
+        hasGetUserMedia: !!navigator.mediaDevices?.getUserMedia,
+        mobile: isMobile()
+    });
+}
@@ -0,0 +1,43 @@
+const chatbotUrl = document.currentScript.dataset.chatbotUrl;
+
+// Add stars to the star chart
+function test(){
+    window.open(chatbotUrl, "_self");
+}
+function createStars() {
+    const starChart = document.getElementById('starChart');
+    const starPositions = [
+        {x: 150, y: 120}, {x: 200, y: 100}, {x: 250, y: 120},
+        {x: 280, y: 180}, {x: 180, y: 200}, {x: 220, y: 250},
+        {x: 270, y: 280}, {x: 120, y: 160}, {x: 300, y: 200},
+        {x: 160, y: 300}, {x: 240, y: 80}, {x: 320, y: 140}
+    ];
+
+    starPositions.forEach((pos, index) => {
+        const star = document.createElement('div');
+        star.className = 'absolute w-1 h-1 bg-white rounded-full animate-twinkle';
+        star.style.left = pos.x + 'px';
+        star.style.top = pos.y + 'px';
+        star.style.animationDelay = (index * 0.2) + 's';
+        starChart.appendChild(star);
+    });
+}
+
+// Assistant functionality
+const assistantInput = document.getElementById('assistantInput');
+const assistantBtn = document.getElementById('assistantBtn');
+
+assistantBtn.addEventListener('click', function() {
+    const question = assistantInput.value.trim();
+
+});
+
+assistantInput.addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        assistantBtn.click();
+    }
+});
+
+document.addEventListener('DOMContentLoaded', function() {
+    createStars();
+});
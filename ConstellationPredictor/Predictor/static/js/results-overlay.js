@@ -0,0 +1,47 @@
+// Draw detection boxes over the original image; box coordinates are in image pixels
+function drawDetectionOverlay() {
+    const img = document.getElementById('processed-image');
+    const overlay = document.getElementById('detection-overlay');
+    const detections = JSON.parse(document.getElementById('detections-data').textContent);
+    if (!img.naturalWidth) return;
+
+    const width = img.clientWidth;
+    const height = img.clientHeight;
+    const ratio = window.devicePixelRatio || 1;
+    overlay.width = width * ratio;
+    overlay.height = height * ratio;
+    const ctx = overlay.getContext('2d');
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    ctx.clearRect(0, 0, width, height);
+
+    // object-contain: the image is scaled uniformly and centred in its box
+    const scale = Math.min(width / img.naturalWidth, height / img.naturalHeight);
+    const offsetX = (width - img.naturalWidth * scale) / 2;
+    const offsetY = (height - img.naturalHeight * scale) / 2;
+
+    ctx.font = '14px sans-serif';
+    ctx.lineWidth = 2;
+    detections.forEach(detection => {
+        if (!detection.box) return;
+        const [x1, y1, x2, y2] = detection.box;
+        const x = offsetX + x1 * scale;
+        const y = offsetY + y1 * scale;
+        ctx.strokeStyle = '#60a5fa';
+        ctx.strokeRect(x, y, (x2 - x1) * scale, (y2 - y1) * scale);
+
+        const label = `${detection.name} ${Math.round(detection.confidence * 100)}%`;
+        const top = Math.max(0, y - 20);
+        ctx.fillStyle = '#60a5fa';
+        ctx.fillRect(x, top, ctx.measureText(label).width + 8, 20);
+        ctx.fillStyle = '#000';
+        ctx.fillText(label, x + 4, top + 15);
+    });
+}
+
+const processedImage = document.getElementById('processed-image');
+if (processedImage.complete) {
+    drawDetectionOverlay();
+} else {
+    processedImage.addEventListener('load', drawDetectionOverlay);
+}
+window.addEventListener('resize', drawDetectionOverlay);
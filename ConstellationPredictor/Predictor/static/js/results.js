@@ -0,0 +1,169 @@
+// Add some interactive effects
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate detection cards
+    const detectionCards = document.querySelectorAll('.bg-white\\/5');
+    detectionCards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(20px)';
+        setTimeout(() => {
+            card.style.transition = 'all 0.5s ease';
+            card.style.opacity = '1';
+            card.style.transform = 'translateY(0)';
+        }, index * 100);
+    });
+
+    // Add click-to-expand for constellation details
+    const constellationCards = document.querySelectorAll('[data-constellation]');
+    constellationCards.forEach(card => {
+        card.addEventListener('click', function() {
+            // Add your constellation detail expansion logic here
+            console.log('Clicked constellation:', this.dataset.constellation);
+        });
+    });
+});
+
+// Add floating stars animation
+function createResultStars() {
+    const starsContainer = document.createElement('div');
+    starsContainer.className = 'fixed inset-0 pointer-events-none z-0';
+    document.body.appendChild(starsContainer);
+
+    for (let i = 0; i < 30; i++) {
+        const star = document.createElement('div');
+        star.className = 'absolute w-1 h-1 bg-blue-400 rounded-full opacity-20';
+        star.style.left = Math.random() * 100 + '%';
+        star.style.top = Math.random() * 100 + '%';
+        star.style.animationDelay = Math.random() * 3 + 's';
+        star.style.animation = 'twinkle 4s infinite';
+        starsContainer.appendChild(star);
+    }
+}
+
+createResultStars();
+
+// Text-to-Speech functionality
+function speakConstellation(constellationName) {
+    if ('speechSynthesis' in window) {
+        // Cancel any ongoing speech
+        speechSynthesis.cancel();
+
+        // Get constellation info from the loaded data
+        const infoElement = document.querySelector(`[data-constellation="${constellationName}"]`);
+        let textToSpeak = `Constellation: ${constellationName}`;
+
+        if (infoElement) {
+            const description = infoElement.querySelector('.constellation-description');
+            if (description) {
+                textToSpeak += `. ${description.textContent}`;
+            }
+        }
+
+        const utterance = new SpeechSynthesisUtterance(textToSpeak);
+        utterance.rate = 0.8;
+        utterance.pitch = 1;
+        utterance.volume = 0.8;
+
+        speechSynthesis.speak(utterance);
+    } else {
+        alert('Text-to-speech is not supported in your browser');
+    }
+}
+
+// Load constellation information (simulated Gemini API call)
+async function loadConstellationInfo(constellationName, index) {
+    const infoDiv = document.getElementById(`info-${index}`);
+
+    // Show loading state
+    infoDiv.innerHTML = `
+        <div class="flex items-center justify-center py-4">
+            <div class="animate-spin rounded-full h-6 w-6 border-b-2 border-purple-500"></div>
+            <span class="ml-2 text-gray-300">Loading constellation info...</span>
+        </div>
+    `;
+
+            try {
+        const response = await fetch('/get-constellation-info/', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': getCookie('csrftoken'),
+            },
+            body: JSON.stringify({
+                constellation_name: constellationName
+            })
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            displayConstellationInfo(infoDiv, data.name, data.info);
+        } else {
+            throw new Error('Failed to fetch constellation info');
+        }
+
+    } catch (error) {
+        // Fallback with basic info
+        displayConstellationInfo(infoDiv, constellationName, getBasicConstellationInfo(constellationName));
+    }
+}
+
+function displayConstellationInfo(container, name, info) {
+    container.innerHTML = `
+        <div data-constellation="${name}" class="constellation-info-content animate-fade-in">
+            <div class="constellation-description text-gray-300 text-sm leading-relaxed mb-3">
+                ${info}
+            </div>
+            <div class="flex items-center justify-between">
+                <button onclick="speakConstellation('${name}')" 
+                        class="px-3 py-1 bg-green-500/20 hover:bg-green-500/40 text-green-300 rounded text-sm transition-colors duration-200 flex items-center space-x-1">
+                    <svg class="w-3 h-3" fill="currentColor" viewBox="0 0 20 20">
+                        <path fill-rule="evenodd" d="M9.383 3.076A1 1 0 0110 4v12a1 1 0 01-1.617.824L4.168 13H2a1 1 0 01-1-1V8a1 1 0 011-1h2.168l4.215-3.824a1 1 0 011.617.824z" clip-rule="evenodd"/>
+                    </svg>
+                    <span>Listen</span>
+                </button>
+                <span class="text-xs text-gray-500">✨ Powered by AI</span>
+            </div>
+        </div>
+    `;
+}
+
+// Basic constellation information fallback
+function getBasicConstellationInfo(name) {
+    const basicInfo = {
+        'Orion': 'Orion is one of the most recognizable constellations, known as "The Hunter." It contains bright stars like Betelgeuse and Rigel, and the famous Orion Nebula.',
+        'Ursa Major': 'Ursa Major, the Great Bear, contains the famous Big Dipper asterism. It\'s visible year-round in most northern hemisphere locations.',
+        'Cassiopeia': 'Cassiopeia is known for its distinctive W-shape formed by five bright stars. In Greek mythology, she was a vain queen.',
+        'Leo': 'Leo the Lion is a zodiac constellation best seen in spring. Its brightest star is Regulus, marking the lion\'s heart.',
+        'Cygnus': 'Cygnus, the Swan, flies along the Milky Way. Its brightest star Deneb forms part of the Summer Triangle.',
+    };
+
+    return basicInfo[name] || `${name} is a fascinating constellation with a rich history in astronomy and mythology. This celestial pattern has guided navigators and inspired storytellers for thousands of years.`;
+}
+
+// CSRF token helper for Django
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let i = 0; i < cookies.length; i++) {
+            const cookie = cookies[i].trim();
+            if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
+
+// Add CSS animations
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes fadeIn {
+        from { opacity: 0; transform: translateY(10px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    .animate-fade-in {
+        animation: fadeIn 0.3s ease-out;
+    }
+`;
+document.head.appendChild(style);
@@ -0,0 +1,30 @@
+tailwind.config = {
+    theme: {
+        extend: {
+            fontFamily: {
+                'orbitron': ['Orbitron', 'monospace'],
+                'space': ['Space Mono', 'monospace'],
+            },
+            animation: {
+                'twinkle': 'twinkle 2s infinite',
+                'twinkle-star': 'twinkle-star 3s infinite',
+                'shoot': 'shoot 1.5s ease-out forwards',
+            },
+            keyframes: {
+                twinkle: {
+                    '0%, 100%': { opacity: '1' },
+                    '50%': { opacity: '0.3' }
+                },
+                'twinkle-star': {
+                    '0%, 100%': { opacity: '1', transform: 'scale(1)' },
+                    '50%': { opacity: '0.3', transform: 'scale(0.8)' }
+                },
+                shoot: {
+                    '0%': { opacity: '0', transform: 'translateX(0) translateY(0)' },
+                    '10%': { opacity: '1' },
+                    '100%': { opacity: '0', transform: 'translateX(300px) translateY(150px)' }
+                }
+            }
+        }
+    }
+}
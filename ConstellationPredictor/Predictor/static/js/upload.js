@@ -0,0 +1,127 @@
+const dropZone = document.getElementById('dropZone');
+const fileInput = document.getElementById('fileInput');
+const uploadContent = document.getElementById('uploadContent');
+const previewArea = document.getElementById('previewArea');
+const previewImage = document.getElementById('previewImage');
+const fileName = document.getElementById('fileName');
+const fileSize = document.getElementById('fileSize');
+const removeImage = document.getElementById('removeImage');
+const submitBtn = document.getElementById('submitBtn');
+const submitText = document.getElementById('submitText');
+const loadingSpinner = document.getElementById('loadingSpinner');
+const uploadForm = document.getElementById('uploadForm');
+
+// Click to browse
+dropZone.addEventListener('click', () => {
+    if (!previewArea.classList.contains('hidden')) return;
+    fileInput.click();
+});
+
+// Drag and drop functionality
+dropZone.addEventListener('dragover', (e) => {
+    e.preventDefault();
+    dropZone.classList.add('border-blue-400', 'bg-blue-400/10');
+});
+
+dropZone.addEventListener('dragleave', (e) => {
+    e.preventDefault();
+    dropZone.classList.remove('border-blue-400', 'bg-blue-400/10');
+});
+
+dropZone.addEventListener('drop', (e) => {
+    e.preventDefault();
+    dropZone.classList.remove('border-blue-400', 'bg-blue-400/10');
+
+    const files = e.dataTransfer.files;
+    if (files.length > 0) {
+        handleFile(files[0]);
+    }
+});
+
+// File input change
+fileInput.addEventListener('change', (e) => {
+    if (e.target.files.length > 0) {
+        handleFile(e.target.files[0]);
+    }
+});
+
+// Handle file selection
+function handleFile(file) {
+    // Validate file type
+    const validTypes = ['image/jpeg', 'image/jpg', 'image/png'];
+    if (!validTypes.includes(file.type)) {
+        alert('Please select a valid image file (JPG, JPEG, or PNG)');
+        return;
+    }
+
+    // Validate file size (10MB limit)
+    const maxSize = 10 * 1024 * 1024; // 10MB in bytes
+    if (file.size > maxSize) {
+        alert('File size must be less than 10MB');
+        return;
+    }
+
+    // Create file reader
+    const reader = new FileReader();
+    reader.onload = function(e) {
+        previewImage.src = e.target.result;
+        fileName.textContent = file.name;
+        fileSize.textContent = `${(file.size / 1024 / 1024).toFixed(2)} MB`;
+
+        // Show preview, hide upload content
+        uploadContent.classList.add('hidden');
+        previewArea.classList.remove('hidden');
+
+        // Enable submit button
+        submitBtn.disabled = false;
+        submitText.textContent = 'Analyze Constellations';
+    };
+    reader.readAsDataURL(file);
+}
+
+// Remove image
+removeImage.addEventListener('click', (e) => {
+    e.stopPropagation();
+    fileInput.value = '';
+    previewArea.classList.add('hidden');
+    uploadContent.classList.remove('hidden');
+    submitBtn.disabled = true;
+    submitText.textContent = 'Select an image first';
+});
+
+// Form submission
+uploadForm.addEventListener('submit', (e) => {
+    e.preventDefault();
+
+    // Show loading state
+    submitBtn.disabled = true;
+    submitText.textContent = 'Analyzing...';
+    loadingSpinner.classList.remove('hidden');
+
+    // Submit form (you can add actual form submission logic here)
+    setTimeout(() => {
+        // Simulate processing time
+        uploadForm.submit();
+    }, 1000);
+});
+
+// Add some interactive stars
+function createFloatingStars() {
+    const starsContainer = document.createElement('div');
+    starsContainer.className = 'fixed inset-0 pointer-events-none z-0';
+    document.body.appendChild(starsContainer);
+
+    for (let i = 0; i < 50; i++) {
+        const star = document.createElement('div');
+        star.className = 'absolute w-1 h-1 bg-white rounded-full opacity-30';
+        star.style.left = Math.random() * 100 + '%';
+        star.style.top = Math.random() * 100 + '%';
+        star.style.animationDelay = Math.random() * 3 + 's';
+        star.style.animation = 'twinkle 3s infinite';
+        starsContainer.appendChild(star);
+    }
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    createFloatingStars();
+});
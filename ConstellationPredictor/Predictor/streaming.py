@@ -0,0 +1,129 @@
+"""
+WebSocket transport for live detection.
+
+One connection per camera session. The client sends JPEG frames as binary
+messages; each result comes back as a JSON text message followed by the
+annotated image as a binary message. Connecting with ``?format=json`` skips
+the image: the JSON message carries the detections (with boxes) instead.
+At most ``DETECTION_WS_MAX_IN_FLIGHT`` frames are processed at once per
+connection: the limit is announced in the ``ready`` message so the client
+can pace itself, and frames that arrive beyond it are dropped and reported
+instead of queueing up server-side.
+
+Django's host validation doesn't run for raw ASGI handlers, so the
+handshake is refused unless Host, and Origin when a browser sends one, are
+in ALLOWED_HOSTS. That stops other sites from opening sockets with a
+visitor's browser.
+"""
+
+import asyncio
+import json
+import urllib.parse
+import uuid
+
+from django.conf import settings
+from django.http.request import split_domain_port, validate_host
+
+from ConstellationPredictor.offload import run_blocking
+
+from .dedup import get_frame_deduplicator
+from .views import detect_frame
+
+DETECTION_SOCKET_PATH = '/ws/detect/'
+MAX_FRAME_BYTES = 5 * 1024 * 1024
+
+
+def allowed_hosts():
+    """ALLOWED_HOSTS, with Django's localhost defaults when it's empty under DEBUG."""
+    if settings.DEBUG and not settings.ALLOWED_HOSTS:
+        return ['.localhost', '127.0.0.1', '[::1]']
+    return settings.ALLOWED_HOSTS
+
+
+def handshake_allowed(scope):
+    """True if the Host header, and Origin if present, name an allowed host."""
+    headers = dict(scope.get('headers', []))
+    hosts = allowed_hosts()
+    host = headers.get(b'host', b'').decode('latin-1')
+    domain, _ = split_domain_port(host)
+    if not domain or not validate_host(domain, hosts):
+        return False
+    origin = headers.get(b'origin')
+    if origin is None:
+        # Not a browser: there's no visitor session to borrow
+        return True
+    domain, _ = split_domain_port(urllib.parse.urlsplit(origin.decode('latin-1')).netloc)
+    return bool(domain) and validate_host(domain, hosts)
+
+
+async def detection_socket(scope, receive, send):
+    """Raw ASGI handler for ``DETECTION_SOCKET_PATH``."""
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+    if not handshake_allowed(scope):
+        await send({'type': 'websocket.close', 'code': 4403})
+        return
+    await send({'type': 'websocket.accept'})
+
+    query = urllib.parse.parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    annotated = query.get('format', ['image'])[0] != 'json'
+    session_id = f"ws-{uuid.uuid4().hex}"
+    max_in_flight = settings.DETECTION_WS_MAX_IN_FLIGHT
+    send_lock = asyncio.Lock()
+    in_flight = set()
+    seq = 0
+
+    async def send_json(payload):
+        await send({'type': 'websocket.send', 'text': json.dumps(payload)})
+
+    async def process(frame_seq, frame_bytes):
+        try:
+            result, reused = await run_blocking(
+                detect_frame, session_id, frame_bytes, confidence=0.25, annotated=annotated
+            )
+        except Exception as e:
+            print(f"WebSocket frame processing error: {e}")
+            async with send_lock:
+                await send_json({'type': 'error', 'seq': frame_seq})
+            return
+        if not annotated:
+            async with send_lock:
+                await send_json({
+                    'type': 'result', 'seq': frame_seq, 'reused': reused, 'detections': result,
+                })
+            return
+        # Keep each metadata/image pair together on the wire.
+        async with send_lock:
+            await send_json({'type': 'result', 'seq': frame_seq, 'reused': reused})
+            await send({'type': 'websocket.send', 'bytes': result})
+
+    async with send_lock:
+        await send_json({'type': 'ready', 'max_in_flight': max_in_flight})
+
+    try:
+        while True:
+            message = await receive()
+            if message['type'] == 'websocket.disconnect':
+                break
+            frame_bytes = message.get('bytes')
+            if not frame_bytes:
+                continue
+            seq += 1
+            if len(frame_bytes) > MAX_FRAME_BYTES or len(in_flight) >= max_in_flight:
+                async with send_lock:
+                    await send_json({'type': 'dropped', 'seq': seq})
+                continue
+            task = asyncio.create_task(process(seq, frame_bytes))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+    finally:
+        for task in in_flight:
+            task.cancel()
+        get_frame_deduplicator().forget(session_id)
+
+
+async def reject_socket(scope, receive, send):
+    message = await receive()
+    if message['type'] == 'websocket.connect':
+        await send({'type': 'websocket.close', 'code': 4404})
@@ -1,3 +1,1105 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import brotli
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from ConstellationPredictor import assets, gradio_io, offload
+from ConstellationPredictor.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceeded,
+    ResilientCaller,
+)
+
+from . import backends, descriptions, streaming, views
+from .backends import (
+    GradioBackend,
+    OnnxBackend,
+    PooledBackend,
+    StubBackend,
+    annotate_image,
+    build_backend,
+    get_backend,
+)
+from .cache import DetectionCache
+from .catalog import get_catalog, normalize
+from .dedup import FrameDeduplicator, frame_hash, hamming_distance
+from .descriptions import DescriptionService
+from .media_store import MediaStore
+from .models import ConstellationDescription
+from .preprocess import PreparedImage, prepare_image
+
+
+# Pages rendered in tests resolve {% static %} without a collectstatic manifest
+UNHASHED_STATIC_STORAGES = {
+    **settings.STORAGES,
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+def image_bytes(format='PNG', size=(32, 24)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, 'navy').save(buffer, format=format)
+    return buffer.getvalue()
+
+
+def use_temporary_media_store(test):
+    """Point the views at a MediaStore in a temp directory for one test."""
+    directory = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, directory)
+    store = MediaStore(FileSystemStorage(directory))
+    patcher = mock.patch.object(views, 'get_media_store', return_value=store)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    return store
+
+
+def rotated_jpeg(size=(1200, 800), orientation=6):
+    """A JPEG stored as ``size`` whose EXIF orientation rotates it on display."""
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    Image.new('RGB', size, 'navy').save(buffer, format='JPEG', exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def gradient_frame(reverse=False, spot=None):
+    """A horizontal gradient JPEG, optionally with a small bright spot."""
+    img = Image.new('L', (320, 240))
+    img.putdata([(255 - x if reverse else x) * 255 // 320 for y in range(240) for x in range(320)])
+    if spot:
+        img.paste(255, spot)
+    buffer = io.BytesIO()
+    img.convert('RGB').save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+class DetectionCacheTests(SimpleTestCase):
+    def entry(self, size):
+        return b'x' * size, [{'name': 'Orion', 'confidence': 0.9}]
+
+    def test_key_depends_on_image_and_confidence(self):
+        keys = {
+            DetectionCache.make_key(b'image', 0.25),
+            DetectionCache.make_key(b'image', 0.5),
+            DetectionCache.make_key(b'other', 0.25),
+        }
+        self.assertEqual(len(keys), 3)
+
+    def test_hit_and_miss_are_counted(self):
+        cache = DetectionCache(max_bytes=10_000)
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', *self.entry(100))
+        self.assertEqual(cache.get('a'), self.entry(100))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 1, 1))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        size = DetectionCache._entry_size(self.entry(400))
+        cache = DetectionCache(max_bytes=size * 2)
+        cache.set('a', *self.entry(400))
+        cache.set('b', *self.entry(400))
+        cache.get('a')  # b is now the oldest
+        cache.set('c', *self.entry(400))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertLessEqual(cache.stats()['bytes'], size * 2)
+
+    def test_entry_larger_than_the_cache_is_not_kept(self):
+        cache = DetectionCache(max_bytes=100)
+        cache.set('a', *self.entry(500))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
+class DetectionCacheDiskTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_disk_tier_survives_a_new_process(self):
+        DetectionCache(disk_dir=self.directory).set('ab12', b'jpeg', [{'name': 'Lyra'}])
+        cache = DetectionCache(disk_dir=self.directory)
+        self.assertEqual(cache.get('ab12'), (b'jpeg', [{'name': 'Lyra'}]))
+        self.assertEqual(cache.stats()['disk_hits'], 1)
+        # Promoted to memory, so the next lookup is a memory hit
+        cache.get('ab12')
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_image_without_metadata_is_a_miss(self):
+        cache = DetectionCache(disk_dir=self.directory)
+        cache.set('ab12', b'jpeg', [])
+        os.remove(os.path.join(self.directory, 'ab', 'ab12.json'))
+        self.assertIsNone(DetectionCache(disk_dir=self.directory).get('ab12'))
+
+    def test_disk_tier_evicts_least_recently_used(self):
+        cache = DetectionCache(disk_dir=self.directory, disk_max_bytes=2500)
+        for key in ('aa01', 'bb02', 'cc03'):
+            cache.set(key, b'x' * 1000, [])
+            time.sleep(0.02)
+        fresh = DetectionCache(disk_dir=self.directory)
+        self.assertIsNone(fresh.get('aa01'))
+        self.assertIsNotNone(fresh.get('bb02'))
+        self.assertIsNotNone(fresh.get('cc03'))
+
+
+class GradioIOTests(SimpleTestCase):
+    def make_client(self):
+        return mock.Mock(
+            upload_url='https://space.example/upload', src_prefixed='https://space.example/',
+            headers={}, cookies={}, ssl_verify=True, httpx_kwargs={},
+        )
+
+    def test_upload_sends_bytes_and_returns_file_data(self):
+        response = mock.Mock(**{'json.return_value': ['/tmp/gradio/abc/frame.jpg']})
+        with mock.patch.object(gradio_io.httpx, 'post', return_value=response) as post:
+            file_data = gradio_io.upload_bytes(self.make_client(), b'jpeg', 'frame.jpg')
+        self.assertEqual(post.call_args.kwargs['files'], [('files', ('frame.jpg', b'jpeg'))])
+        self.assertEqual(file_data, {'path': '/tmp/gradio/abc/frame.jpg', 'orig_name': 'frame.jpg'})
+
+    def test_fetch_prefers_the_output_url(self):
+        response = mock.Mock(content=b'annotated')
+        with mock.patch.object(gradio_io.httpx, 'get', return_value=response) as get:
+            data = gradio_io.fetch_bytes(self.make_client(), {'url': 'https://cdn.example/a.jpg', 'path': 'a.jpg'})
+        self.assertEqual(data, b'annotated')
+        self.assertEqual(get.call_args.args[0], 'https://cdn.example/a.jpg')
+
+    def test_fetch_builds_a_url_from_a_path(self):
+        response = mock.Mock(content=b'annotated')
+        with mock.patch.object(gradio_io.httpx, 'get', return_value=response) as get:
+            gradio_io.fetch_bytes(self.make_client(), '/tmp/out put.jpg')
+        self.assertEqual(get.call_args.args[0], 'https://space.example/file=/tmp/out%20put.jpg')
+
+
+class ReadImageSizeTests(SimpleTestCase):
+    def test_png_and_jpeg(self):
+        self.assertEqual(views.read_image_size(image_bytes('PNG')), (32, 24))
+        self.assertEqual(views.read_image_size(image_bytes('JPEG')), (32, 24))
+
+    def test_other_formats_and_garbage_are_rejected(self):
+        self.assertIsNone(views.read_image_size(image_bytes('GIF')))
+        self.assertIsNone(views.read_image_size(b'not an image'))
+
+
+class FrameHashTests(SimpleTestCase):
+    def test_small_changes_stay_close(self):
+        base = frame_hash(gradient_frame())
+        self.assertEqual(frame_hash(gradient_frame()), base)
+        self.assertLessEqual(hamming_distance(base, frame_hash(gradient_frame(spot=(100, 100, 104, 104)))), 4)
+
+    def test_different_scenes_are_far_apart(self):
+        distance = hamming_distance(frame_hash(gradient_frame()), frame_hash(gradient_frame(reverse=True)))
+        self.assertGreater(distance, 32)
+
+
+class FrameDeduplicatorTests(SimpleTestCase):
+    def test_near_duplicate_reuses_the_inferred_result(self):
+        dedup = FrameDeduplicator(max_distance=2)
+        self.assertIsNone(dedup.lookup('s', 0b1111))
+        dedup.remember('s', 0b1111, b'annotated')
+        self.assertEqual(dedup.lookup('s', 0b1100), b'annotated')
+        self.assertIsNone(dedup.lookup('s', 0b0000))
+        self.assertIsNone(dedup.lookup('other', 0b1111))
+        self.assertEqual(dedup.stats(), {'sessions': 1, 'reused': 1, 'forwarded': 3})
+
+    def test_result_is_refreshed_after_the_interval(self):
+        dedup = FrameDeduplicator(refresh_seconds=0.01)
+        dedup.remember('s', 1, b'annotated')
+        time.sleep(0.02)
+        self.assertIsNone(dedup.lookup('s', 1))
+
+    def test_oldest_session_is_dropped(self):
+        dedup = FrameDeduplicator(max_sessions=2)
+        for session in ('a', 'b', 'c'):
+            dedup.remember(session, 1, session.encode())
+        self.assertIsNone(dedup.lookup('a', 1))
+        self.assertEqual(dedup.lookup('c', 1), b'c')
+
+
+class DetectFrameTests(SimpleTestCase):
+    def test_repeated_frame_skips_inference(self):
+        detect = mock.Mock(return_value=(b'annotated', []))
+        with mock.patch.object(views, 'get_frame_deduplicator', return_value=FrameDeduplicator()), \
+                mock.patch.object(views, 'detect_constellations', detect):
+            self.assertEqual(views.detect_frame('s', gradient_frame()), (b'annotated', False))
+            self.assertEqual(views.detect_frame('s', gradient_frame(spot=(10, 10, 12, 12))), (b'annotated', True))
+            views.detect_frame('s', gradient_frame(reverse=True))
+        self.assertEqual(detect.call_count, 2)
+
+    def test_undecodable_frame_is_forwarded(self):
+        detect = mock.Mock(return_value=(b'annotated', []))
+        with mock.patch.object(views, 'get_frame_deduplicator', return_value=FrameDeduplicator()), \
+                mock.patch.object(views, 'detect_constellations', detect):
+            views.detect_frame('s', b'not a jpeg')
+            views.detect_frame('s', b'not a jpeg')
+        self.assertEqual(detect.call_count, 2)
+
+
+class SocketClient:
+    """Drives an ASGI WebSocket handler through in-memory queues."""
+
+    def __init__(self, handler, path='/ws/detect/', query_string=b'', headers=None):
+        self.incoming = asyncio.Queue()
+        self.outgoing = asyncio.Queue()
+        if headers is None:
+            headers = [(b'host', b'testserver'), (b'origin', b'http://testserver')]
+        scope = {'type': 'websocket', 'path': path, 'query_string': query_string, 'headers': headers}
+        self.task = asyncio.create_task(handler(scope, self.incoming.get, self.outgoing.put))
+
+    async def send(self, message):
+        await self.incoming.put(message)
+
+    async def receive(self):
+        return await asyncio.wait_for(self.outgoing.get(), 2)
+
+    async def receive_json(self):
+        return json.loads((await self.receive())['text'])
+
+    async def close(self):
+        await self.send({'type': 'websocket.disconnect'})
+        await asyncio.wait_for(self.task, 2)
+
+
+@override_settings(DETECTION_WS_MAX_IN_FLIGHT=1)
+class DetectionSocketTests(SimpleTestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+        def detect_frame(session_id, frame_bytes, **options):
+            self.release.wait(2)
+            if frame_bytes == b'bad':
+                raise ValueError('undecodable')
+            return b'annotated:' + frame_bytes, False
+
+        patcher = mock.patch.object(streaming, 'detect_frame', detect_frame)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def connect(self):
+        client = SocketClient(streaming.detection_socket)
+        await client.send({'type': 'websocket.connect'})
+        self.assertEqual(await client.receive(), {'type': 'websocket.accept'})
+        self.assertEqual(await client.receive_json(), {'type': 'ready', 'max_in_flight': 1})
+        return client
+
+    async def test_frames_beyond_the_limit_are_dropped(self):
+        client = await self.connect()
+        await client.send({'type': 'websocket.receive', 'bytes': b'one'})
+        await client.send({'type': 'websocket.receive', 'bytes': b'two'})
+        self.assertEqual(await client.receive_json(), {'type': 'dropped', 'seq': 2})
+
+        self.release.set()
+        self.assertEqual(await client.receive_json(), {'type': 'result', 'seq': 1, 'reused': False})
+        self.assertEqual(await client.receive(), {'type': 'websocket.send', 'bytes': b'annotated:one'})
+
+        # The slot is free again
+        await client.send({'type': 'websocket.receive', 'bytes': b'three'})
+        self.assertEqual(await client.receive_json(), {'type': 'result', 'seq': 3, 'reused': False})
+        self.assertEqual((await client.receive())['bytes'], b'annotated:three')
+        await client.close()
+
+    async def test_failed_frame_is_reported(self):
+        self.release.set()
+        client = await self.connect()
+        await client.send({'type': 'websocket.receive', 'bytes': b'bad'})
+        self.assertEqual(await client.receive_json(), {'type': 'error', 'seq': 1})
+        await client.close()
+
+    async def test_unknown_path_is_rejected(self):
+        client = SocketClient(streaming.reject_socket, path='/ws/other/')
+        await client.send({'type': 'websocket.connect'})
+        self.assertEqual(await client.receive(), {'type': 'websocket.close', 'code': 4404})
+
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    async def test_foreign_host_or_origin_is_rejected(self):
+        for headers in (
+            [],
+            [(b'host', b'evil.example')],
+            [(b'host', b'testserver'), (b'origin', b'https://evil.example')],
+            [(b'host', b'testserver'), (b'origin', b'null')],
+        ):
+            with self.subTest(headers=headers):
+                client = SocketClient(streaming.detection_socket, headers=headers)
+                await client.send({'type': 'websocket.connect'})
+                self.assertEqual(await client.receive(), {'type': 'websocket.close', 'code': 4403})
+                await asyncio.wait_for(client.task, 2)
+
+    @override_settings(ALLOWED_HOSTS=['stars.example'])
+    async def test_allowed_host_with_port_and_no_origin(self):
+        client = SocketClient(streaming.detection_socket, headers=[(b'host', b'stars.example:8000')])
+        await client.send({'type': 'websocket.connect'})
+        self.assertEqual(await client.receive(), {'type': 'websocket.accept'})
+        await client.close()
+
+
+class BatchUploadTests(SimpleTestCase):
+    def setUp(self):
+        def detect(image_bytes, *args, **kwargs):
+            names = ['Orion', 'Lyra'] if image_bytes.startswith(b'\x89PNG') else ['Orion']
+            return b'annotated', [{'name': name, 'confidence': 0.8} for name in names]
+
+        patcher = mock.patch.object(views, 'detect_constellations', side_effect=detect)
+        self.detect = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = use_temporary_media_store(self)
+
+    async def post(self, data):
+        response = await self.async_client.post('/process-upload/batch/', data)
+        if not response.streaming:
+            return response, None
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        body = b''.join([line async for line in response.streaming_content]).decode()
+        return response, [json.loads(line) for line in body.splitlines()]
+
+    def archive(self, **files):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as bundle:
+            for name, data in files.items():
+                bundle.writestr(name, data)
+        return SimpleUploadedFile('night.zip', buffer.getvalue())
+
+    async def test_one_line_per_image_then_a_summary(self):
+        _, lines = await self.post({
+            'images': [
+                SimpleUploadedFile('a.png', image_bytes('PNG')),
+                SimpleUploadedFile('broken.jpg', b'not an image'),
+            ],
+            'archive': self.archive(**{'b.jpg': image_bytes('JPEG'), '.hidden.jpg': b'', 'notes.txt': b'x'}),
+        })
+        *items, summary = lines
+        by_name = {item['filename']: item for item in items}
+        self.assertEqual(set(by_name), {'a.png', 'broken.jpg', 'b.jpg'})
+        self.assertEqual(by_name['broken.jpg'], {
+            'type': 'error', 'filename': 'broken.jpg', 'error': 'Invalid image file', 'index': 1,
+        })
+        self.assertEqual((by_name['a.png']['type'], by_name['a.png']['width']), ('result', 32))
+        self.assertEqual(summary['type'], 'summary')
+        self.assertEqual((summary['images'], summary['succeeded'], summary['failed']), (3, 2, 1))
+        self.assertEqual(
+            [(c['name'], c['images']) for c in summary['constellations']], [('Orion', 2), ('Lyra', 1)]
+        )
+
+    async def test_detection_failure_is_reported_per_image(self):
+        self.detect.side_effect = RuntimeError('Space unavailable')
+        _, lines = await self.post({'images': [SimpleUploadedFile('a.png', image_bytes('PNG'))]})
+        self.assertEqual(lines[0]['error'], 'Detection failed')
+        self.assertEqual(lines[-1]['failed'], 1)
+
+    async def test_invalid_uploads_are_rejected(self):
+        for data in ({}, {'archive': SimpleUploadedFile('night.zip', b'not a zip')}):
+            with self.subTest(data=data):
+                response, _ = await self.post(data)
+                self.assertEqual(response.status_code, 400)
+
+    @override_settings(BATCH_UPLOAD_MAX_IMAGES=1)
+    async def test_too_many_images(self):
+        response, _ = await self.post({'archive': self.archive(**{'a.jpg': b'1', 'b.jpg': b'2'})})
+        self.assertEqual(response.status_code, 400)
+
+
+class StubBackendTests(SimpleTestCase):
+    def test_same_image_gives_the_same_detections(self):
+        backend = StubBackend()
+        frames = [image_bytes('PNG', (200, 100 + i)) for i in range(20)]
+        results = [backend.predict(frame, 0.2) for frame in frames]
+        self.assertEqual(results, [backend.predict(frame, 0.2) for frame in frames])
+        detections = [d for result in results for d in result]
+        self.assertTrue(detections)
+        for detection in detections:
+            x1, y1, x2, y2 = detection['box']
+            self.assertTrue(0 <= x1 < x2 <= 200 and 0 <= y1 < y2 <= 120)
+
+    def test_confidence_threshold(self):
+        backend = StubBackend()
+        frames = [image_bytes('PNG', (200, 100 + i)) for i in range(20)]
+        for frame in frames:
+            self.assertTrue(all(d['confidence'] >= 0.7 for d in backend.predict(frame, 0.7)))
+
+    def test_predict_annotated_draws_onto_the_image(self):
+        annotated, _ = StubBackend().predict_annotated(image_bytes('PNG', (200, 100)), 0.2)
+        with Image.open(io.BytesIO(annotated)) as img:
+            self.assertEqual((img.format, img.size), ('JPEG', (200, 100)))
+
+
+class GradioBackendTests(SimpleTestCase):
+    SUMMARY = (
+        "## Detected constellations\n"
+        "- **Orion** — 91.5% confidence\n"
+        "- **Canis Major** — 40% confidence\n"
+        "Other text\n"
+    )
+
+    def test_summary_is_parsed_into_detections(self):
+        backend = GradioBackend(space='owner/space')
+        with mock.patch.object(backend, 'run_api', return_value=(b'rendered', self.SUMMARY)) as run_api:
+            annotated, detections = backend.predict_annotated(b'jpeg', 0.25)
+        run_api.assert_called_once_with(b'jpeg', 0.25)
+        self.assertEqual(annotated, b'rendered')
+        self.assertEqual(detections, [
+            {'name': 'Orion', 'confidence': 0.915, 'box': None},
+            {'name': 'Canis Major', 'confidence': 0.4, 'box': None},
+        ])
+
+    def test_upload_name_follows_the_image_type(self):
+        self.assertEqual(backends.upload_filename(image_bytes('PNG')), 'image.png')
+        self.assertEqual(backends.upload_filename(image_bytes('JPEG')), 'image.jpg')
+
+
+class OnnxBackendTests(SimpleTestCase):
+    def make_backend(self, anchors):
+        """An OnnxBackend over a fake 64px session returning ``anchors``."""
+        import numpy as np
+
+        backend = OnnxBackend(model_path='model.onnx')
+        output = np.zeros((1, 4 + 2, len(anchors)), dtype=np.float32)
+        for i, (cx, cy, w, h, class_id, score) in enumerate(anchors):
+            output[0, :4, i] = (cx, cy, w, h)
+            output[0, 4 + class_id, i] = score
+        session = mock.Mock(**{'run.return_value': [output]})
+        backend._session = session
+        backend.class_names = ['Orion', 'Lyra']
+        backend.input_name = 'images'
+        backend.input_size = 64
+        return backend
+
+    def test_boxes_are_mapped_back_through_the_letterbox(self):
+        # A 128x64 image is scaled by 0.5 and padded 16px top and bottom
+        backend = self.make_backend([(32, 32, 16, 8, 0, 0.9)])
+        detections = backend.predict(image_bytes('PNG', (128, 64)), 0.25)
+        self.assertEqual(detections, [{'name': 'Orion', 'confidence': 0.9, 'box': [48.0, 24.0, 80.0, 40.0]}])
+        tensor = backend._session.run.call_args.args[1]['images']
+        self.assertEqual(tensor.shape, (1, 3, 64, 64))
+
+    def test_overlaps_are_suppressed_per_class(self):
+        backend = self.make_backend([
+            (32, 32, 16, 8, 0, 0.9),
+            (33, 32, 16, 8, 0, 0.8),  # same class, overlapping: suppressed
+            (33, 32, 16, 8, 1, 0.7),  # other class: kept
+            (10, 20, 4, 4, 1, 0.1),   # under the threshold
+        ])
+        detections = backend.predict(image_bytes('PNG', (128, 64)), 0.25)
+        self.assertEqual([(d['name'], d['confidence']) for d in detections], [('Orion', 0.9), ('Lyra', 0.7)])
+
+    def test_missing_model_path(self):
+        with self.assertRaisesMessage(RuntimeError, 'onnx'):
+            OnnxBackend(model_path='').get_session()
+
+
+class AnnotateImageTests(SimpleTestCase):
+    def pixel(self, detections, xy=(10, 45)):
+        annotated = annotate_image(image_bytes('PNG', (100, 80)), detections)
+        with Image.open(io.BytesIO(annotated)) as img:
+            return img.getpixel(xy)
+
+    def test_box_is_drawn(self):
+        red, green, blue = self.pixel([{'name': 'Orion', 'confidence': 0.9, 'box': [10, 20, 60, 70]}])
+        self.assertGreater(green, 120)
+
+    def test_detections_without_a_box_are_skipped(self):
+        red, green, blue = self.pixel([{'name': 'Orion', 'confidence': 0.9, 'box': None}])
+        self.assertLess(green, 20)
+
+
+class GetBackendTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(backends, '_backend', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(DETECTION_BACKEND='stub')
+    def test_by_name(self):
+        self.assertIsInstance(get_backend(), StubBackend)
+        self.assertIs(get_backend(), get_backend())
+
+    @override_settings(DETECTION_BACKEND='Predictor.backends.StubBackend')
+    def test_by_dotted_path(self):
+        self.assertIsInstance(get_backend(), StubBackend)
+
+
+@override_settings(DETECTION_BACKEND='stub', STORAGES=UNHASHED_STATIC_STORAGES)
+class StructuredDetectionTests(SimpleTestCase):
+    def setUp(self):
+        for patcher in (
+            mock.patch.object(backends, '_backend', None),
+            mock.patch.object(views, 'get_detection_cache', return_value=DetectionCache()),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.store = use_temporary_media_store(self)
+        # An image the stub reports at least one constellation for
+        self.image = next(
+            frame for frame in (image_bytes('PNG', (200, 100 + i)) for i in range(20))
+            if StubBackend().predict(frame, 0.25)
+        )
+
+    def test_detect_api_returns_boxes(self):
+        response = self.client.post('/detect/api/', {'image': SimpleUploadedFile('sky.png', self.image)})
+        body = response.json()
+        self.assertEqual((body['width'], body['boxes'], body['reused']), (200, True, False))
+        self.assertEqual(body['detections'], StubBackend().predict(self.image, 0.25))
+
+    def test_detect_api_reuses_results_within_a_session(self):
+        for reused in (False, True):
+            response = self.client.post('/detect/api/', {
+                'frame': SimpleUploadedFile('frame.png', self.image), 'session': 'camera-1',
+            })
+            self.assertEqual(response.json()['reused'], reused)
+
+    def test_detect_api_rejects_bad_input(self):
+        self.assertEqual(self.client.post('/detect/api/').status_code, 400)
+        response = self.client.post('/detect/api/', {'image': SimpleUploadedFile('sky.png', b'nope')})
+        self.assertEqual(response.status_code, 400)
+
+    def test_boxes_are_cached_without_an_image(self):
+        with mock.patch.object(StubBackend, 'predict', wraps=StubBackend().predict) as predict:
+            first = views.detect_constellation_boxes(self.image)
+            self.assertEqual(views.detect_constellation_boxes(self.image), first)
+        self.assertEqual(predict.call_count, 1)
+
+    def test_upload_shows_the_original_image_for_a_client_overlay(self):
+        response = async_to_sync(self.async_client.post)(
+            '/process-upload/', {'image': SimpleUploadedFile('sky.png', self.image)}
+        )
+        self.assertTrue(response.context['client_overlay'])
+        key, ext = response.context['processed_image_url'].rsplit('/', 1)[1].split('.')
+        with self.store.open(key, ext) as f:
+            self.assertEqual(f.read(), self.image)
+
+    async def test_socket_json_format_sends_detections(self):
+        client = SocketClient(streaming.detection_socket, query_string=b'format=json')
+        await client.send({'type': 'websocket.connect'})
+        await client.receive()
+        await client.receive_json()
+        await client.send({'type': 'websocket.receive', 'bytes': self.image})
+        message = await client.receive_json()
+        self.assertEqual(message['detections'], StubBackend().predict(self.image, 0.25))
+        await client.close()
+
+
+class PrepareImageTests(SimpleTestCase):
+    def test_small_images_pass_through(self):
+        source = image_bytes('PNG', (320, 200))
+        prepared = prepare_image(source, max_side=640)
+        self.assertIs(prepared.image_bytes, source)
+        self.assertEqual((prepared.scale_x, prepared.size), (1.0, (320, 200)))
+
+    def test_large_images_are_downscaled(self):
+        prepared = prepare_image(image_bytes('PNG', (2000, 1000)), max_side=640, quality=80)
+        with Image.open(io.BytesIO(prepared.image_bytes)) as img:
+            self.assertEqual((img.format, img.size), ('JPEG', (640, 320)))
+        self.assertEqual(prepared.size, (2000, 1000))
+        self.assertAlmostEqual(prepared.scale_x, 2000 / 640)
+
+    def test_exif_orientation_is_applied(self):
+        prepared = prepare_image(rotated_jpeg((1200, 800)), max_side=600)
+        with Image.open(io.BytesIO(prepared.image_bytes)) as img:
+            self.assertEqual(img.size, (400, 600))
+        self.assertEqual(prepared.size, (800, 1200))
+        self.assertEqual(views.read_image_size(rotated_jpeg((1200, 800))), (800, 1200))
+
+    def test_grayscale(self):
+        prepared = prepare_image(image_bytes('PNG', (100, 100)), max_side=0, grayscale=True)
+        with Image.open(io.BytesIO(prepared.image_bytes)) as img:
+            self.assertEqual(img.mode, 'L')
+
+    def test_unreadable_bytes_are_left_for_the_backend(self):
+        self.assertEqual(prepare_image(b'not an image', max_side=640).image_bytes, b'not an image')
+
+
+class RestoreBoxesTests(SimpleTestCase):
+    def test_boxes_are_scaled_and_clamped(self):
+        prepared = PreparedImage(b'', scale_x=2.0, scale_y=3.0, size=(1000, 600))
+        detections = [
+            {'name': 'Orion', 'confidence': 0.9, 'box': [10, 20, 100, 150]},
+            {'name': 'Lyra', 'confidence': 0.5, 'box': [-5, 10, 600, 300]},
+            {'name': 'Leo', 'confidence': 0.4, 'box': None},
+        ]
+        self.assertEqual(prepared.restore_boxes(detections), [
+            {'name': 'Orion', 'confidence': 0.9, 'box': [20.0, 60.0, 200.0, 450.0]},
+            {'name': 'Lyra', 'confidence': 0.5, 'box': [0, 30.0, 1000, 600]},
+            {'name': 'Leo', 'confidence': 0.4, 'box': None},
+        ])
+        self.assertEqual(detections[0]['box'], [10, 20, 100, 150])
+
+    def test_unscaled_detections_are_returned_as_is(self):
+        detections = [{'name': 'Orion', 'confidence': 0.9, 'box': [1, 2, 3, 4]}]
+        self.assertIs(PreparedImage(b'').restore_boxes(detections), detections)
+
+
+@override_settings(DETECTION_INPUT_SIZE=640)
+class RunDetectionTests(SimpleTestCase):
+    def test_backend_sees_the_normalized_image_and_boxes_match_the_original(self):
+        backend = mock.Mock(provides_boxes=True)
+        backend.predict.return_value = [{'name': 'Orion', 'confidence': 0.9, 'box': [0, 0, 320, 160]}]
+        with mock.patch.object(views, 'get_backend', return_value=backend):
+            annotated, detections = views.run_detection(image_bytes('PNG', (2560, 1280)), 0.25)
+        with Image.open(io.BytesIO(backend.predict.call_args.args[0])) as img:
+            self.assertEqual(img.size, (640, 320))
+        self.assertEqual(detections[0]['box'], [0.0, 0.0, 1280.0, 640.0])
+        with Image.open(io.BytesIO(annotated)) as img:
+            self.assertEqual(img.size, (2560, 1280))
+
+    def test_service_render_is_scaled_back_to_the_upload(self):
+        backend = mock.Mock(provides_boxes=False)
+        # Like the Gradio Space: draws on the image it was sent, no boxes
+        backend.predict_annotated.side_effect = lambda data, confidence: (
+            data, [{'name': 'Orion', 'confidence': 0.9}]
+        )
+        with mock.patch.object(views, 'get_backend', return_value=backend):
+            annotated, detections = views.run_detection(image_bytes('PNG', (2560, 1280)), 0.25)
+        with Image.open(io.BytesIO(backend.predict_annotated.call_args.args[0])) as img:
+            self.assertEqual(img.size, (640, 320))
+        with Image.open(io.BytesIO(annotated)) as img:
+            self.assertEqual((img.format, img.size), ('JPEG', (2560, 1280)))
+        self.assertEqual(detections, [{'name': 'Orion', 'confidence': 0.9}])
+
+    def test_small_uploads_keep_the_service_render(self):
+        render = image_bytes('PNG', (320, 160))
+        self.assertIs(PreparedImage(render, size=(320, 160)).restore_image(render), render)
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def test_opens_after_threshold_and_probes_once(self):
+        breaker = CircuitBreaker('test', failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+
+        time.sleep(0.06)
+        breaker.before_call()  # the probe
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()  # everyone else waits for it
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+
+class ResilientCallerTests(SimpleTestCase):
+    def make_caller(self, **options):
+        options = {'deadline': 1.0, 'max_attempts': 3, 'backoff': 0.01, 'failure_threshold': 5, **options}
+        return ResilientCaller('test', **options)
+
+    def test_retries_until_success(self):
+        caller = self.make_caller()
+        results = iter([ConnectionError('1'), ConnectionError('2'), 'ok'])
+
+        def flaky():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        self.assertEqual(caller.call(flaky), 'ok')
+        stats = caller.stats()
+        self.assertEqual((stats['retries'], stats['successes'], stats['failures']), (2, 1, 0))
+
+    def test_gives_up_after_max_attempts(self):
+        caller = self.make_caller(max_attempts=2)
+        with self.assertRaises(ConnectionError):
+            caller.call(mock.Mock(side_effect=ConnectionError('down')))
+        self.assertEqual(caller.stats()['failures'], 1)
+
+    def test_other_errors_are_not_retried(self):
+        caller = self.make_caller()
+        func = mock.Mock(side_effect=ValueError('bad image'))
+        with self.assertRaises(ValueError):
+            caller.call(func)
+        self.assertEqual(func.call_count, 1)
+        stats = caller.stats()
+        self.assertEqual((stats['retries'], stats['failures'], stats['consecutive_failures']), (0, 1, 1))
+
+    def test_retried_call_counts_once_against_the_breaker(self):
+        caller = self.make_caller(max_attempts=3, failure_threshold=2)
+        func = mock.Mock(side_effect=ConnectionError('down'))
+        with self.assertRaises(ConnectionError):
+            caller.call(func)
+        self.assertEqual(func.call_count, 3)
+        stats = caller.stats()
+        self.assertEqual((stats['state'], stats['consecutive_failures']), ('closed', 1))
+
+    def test_deadline_covers_a_stalled_call(self):
+        caller = self.make_caller(deadline=0.05)
+        release = threading.Event()
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            caller.call(release.wait, 5)
+        self.assertLess(time.monotonic() - started, 1)
+        release.set()
+        self.assertEqual(caller.stats()['timeouts'], 1)
+
+    def test_open_circuit_short_circuits(self):
+        caller = self.make_caller(max_attempts=1, failure_threshold=1, reset_timeout=60)
+        with self.assertRaises(ConnectionError):
+            caller.call(mock.Mock(side_effect=ConnectionError('down')))
+        func = mock.Mock()
+        with self.assertRaises(CircuitOpenError):
+            caller.call(func)
+        func.assert_not_called()
+        self.assertEqual(caller.stats()['short_circuits'], 1)
+
+    def test_hedge_wins_over_a_slow_attempt(self):
+        caller = self.make_caller(hedge=True, hedge_min_samples=1)
+        caller._latencies.append(0.01)
+        calls = []
+        release = threading.Event()
+
+        def sometimes_slow():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(2)
+            return len(calls)
+
+        self.assertEqual(caller.call(sometimes_slow), 2)
+        release.set()
+        stats = caller.stats()
+        self.assertEqual((stats['hedges'], stats['hedge_wins']), (1, 1))
+
+
+class CircuitOpenResponseTests(SimpleTestCase):
+    def test_live_endpoints_answer_503_with_retry_after(self):
+        error = CircuitOpenError('detection', retry_after=12.4)
+        with mock.patch.object(views, 'detect_frame', side_effect=error), \
+                mock.patch.object(views, 'detect_constellation_boxes', side_effect=error):
+            frame = self.client.post('/detect/process/', {'frame': SimpleUploadedFile('f.png', image_bytes())})
+            api = self.client.post('/detect/api/', {'image': SimpleUploadedFile('f.png', image_bytes())})
+        for response in (frame, api):
+            self.assertEqual((response.status_code, response['Retry-After']), (503, '12'))
+
+    @override_settings(DEBUG=False)
+    def test_status_is_hidden_from_visitors(self):
+        self.assertEqual(self.client.get('/detect/status/').status_code, 404)
+
+
+@override_settings(REMOTE_CALL_BREAKER_THRESHOLD=2, REMOTE_CALL_BREAKER_RESET_SECONDS=60)
+class PooledBackendTests(SimpleTestCase):
+    def make_pool(self, *backends):
+        pool = PooledBackend(['stub'] * len(backends), alpha=0.5)
+        for endpoint, backend in zip(pool.endpoints, backends):
+            endpoint.backend = backend
+        return pool
+
+    def test_untried_endpoints_are_measured_first_then_the_fastest_wins(self):
+        fast, slow = mock.Mock(), mock.Mock()
+        fast.predict.return_value = ['fast']
+        slow.predict.side_effect = lambda *args: time.sleep(0.02) or ['slow']
+        pool = self.make_pool(slow, fast)
+        self.assertEqual(pool.predict(b'img', 0.25), ['slow'])
+        self.assertEqual(pool.predict(b'img', 0.25), ['fast'])
+        for _ in range(3):
+            self.assertEqual(pool.predict(b'img', 0.25), ['fast'])
+        self.assertEqual([e['calls'] for e in pool.stats()['endpoints']], [1, 4])
+
+    def test_failing_endpoint_drops_out_of_rotation(self):
+        broken, healthy = mock.Mock(), mock.Mock()
+        broken.predict.side_effect = ConnectionError('down')
+        healthy.predict.return_value = ['ok']
+        pool = self.make_pool(broken, healthy)
+        with self.assertRaises(ConnectionError):
+            pool.predict(b'img', 0.25)
+        for _ in range(3):
+            self.assertEqual(pool.predict(b'img', 0.25), ['ok'])
+        self.assertEqual(broken.predict.call_count, 1)
+        self.assertEqual(pool.stats()['endpoints'][0]['failures'], 1)
+
+    def test_all_endpoints_open(self):
+        broken = mock.Mock()
+        broken.predict.side_effect = ConnectionError('down')
+        pool = self.make_pool(broken)
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                pool.predict(b'img', 0.25)
+        with self.assertRaises(CircuitOpenError):
+            pool.predict(b'img', 0.25)
+
+    def test_boxes_only_when_every_endpoint_has_them(self):
+        self.assertTrue(PooledBackend(['stub', 'stub']).provides_boxes)
+        self.assertFalse(PooledBackend(['stub', 'gradio']).provides_boxes)
+
+    def test_empty_pool_is_rejected(self):
+        with self.assertRaisesMessage(RuntimeError, 'DETECTION_POOL'):
+            PooledBackend('')
+
+
+class MediaStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.store = use_temporary_media_store(self)
+
+    def test_identical_images_are_stored_once(self):
+        first = self.store.save(image_bytes('PNG'))
+        self.assertEqual(self.store.save(image_bytes('PNG')), first)
+        self.assertEqual(first[1], 'png')
+        self.assertEqual(self.store.save(image_bytes('JPEG'))[1], 'jpg')
+        directory = self.store.storage.location
+        self.assertEqual(sum(len(files) for _, _, files in os.walk(directory)), 2)
+
+    def test_cleanup_spares_recently_reused_images(self):
+        old_key, ext = self.store.save(image_bytes('PNG', (10, 10)))
+        kept_key, _ = self.store.save(image_bytes('PNG', (20, 20)))
+        long_ago = time.time() - 3600
+        for key in (old_key, kept_key):
+            os.utime(self.store.storage.path(MediaStore.name_for(key, ext)), (long_ago, long_ago))
+        self.store.save(image_bytes('PNG', (20, 20)))  # reused: refreshed
+        self.assertEqual(self.store.cleanup(max_age=600), 1)
+        self.assertFalse(self.store.exists(old_key, ext))
+        self.assertTrue(self.store.exists(kept_key, ext))
+
+    def test_result_image_view(self):
+        key, ext = self.store.save(image_bytes('PNG'))
+        url = f'/results/{key}.{ext}'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), image_bytes('PNG'))
+        self.assertEqual((response['Content-Type'], response['ETag']), ('image/png', f'"{key}"'))
+        self.assertIn('immutable', response['Cache-Control'])
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=f'"{key}"').status_code, 304)
+        self.assertEqual(self.client.get(f'/results/{"0" * 64}.png').status_code, 404)
+
+
+class CatalogTests(SimpleTestCase):
+    def names(self, query):
+        return [entry['name'] for entry, _ in get_catalog().search(query)]
+
+    def test_normalize(self):
+        self.assertEqual(normalize("  The Boötes! "), 'bootes')
+        self.assertEqual(normalize("Hercules' Club"), 'hercules club')
+
+    def test_resolve_names_aliases_and_abbreviations(self):
+        catalog = get_catalog()
+        self.assertEqual(catalog.resolve('big dipper'), 'Ursa Major')
+        self.assertEqual(catalog.resolve('UMa'), 'Ursa Major')
+        self.assertEqual(catalog.resolve('bootes'), 'Boötes')
+        self.assertIsNone(catalog.resolve('Nowhere'))
+
+    def test_exact_match_ranks_before_prefixes(self):
+        names = self.names('ursa')
+        self.assertEqual(set(names[:2]), {'Ursa Major', 'Ursa Minor'})
+        self.assertEqual(self.names('leo')[0], 'Leo')
+        self.assertIn('Leo Minor', self.names('leo'))
+
+    def test_typos_and_descriptions(self):
+        self.assertEqual(self.names('orin')[0], 'Orion')
+        self.assertEqual(self.names('cassiopiea')[0], 'Cassiopeia')
+        self.assertEqual(self.names('orpheus'), ['Lyra'])
+
+    def test_empty_query_lists_everything(self):
+        names = self.names('')
+        self.assertEqual(len(names), 88)
+        self.assertEqual(names, sorted(names))
+
+
+@override_settings(STORAGES=UNHASHED_STATIC_STORAGES)
+class CatalogApiTests(SimpleTestCase):
+    def test_pages(self):
+        body = self.client.get('/database/api/', {'page': 2, 'page_size': 50}).json()
+        self.assertEqual((body['count'], body['page'], body['num_pages'], body['has_next']), (88, 2, 2, False))
+        self.assertEqual(len(body['results']), 38)
+
+    def test_search_result_fields(self):
+        result = self.client.get('/database/api/', {'q': 'plough'}).json()['results'][0]
+        self.assertEqual(
+            (result['name'], result['abbreviation'], result['matched']), ('Ursa Major', 'UMa', 'Plough')
+        )
+
+    def test_etag_revalidation(self):
+        response = self.client.get('/database/api/', {'q': 'orion'})
+        self.assertIn('max-age=300', response['Cache-Control'])
+        again = self.client.get('/database/api/', {'q': 'orion'}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(again.status_code, 304)
+        other = self.client.get('/database/api/', {'q': 'lyra'}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(other.status_code, 200)
+
+
+class StaticAssetPipelineTests(SimpleTestCase):
+    SCRIPT = "/*! keep */\n// a comment\nfunction add(first, second) {\n    return first + second;\n}\n" * 40
+    STYLE = "body {\n    color: red;  /* note */\n}\n"
+
+    def setUp(self):
+        source = tempfile.mkdtemp()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, source)
+        self.addCleanup(shutil.rmtree, self.root)
+        files = {'js/app.js': self.SCRIPT, 'css/site.css': self.STYLE, 'js/vendor.min.js': 'var a = 1 ;'}
+        for name, text in files.items():
+            for directory in (source, self.root):
+                os.makedirs(os.path.join(directory, os.path.dirname(name)), exist_ok=True)
+                with open(os.path.join(directory, name), 'w') as f:
+                    f.write(text)
+        self.storage = assets.CompressedManifestStaticFilesStorage(location=self.root, base_url='/static/')
+        source_storage = FileSystemStorage(source)
+        list(self.storage.post_process({name: (source_storage, name) for name in files}))
+
+    def read(self, name):
+        with open(os.path.join(self.root, name), 'rb') as f:
+            return f.read()
+
+    def test_minified_before_hashing(self):
+        hashed = self.storage.stored_name('js/app.js')
+        self.assertRegex(hashed, r'^js/app\.[0-9a-f]{12}\.js$')
+        text = self.read(hashed).decode()
+        self.assertNotIn('// a comment', text)
+        self.assertIn('/*! keep */', text)
+        self.assertLess(len(text), len(self.SCRIPT))
+        self.assertEqual(self.read(self.storage.stored_name('css/site.css')), b'body{color:red}')
+
+    def test_minified_files_are_left_alone(self):
+        self.assertEqual(self.read(self.storage.stored_name('js/vendor.min.js')), b'var a = 1 ;')
+
+    def test_large_text_assets_get_compressed_variants(self):
+        hashed = self.storage.stored_name('js/app.js')
+        minified = self.read(hashed)
+        self.assertEqual(gzip.decompress(self.read(hashed + '.gz')), minified)
+        self.assertEqual(brotli.decompress(self.read(hashed + '.br')), minified)
+        # Too small to be worth it
+        self.assertFalse(os.path.exists(os.path.join(self.root, self.storage.stored_name('css/site.css') + '.gz')))
+
+
+@override_settings(DEBUG=False, STATIC_SERVE=True, STATIC_MAX_AGE=60)
+class StaticFilesMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        os.makedirs(os.path.join(self.root, 'js'))
+        files = {
+            'js/app.abc123def456.js': b'x' * 1000,
+            'js/app.abc123def456.js.br': b'br',
+            'js/app.abc123def456.js.gz': b'gz',
+            'robots.txt': b'User-agent: *',
+        }
+        for name, data in files.items():
+            with open(os.path.join(self.root, name), 'wb') as f:
+                f.write(data)
+        hashed_files = {'js/app.js': 'js/app.abc123def456.js'}
+        with override_settings(STATIC_ROOT=self.root), \
+                mock.patch.object(assets.staticfiles_storage, 'hashed_files', hashed_files, create=True):
+            self.middleware = assets.StaticFilesMiddleware(lambda request: HttpResponse('from django'))
+
+    def get(self, path, **headers):
+        return self.middleware(RequestFactory().get(path, headers=headers))
+
+    def test_best_encoding_and_immutable_caching(self):
+        response = self.get('/static/js/app.abc123def456.js', accept_encoding='gzip, br')
+        self.assertEqual((response.content, response['Content-Encoding']), (b'br', 'br'))
+        self.assertEqual(response['Cache-Control'], assets.IMMUTABLE)
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+        response = self.get('/static/js/app.abc123def456.js', accept_encoding='gzip, br;q=0')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        response = self.get('/static/js/app.abc123def456.js')
+        self.assertEqual((len(response.content), response.has_header('Content-Encoding')), (1000, False))
+
+    def test_each_encoding_revalidates_separately(self):
+        etag = self.get('/static/js/app.abc123def456.js', accept_encoding='br')['ETag']
+        response = self.get('/static/js/app.abc123def456.js', accept_encoding='br', if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        response = self.get('/static/js/app.abc123def456.js', accept_encoding='gzip', if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_unhashed_names_get_a_short_max_age(self):
+        response = self.get('/static/robots.txt')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+
+    def test_other_paths_reach_django(self):
+        self.assertEqual(self.get('/static/missing.js').content, b'from django')
+        self.assertEqual(self.get('/upload/').content, b'from django')
+
+    @override_settings(DEBUG=True)
+    def test_not_used_with_debug(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            assets.StaticFilesMiddleware(lambda request: None)
+
+
+class ClosingConnectionsTests(SimpleTestCase):
+    def test_run_blocking_closes_old_connections_around_the_call(self):
+        calls = []
+        with mock.patch.object(offload, 'close_old_connections', side_effect=lambda: calls.append('close')):
+            result = async_to_sync(offload.run_blocking)(lambda: calls.append('work') or 42)
+        self.assertEqual(result, 42)
+        self.assertEqual(calls, ['close', 'work', 'close'])
+
+    def test_connections_are_closed_when_the_call_fails(self):
+        with mock.patch.object(offload, 'close_old_connections') as close:
+            with self.assertRaises(ZeroDivisionError):
+                offload.closing_connections(lambda: 1 / 0)
+        self.assertEqual(close.call_count, 2)
+
+
+class DescriptionServiceTests(TestCase):
+    def make_service(self, text='Orion is a hunter'):
+        self.fetch = mock.Mock(return_value=text)
+        return DescriptionService(
+            fetch=self.fetch, fallback=lambda name: f'{name} (basic)', ttl=3600, stale_ttl=600,
+        )
+
+    def test_miss_fetches_once_and_stores(self):
+        service = self.make_service()
+        self.assertEqual(service.get('Orion'), ('Orion is a hunter', 'gemini'))
+        self.assertEqual(service.get('Orion'), ('Orion is a hunter', 'cache'))
+        self.assertEqual(self.fetch.call_count, 1)
+        self.assertEqual(ConstellationDescription.objects.get(name='Orion').description, 'Orion is a hunter')
+
+    def test_fallback_when_gemini_fails(self):
+        service = self.make_service(text=None)
+        self.assertEqual(service.get('Orion'), ('Orion (basic)', 'basic'))
+
+    def test_stale_entry_is_served_and_refreshed_in_the_background(self):
+        ConstellationDescription.objects.create(
+            name='Orion', description='Old text', updated_at=timezone.now() - timedelta(seconds=3700),
+        )
+        service = self.make_service()
+        executor = mock.Mock()
+        with mock.patch.object(descriptions, 'get_executor', return_value=executor):
+            self.assertEqual(service.get('Orion'), ('Old text', 'cache'))
+        # The refresh runs with database connections managed like a request
+        executor.submit.assert_called_once_with(
+            offload.closing_connections, service._refresh_quietly, ('Orion', 'en')
+        )
+
+
+class BuildBackendTests(SimpleTestCase):
+    def test_name_only(self):
+        self.assertIsInstance(build_backend('stub'), StubBackend)
+
+    def test_argument_is_passed_to_backends_that_take_one(self):
+        backend = build_backend('gradio:owner/space')
+        self.assertIsInstance(backend, GradioBackend)
+        self.assertEqual(backend.space, 'owner/space')
+
+    def test_argument_for_a_backend_without_one_is_rejected(self):
+        with self.assertRaisesMessage(RuntimeError, "takes no argument"):
+            build_backend('stub:x')
+
+    def test_pool_of_specs(self):
+        backend = build_backend('pool:stub, gradio:owner/space')
+        self.assertIsInstance(backend, PooledBackend)
+        self.assertEqual([e.label for e in backend.endpoints], ['stub', 'gradio:owner/space'])
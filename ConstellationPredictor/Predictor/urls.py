@@ -1,16 +1,21 @@
-from django.urls import path,include
+from django.urls import path, include, re_path
 from . import views
 
 urlpatterns = [
     path('', views.home, name='home'),
     path('detect/', views.detect_view, name='detect'),
 path('detect/process/', views.process_frame, name='process_frame'),
+path('detect/api/', views.detect_api, name='detect_api'),
+path('detect/status/', views.detection_status, name='detection_status'),
 path('chatbot/', include('chatbot.urls')),
 path('locator/', include('Locator.urls'),name='Locator'),
 path('database/', views.database, name='database'),
+path('database/api/', views.catalog_api, name='catalog_api'),
     path('predict/', views.predict, name='predict'),
     path('upload/',views.upload,name='upload'),
     path('get-constellation-info/', views.get_constellation_info, name='get_constellation_info'),
     path('process-upload/', views.process_upload, name='process_upload'),
+    path('process-upload/batch/', views.process_batch_upload, name='process_batch_upload'),
+    re_path(r'^results/(?P<key>[0-9a-f]{64})\.(?P<ext>jpg|png)$', views.result_image, name='result_image'),
     
 ]
@@ -1,12 +1,9 @@
-import cv2
 from django.shortcuts import render, redirect
 from django.views.decorators.csrf import csrf_exempt
-from django.http import HttpResponse, JsonResponse
-import numpy as np
+from django.http import FileResponse, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib import messages
-import base64
 from datetime import datetime
 import os
 from django.conf import settings
@@ -14,59 +11,59 @@ import time
 from PIL import Image
 import io
 import json
-import requests
+import asyncio
+import zipfile
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import require_GET, require_http_methods, etag
+from django.views.decorators.cache import cache_control
+from django.core.paginator import Paginator
+from django.templatetags.static import static
+from django.urls import reverse
+import hashlib
 from dotenv import load_dotenv
 
-# ── Gradio API client ──────────────────────────────────────────────────────────
-from gradio_client import Client, handle_file
+from ConstellationPredictor.llm import PRIORITY_BACKGROUND, LLMError, get_llm_gateway
+from ConstellationPredictor.offload import run_blocking
+from ConstellationPredictor.resilience import CircuitOpenError, caller_stats, get_caller
 
-load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-
-HF_SPACE = os.getenv("HF_SPACE", "rverma0631/Constellation_YOLO")
-
-# Shared client — created once at startup
-_gradio_client = None
-
-def get_gradio_client():
-    global _gradio_client
-    if _gradio_client is None:
-        _gradio_client = Client(HF_SPACE)
-        print(f"Gradio client connected to {HF_SPACE}")
-    return _gradio_client
+from .backends import annotate_image, get_backend
+from .cache import get_detection_cache
+from .catalog import get_catalog, normalize
+from .dedup import frame_hash, get_frame_deduplicator
+from .descriptions import get_description_service, language_name
+from .media_store import CONTENT_TYPES, get_media_store
+from .preprocess import prepare_image, preprocessing_signature, upright_size
 
+load_dotenv()
 
 # ── Constellation info helpers (unchanged) ────────────────────────────────────
 @csrf_exempt
 @require_http_methods(["POST"])
-def get_constellation_info(request):
+async def get_constellation_info(request):
     try:
         data = json.loads(request.body)
         constellation_name = data.get('constellation_name', '')
+        language = data.get('language') or 'en'
 
         if not constellation_name:
             return JsonResponse({'error': 'Constellation name is required'}, status=400)
+        if language_name(language) is None:
+            return JsonResponse({'error': 'Unsupported language'}, status=400)
 
-        prompt = f"""
-        Provide a brief, fascinating description of the constellation {constellation_name}. 
-        Include key mythological background, notable stars, and interesting facts.
-        Keep it concise, under 100 words, and engaging for general audience.
-        """
-
-        gemini_response = call_gemini_api(prompt)
+        # "Big Dipper" and "UMa" share Ursa Major's entry
+        constellation_name = get_catalog().resolve(constellation_name) or constellation_name
 
-        if gemini_response:
-            info = gemini_response
-        else:
-            info = get_basic_constellation_info(constellation_name)
+        # Cached per name and language; falls back to get_basic_constellation_info
+        info, source = await run_blocking(
+            get_description_service().get, constellation_name, language
+        )
 
         return JsonResponse({
             'name': constellation_name,
-            'info': info
+            'info': info,
+            'language': language,
+            'source': source,
         })
 
     except Exception as e:
@@ -74,25 +71,13 @@ def get_constellation_info(request):
         return JsonResponse({'error': 'Internal server error'}, status=500)
 
 
-def call_gemini_api(prompt):
+def call_gemini_api(prompt, background=False):
+    """Short Gemini answer for ``prompt``, or None if Gemini is unavailable."""
     try:
-        headers = {'Content-Type': 'application/json'}
-        payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.7, "maxOutputTokens": 150},
-        }
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            headers=headers,
-            json=payload,
-            timeout=10,
+        return get_llm_gateway().generate(
+            'description', prompt, priority=PRIORITY_BACKGROUND if background else None
         )
-        if response.status_code == 200:
-            result = response.json()
-            if 'candidates' in result and len(result['candidates']) > 0:
-                return result['candidates'][0]['content']['parts'][0]['text']
-        return None
-    except Exception as e:
+    except LLMError as e:
         print(f"Gemini API error: {str(e)}")
         return None
 
@@ -118,25 +103,119 @@ def get_basic_constellation_info(constellation_name):
     )
 
 
-# ── Gradio API inference helper ───────────────────────────────────────────────
-def run_constellation_api(image_path: str, confidence: float = 0.25):
+# ── Detection (backend + cache) ───────────────────────────────────────────────
+def run_detection(image_bytes, confidence, annotated=True):
     """
-    Call the HF Space Gradio API with a local image file path.
-    Returns (annotated_image_path, summary_text) or raises on error.
+    Normalize the image for inference, run the backend on it and map the
+    boxes back to the original image.
+    Returns (annotated_jpeg_bytes or None, detections).
     """
-    client = get_gradio_client()
-    result = client.predict(
-        image=handle_file(image_path),
-        confidence=confidence,
-        api_name="/predict_constellation",
-    )
-    # result is a tuple: (annotated_image_path, summary_markdown)
-    return result
+    backend = get_backend()
+    # Deadline, retries and circuit breaker around the backend call
+    guard = get_caller('detection')
+    prepared = prepare_image(image_bytes)
+    if annotated and not backend.provides_boxes:
+        # Only the service can render its result; it does so at the
+        # normalized size, so scale it back up to the upload's
+        annotated_bytes, detections = guard.call(
+            backend.predict_annotated, prepared.image_bytes, confidence
+        )
+        return prepared.restore_image(annotated_bytes), prepared.restore_boxes(detections)
+
+    detections = guard.call(backend.predict, prepared.image_bytes, confidence)
+    detections = prepared.restore_boxes(detections)
+    if annotated:
+        return annotate_image(image_bytes, detections), detections
+    return None, detections
+
+
+def detection_namespace(suffix=''):
+    """Cache namespace: results depend on the backend and the preprocessing."""
+    return f"{get_backend().name}{suffix}-{preprocessing_signature()}"
+
+
+def detect_constellations(image_bytes, confidence=0.25):
+    """
+    Run detection on raw image bytes with the configured backend, going
+    through the detection cache.
+    Returns (annotated_jpeg_bytes, detections).
+    """
+    cache = get_detection_cache()
+    key = cache.make_key(image_bytes, confidence, namespace=detection_namespace())
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    annotated_bytes, detections = run_detection(image_bytes, confidence)
+    cache.set(key, annotated_bytes, detections)
+    return annotated_bytes, detections
+
+
+def detect_constellation_boxes(image_bytes, confidence=0.25):
+    """
+    Structured detections only (name, confidence, box) for clients that draw
+    their own overlays. Reuses a cached annotated result when there is one.
+    """
+    cache = get_detection_cache()
+    key = cache.make_key(image_bytes, confidence, namespace=detection_namespace())
+    cached = cache.get(key)
+    if cached is not None:
+        return cached[1]
+
+    boxes_key = cache.make_key(image_bytes, confidence, namespace=detection_namespace('-boxes'))
+    cached = cache.get(boxes_key)
+    if cached is not None:
+        return cached[1]
+
+    _, detections = run_detection(image_bytes, confidence, annotated=False)
+    cache.set(boxes_key, b'', detections)
+    return detections
+
+
+def read_image_size(image_bytes):
+    """
+    Return the displayed (EXIF-oriented) (width, height) from the image
+    header without decoding pixels, or None if the bytes aren't a JPEG or PNG.
+    """
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            if img.format not in ('JPEG', 'PNG'):
+                return None
+            return upright_size(img)
+    except (OSError, ValueError):
+        return None
 
 
 # ── Real-time frame processing (uses API) ────────────────────────────────────
+def detect_frame(session_id, frame_bytes, confidence=0.25, annotated=True):
+    """
+    Detection for one live camera frame. Returns (result, reused), where
+    result is the annotated JPEG bytes, or the detection list when
+    ``annotated`` is False. reused is True when a near-identical earlier
+    frame's result was served.
+    """
+    dedup = get_frame_deduplicator()
+    try:
+        hash_value = frame_hash(frame_bytes)
+    except (OSError, ValueError):
+        hash_value = None
+
+    if hash_value is not None:
+        result = dedup.lookup(session_id, hash_value)
+        if result is not None:
+            return result, True
+
+    if annotated:
+        result, _ = detect_constellations(frame_bytes, confidence=confidence)
+    else:
+        result = detect_constellation_boxes(frame_bytes, confidence=confidence)
+    if hash_value is not None:
+        dedup.remember(session_id, hash_value, result)
+    return result, False
+
+
 @csrf_exempt
-def process_frame(request):
+async def process_frame(request):
     """Frame processing for real-time video — calls Gradio API"""
     if request.method != 'POST' or 'frame' not in request.FILES:
         return HttpResponse(status=400)
@@ -146,24 +225,110 @@ def process_frame(request):
         if file.size > 5 * 1024 * 1024:
             return HttpResponse(status=413)
 
-        # Save frame to a temp file for the API
-        tmp_path = f"/tmp/frame_{int(time.time()*1000)}.jpg"
-        with open(tmp_path, 'wb') as f:
-            f.write(file.read())
+        # The page sends a per-camera-session id; fall back to the client address.
+        session_id = request.POST.get('session') or request.META.get('REMOTE_ADDR', '')
+        annotated_bytes, reused = await run_blocking(
+            detect_frame, session_id, file.read(), confidence=0.25
+        )
+        response = HttpResponse(annotated_bytes, content_type='image/jpeg')
+        response['X-Frame-Reused'] = '1' if reused else '0'
+        return response
+
+    except CircuitOpenError as e:
+        response = HttpResponse(status=503)
+        response['Retry-After'] = str(max(1, round(e.retry_after)))
+        return response
+    except Exception as e:
+        print(f"Frame processing error: {e}")
+        return HttpResponse(status=500)
 
-        try:
-            annotated_path, _ = run_constellation_api(tmp_path, confidence=0.25)
 
-            # Read annotated image and return as JPEG bytes
-            with open(annotated_path, 'rb') as f:
-                return HttpResponse(f.read(), content_type='image/jpeg')
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+@csrf_exempt
+@require_http_methods(["POST"])
+async def detect_api(request):
+    """
+    JSON detection API: class, confidence and box for each detection, for
+    clients that draw overlays themselves instead of downloading an
+    annotated image. Accepts a ``frame`` or ``image`` file.
+    """
+    file = request.FILES.get('frame') or request.FILES.get('image')
+    if file is None:
+        return JsonResponse({'error': 'No image provided'}, status=400)
+    if file.size > 10 * 1024 * 1024:
+        return JsonResponse({'error': 'Image larger than 10MB'}, status=413)
+
+    image_bytes = file.read()
+    dimensions = read_image_size(image_bytes)
+    if dimensions is None:
+        return JsonResponse({'error': 'Invalid image file'}, status=400)
 
+    try:
+        session = request.POST.get('session')
+        if session:
+            detections, reused = await run_blocking(
+                detect_frame, f"{session}:boxes", image_bytes, confidence=0.25, annotated=False
+            )
+        else:
+            detections = await run_blocking(detect_constellation_boxes, image_bytes, confidence=0.25)
+            reused = False
+    except CircuitOpenError as e:
+        response = JsonResponse({'error': 'Detection service unavailable'}, status=503)
+        response['Retry-After'] = str(max(1, round(e.retry_after)))
+        return response
     except Exception as e:
-        print(f"Frame processing error: {e}")
-        return HttpResponse(status=500)
+        print(f"Detection API error: {e}")
+        return JsonResponse({'error': 'Detection failed'}, status=502)
+
+    return JsonResponse({
+        'width': dimensions[0],
+        'height': dimensions[1],
+        'detections': detections,
+        'boxes': get_backend().provides_boxes,
+        'reused': reused,
+    })
+
+
+# ── Result images (content-addressed media store) ────────────────────────────
+RESULT_IMAGE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def result_image(request, key, ext):
+    """
+    Serve a stored result image. The URL is the content hash, so the ETag
+    is the hash too and the response can be cached forever.
+    """
+    etag = f'"{key}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponse(status=304)
+    else:
+        store = get_media_store()
+        try:
+            image_file = store.open(key, ext)
+        except FileNotFoundError:
+            return HttpResponse(status=404)
+        response = FileResponse(image_file, content_type=CONTENT_TYPES[ext])
+    response['ETag'] = etag
+    response['Cache-Control'] = RESULT_IMAGE_CACHE_CONTROL
+    return response
+
+
+def detection_status(request):
+    """
+    Operator view of the detection pipeline: circuit breaker state and
+    counters for remote calls, plus cache and frame dedup stats. Only
+    available to staff users (or anyone when DEBUG is on).
+    """
+    if not (settings.DEBUG or request.user.is_staff):
+        return JsonResponse({'error': 'Not found'}, status=404)
+    return JsonResponse({
+        'backend': get_backend().name,
+        'backend_stats': get_backend().stats(),
+        'remote_calls': caller_stats(),
+        'cache': get_detection_cache().stats(),
+        'frame_dedup': get_frame_deduplicator().stats(),
+        'descriptions': get_description_service().stats(),
+        'llm': get_llm_gateway().stats(),
+    })
 
 
 # ── Views ─────────────────────────────────────────────────────────────────────
@@ -171,7 +336,8 @@ def home(request):
     return render(request, 'home.html')
 
 def detect_view(request):
-    return render(request, 'detect.html')
+    # Draw overlays in the browser when the backend gives us boxes
+    return render(request, 'detect.html', {'overlay_mode': get_backend().provides_boxes})
 
 def database(request):
     return render(request, 'database.html')
@@ -183,9 +349,63 @@ def predict(request):
     return render(request, 'predict.html')
 
 
+# ── Constellation catalog API ─────────────────────────────────────────────────
+CATALOG_PAGE_SIZE = 24
+
+
+def catalog_params(request):
+    query = request.GET.get('q', '').strip()[:100]
+    try:
+        page_size = min(max(int(request.GET.get('page_size', CATALOG_PAGE_SIZE)), 1), 88)
+    except ValueError:
+        page_size = CATALOG_PAGE_SIZE
+    return query, request.GET.get('page', '1'), page_size
+
+
+def catalog_etag(request):
+    query, page, page_size = catalog_params(request)
+    key = f"{get_catalog().version}|{normalize(query)}|{page}|{page_size}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+@require_GET
+@etag(catalog_etag)
+@cache_control(public=True, max_age=300)
+def catalog_api(request):
+    """
+    Paginated search over the 88 constellations: ``q`` (name, alias such
+    as "Big Dipper", IAU abbreviation, or a fuzzy/prefix match), ``page``
+    and ``page_size``. An empty query lists them alphabetically.
+    """
+    query, page, page_size = catalog_params(request)
+    catalog = get_catalog()
+    paginator = Paginator(catalog.search(query), page_size)
+    page_obj = paginator.get_page(page)
+    return JsonResponse({
+        'query': query,
+        'count': paginator.count,
+        'total': len(catalog.entries),
+        'page': page_obj.number,
+        'num_pages': paginator.num_pages,
+        'has_next': page_obj.has_next(),
+        'results': [
+            {
+                'id': entry['id'],
+                'name': entry['name'],
+                'description': entry['description'],
+                'image': static(f"images/{entry['image']}"),
+                'abbreviation': catalog.abbreviations[entry['name']],
+                'aliases': catalog.aliases[entry['name']],
+                'matched': matched,
+            }
+            for entry, matched in page_obj.object_list
+        ],
+    })
+
+
 # ── Static image upload processing (uses API) ─────────────────────────────────
 @csrf_exempt
-def process_upload(request):
+async def process_upload(request):
     """Upload processing — calls Gradio API for constellation detection"""
     if request.method == 'POST':
         try:
@@ -210,46 +430,32 @@ def process_upload(request):
                 return redirect('upload')
 
             # Read image for dimension info
-            img_data = np.frombuffer(file.read(), np.uint8)
-            frame = cv2.imdecode(img_data, cv2.IMREAD_COLOR)
-            if frame is None:
+            image_bytes = file.read()
+            dimensions = read_image_size(image_bytes)
+            if dimensions is None:
                 messages.error(request, 'Invalid image file. Please upload a valid image.')
                 return redirect('upload')
 
-            height, width = frame.shape[:2]
-
-            # Save to temp file for API call
-            tmp_path = f"/tmp/upload_{int(time.time()*1000)}{file_extension}"
-            cv2.imwrite(tmp_path, frame)
-
-            try:
-                # ── Call Gradio API ──
-                annotated_path, summary_text = run_constellation_api(tmp_path, confidence=0.25)
-
-                # Parse detections from summary markdown
-                detected_constellations = []
-                for line in summary_text.splitlines():
-                    line = line.strip()
-                    if line.startswith('- **') and '—' in line:
-                        # Format: "- **Name** — XX.X% confidence"
-                        name_part = line.split('**')[1]
-                        conf_part = line.split('—')[1].strip()
-                        conf_val = float(conf_part.replace('% confidence', '').replace('%', '').strip()) / 100
-                        detected_constellations.append({
-                            'name': name_part,
-                            'confidence': conf_val,
-                        })
-
-                # Read annotated image → base64
-                with open(annotated_path, 'rb') as f:
-                    img_base64 = base64.b64encode(f.read()).decode('utf-8')
-
-            finally:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
+            width, height = dimensions
+
+            # ── Run detection (or serve a cached result) ──
+            # With boxes available the page draws the overlay itself, so the
+            # original image is shown and nothing is rendered server-side.
+            client_overlay = get_backend().provides_boxes
+            if client_overlay:
+                detected_constellations = await run_blocking(
+                    detect_constellation_boxes, image_bytes, confidence=0.25
+                )
+                display_bytes = image_bytes
+            else:
+                display_bytes, detected_constellations = await run_blocking(
+                    detect_constellations, image_bytes, confidence=0.25
+                )
+            key, ext = await run_blocking(get_media_store().save, display_bytes)
 
             context = {
-                'processed_image': img_base64,
+                'processed_image_url': reverse('result_image', args=[key, ext]),
+                'client_overlay': client_overlay,
                 'original_filename': file.name,
                 'file_size': f"{file.size / 1024 / 1024:.2f} MB",
                 'image_dimensions': f"{width} x {height}",
@@ -273,6 +479,157 @@ def process_upload(request):
     return redirect('upload')
 
 
+
+# ── Batch upload processing (uses API) ────────────────────────────────────────
+ALLOWED_IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png']
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+
+def collect_batch_images(request):
+    """
+    Gather images from the ``images`` multipart field and/or a zip in the
+    ``archive`` field as (filename, size, read) triples; ``read`` returns the
+    bytes, so only images currently being processed are held in memory.
+    Raises ValueError with a user-facing message.
+    """
+    max_images = settings.BATCH_UPLOAD_MAX_IMAGES
+    images = []
+
+    for file in request.FILES.getlist('images'):
+        images.append((file.name, file.size, file.read))
+
+    archive = request.FILES.get('archive')
+    if archive is not None:
+        try:
+            bundle = zipfile.ZipFile(archive)
+        except zipfile.BadZipFile:
+            raise ValueError('Archive is not a valid zip file.')
+        for info in bundle.infolist():
+            if info.is_dir() or os.path.basename(info.filename).startswith('.'):
+                continue
+            # The declared size is only an early reject; reads are capped as well.
+            images.append((
+                os.path.basename(info.filename),
+                info.file_size,
+                lambda info=info: bundle.open(info).read(MAX_IMAGE_BYTES + 1),
+            ))
+
+    images = [
+        item for item in images
+        if os.path.splitext(item[0])[1].lower() in ALLOWED_IMAGE_EXTENSIONS
+    ]
+    if not images:
+        raise ValueError('No JPG, JPEG or PNG images found in the upload.')
+    if len(images) > max_images:
+        raise ValueError(f'Too many images: at most {max_images} per batch.')
+    return images
+
+
+def detect_batch_item(filename, size, read):
+    """Detection for one batch image; returns the per-image result dict."""
+    if size > MAX_IMAGE_BYTES:
+        return {'filename': filename, 'error': 'File larger than 10MB'}
+    image_bytes = read()
+    if len(image_bytes) > MAX_IMAGE_BYTES:
+        return {'filename': filename, 'error': 'File larger than 10MB'}
+    dimensions = read_image_size(image_bytes)
+    if dimensions is None:
+        return {'filename': filename, 'error': 'Invalid image file'}
+    result = {
+        'filename': filename,
+        'width': dimensions[0],
+        'height': dimensions[1],
+    }
+    if get_backend().provides_boxes:
+        # Boxes are enough for the client to draw; skip shipping an image.
+        result['detections'] = detect_constellation_boxes(image_bytes, confidence=0.25)
+    else:
+        annotated_bytes, result['detections'] = detect_constellations(image_bytes, confidence=0.25)
+        key, ext = get_media_store().save(annotated_bytes)
+        result['annotated_image_url'] = reverse('result_image', args=[key, ext])
+    return result
+
+
+def summarize_batch(results):
+    """Aggregate constellations found across a batch."""
+    found = {}
+    for result in results:
+        for detection in result.get('detections', []):
+            entry = found.setdefault(detection['name'], {
+                'name': detection['name'],
+                'images': 0,
+                'detections': 0,
+                'max_confidence': 0,
+            })
+            entry['detections'] += 1
+            entry['max_confidence'] = max(entry['max_confidence'], detection['confidence'])
+        for name in {d['name'] for d in result.get('detections', [])}:
+            found[name]['images'] += 1
+    return sorted(found.values(), key=lambda e: (-e['images'], e['name']))
+
+
+async def stream_batch_results(images):
+    """
+    Yield one NDJSON line per image as soon as its detection finishes, then a
+    summary line. At most BATCH_UPLOAD_CONCURRENCY images are in flight.
+    """
+    semaphore = asyncio.Semaphore(settings.BATCH_UPLOAD_CONCURRENCY)
+    started = time.monotonic()
+
+    async def run(index, filename, size, read):
+        async with semaphore:
+            try:
+                result = await run_blocking(detect_batch_item, filename, size, read)
+            except Exception as e:
+                print(f"Batch item error ({filename}): {e}")
+                result = {'filename': filename, 'error': 'Detection failed'}
+        result['index'] = index
+        return result
+
+    tasks = [
+        asyncio.create_task(run(index, *image))
+        for index, image in enumerate(images)
+    ]
+    results = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            results.append(result)
+            result_type = 'error' if 'error' in result else 'result'
+            yield json.dumps({'type': result_type, **result}) + '\n'
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    failed = sum(1 for r in results if 'error' in r)
+    yield json.dumps({
+        'type': 'summary',
+        'images': len(results),
+        'succeeded': len(results) - failed,
+        'failed': failed,
+        'constellations': summarize_batch(results),
+        'elapsed_ms': round((time.monotonic() - started) * 1000),
+    }) + '\n'
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+async def process_batch_upload(request):
+    """
+    Batch detection for many images (multipart ``images`` and/or zip ``archive``).
+    Streams newline-delimited JSON: one line per image as it completes, then a summary.
+    """
+    try:
+        images = await run_blocking(collect_batch_images, request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    response = StreamingHttpResponse(
+        stream_batch_results(images), content_type='application/x-ndjson'
+    )
+    response['Cache-Control'] = 'no-store'
+    return response
+
 def chatbot(request):
     return render(request, 'chatbot.html')
 
@@ -0,0 +1,149 @@
+"""
+Content-addressed cache of synthesized speech.
+
+Each MP3 is stored on disk under the SHA-256 of its (language, text), so a
+phrase is rendered by gTTS once however often it is spoken: repeated
+answers, the fallback reply, the same segment of a streamed reply. Files are
+served by ``chatbot.views.speech_audio`` straight from disk. The name never
+changes content, so browsers can cache them indefinitely.
+
+The directory is kept under TTS_CACHE_MAX_BYTES by deleting the files least
+recently used (a hit refreshes the modified time).
+"""
+
+import hashlib
+import os
+import threading
+
+from django.conf import settings
+
+from Predictor.descriptions import SingleFlight
+
+
+class SpeechCache:
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._size = None
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key_for(text, language):
+        return hashlib.sha256(f"{language}\0{text}".encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        # Fan out into 256 directories to keep listings small
+        return os.path.join(self.directory, key[:2], f"{key}.mp3")
+
+    def get_or_synthesize(self, text, language, synthesize):
+        """
+        Key of the MP3 for ``text`` in ``language``, calling
+        ``synthesize(text, language)`` for the bytes on a miss. Concurrent
+        misses for the same phrase share one synthesis.
+        """
+        key = self.key_for(text, language)
+        if self._touch(key):
+            with self._lock:
+                self.hits += 1
+            return key
+        return self._flight.do(key, lambda: self._fill(key, text, language, synthesize))
+
+    def open(self, key):
+        """Open a cached MP3 for reading; FileNotFoundError if it isn't cached."""
+        return open(self.path(key), 'rb')
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def _touch(self, key):
+        """Mark an entry as used; False if it isn't cached."""
+        try:
+            os.utime(self.path(key))
+        except OSError:
+            return False
+        return True
+
+    def _fill(self, key, text, language, synthesize):
+        # Another caller may have finished the same phrase just before us
+        if self._touch(key):
+            with self._lock:
+                self.hits += 1
+            return key
+        audio = synthesize(text, language)
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(audio)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.misses += 1
+            if self._size is None:
+                self._size = self._scan()
+            else:
+                self._size += len(audio)
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self._evict(keep=path)
+        return key
+
+    def _files(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith('.mp3'):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield st.st_mtime, st.st_size, path
+
+    def _scan(self):
+        return sum(size for _, size, _ in self._files())
+
+    def _evict(self, keep):
+        """Delete least-recently-used files until the cache fits its budget."""
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                # The file this request is about to serve
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        with self._lock:
+            self._size = total
+
+
+_speech_cache = None
+_speech_cache_lock = threading.Lock()
+
+
+def get_speech_cache():
+    global _speech_cache
+    if _speech_cache is None:
+        with _speech_cache_lock:
+            if _speech_cache is None:
+                _speech_cache = SpeechCache(
+                    directory=settings.TTS_CACHE_DIR,
+                    max_bytes=settings.TTS_CACHE_MAX_BYTES,
+                )
+    return _speech_cache
@@ -0,0 +1,484 @@
+// Endpoint URLs come from the script tag's data attributes
+const chatbotUrls = document.currentScript.dataset;
+
+// Create starfield background
+function createStarfield() {
+    const starfield = document.getElementById('starfield');
+    const numberOfStars = 100;
+
+    for (let i = 0; i < numberOfStars; i++) {
+        const star = document.createElement('div');
+        star.className = 'star absolute bg-white rounded-full';
+
+        const size = Math.random() * 3 + 1;
+        star.style.width = size + 'px';
+        star.style.height = size + 'px';
+        star.style.left = Math.random() * 100 + '%';
+        star.style.top = Math.random() * 100 + '%';
+
+        starfield.appendChild(star);
+    }
+}
+
+// Global variables
+let lastAIResponse = '';
+let speechEnabled = false;
+let mediaRecorder = null;
+let audioChunks = [];
+let isRecording = false;
+
+// Streamed replies are spoken a segment at a time, so audio can start before
+// the reply is finished. The first segment is short to start sooner.
+const FIRST_SPEECH_WORDS = 12;
+const SPEECH_WORDS = 40;
+let speechQueue = Promise.resolve();
+
+// DOM elements
+const messagesContainer = document.getElementById('chatMessages');
+const messageInput = document.getElementById('messageInput');
+const sendBtn = document.getElementById('sendBtn');
+const micBtn = document.getElementById('micBtn');
+const speechToggle = document.getElementById('speechToggle');
+const speakBtn = document.getElementById('speakBtn');
+const clearBtn = document.getElementById('clearBtn');
+const languageSelect = document.getElementById('languageSelect');
+const loadingIndicator = document.getElementById('loadingIndicator');
+const voiceStatus = document.getElementById('voiceStatus');
+const processingStatus = document.getElementById('processingStatus');
+
+// Initialize audio recording
+async function initAudioRecording() {
+    try {
+        const stream = await navigator.mediaDevices.getUserMedia({ 
+            audio: {
+                sampleRate: 16000,
+                channelCount: 1,
+                echoCancellation: true,
+                noiseSuppression: true
+            } 
+        });
+
+        mediaRecorder = new MediaRecorder(stream, {
+            mimeType: 'audio/webm;codecs=opus'
+        });
+
+        mediaRecorder.ondataavailable = (event) => {
+            if (event.data.size > 0) {
+                audioChunks.push(event.data);
+            }
+        };
+
+        mediaRecorder.onstop = async () => {
+            const audioBlob = new Blob(audioChunks, { type: 'audio/webm' });
+            audioChunks = [];
+            await processAudioInput(audioBlob);
+        };
+
+        return true;
+    } catch (error) {
+        console.error('Failed to initialize audio recording:', error);
+        micBtn.disabled = true;
+        micBtn.title = 'Microphone access denied or not available';
+        return false;
+    }
+}
+
+async function processAudioInput(audioBlob) {
+    try {
+        // Show processing status
+        voiceStatus.classList.add('hidden');
+        processingStatus.classList.remove('hidden');
+        micBtn.disabled = true;
+
+        // Prepare form data
+        const formData = new FormData();
+        formData.append('audio', audioBlob, 'recording.webm');
+        formData.append('language', languageSelect.value);
+
+        // Get CSRF token
+        const csrfToken = getCookie('csrftoken');
+
+        // Send to speech-to-text endpoint
+        const response = await fetch(chatbotUrls.speechToTextUrl, {
+            method: 'POST',
+            headers: {
+                'X-CSRFToken': csrfToken,
+            },
+            body: formData
+        });
+
+        const data = await response.json();
+
+        if (data.success && data.transcript) {
+            // Add voice message to chat
+            addMessage(`🎤 "${data.transcript}"`, true, true);
+
+            // Set the transcript in the input field
+            messageInput.value = data.transcript;
+
+            // Automatically send the message
+            setTimeout(() => sendMessage(), 500);
+        } else {
+            addMessage('Sorry, I couldn\'t understand your speech. Please try again.');
+        }
+
+    } catch (error) {
+        console.error('Error processing audio:', error);
+        addMessage('Error processing your voice. Please try again.');
+    } finally {
+        // Hide processing status and re-enable microphone
+        processingStatus.classList.add('hidden');
+        micBtn.disabled = false;
+    }
+}
+
+function toggleSpeech() {
+    speechEnabled = !speechEnabled;
+    if (speechEnabled) {
+        speechToggle.innerHTML = '🔊 Speech: ON';
+        speechToggle.classList.remove('bg-blue-600');
+        speechToggle.classList.add('bg-green-600');
+        speechToggle.classList.remove('border-blue-400');
+        speechToggle.classList.add('border-green-400');
+    } else {
+        speechToggle.innerHTML = '🔇 Speech: OFF';
+        speechToggle.classList.remove('bg-green-600');
+        speechToggle.classList.add('bg-blue-600');
+        speechToggle.classList.remove('border-green-400');
+        speechToggle.classList.add('border-blue-400');
+    }
+}
+
+async function startRecording() {
+    if (!mediaRecorder) {
+        const initialized = await initAudioRecording();
+        if (!initialized) return;
+    }
+
+    if (isRecording) {
+        // Stop recording
+        mediaRecorder.stop();
+        isRecording = false;
+        voiceStatus.classList.add('hidden');
+        micBtn.innerHTML = '🎤';
+        micBtn.classList.remove('listening');
+    } else {
+        // Start recording
+        audioChunks = [];
+        mediaRecorder.start();
+        isRecording = true;
+        voiceStatus.classList.remove('hidden');
+        micBtn.innerHTML = '🔴';
+        micBtn.classList.add('listening');
+
+        // Auto-stop after 30 seconds
+        setTimeout(() => {
+            if (isRecording) {
+                mediaRecorder.stop();
+                isRecording = false;
+                voiceStatus.classList.add('hidden');
+                micBtn.innerHTML = '🎤';
+                micBtn.classList.remove('listening');
+            }
+        }, 30000);
+    }
+}
+
+function addMessage(content, isUser = false, isVoice = false) {
+    const messageDiv = document.createElement('div');
+    messageDiv.className = 'flex items-start space-x-3';
+
+    if (isUser) {
+        messageDiv.className += ' justify-end';
+        const iconClass = isVoice ? '🎤' : '👤';
+        const bgClass = isVoice ? 'bg-gradient-to-r from-red-500 to-pink-500' : 'bg-gradient-to-r from-purple-500 to-pink-500';
+        messageDiv.innerHTML = `
+            <div class="glass bg-purple-900 bg-opacity-40 rounded-2xl rounded-tr-none p-4 max-w-md border border-purple-400 border-opacity-30">
+                <p class="text-purple-100">${content}</p>
+            </div>
+            <div class="w-10 h-10 rounded-full ${bgClass} flex items-center justify-center text-lg">
+                ${iconClass}
+            </div>
+        `;
+    } else {
+        messageDiv.innerHTML = `
+            <div class="w-10 h-10 rounded-full bg-gradient-to-r from-blue-500 to-purple-500 flex items-center justify-center text-lg">
+                🤖
+            </div>
+            <div class="glass bg-blue-900 bg-opacity-30 rounded-2xl rounded-tl-none p-4 max-w-md border border-blue-400 border-opacity-30">
+                <p class="text-blue-100">${content}</p>
+            </div>
+        `;
+    }
+
+    messagesContainer.appendChild(messageDiv);
+    messagesContainer.scrollTop = messagesContainer.scrollHeight;
+    return messageDiv.querySelector('p');
+}
+
+function showLoading(show) {
+    loadingIndicator.classList.toggle('hidden', !show);
+    sendBtn.disabled = show;
+    messageInput.disabled = show;
+    if (!isRecording) {
+        micBtn.disabled = show;
+    }
+}
+
+async function sendMessage() {
+    const message = messageInput.value.trim();
+    if (!message) return;
+
+    // Only add text message if it wasn't already added by voice input
+    if (!message.startsWith('🎤')) {
+        addMessage(message, true);
+    }
+    messageInput.value = '';
+    showLoading(true);
+
+    try {
+        const question = message.replace('🎤 "', '').replace('"', ''); // Clean voice input formatting
+
+        if (chatbotUrls.askAiStreamUrl && window.ReadableStream && window.TextDecoder) {
+            await askStreaming(question);
+        } else {
+            await askOnce(question);
+        }
+    } catch (error) {
+        addMessage('Connection error. Please try again.');
+        console.error('Error:', error);
+    } finally {
+        showLoading(false);
+    }
+}
+
+function askRequest(url, message) {
+    return fetch(url, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': getCookie('csrftoken'),
+        },
+        body: JSON.stringify({ message: message })
+    });
+}
+
+// Whole reply in one response (browsers without fetch streams)
+async function askOnce(message) {
+    const response = await askRequest(chatbotUrls.askAiUrl, message);
+    const data = await response.json();
+
+    if (data.success) {
+        lastAIResponse = data.reply;
+        addMessage(data.reply);
+        speakBtn.disabled = false;
+
+        // Auto-speak if speech is enabled
+        if (speechEnabled) {
+            setTimeout(() => speakText(), 500);
+        }
+    } else {
+        addMessage('Sorry, I encountered an error: ' + (data.error || 'Unknown error'));
+    }
+}
+
+// Reply rendered (and spoken) as it is written, from server-sent events
+async function askStreaming(message) {
+    const response = await askRequest(chatbotUrls.askAiStreamUrl, message);
+    if (!response.ok) {
+        const data = await response.json();
+        addMessage('Sorry, I encountered an error: ' + (data.error || 'Unknown error'));
+        return;
+    }
+
+    const speak = speechEnabled;
+    let bubble = null;
+    let reply = '';
+    let unspoken = '';
+    let segmentWords = FIRST_SPEECH_WORDS;
+
+    await readEvents(response, (event, data) => {
+        if (event === 'chunk') {
+            if (!bubble) {
+                bubble = addMessage('');
+                loadingIndicator.classList.add('hidden');
+            }
+            reply += data.text;
+            bubble.textContent = reply;
+            messagesContainer.scrollTop = messagesContainer.scrollHeight;
+
+            if (speak) {
+                unspoken = (unspoken + data.text).trimStart();
+                let cut;
+                while ((cut = speechSegmentLength(unspoken, segmentWords)) > 0) {
+                    queueSpeech(unspoken.slice(0, cut));
+                    unspoken = unspoken.slice(cut).trimStart();
+                    segmentWords = SPEECH_WORDS;
+                }
+            }
+        } else if (event === 'done') {
+            lastAIResponse = data.reply;
+            speakBtn.disabled = false;
+            if (speak && unspoken.trim()) {
+                queueSpeech(unspoken);
+            }
+        } else if (event === 'error') {
+            addMessage('Sorry, I encountered an error: ' + (data.error || 'Unknown error'));
+        }
+    });
+}
+
+// Calls onEvent(event, data) for each server-sent event in a fetch response
+async function readEvents(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let end;
+        while ((end = buffer.indexOf('\n\n')) >= 0) {
+            const block = buffer.slice(0, end);
+            buffer = buffer.slice(end + 2);
+
+            let event = 'message';
+            const data = [];
+            for (const line of block.split('\n')) {
+                if (line.startsWith('event:')) {
+                    event = line.slice(6).trim();
+                } else if (line.startsWith('data:')) {
+                    data.push(line.slice(5).trim());
+                }
+            }
+            if (data.length) {
+                onEvent(event, JSON.parse(data.join('\n')));
+            }
+        }
+    }
+}
+
+// Length of the leading part of `text` ready to be spoken: a full sentence,
+// or `words` complete words (replies are often unpunctuated). 0 if not yet.
+function speechSegmentLength(text, words) {
+    const sentence = text.match(/^[\s\S]*?[.!?]\s/);
+    if (sentence) return sentence[0].length;
+
+    const complete = text.match(/\S+\s+/g) || [];
+    if (complete.length < words) return 0;
+    return complete.slice(0, words).join('').length;
+}
+
+// Synthesis starts at once; playback waits for the segments queued before it
+function queueSpeech(text) {
+    const audio = fetchSpeech(text);
+    speechQueue = speechQueue
+        .then(() => audio)
+        .then(playAudio)
+        .catch((error) => console.error('Speech synthesis failed:', error));
+}
+
+async function fetchSpeech(text) {
+    const response = await fetch(chatbotUrls.textToSpeechUrl, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': getCookie('csrftoken'),
+        },
+        body: JSON.stringify({
+            text: text,
+            language: languageSelect.value
+        })
+    });
+
+    const data = await response.json();
+    if (!data.success) {
+        throw new Error(data.error || 'Failed to generate speech');
+    }
+    // The browser streams the cached MP3 (with range requests) as it plays
+    return new Audio(data.audio_url);
+}
+
+function playAudio(audio) {
+    return new Promise((resolve) => {
+        audio.onended = resolve;
+        audio.onerror = resolve;
+        audio.play().catch(resolve);
+    });
+}
+
+async function speakText() {
+    if (!lastAIResponse || !speechEnabled) return;
+
+    speakBtn.disabled = true;
+    speakBtn.innerHTML = '🔄 Speaking...';
+
+    try {
+        const audio = await fetchSpeech(lastAIResponse);
+        audio.play();
+
+        audio.onended = () => {
+            speakBtn.disabled = false;
+            speakBtn.innerHTML = '🔊 Speak Last Response';
+        };
+    } catch (error) {
+        console.error('Speech synthesis failed:', error);
+        addMessage('Sorry, speech synthesis failed.');
+        speakBtn.disabled = false;
+        speakBtn.innerHTML = '🔊 Speak Last Response';
+    }
+}
+
+// Helper function to get CSRF token
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let i = 0; i < cookies.length; i++) {
+            const cookie = cookies[i].trim();
+            if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
+
+function clearChat() {
+    messagesContainer.innerHTML = `
+        <div class="flex items-start space-x-3">
+            <div class="w-10 h-10 rounded-full bg-gradient-to-r from-blue-500 to-purple-500 flex items-center justify-center text-lg">
+                🤖
+            </div>
+            <div class="glass bg-blue-900 bg-opacity-30 rounded-2xl rounded-tl-none p-4 max-w-md border border-blue-400 border-opacity-30">
+                <p class="text-blue-100">
+                    Welcome back! 🌌 I'm ready to help you explore the cosmos again. What would you like to know about the stars? ⭐
+                </p>
+            </div>
+        </div>
+    `;
+    lastAIResponse = '';
+    speakBtn.disabled = true;
+}
+
+// Event listeners
+sendBtn.addEventListener('click', sendMessage);
+micBtn.addEventListener('click', startRecording);
+speechToggle.addEventListener('click', toggleSpeech);
+speakBtn.addEventListener('click', speakText);
+clearBtn.addEventListener('click', clearChat);
+
+messageInput.addEventListener('keypress', (e) => {
+    if (e.key === 'Enter' && !sendBtn.disabled) {
+        sendMessage();
+    }
+});
+
+// Initialize
+createStarfield();
+
+// Auto-focus input
+messageInput.focus();
@@ -1,3 +1,385 @@
-from django.test import TestCase
+import asyncio
+import json
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.test import SimpleTestCase
+
+from ConstellationPredictor.llm import LLMError, LLMGateway, PriorityLimiter
+from ConstellationPredictor.offload import iterate_blocking
+
+from . import views
+from .speech_cache import SpeechCache
+
+
+class FakeResponse:
+    """Enough of requests.Response for the gateway; the body is unreadable once closed."""
+
+    def __init__(self, status_code, body=None, lines=(), headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+        self._lines = lines
+        self.closed = False
+
+    def json(self):
+        if self.closed:
+            raise ValueError("body already released")
+        if self._body is None:
+            raise ValueError("no JSON body")
+        return self._body
+
+    def iter_lines(self, decode_unicode=False):
+        for line in self._lines:
+            if isinstance(line, Exception):
+                raise line
+            yield line
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def reply(text, usage=None):
+    body = {'candidates': [{'content': {'parts': [{'text': text}]}}]}
+    if usage:
+        body['usageMetadata'] = usage
+    return body
+
+
+def sse_lines(*chunks):
+    lines = []
+    for chunk in chunks:
+        lines += ['data: ' + json.dumps(chunk), '']
+    return lines
+
+
+def make_gateway(*responses, **options):
+    gateway = LLMGateway(
+        api_key='test-key',
+        purposes={'chat': {'model': 'test-model', 'priority': 0, 'timeout': 5}},
+        backoff=0.01,
+        **options,
+    )
+    gateway.session.post = mock.Mock(side_effect=list(responses))
+    return gateway
+
+
+class PriorityLimiterTests(SimpleTestCase):
+    def test_lowest_priority_value_is_served_first(self):
+        limiter = PriorityLimiter(1)
+        self.assertTrue(limiter.acquire(5, timeout=1))
+        served = []
+
+        def wait(priority):
+            limiter.acquire(priority, timeout=5)
+            served.append(priority)
+            limiter.release()
+
+        threads = [threading.Thread(target=wait, args=(p,)) for p in (9, 0, 1)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.05)  # queue them in a known order
+        self.assertEqual(limiter.queued(), 3)
+        limiter.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(served, [0, 1, 9])
+        self.assertEqual(limiter.in_use(), 0)
+
+    def test_timed_out_waiter_does_not_take_a_slot(self):
+        limiter = PriorityLimiter(1)
+        limiter.acquire(0, timeout=1)
+        self.assertFalse(limiter.acquire(0, timeout=0.01))
+        self.assertEqual(limiter.queued(), 0)
+        limiter.release()
+        self.assertEqual(limiter.in_use(), 0)
+
+
+class LLMGatewayTests(SimpleTestCase):
+    def test_generate_retries_server_errors(self):
+        gateway = make_gateway(FakeResponse(503), FakeResponse(200, reply('Orion', {'totalTokenCount': 3})))
+        self.assertEqual(gateway.generate('chat', 'hi'), 'Orion')
+        usage = gateway.stats()['purposes']['chat']
+        self.assertEqual((usage['calls'], usage['retries'], usage['errors']), (1, 1, 0))
+
+    def test_client_errors_are_not_retried(self):
+        gateway = make_gateway(FakeResponse(400), FakeResponse(200, reply('unused')))
+        with self.assertRaises(LLMError):
+            gateway.generate('chat', 'hi')
+        self.assertEqual(gateway.session.post.call_count, 1)
+        self.assertEqual(gateway.limiter.in_use(), 0)
+
+    def test_unreadable_reply_raises_llm_error(self):
+        for body in (None, ['not', 'an', 'object']):
+            with self.subTest(body=body):
+                gateway = make_gateway(FakeResponse(200, body))
+                with self.assertRaises(LLMError):
+                    gateway.generate('chat', 'hi')
+                self.assertEqual(gateway.stats()['purposes']['chat']['errors'], 1)
+                self.assertEqual(gateway.limiter.in_use(), 0)
+
+    def test_reply_without_candidates_raises_llm_error(self):
+        gateway = make_gateway(FakeResponse(200, {'candidates': None}))
+        with self.assertRaises(LLMError):
+            gateway.generate('chat', 'hi')
+
+    def test_retry_delay_is_read_before_the_response_is_closed(self):
+        quota = FakeResponse(429, {'error': {'details': [{'retryDelay': '0.2s'}]}})
+        gateway = make_gateway(quota, FakeResponse(200, lines=sse_lines(reply('Vega'))))
+        started = time.monotonic()
+        self.assertEqual(list(gateway.stream('chat', 'hi')), ['Vega'])
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertTrue(quota.closed)
+
+    def test_stream_yields_chunks_and_records_usage(self):
+        lines = sse_lines(reply('Hello '), reply('stargazer'), {'usageMetadata': {'candidatesTokenCount': 2}})
+        gateway = make_gateway(FakeResponse(200, lines=lines))
+        self.assertEqual(list(gateway.stream('chat', 'hi')), ['Hello ', 'stargazer'])
+        _, kwargs = gateway.session.post.call_args
+        self.assertEqual((kwargs['params'], kwargs['stream']), ({'alt': 'sse'}, True))
+        usage = gateway.stats()['purposes']['chat']
+        self.assertEqual((usage['output_tokens'], usage['streams']), (2, 1))
+        self.assertEqual(gateway.limiter.in_use(), 0)
+
+    def test_interrupted_stream_raises(self):
+        lines = sse_lines(reply('Hel')) + [requests.ConnectionError('reset')]
+        gateway = make_gateway(FakeResponse(200, lines=lines))
+        chunks = gateway.stream('chat', 'hi')
+        self.assertEqual(next(chunks), 'Hel')
+        with self.assertRaises(LLMError):
+            next(chunks)
+        self.assertEqual(gateway.limiter.in_use(), 0)
+
+    def test_closing_a_stream_releases_its_slot(self):
+        gateway = make_gateway(FakeResponse(200, lines=sse_lines(reply('a'), reply('b'))))
+        chunks = gateway.stream('chat', 'hi')
+        next(chunks)
+        self.assertEqual(gateway.limiter.in_use(), 1)
+        chunks.close()
+        self.assertEqual(gateway.limiter.in_use(), 0)
+
+
+class WhisperClientTests(SimpleTestCase):
+    def test_concurrent_first_use_creates_one_client(self):
+        def slow_client(*args, **kwargs):
+            time.sleep(0.05)
+            return object()
+
+        with mock.patch.object(views, 'Client', side_effect=slow_client) as client, \
+                mock.patch.object(views, '_whisper_client', None):
+            clients = []
+            threads = [
+                threading.Thread(target=lambda: clients.append(views.get_whisper_client()))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(client.call_count, 1)
+        self.assertEqual(len(set(map(id, clients))), 1)
+
+
+class IterateBlockingTests(SimpleTestCase):
+    async def test_items_and_errors_are_passed_through(self):
+        def numbers():
+            yield 1
+            yield 2
+            raise LLMError('stopped')
+
+        items = []
+        with self.assertRaises(LLMError):
+            async for item in iterate_blocking(numbers):
+                items.append(item)
+        self.assertEqual(items, [1, 2])
+
+    async def test_stopping_early_closes_the_generator(self):
+        closed = threading.Event()
+
+        def endless():
+            try:
+                while True:
+                    time.sleep(0.01)
+                    yield 'tick'
+            finally:
+                closed.set()
+
+        chunks = iterate_blocking(endless)
+        self.assertEqual(await chunks.__anext__(), 'tick')
+        await chunks.aclose()
+        self.assertTrue(await asyncio.to_thread(closed.wait, 2))
+
+
+class AskAiStreamTests(SimpleTestCase):
+    async def events(self, stream):
+        gateway = mock.Mock()
+        gateway.stream = stream
+        with mock.patch.object(views, 'get_llm_gateway', return_value=gateway):
+            response = await self.async_client.post(
+                '/chatbot/api/ask/stream/', {'message': 'What is Orion?'}, content_type='application/json'
+            )
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            body = b''.join([part async for part in response.streaming_content]).decode()
+        events = []
+        for block in body.strip().split('\n\n'):
+            event, data = block.split('\n')
+            events.append((event[len('event: '):], json.loads(data[len('data: '):])))
+        return events
+
+    async def test_chunks_then_done(self):
+        def stream(purpose, prompt):
+            self.assertIn('What is Orion?', prompt)
+            yield 'Orion is '
+            yield 'a hunter'
+
+        self.assertEqual(await self.events(stream), [
+            ('chunk', {'text': 'Orion is '}),
+            ('chunk', {'text': 'a hunter'}),
+            ('done', {'reply': 'Orion is a hunter', 'success': True}),
+        ])
+
+    async def test_fallback_before_the_first_chunk(self):
+        def stream(purpose, prompt):
+            raise LLMError('unavailable')
+            yield
+
+        events = await self.events(stream)
+        self.assertEqual([event for event, _ in events], ['chunk', 'done'])
+        self.assertEqual(events[1][1]['reply'], views.FALLBACK_REPLY)
+
+    async def test_error_after_a_partial_reply(self):
+        def stream(purpose, prompt):
+            yield 'Orion'
+            raise LLMError('reset')
+
+        events = await self.events(stream)
+        self.assertEqual([event for event, _ in events], ['chunk', 'error'])
+
+    async def test_empty_message(self):
+        response = await self.async_client.post(
+            '/chatbot/api/ask/stream/', {'message': ' '}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class ParseByteRangeTests(SimpleTestCase):
+    def test_ranges(self):
+        cases = {
+            'bytes=0-99': (0, 99),
+            'bytes=100-': (100, 999),
+            'bytes=-10': (990, 999),
+            'bytes=-5000': (0, 999),
+            'bytes=900-5000': (900, 999),
+            'bytes=1000-': False,
+            'bytes=-0': False,
+            'bytes=5-1': None,
+            'bytes=0-1,5-6': None,
+            'items=0-1': None,
+            'bytes=a-b': None,
+            'bytes=10': None,
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(views.parse_byte_range(header, 1000), expected)
+
+
+class SpeechCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.synthesize = mock.Mock(side_effect=lambda text, language: f'{language}:{text}'.encode() * 100)
+
+    def test_key_depends_on_text_and_language(self):
+        keys = {SpeechCache.key_for('Orion', 'en'), SpeechCache.key_for('Orion', 'hi'), SpeechCache.key_for('Vega', 'en')}
+        self.assertEqual(len(keys), 3)
+
+    def test_each_phrase_is_synthesized_once(self):
+        cache = SpeechCache(self.directory, max_bytes=10 ** 6)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_synthesize('Orion', 'en', self.synthesize)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(set(results), {SpeechCache.key_for('Orion', 'en')})
+        self.assertEqual(self.synthesize.call_count, 1)
+        with cache.open(results[0]) as f:
+            self.assertEqual(f.read(), b'en:Orion' * 100)
+
+    def test_least_recently_used_are_evicted(self):
+        cache = SpeechCache(self.directory, max_bytes=2500)  # room for two 1100-byte phrases
+        first = cache.get_or_synthesize('phrase-a', 'en', self.synthesize)
+        time.sleep(0.02)
+        second = cache.get_or_synthesize('phrase-b', 'en', self.synthesize)
+        time.sleep(0.02)
+        cache.get_or_synthesize('phrase-a', 'en', self.synthesize)  # refreshes a
+        time.sleep(0.02)
+        third = cache.get_or_synthesize('phrase-c', 'en', self.synthesize)
+
+        self.assertLessEqual(cache.stats()['bytes'], 2500)
+        for key in (first, third):
+            cache.open(key).close()
+        with self.assertRaises(FileNotFoundError):
+            cache.open(second)
+
+
+class SpeechAudioTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.cache = SpeechCache(directory, max_bytes=10 ** 6)
+        self.audio = bytes(range(256)) * 4
+        self.key = self.cache.get_or_synthesize('Orion', 'en', lambda text, language: self.audio)
+        self.url = f'/chatbot/speech/{self.key}.mp3'
+        patcher = mock.patch.object(views, 'get_speech_cache', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_text_to_speech_returns_the_audio_url(self):
+        response = self.client.post(
+            '/chatbot/text_to_speech/', {'text': 'Orion', 'language': 'en'}, content_type='application/json'
+        )
+        self.assertEqual(response.json(), {'audio_url': self.url, 'success': True})
+
+    def test_full_response(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'audio/mpeg')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(b''.join(response.streaming_content), self.audio)
+
+    def test_range(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 10-19/{len(self.audio)}')
+        self.assertEqual(response.content, self.audio[10:20])
+
+    def test_unsatisfiable_range(self):
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(self.audio)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.audio)}')
+
+    def test_stale_if_range_gets_the_whole_file(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"other"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_conditional_request(self):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=f'"{self.key}"')
+        self.assertEqual(response.status_code, 304)
+
+    def test_unknown_key(self):
+        self.assertEqual(self.client.get(f'/chatbot/speech/{"0" * 64}.mp3').status_code, 404)
@@ -1,8 +1,11 @@
-from django.urls import path
+from django.urls import path, re_path
 from . import views
 
 urlpatterns = [
     path('', views.chatbot, name='chatbot'),
     path('api/ask/', views.ask_ai, name='ask_ai'),
+    path('api/ask/stream/', views.ask_ai_stream, name='ask_ai_stream'),
     path('speech_to_text/', views.speech_to_text, name='speech_to_text'),  
-    path('text_to_speech/', views.text_to_speech, name='text_to_speech'),]
\ No newline at end of file
+    path('text_to_speech/', views.text_to_speech, name='text_to_speech'),
+    re_path(r'^speech/(?P<key>[0-9a-f]{64})\.mp3$', views.speech_audio, name='speech_audio'),
+]
\ No newline at end of file
@@ -1,35 +1,42 @@
 from django.shortcuts import render
-from django.http import JsonResponse, HttpResponse
+from django.http import FileResponse, JsonResponse, HttpResponse, StreamingHttpResponse
+from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from django.conf import settings
 import json
 import logging
 from gtts import gTTS
 import io
-import base64
-import tempfile
 import os
-from gradio_client import Client, handle_file
-import google.generativeai as genai
+import threading
+from gradio_client import Client
 from dotenv import load_dotenv
+from ConstellationPredictor.gradio_io import upload_bytes
+from ConstellationPredictor.llm import LLMError, get_llm_gateway
+from ConstellationPredictor.offload import iterate_blocking, run_blocking
+from .speech_cache import get_speech_cache
 load_dotenv()
-import os
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-model = genai.GenerativeModel('gemini-3-flash-preview')
+# Gradio Whisper client — created on first use so startup never waits on the Space
+_whisper_client = None
+_whisper_client_lock = threading.Lock()
 
-# Initialize Gradio Whisper client
-whisper_client = Client("rverma0631/Whisper")
+def get_whisper_client():
+    global _whisper_client
+    if _whisper_client is None:
+        with _whisper_client_lock:
+            if _whisper_client is None:
+                _whisper_client = Client("rverma0631/Whisper", download_files=False)
+    return _whisper_client
 
 def chatbot(request):
     return render(request, 'index.html')
 
 @csrf_exempt
 @require_http_methods(["POST"])
-def ask_ai(request):
+async def ask_ai(request):
     try:
         body = json.loads(request.body.decode('utf-8'))
         user_message = body.get('message', '').strip()
@@ -41,7 +48,7 @@ def ask_ai(request):
         
         logger.info(f"User message: {user_message}")
         
-        ai_response = generate_gemini_response(user_message)
+        ai_response = await run_blocking(generate_gemini_response, user_message)
         
         logger.info(f"AI response: {ai_response}")
         
@@ -62,7 +69,39 @@ def ask_ai(request):
 
 @csrf_exempt
 @require_http_methods(["POST"])
-def speech_to_text(request):
+async def ask_ai_stream(request):
+    """
+    Same request as ask_ai, answered as server-sent events: a ``chunk``
+    event for each piece of the reply as Gemini writes it, then ``done``
+    with the full reply (or ``error``).
+    """
+    try:
+        body = json.loads(request.body.decode('utf-8'))
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'error': 'Invalid JSON in request body'
+        }, status=400)
+
+    user_message = body.get('message', '').strip()
+    if not user_message:
+        return JsonResponse({
+            'error': 'Message cannot be empty'
+        }, status=400)
+
+    logger.info(f"User message (streamed): {user_message}")
+
+    response = StreamingHttpResponse(
+        stream_gemini_response(user_message),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx and similar proxies from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+@csrf_exempt
+@require_http_methods(["POST"])
+async def speech_to_text(request):
     try:
         if 'audio' not in request.FILES:
             return JsonResponse({
@@ -81,28 +120,18 @@ def speech_to_text(request):
             if '.' in audio_file.name:
                 file_ext = '.' + audio_file.name.split('.')[-1]
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(suffix=file_ext, delete=False) as temp_file:
-            for chunk in audio_file.chunks():
-                temp_file.write(chunk)
-            temp_file_path = temp_file.name
-        
-        # Validate file size
-        file_size = os.path.getsize(temp_file_path)
-        logger.info(f"Processing audio file: {temp_file_path}, size: {file_size} bytes, extension: {file_ext}")
+        audio_bytes = audio_file.read()
+        file_size = len(audio_bytes)
+        logger.info(f"Processing audio upload: size: {file_size} bytes, extension: {file_ext}")
         
         if file_size == 0:
-            os.unlink(temp_file_path)
             return JsonResponse({
                 'error': 'Uploaded audio file is empty'
             }, status=400)
         
         try:
             # Transcribe using Gradio Whisper API
-            result = whisper_client.predict(
-                audio=handle_file(temp_file_path),
-                api_name="/transcribe"
-            )
+            result = await run_blocking(transcribe_audio, audio_bytes, f"audio{file_ext}")
             
             logger.info(f"Whisper API result: {result}")
             
@@ -110,9 +139,6 @@ def speech_to_text(request):
             transcript = result.strip() if isinstance(result, str) else str(result).strip()
             detected_language = language
             
-            # Clean up temp file
-            os.unlink(temp_file_path)
-            
             return JsonResponse({
                 'transcript': transcript,
                 'detected_language': detected_language,
@@ -121,9 +147,6 @@ def speech_to_text(request):
             
         except Exception as e:
             logger.error(f"Whisper API error: {str(e)}", exc_info=True)
-            # Clean up temp file on error
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
             
             # Return user-friendly error
             return JsonResponse({
@@ -139,17 +162,11 @@ def speech_to_text(request):
 
 @csrf_exempt
 @require_http_methods(["POST"])
-def text_to_speech(request):
-    """Convert text to speech using gTTS"""
-    import json
-    import base64
-    import os
-    import tempfile
-    import logging
-    from django.http import JsonResponse
-    from gtts import gTTS
-
-    logger = logging.getLogger(__name__)
+async def text_to_speech(request):
+    """
+    Convert text to speech using gTTS. Returns the URL of the cached MP3
+    rather than the audio itself, so the browser can stream it.
+    """
 
     try:
         body = json.loads(request.body.decode('utf-8'))
@@ -165,31 +182,118 @@ def text_to_speech(request):
             return JsonResponse({'error': 'Unsupported language'}, status=400)
 
         gtts_lang = gtts_language_map[language]
-        tts = gTTS(text=text, lang=gtts_lang, slow=False)
-
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-            tts.save(temp_file.name)
-
-        with open(temp_file.name, 'rb') as audio_file:
-            audio_data = audio_file.read()
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-
-        os.unlink(temp_file.name)
+        key = await run_blocking(get_speech_cache().get_or_synthesize, text, gtts_lang, synthesize_speech)
 
-        return JsonResponse({'audio_data': audio_base64, 'success': True})
+        return JsonResponse({
+            'audio_url': reverse('speech_audio', args=[key]),
+            'success': True
+        })
 
     except Exception as e:
         logger.error(f"Error in text_to_speech: {str(e)}")
         return JsonResponse({'error': 'Failed to generate speech'}, status=500)
 
+# Speech files are named by content hash, so they never change
+SPEECH_CACHE_CONTROL = 'public, max-age=31536000, immutable'
 
-def generate_gemini_response(message):
+@require_http_methods(["GET", "HEAD"])
+def speech_audio(request, key):
     """
-    Generate AI responses using Google's Gemini API
+    Serve a cached MP3 from text_to_speech. Supports single byte-range
+    requests so players can seek and start before the download finishes.
     """
+    etag = f'"{key}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponse(status=304)
+    else:
+        try:
+            audio_file = get_speech_cache().open(key)
+        except FileNotFoundError:
+            return HttpResponse(status=404)
+        size = os.fstat(audio_file.fileno()).st_size
+
+        byte_range = request.headers.get('Range')
+        if byte_range and request.headers.get('If-Range', etag) != etag:
+            byte_range = None  # Client's copy is stale: send everything
+        span = parse_byte_range(byte_range, size) if byte_range else None
+
+        if span is None:
+            response = FileResponse(audio_file, content_type='audio/mpeg')
+        elif span is False:
+            audio_file.close()
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+        else:
+            start, end = span
+            with audio_file:
+                audio_file.seek(start)
+                data = audio_file.read(end - start + 1)
+            response = HttpResponse(data, status=206, content_type='audio/mpeg')
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Cache-Control'] = SPEECH_CACHE_CONTROL
+    return response
+
+
+def parse_byte_range(header, size):
+    """
+    (start, end) of a single ``bytes=`` range, inclusive and clipped to
+    ``size``. None to ignore the header (malformed or several ranges) and
+    False if it can't be satisfied.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, dash, last = spec.strip().partition('-')
+    if not dash:
+        return None
     try:
-        # Create a specilized prompt for constellation and astronomy topics
-        prompt = f"""
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0:
+                return False
+            start, end = max(0, size - length), size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        return False
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def transcribe_audio(audio_bytes, filename):
+    """Send in-memory audio to the Whisper Space and return its raw result"""
+    client = get_whisper_client()
+    return client.predict(
+        audio=upload_bytes(client, audio_bytes, filename),
+        api_name="/transcribe",
+    )
+
+
+def synthesize_speech(text, lang):
+    """Render text to MP3 bytes with gTTS, entirely in memory"""
+    tts = gTTS(text=text, lang=lang, slow=False)
+    buffer = io.BytesIO()
+    tts.write_to_fp(buffer)
+    return buffer.getvalue()
+
+
+FALLBACK_REPLY = """🌟 I apologize, but I'm having trouble accessing my astronomical database right now. 
+
+Please try asking your question again in a moment. I'm here to help you explore the wonders of the night sky, including constellations, stars, planets, and cosmic phenomena!
+
+In the meantime, did you know that on any clear night, you can see about 2,000 to 3,000 stars with the naked eye? ✨"""
+
+
+def chat_prompt(message):
+    """Create a specilized prompt for constellation and astronomy topics"""
+    return f"""
         You are an enthusiastic and friendly astronomy assistant who loves teaching people about constellations and the night sky
 
         You help beginners understand stars constellations and space in a clear and exciting way
@@ -206,14 +310,47 @@ def generate_gemini_response(message):
 """
 
 
-        # Generate response using Gemini
-        response = model.generate_content(prompt)
-        return response.text
+def generate_gemini_response(message):
+    """
+    Generate AI responses using Google's Gemini API
+    """
+    try:
+        # Generate response using Gemini (chat requests are served first)
+        return get_llm_gateway().generate('chat', chat_prompt(message))
         
-    except Exception as e:
+    except LLMError as e:
         logger.error(f"Error generating Gemini response: {str(e)}")
-        return """🌟 I apologize, but I'm having trouble accessing my astronomical database right now. 
+        return FALLBACK_REPLY
 
-Please try asking your question again in a moment. I'm here to help you explore the wonders of the night sky, including constellations, stars, planets, and cosmic phenomena!
 
-In the meantime, did you know that on any clear night, you can see about 2,000 to 3,000 stars with the naked eye? ✨"""
+def sse_event(event, data):
+    """One server-sent event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_gemini_response(message):
+    """
+    Server-sent events for a Gemini reply, forwarded chunk by chunk. If
+    Gemini fails before writing anything the fallback reply is sent instead.
+    """
+    reply = []
+    try:
+        chunks = iterate_blocking(get_llm_gateway().stream, 'chat', chat_prompt(message))
+        async for text in chunks:
+            reply.append(text)
+            yield sse_event('chunk', {'text': text})
+    except LLMError as e:
+        logger.error(f"Error streaming Gemini response: {str(e)}")
+        if reply:
+            yield sse_event('error', {'error': 'The reply was interrupted'})
+            return
+        reply.append(FALLBACK_REPLY)
+        yield sse_event('chunk', {'text': FALLBACK_REPLY})
+    except Exception as e:
+        logger.error(f"Error in ask_ai_stream: {str(e)}")
+        yield sse_event('error', {'error': 'An internal server error occurred'})
+        return
+
+    ai_response = ''.join(reply)
+    logger.info(f"AI response (streamed): {ai_response}")
+    yield sse_event('done', {'reply': ai_response, 'success': True})
@@ -1,5 +1,5 @@
 #!/bin/bash
-# start.sh - Start the Django development server
+# start.sh - Start the Django server (ASGI, via uvicorn)
 
 set -e  # Exit on error
 
@@ -8,5 +8,5 @@ echo "Starting Constellation Predictor server..."
 # Navigate to Django project
 cd ConstellationPredictor
 
-# Start Django development server
-uv run manage.py runserver 0.0.0.0:8000
+# Serve the ASGI app so async views can hold many in-flight requests per worker
+uv run uvicorn ConstellationPredictor.asgi:application --host 0.0.0.0 --port 8000